@@ -22,7 +22,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import DurableQueue, open_queue, state_dir
 from automation.envelope import ulid
 from automation.responder import evidence_verdict
 
@@ -103,5 +103,5 @@ def emit_graph_upsert(receipt: dict, beacons: List[dict], *,
                       tenant_id: str = DEFAULT_TENANT, sink: Optional[DurableQueue] = None) -> dict:
     """Produce a graph-upsert and record it durably for a credentialed job to POST upstream."""
     upsert = to_graph_upsert(receipt, beacons, tenant_id=tenant_id)
-    (sink if sink is not None else DurableQueue(state_dir() / "graph-upserts")).put(upsert)
+    (sink if sink is not None else open_queue(state_dir() / "graph-upserts")).put(upsert)
     return upsert
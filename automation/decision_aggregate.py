@@ -0,0 +1,161 @@
+"""Checkpointed aggregate over the decision-receipt stream (state/decisions).
+
+Telemetry scrapes every minute and the learning loop analyzes hourly, and both used to
+``peek_all()`` the decisions queue: re-read and JSON-parse every receipt ever written,
+so a tick cost grew with total history. The receipts are an append-only log, so the
+counters they feed can be folded forward instead. This module keeps one aggregate in
+``<state>/decisions-aggregate.json`` together with a watermark (the last receipt id
+folded); ``update()`` reads only receipts past the watermark, folds them in, and
+checkpoints. Telemetry and learning both call ``update()``, so they share one stream
+and one fold.
+
+Counters are cumulative: a receipt, once folded, stays counted even if the queue is
+later drained or compacted.
+
+Watermark and concurrent writers
+--------------------------------
+SQLite-backed queues assign ids under the write lock, so "id > watermark" is exact.
+File-backed ids are wall-clock stamps taken *before* the atomic rename, so a slow
+writer can publish a receipt whose id is just below one already folded. The file path
+therefore re-reads a short ``SETTLE_NS`` window below the watermark and skips the ids
+it already folded there (kept in ``recent``, bounded by the same window).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: single-process use only
+    fcntl = None  # type: ignore
+
+from automation.durable_queue import open_queue, state_dir
+
+AGGREGATE_FILE = "decisions-aggregate.json"
+SETTLE_NS = 5_000_000_000   # 5 s: far longer than any mkstemp -> rename in put()
+
+_COUNTERS = ("decisions_total", "heals_total", "proposals_total", "quarantines_total",
+             "escalations_total", "healing_failures_total")
+
+
+def empty() -> dict:
+    """A fresh aggregate: no receipts folded yet."""
+    agg: dict = {name: 0 for name in _COUNTERS}
+    agg.update({"by_action": {}, "by_kind": {}, "by_verdict": {}, "outcomes_by_kind": {},
+                "source": None, "watermark": None, "recent": []})
+    return agg
+
+
+def fold(agg: dict, r: dict) -> None:
+    """Fold one decision receipt into *agg* in place."""
+    action = str(r.get("action", "unknown"))
+    kind = str(r.get("beacon_kind", "unknown"))
+    verdict = str(r.get("verdict", "unknown"))
+    agg["decisions_total"] += 1
+    agg["by_action"][action] = agg["by_action"].get(action, 0) + 1
+    agg["by_kind"][kind] = agg["by_kind"].get(kind, 0) + 1
+    agg["by_verdict"][verdict] = agg["by_verdict"].get(verdict, 0) + 1
+    if action == "escalate_human":
+        agg["escalations_total"] += 1
+    ex = r.get("execution") or {}
+    if ex.get("healed"):
+        agg["heals_total"] += 1
+    if ex.get("proposed"):
+        agg["proposals_total"] += 1
+    if ex.get("quarantined"):
+        agg["quarantines_total"] += 1
+    # A healing FAILURE is a remediation that was ATTEMPTED and undone — i.e. a fix
+    # executor wrote/regenerated and had to roll back. It is NOT an intended escalation
+    # (e.g. stale_vendor's propose_pr correctly declining because the fix is cross-repo):
+    # counting those inflates the drift signal and would teach the learning loop that a
+    # working class is failing. `rolled_back` marks exactly "tried to fix, undid it".
+    if ex.get("rolled_back"):
+        agg["healing_failures_total"] += 1
+    # Learning's view: per class, attempts (an executor ran) and failures (it did not
+    # resolve). A receipt without an execution is a pure decision, not an outcome.
+    if ex:
+        s = agg["outcomes_by_kind"].setdefault(kind, {"attempts": 0, "failures": 0})
+        s["attempts"] += 1
+        if not (ex.get("healed") or ex.get("proposed") or ex.get("quarantined")):
+            s["failures"] += 1
+
+
+def _load(path: Path) -> dict:
+    try:
+        agg = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return empty()
+    base = empty()
+    base.update(agg)
+    return base
+
+
+def _save(path: Path, agg: dict) -> None:
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(agg, fh, sort_keys=True)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _stamp_of(item_id: str) -> int:
+    return int(item_id.split("-", 1)[0])
+
+
+def _fold_new(agg: dict, decisions) -> int:
+    """Fold receipts past the watermark; returns how many were folded."""
+    if agg["source"] != decisions.backend:
+        # Never folded, or the queue moved backends (ids restart): rebuild once.
+        agg.clear()
+        agg.update(empty())
+        agg["source"] = decisions.backend
+    watermark: Optional[str] = agg["watermark"]
+    recent = set(agg["recent"])
+    after = watermark
+    if decisions.backend == "files" and watermark is not None:
+        after = f"{max(0, _stamp_of(watermark) - SETTLE_NS):020d}"
+    folded = 0
+    for item_id, receipt in decisions.peek_since(after):
+        if item_id in recent:
+            continue
+        fold(agg, receipt)
+        folded += 1
+        recent.add(item_id)
+        if watermark is None or item_id > watermark:
+            watermark = item_id
+    agg["watermark"] = watermark
+    if decisions.backend == "files" and watermark is not None:
+        floor = _stamp_of(watermark) - SETTLE_NS
+        agg["recent"] = sorted(i for i in recent if _stamp_of(i) >= floor)
+    else:
+        agg["recent"] = []
+    return folded
+
+
+def update(state: Optional[Path] = None) -> dict:
+    """Fold receipts written since the last checkpoint and return the aggregate.
+
+    Holds an exclusive lock on the checkpoint while folding, so the telemetry and
+    learning jobs (or two processes) never fold the same receipts twice.
+    """
+    root = Path(state) if state is not None else state_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / AGGREGATE_FILE
+    with open_queue(root / "decisions") as decisions, open(root / f".{AGGREGATE_FILE}.lock", "a+") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        agg = _load(path)
+        moved = agg["source"] != decisions.backend
+        if _fold_new(agg, decisions) or moved or not path.exists():
+            _save(path, agg)
+    return agg
@@ -29,7 +29,7 @@ from typing import Callable, List, Optional, Union
 import yaml
 
 from automation.beacon_producers import propose_state_failback
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import DurableQueue, open_queue, state_dir
 from automation.executors import is_in_sync, vendored_graph_in_sync
 from automation.macro_triad import assess_triad
 from automation.triad_rotation import load_schedule, writers_on_schedule
@@ -546,7 +546,7 @@ def run_detectors(inbox: Optional[DurableQueue] = None,
     """
     from automation import envelope
 
-    inbox = inbox if inbox is not None else DurableQueue(state_dir() / "beacons")
+    inbox = inbox if inbox is not None else open_queue(state_dir() / "beacons")
     emitted: List[dict] = []
     for detector in (detectors if detectors is not None else DETECTORS):
         try:
@@ -15,6 +15,18 @@ This queue persists each event as one JSON file in a shared directory. A produce
 It is duck-type compatible with the ``queue.Queue`` surface the scheduler uses
 (``put`` / ``get_nowait`` / ``empty`` / ``qsize``) so it is a drop-in replacement.
 
+Backends
+--------
+``DurableQueue`` (one file per entry) is the default and needs nothing but a
+directory. Its consumer side lists the directory on every call (``peek_since``
+sorts and parses only the new names, but still lists them all), so it suits the
+trickle of events the estate normally sees. ``SqliteQueue`` keeps the
+same interface on a SQLite WAL database in the same directory: an append-only
+table plus a persisted read cursor, so claims, ``empty`` and ``qsize`` are index
+lookups however deep the backlog, and ``put_many`` commits a burst with one
+fsync. ``open_queue`` picks the backend from ``SOCIOSPHERE_QUEUE_BACKEND``
+(``files`` | ``sqlite``); every process sharing a directory must use the same one.
+
 Scope / limits (honest)
 -----------------------
 File-backed sharing works when both processes see the same directory: a shared
@@ -29,11 +41,13 @@ from __future__ import annotations
 import json
 import os
 import queue
+import sqlite3
 import tempfile
+import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
 
 
 def state_dir() -> Path:
@@ -54,22 +68,65 @@ def default_queue_dir() -> Path:
     return Path(env) if env else state_dir() / "queue"
 
 
+_stamp_lock = threading.Lock()
+_last_stamp = 0
+
+
+def _stamp() -> int:
+    """Wall-clock nanoseconds, never repeating or going backwards within a process.
+
+    File-queue ids start with this stamp. Wall clock rather than ``monotonic_ns``
+    so that ids written after a reboot still sort after the ones before it, which
+    readers that keep a watermark (``decision_aggregate``) rely on.
+    """
+    global _last_stamp
+    with _stamp_lock:
+        _last_stamp = max(time.time_ns(), _last_stamp + 1)
+        return _last_stamp
+
+
+def open_queue(directory: "os.PathLike[str] | str | None" = None,
+               backend: Optional[str] = None) -> "DurableQueue | SqliteQueue":
+    """Open the queue at *directory* with the configured backend.
+
+    ``backend`` defaults to env ``SOCIOSPHERE_QUEUE_BACKEND`` and then ``files``.
+    """
+    backend = (backend or os.environ.get("SOCIOSPHERE_QUEUE_BACKEND") or "files").lower()
+    if backend == "files":
+        return DurableQueue(directory)
+    if backend == "sqlite":
+        return SqliteQueue(directory)
+    raise ValueError(f"unknown queue backend {backend!r} (expected 'files' or 'sqlite')")
+
+
 class DurableQueue:
     """A minimal persistent FIFO backed by one JSON file per entry.
 
-    Ordering is by filename, which is ``<monotonic-ns>-<uuid>.json`` so lexical
-    sort == arrival order. Writes are atomic (temp file + ``os.rename``), so a
-    crash mid-write never leaves a half-written entry visible to the consumer.
+    Ordering is by filename, which is ``<wall-clock-ns>-<uuid>.json`` (see
+    ``_stamp``) so lexical sort == arrival order. Writes are atomic (temp file +
+    ``os.rename``), so a crash mid-write never leaves a half-written entry visible
+    to the consumer.
     """
 
+    backend = "files"
+
     def __init__(self, directory: "os.PathLike[str] | str | None" = None) -> None:
         self.directory = Path(directory) if directory is not None else default_queue_dir()
         self.directory.mkdir(parents=True, exist_ok=True)
 
+    def close(self) -> None:
+        """Nothing to release; present so callers can close either backend."""
+
+    def __enter__(self) -> "DurableQueue":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
     # -- producer ------------------------------------------------------------
     def put(self, entry: Dict[str, Any]) -> str:
         """Persist *entry*; returns the queue-item id. Atomic and durable."""
-        item_id = f"{time.monotonic_ns():020d}-{uuid.uuid4().hex}"
+        item_id = f"{_stamp():020d}-{uuid.uuid4().hex}"
         target = self.directory / f"{item_id}.json"
         fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
         try:
@@ -85,12 +142,28 @@ class DurableQueue:
                 raise
         return item_id
 
+    def put_many(self, entries: Iterable[Dict[str, Any]]) -> list[str]:
+        """Persist several entries in order; returns their ids."""
+        return [self.put(entry) for entry in entries]
+
     # -- consumer ------------------------------------------------------------
     def _pending(self) -> list[Path]:
         return sorted(
             p for p in self.directory.glob("*.json") if not p.name.startswith(".tmp-")
         )
 
+    @staticmethod
+    def _claim(path: Path) -> Optional[Dict[str, Any]]:
+        claim = path.with_suffix(".claimed")
+        try:
+            os.rename(path, claim)  # atomic claim; loser gets FileNotFoundError
+        except FileNotFoundError:
+            return None
+        try:
+            return json.loads(claim.read_text(encoding="utf-8"))
+        finally:
+            claim.unlink(missing_ok=True)
+
     def get_nowait(self) -> Dict[str, Any]:
         """Return and remove the oldest entry, or raise ``queue.Empty``.
 
@@ -99,18 +172,26 @@ class DurableQueue:
         try the next file.
         """
         for path in self._pending():
-            claim = path.with_suffix(".claimed")
-            try:
-                os.rename(path, claim)  # atomic claim; loser gets FileNotFoundError
-            except FileNotFoundError:
-                continue
-            try:
-                data = json.loads(claim.read_text(encoding="utf-8"))
-            finally:
-                claim.unlink(missing_ok=True)
-            return data
+            data = self._claim(path)
+            if data is not None:
+                return data
         raise queue.Empty
 
+    def get_many(self, max_items: Optional[int] = None) -> list[Dict[str, Any]]:
+        """Claim and return up to *max_items* oldest entries (all if ``None``).
+
+        One directory listing serves the whole batch, instead of one per
+        ``get_nowait``. Never raises ``queue.Empty``; an empty list means empty.
+        """
+        out: list[Dict[str, Any]] = []
+        for path in self._pending():
+            if max_items is not None and len(out) >= max_items:
+                break
+            data = self._claim(path)
+            if data is not None:
+                out.append(data)
+        return out
+
     def empty(self) -> bool:
         return not self._pending()
 
@@ -124,10 +205,227 @@ class DurableQueue:
         the accumulated receipts while the queue keeps its contents. Entries removed or written
         concurrently are skipped rather than raising.
         """
-        out: list[Dict[str, Any]] = []
-        for path in self._pending():
+        return [entry for _id, entry in self.peek_since(None)]
+
+    def peek_since(self, after: Optional[str]) -> list[tuple[str, Dict[str, Any]]]:
+        """Pending ``(id, entry)`` pairs with id greater than *after*, oldest first.
+
+        Non-destructive, like ``peek_all``. Only entries past *after* are sorted,
+        read and parsed, but the directory itself is still listed in full on every
+        call: a directory offers no cheaper way to find new files. Readers that
+        need a per-tick cost independent of backlog size should use the SQLite
+        backend, whose ``peek_since`` is an index range scan.
+        """
+        out: list[tuple[str, Dict[str, Any]]] = []
+        with os.scandir(self.directory) as it:
+            names = sorted(
+                e.name[:-5] for e in it
+                if e.name.endswith(".json") and not e.name.startswith(".tmp-")
+                and (after is None or e.name[:-5] > after)
+            )
+        for item_id in names:
+            path = self.directory / f"{item_id}.json"
             try:
-                out.append(json.loads(path.read_text(encoding="utf-8")))
+                out.append((item_id, json.loads(path.read_text(encoding="utf-8"))))
             except (FileNotFoundError, ValueError):
                 continue
         return out
+
+
+class SqliteQueue:
+    """The same FIFO on a SQLite WAL database (``<directory>/queue.sqlite3``).
+
+    Entries are appended to ``entries`` with an AUTOINCREMENT id, which is the
+    arrival order. Consumers never delete on claim: a claim advances the persisted
+    ``cursor`` inside a ``BEGIN IMMEDIATE`` transaction, which SQLite serializes
+    across processes, so two consumers cannot take the same entry. Rows at or
+    below the cursor are deleted in bulk every ``compact_every`` claims (and by
+    ``compact()``), so the file does not grow without bound.
+
+    Any ``*.json`` entries left in the directory by the file backend are adopted,
+    oldest first, when the queue is opened, so switching backends loses nothing
+    (see ``_adopt_legacy``). Both backends are context managers; a SQLite queue
+    holds a connection until ``close()``.
+    """
+
+    FILENAME = "queue.sqlite3"
+    backend = "sqlite"
+
+    def __init__(self, directory: "os.PathLike[str] | str | None" = None, *,
+                 synchronous: str = "FULL", compact_every: int = 4096) -> None:
+        self.directory = Path(directory) if directory is not None else default_queue_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / self.FILENAME
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._claimed_since_compact = 0
+        self._db = sqlite3.connect(self.path, timeout=30.0, isolation_level=None,
+                                   check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA synchronous={synchronous}")
+        self._db.execute("CREATE TABLE IF NOT EXISTS entries "
+                         "(id INTEGER PRIMARY KEY AUTOINCREMENT, body TEXT NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS cursor "
+                         "(name TEXT PRIMARY KEY, position INTEGER NOT NULL)")
+        self._db.execute("INSERT OR IGNORE INTO cursor VALUES ('read', 0)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS adopted (name TEXT PRIMARY KEY) WITHOUT ROWID")
+        self._adopt_legacy()
+
+    def _adopt_legacy(self) -> None:
+        """Move entries left by the file backend into the table, oldest first.
+
+        The files are read without claiming them, inserted in one transaction that
+        also records their names in ``adopted``, and unlinked only after it commits.
+        A crash before the commit leaves the files queued; a crash after it (or a
+        second process adopting the same directory) finds the names recorded and
+        just removes the files, so no entry is lost or inserted twice. A name is
+        only needed while its file exists, and file-queue ids never repeat, so
+        names whose file is gone are dropped here and by ``compact()``.
+        """
+        legacy = DurableQueue(self.directory)
+        if not legacy._pending() and self._db.execute("SELECT 1 FROM adopted LIMIT 1").fetchone() is None:
+            return
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._forget_adopted(legacy)
+                pending = legacy.peek_since(None)
+                done = {name for (name,) in self._db.execute("SELECT name FROM adopted")}
+                fresh = [(item_id, entry) for item_id, entry in pending if item_id not in done]
+                self._db.executemany("INSERT INTO entries (body) VALUES (?)",
+                                     ((json.dumps(entry, ensure_ascii=False),) for _id, entry in fresh))
+                self._db.executemany("INSERT INTO adopted VALUES (?)", ((item_id,) for item_id, _ in fresh))
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        for item_id, _entry in pending:
+            (self.directory / f"{item_id}.json").unlink(missing_ok=True)
+
+    def _forget_adopted(self, legacy: DurableQueue) -> None:
+        """Delete ``adopted`` names whose file is gone (inside a write transaction)."""
+        present = {path.stem for path in legacy._pending()}
+        gone = [(name,) for (name,) in self._db.execute("SELECT name FROM adopted").fetchall()
+                if name not in present]
+        self._db.executemany("DELETE FROM adopted WHERE name = ?", gone)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "SqliteQueue":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _position(self) -> int:
+        return self._db.execute("SELECT position FROM cursor WHERE name = 'read'").fetchone()[0]
+
+    # -- producer ------------------------------------------------------------
+    def put(self, entry: Dict[str, Any]) -> str:
+        """Persist *entry*; returns the queue-item id. Atomic and durable."""
+        return self.put_many([entry])[0]
+
+    def put_many(self, entries: Iterable[Dict[str, Any]]) -> list[str]:
+        """Persist several entries in one transaction: one commit, one fsync."""
+        bodies = [json.dumps(entry, ensure_ascii=False) for entry in entries]
+        if not bodies:
+            return []
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany("INSERT INTO entries (body) VALUES (?)", ((b,) for b in bodies))
+                last = self._db.execute("SELECT last_insert_rowid()").fetchone()[0]
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        # BEGIN IMMEDIATE holds the database write lock for the insert, so ids are contiguous.
+        return [f"{i:020d}" for i in range(last - len(bodies) + 1, last + 1)]
+
+    # -- consumer ------------------------------------------------------------
+    def get_nowait(self) -> Dict[str, Any]:
+        """Return and remove the oldest entry, or raise ``queue.Empty``."""
+        got = self.get_many(1)
+        if not got:
+            raise queue.Empty
+        return got[0]
+
+    def get_many(self, max_items: Optional[int] = None) -> list[Dict[str, Any]]:
+        """Claim and return up to *max_items* oldest entries (all if ``None``)."""
+        limit = -1 if max_items is None else max_items
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                position = self._position()
+                rows = self._db.execute(
+                    "SELECT id, body FROM entries WHERE id > ? ORDER BY id LIMIT ?", (position, limit)
+                ).fetchall()
+                if rows:
+                    position = rows[-1][0]
+                    self._db.execute("UPDATE cursor SET position = ? WHERE name = 'read'", (position,))
+                    self._claimed_since_compact += len(rows)
+                    if self._claimed_since_compact >= self.compact_every:
+                        self._db.execute("DELETE FROM entries WHERE id <= ?", (position,))
+                        self._claimed_since_compact = 0
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return [json.loads(body) for _id, body in rows]
+
+    def empty(self) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM entries WHERE id > (SELECT position FROM cursor WHERE name = 'read') LIMIT 1"
+            ).fetchone()
+        return row is None
+
+    def qsize(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM entries WHERE id > (SELECT position FROM cursor WHERE name = 'read')"
+            ).fetchone()[0]
+
+    def peek_all(self) -> list[Dict[str, Any]]:
+        """Read every pending entry WITHOUT claiming it, in arrival order."""
+        return [entry for _id, entry in self.peek_since(None)]
+
+    def peek_since(self, after: Optional[str]) -> list[tuple[str, Dict[str, Any]]]:
+        """Pending ``(id, entry)`` pairs with id greater than *after*, oldest first.
+
+        Ids are assigned under the database write lock, so an entry can never
+        become visible with an id below one already returned.
+        """
+        floor = int(after) if after is not None else 0
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, body FROM entries "
+                "WHERE id > max(?, (SELECT position FROM cursor WHERE name = 'read')) ORDER BY id",
+                (floor,),
+            ).fetchall()
+        out: list[tuple[str, Dict[str, Any]]] = []
+        for item_id, body in rows:
+            try:
+                out.append((f"{item_id:020d}", json.loads(body)))
+            except ValueError:
+                continue
+        return out
+
+    def compact(self) -> int:
+        """Drop claimed entries and spent ``adopted`` names, truncate the WAL; returns the entries removed."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                removed = self._db.execute(
+                    "DELETE FROM entries WHERE id <= (SELECT position FROM cursor WHERE name = 'read')"
+                ).rowcount
+                self._forget_adopted(DurableQueue(self.directory))
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._claimed_since_compact = 0
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
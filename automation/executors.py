@@ -291,7 +291,7 @@ def reconcile_vendored_graph() -> dict:
 import hashlib as _hashlib
 import json as _json
 
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import open_queue, state_dir
 
 
 def _proposal_id(proposal: dict) -> str:
@@ -343,7 +343,7 @@ def propose_pr(*, beacon: dict, proposals_dir: Optional[Path] = None, opener=Non
 
     # Default: durably record the proposal; do not open (no standing creds in the daemon).
     directory = Path(proposals_dir) if proposals_dir is not None else state_dir() / "proposals"
-    DurableQueue(directory).put(
+    open_queue(directory).put(
         {
             "id": pid,
             "proposal": proposal,
@@ -374,7 +374,7 @@ def quarantine(*, beacon: dict, quarantine_dir: Optional[Path] = None) -> dict:
         result["error"] = "beacon has no subject (system) to quarantine"
         return result
     directory = Path(quarantine_dir) if quarantine_dir is not None else state_dir() / "quarantine"
-    DurableQueue(directory).put({
+    open_queue(directory).put({
         "subject": subject,
         "kind_class": beacon.get("kind_class"),
         "reason": (beacon.get("detail") or {}).get("reason") or beacon.get("reason"),
@@ -17,12 +17,31 @@ Integrity across the trust mesh: reconstruction is verified against the leaf's c
 (sha256 — its Merkle commitment). A tampered fragment yields wrong bytes -> a hash mismatch, so a
 lying node is DETECTED; with n>k redundancy the honest quorum simply reconstructs from a fragment
 set that excludes it (proven in the tests + tools/prove_holographic_propagation.py).
+
+Codec path: encoding is the n x k Vandermonde matrix (x_i^j) applied to the leaf's k byte
+columns, and decoding is its k x k inverse for the chosen fragment ids, applied to the k
+fragments. Both matrices depend only on (xs, k), so they are built once and cached; each matrix
+entry c then scales a whole column through a 256-byte multiplication table (``bytes.translate``,
+or a NumPy gather when NumPy is importable) and columns are summed with one big-int / array XOR.
+The scalar ``_eval_poly`` / ``_interpolate_coeffs`` stay as the reference the fast path is
+tested byte-for-byte against (and the inverse matrix is built from the latter).
+
+Streaming: ``disperse_stream`` / ``reconstruct_stream`` run the same codec over fixed-size stripes
+of a file-like object, so a multi-GB leaf is never whole in memory (peak is about
+``stripe_size * (2 + n/k)``). Each stripe is committed by its own sha256 root, and the stripe roots
+by a binary Merkle tree (``stripe_tree_root``), so a reader verifies stripe by stripe as it goes.
 """
 from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:  # optional: vectorized column products; the pure-Python path is byte-identical
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised wherever numpy is absent
+    _np = None
 
 # ── GF(2^8), the AES field (primitive polynomial 0x11b, generator 0x03) ──────────────────────
 _EXP: List[int] = [0] * 512
@@ -92,6 +111,143 @@ def _interpolate_coeffs(xs: Sequence[int], ys: Sequence[int]) -> List[int]:
     return coeffs
 
 
+# ── error location (Berlekamp–Welch) ─────────────────────────────────────────────────────────
+
+def _solve(rows: List[List[int]], rhs: List[int]) -> Optional[List[int]]:
+    """One solution of ``rows · v = rhs`` over GF(256) (free variables = 0), or None if inconsistent."""
+    m = [row[:] + [b] for row, b in zip(rows, rhs)]
+    ncols = len(rows[0]) if rows else 0
+    pivots: List[int] = []
+    r = 0
+    for c in range(ncols):
+        pr = next((i for i in range(r, len(m)) if m[i][c]), None)
+        if pr is None:
+            continue
+        m[r], m[pr] = m[pr], m[r]
+        inv = _inv(m[r][c])
+        m[r] = [_mul(v, inv) for v in m[r]]
+        for i in range(len(m)):
+            if i != r and m[i][c]:
+                f = m[i][c]
+                m[i] = [a ^ _mul(f, b) for a, b in zip(m[i], m[r])]
+        pivots.append(c)
+        r += 1
+    if any(row[-1] for row in m[r:]):
+        return None
+    out = [0] * ncols
+    for i, c in enumerate(pivots):
+        out[c] = m[i][-1]
+    return out
+
+
+def _poly_divmod(num: List[int], den: List[int]) -> tuple:
+    """(quotient, remainder) of num / den over GF(256); coefficients lowest degree first."""
+    num = num[:]
+    while len(den) > 1 and den[-1] == 0:
+        den = den[:-1]
+    dl = len(den) - 1
+    inv_lead = _inv(den[-1])
+    quot = [0] * max(1, len(num) - dl)
+    for i in range(len(num) - 1, dl - 1, -1):
+        coef = _mul(num[i], inv_lead)
+        if coef:
+            quot[i - dl] = coef
+            for j, d in enumerate(den):
+                num[i - dl + j] ^= _mul(coef, d)
+    return quot, num[:dl]
+
+
+def berlekamp_welch(xs: Sequence[int], ys: Sequence[int], k: int) -> Optional[tuple]:
+    """Decode one symbol position with up to ``(len(xs) - k) // 2`` wrong values.
+
+    Solves for a monic error locator E (degree e) and Q (degree < k + e) with
+    ``Q(x_i) = y_i · E(x_i)`` for every point, then P = Q / E. Returns ``(coeffs, error_xs)``:
+    the k data coefficients and the points whose value disagrees with P — or None when the
+    values are not within e errors of any codeword (too many liars at this position).
+    """
+    m = len(xs)
+    e = (m - k) // 2
+    # Unknowns: E_0..E_{e-1} (E_e = 1), then Q_0..Q_{k+e-1}.
+    rows, rhs = [], []
+    for x, y in zip(xs, ys):
+        powers = [1]
+        for _ in range(k + e):
+            powers.append(_mul(powers[-1], x))
+        rows.append([_mul(y, powers[j]) for j in range(e)] + powers[:k + e])   # y·x^j | x^j (xor == -)
+        rhs.append(_mul(y, powers[e]))
+    sol = _solve(rows, rhs)
+    if sol is None:
+        return None
+    locator = sol[:e] + [1]
+    quot, rem = _poly_divmod(sol[e:], locator)
+    if any(rem) or any(quot[k:]):
+        return None
+    coeffs = (quot + [0] * k)[:k]
+    wrong = [x for x, y in zip(xs, ys) if _eval_poly(coeffs, x) != y]
+    if len(wrong) > e:
+        return None
+    return coeffs, wrong
+
+
+# ── column codec: cached matrices + whole-column table lookups ───────────────────────────────
+
+@lru_cache(maxsize=256)
+def _mul_table(c: int) -> bytes:
+    """The 256-byte translate table for multiplication by ``c``."""
+    if c == 0:
+        return bytes(256)
+    lc = _LOG[c]
+    return bytes([0] + [_EXP[lc + _LOG[b]] for b in range(1, 256)])
+
+
+@lru_cache(maxsize=1)
+def _mul_table_np():
+    return _np.frombuffer(b"".join(_mul_table(c) for c in range(256)), dtype=_np.uint8).reshape(256, 256)
+
+
+@lru_cache(maxsize=256)
+def _encode_matrix(xs: Tuple[int, ...], k: int) -> Tuple[Tuple[int, ...], ...]:
+    """Row i is (x_i^0, ..., x_i^(k-1)): fragment i = sum_j x_i^j * column j."""
+    rows = []
+    for x in xs:
+        row, p = [], 1
+        for _ in range(k):
+            row.append(p)
+            p = _mul(p, x)
+        rows.append(tuple(row))
+    return tuple(rows)
+
+
+@lru_cache(maxsize=256)
+def _decode_matrix(xs: Tuple[int, ...]) -> Tuple[Tuple[int, ...], ...]:
+    """Inverse Vandermonde for fragment ids ``xs``: column j = sum_i inv[j][i] * fragment i.
+
+    Column i of the inverse is the interpolation of the i-th unit vector, so this is the
+    reference Lagrange interpolation evaluated once per (xs) instead of once per byte.
+    """
+    k = len(xs)
+    cols = [_interpolate_coeffs(xs, [1 if r == i else 0 for r in range(k)]) for i in range(k)]
+    return tuple(tuple(cols[i][j] for i in range(k)) for j in range(k))
+
+
+def _combine(row: Sequence[int], columns: Sequence[bytes], length: int) -> bytes:
+    """sum_j row[j] * columns[j] over GF(256), each column ``length`` bytes."""
+    if _np is not None:
+        table = _mul_table_np()
+        acc = _np.zeros(length, dtype=_np.uint8)
+        for c, col in zip(row, columns):
+            if c:
+                acc ^= table[c][_np.frombuffer(col, dtype=_np.uint8)]
+        return acc.tobytes()
+    acc_int = 0
+    for c, col in zip(row, columns):
+        if c == 1:
+            acc_int ^= int.from_bytes(col, "little")
+        elif c:
+            acc_int ^= int.from_bytes(col.translate(_mul_table(c)), "little")
+    return acc_int.to_bytes(length, "little")
+
+
 @dataclass(frozen=True)
 class Dispersal:
     k: int
@@ -113,15 +269,20 @@ def disperse(leaf: bytes, k: int, n: int, *, xs: Optional[Sequence[int]] = None)
     points = list(xs) if xs is not None else list(range(1, n + 1))
     if len(points) != n or len(set(points)) != n or any(p == 0 for p in points):
         raise ValueError("xs must be n distinct nonzero points")
+    return Dispersal(k=k, n=n, orig_len=len(leaf), xs=points, fragments=encode_at(leaf, k, points))
+
+
+def encode_at(leaf: bytes, k: int, xs: Sequence[int]) -> Dict[int, bytes]:
+    """The fragments of ``leaf`` (at threshold ``k``) for just the points ``xs`` — any number of
+    them. Readers use it to re-derive what honest fragments must hold once a leaf verifies."""
     pad = (-len(leaf)) % k
-    data = leaf + b"\x00" * pad          # pad to a multiple of k (orig_len restores exact bytes)
-    frags: Dict[int, bytearray] = {x: bytearray() for x in points}
-    for start in range(0, len(data), k):
-        block = data[start:start + k]     # k coefficients of a degree-(k-1) polynomial
-        for x in points:
-            frags[x].append(_eval_poly(block, x))
-    return Dispersal(k=k, n=n, orig_len=len(leaf), xs=points,
-                     fragments={x: bytes(b) for x, b in frags.items()})
+    data = bytes(leaf) + b"\x00" * pad   # pad to a multiple of k (orig_len restores exact bytes)
+    # Block b is the coefficient vector data[b*k : b*k+k], so coefficient j of every block is
+    # the strided column data[j::k]; fragment x is the matrix row for x applied to the columns.
+    length = len(data) // k
+    columns = [data[j::k] for j in range(k)]
+    matrix = _encode_matrix(tuple(xs), k)
+    return {x: _combine(row, columns, length) for x, row in zip(xs, matrix)}
 
 
 def reconstruct(fragments: Dict[int, bytes], k: int, orig_len: int) -> bytes:
@@ -131,8 +292,69 @@ def reconstruct(fragments: Dict[int, bytes], k: int, orig_len: int) -> bytes:
         raise ValueError(f"need {k} fragments to reconstruct; got {len(xs)}")
     xs = xs[:k]
     flen = len(fragments[xs[0]])
-    out = bytearray()
-    for pos in range(flen):
-        ys = [fragments[x][pos] for x in xs]
-        out.extend(_interpolate_coeffs(xs, ys))
+    frags = [bytes(fragments[x][:flen]) for x in xs]
+    if any(len(f) != flen for f in frags):
+        raise ValueError("fragments must all be the same length")
+    out = bytearray(flen * k)
+    for j, row in enumerate(_decode_matrix(tuple(xs))):
+        out[j::k] = _combine(row, frags, flen)   # coefficient j of every block
     return bytes(out[:orig_len])
+
+
+# ── streaming: fixed-size stripes, each its own leaf, committed by a Merkle tree ─────────────
+
+STRIPE_SIZE = 4 << 20
+
+
+def iter_stripes(reader: BinaryIO, stripe_size: int = STRIPE_SIZE) -> Iterator[bytes]:
+    """Consecutive ``stripe_size``-byte reads of ``reader`` (the last may be short; none is empty).
+    Short reads from pipes and sockets are filled before a stripe is yielded."""
+    if stripe_size < 1:
+        raise ValueError("stripe_size must be positive")
+    while True:
+        stripe = reader.read(stripe_size)
+        if not stripe:
+            return
+        while len(stripe) < stripe_size:
+            more = reader.read(stripe_size - len(stripe))
+            if not more:
+                break
+            stripe += more
+        yield bytes(stripe)
+
+
+def stripe_tree_root(stripe_roots: Sequence[str]) -> str:
+    """The binary Merkle root over per-stripe roots, with RFC 6962 leaf/node domain separation (an
+    odd node is promoted a level). Binds the order and the count of the stripes."""
+    level = [hashlib.sha256(b"\x00" + r.encode("ascii")).digest() for r in stripe_roots]
+    if not level:
+        return "merkle:" + hashlib.sha256(b"").hexdigest()
+    while len(level) > 1:
+        nxt = [hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest()
+               for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+    return "merkle:" + level[0].hex()
+
+
+def disperse_stream(reader: BinaryIO, k: int, n: int, *, stripe_size: int = STRIPE_SIZE,
+                    xs: Optional[Sequence[int]] = None) -> Iterator[Tuple[str, Dispersal]]:
+    """Disperse ``reader`` one stripe at a time: yields ``(stripe root, Dispersal)`` per stripe, and
+    holds only the current stripe and its fragments."""
+    for stripe in iter_stripes(reader, stripe_size):
+        yield merkle_root(stripe), disperse(stripe, k, n, xs=xs)
+
+
+def reconstruct_stream(stripes: Iterable[Tuple[Dict[int, bytes], int]], k: int, out: BinaryIO, *,
+                       roots: Optional[Sequence[str]] = None) -> int:
+    """Reconstruct stripe after stripe into ``out`` from ``(fragments, orig_len)`` pairs; with
+    ``roots``, each stripe is checked against its root BEFORE it is written. Returns bytes written."""
+    written = 0
+    for i, (fragments, orig_len) in enumerate(stripes):
+        stripe = reconstruct(fragments, k, orig_len)
+        if roots is not None and merkle_root(stripe) != roots[i]:
+            raise ValueError(f"stripe {i} does not match its committed root")
+        out.write(stripe)
+        written += len(stripe)
+    return written
@@ -16,16 +16,26 @@ Trust properties this path realizes end to end:
                 leaves land with more parity automatically (the effect link #604 closed).
   * CAP READ  — fetch reconstructs from ANY k reachable fragments, so a partition holding a quorum
                 still serves reads (AP), while the write quorum keeps truth un-forked (CP).
-  * BYZANTINE — a corrupted/lying fragment fails the Merkle root; fetch ROUTES AROUND it by trying
-                other k-subsets of the reachable fragments until one reconstructs the committed root.
+  * BYZANTINE — a corrupted/lying fragment fails the Merkle root; fetch LOCATES it with a
+                Berlekamp–Welch decoder, reconstructs from the honest fragments, and reports the
+                liars (``fetch_report``) so mesh_threat can count them as witnessed anomalies.
+
+Large leaves go through ``propagate_stream`` / ``fetch_stream``: the leaf is read from a file-like
+object in fixed-size stripes, each stripe is written as an ordinary leaf the moment it is encoded,
+and the read writes each stripe out as soon as it verifies — memory stays at a few stripes however
+large the leaf. The ``StripedManifest`` commits to the stripe roots with a Merkle tree.
 """
 from __future__ import annotations
 
 import itertools
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence
+from typing import BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple
 
-from automation.holographic_ida import disperse, merkle_root, reconstruct
+from automation.holographic_ida import (
+    STRIPE_SIZE, Dispersal, _eval_poly, berlekamp_welch, disperse, disperse_stream, encode_at,
+    merkle_root, reconstruct, stripe_tree_root,
+)
+from automation.mesh_io import MeshIO
 from automation.mesh_topology import build_tree, leaves
 from automation.storage_placement import load_runtime_placement
 from automation.storage_resilience import Placement
@@ -51,6 +61,16 @@ class IntegrityError(Exception):
     corruption / too many Byzantine fragments to route around)."""
 
 
+@dataclass(frozen=True)
+class FetchReport:
+    """A verified read plus what it witnessed: which fragments (and the nodes that served them)
+    disagreed with the committed leaf. ``liar_nodes`` is what mesh_threat consumes as anomalies."""
+    leaf: bytes
+    liars: List[int]                      # fragment ids whose bytes were not the committed fragment
+    liar_nodes: List[str]                 # the node that served each liar fragment, same order
+    reconstructions: int                  # full reconstructions it took (1 when every fragment is clean)
+
+
 @dataclass(frozen=True)
 class PropagationManifest:
     """Where a leaf's fragments live + how to verify a reconstruction. The manifest itself is small
@@ -84,65 +104,240 @@ def _place(nodes: Sequence[str], xs: Sequence[int], replicas: int) -> Dict[int,
 
 
 def propagate(leaf: bytes, *, nodes: Sequence[str], put: PutFn,
-              placement: Optional[Placement] = None, tier: str = "runtime") -> PropagationManifest:
+              placement: Optional[Placement] = None, tier: str = "runtime",
+              io: Optional[MeshIO] = None, write_quorum: Optional[int] = None) -> PropagationManifest:
     """WRITE a leaf: disperse it at the current (or given) tier and place its fragments on the mesh.
 
     With no explicit ``placement`` the tier is whatever the live threat posture selects
     (``load_runtime_placement``), so an escalation raises the parity AND the shard replication of
     new writes with no code change. Each fragment copy is handed to ``put`` for node-local storage.
     Returns the manifest a reader needs — commitment + placement — and never the leaf bytes.
+
+    With ``io`` (a ``MeshIO``) every copy is written concurrently and the call returns once
+    ``write_quorum`` fragments (default: all n) have at least one acknowledged copy; the other
+    replicas land in the background. A quorum below k would acknowledge an unreadable leaf.
     """
     placement = placement if placement is not None else load_runtime_placement()
     k, n, r = placement.rs_k, placement.rs_n, placement.shard_replicas
+    if write_quorum is not None and not k <= write_quorum <= n:
+        raise ValueError(f"write_quorum must be in {k}..{n}")
     d = disperse(leaf, k, n)
     root = merkle_root(leaf)
     mapping = _place(nodes, d.xs, r)
-    for x, node_list in mapping.items():
-        for node in node_list:
-            put(node, _frag_key(root, x), d.fragments[x])
+    _write(root, d, mapping, put, io, write_quorum)
     return PropagationManifest(root=root, k=k, n=n, orig_len=d.orig_len,
                                tier=tier, replicas=r, fragment_nodes=mapping)
 
 
-def fetch(manifest: PropagationManifest, *, get: GetFn,
-          reachable: Optional[set] = None, max_attempts: int = 500) -> bytes:
+def _write(root: str, d: Dispersal, mapping: Dict[int, List[str]], put: PutFn,
+           io: Optional[MeshIO], write_quorum: Optional[int]) -> None:
+    """Hand every fragment copy of ``d`` to ``put`` — concurrently with ``io``."""
+    if io is not None:
+        io.write([(x, node, _frag_key(root, x), d.fragments[x])
+                  for x, node_list in mapping.items() for node in node_list], put, quorum=write_quorum)
+    else:
+        for x, node_list in mapping.items():
+            for node in node_list:
+                put(node, _frag_key(root, x), d.fragments[x])
+
+
+def _first_difference(a: bytes, b: bytes) -> int:
+    """Index of the first differing byte of two equal-length strings, or -1."""
+    diff = int.from_bytes(a, "little") ^ int.from_bytes(b, "little")
+    return ((diff & -diff).bit_length() - 1) // 8 if diff else -1
+
+
+def fetch_report(manifest: PropagationManifest, *, get: GetFn,
+                 reachable: Optional[set] = None, max_attempts: int = 500,
+                 identify_liars: bool = True, io: Optional[MeshIO] = None) -> FetchReport:
     """READ a leaf: gather a quorum of fragments from reachable nodes and reconstruct, Merkle-verified.
 
     Fail-closed and Byzantine-robust:
       * fewer than k fragments reachable -> LeafUnavailable (a minority partition cannot read).
-      * a reconstruction is returned ONLY if it matches the committed Merkle root; a corrupted
-        fragment yields a wrong root, so fetch tries other k-subsets of the reachable fragments
-        (routing around the liar) until one verifies, or IntegrityError if none does.
-    (The subset search is the simple, correct decoder given the Merkle-root oracle; a production
-    reader would use Berlekamp-Welch RS error correction to locate corrupt fragments directly.)
+      * a reconstruction is returned ONLY if it matches the committed Merkle root. When one does
+        not, the reachable fragments form a Reed-Solomon word with errors: Berlekamp–Welch at a
+        byte position where they disagree names the lying fragments there, and the next
+        reconstruction excludes them. Each round names at least one new liar, so up to
+        (m-k)/2 liars among m reachable fragments cost at most liars+1 reconstructions.
+      * past that bound the decoder cannot locate the liars uniquely; fetch then falls back to
+        trying other k-subsets (at most ``max_attempts``) with the Merkle root as the oracle, and
+        raises IntegrityError if none verifies.
+    Liars are identified by comparing every reachable fragment with the re-encoded verified leaf
+    (skipped with ``identify_liars=False``, which is what plain ``fetch`` does).
+
+    With ``io`` (a ``MeshIO``) the copies are read concurrently — hedged, fastest nodes first — and
+    the read stops once k fragments have arrived. Only if those k do not verify are the remaining
+    fragments fetched for error location, so a clean read names no liars it never read.
     """
     avail: Dict[int, bytes] = {}
-    for x, node_list in manifest.fragment_nodes.items():
-        for node in node_list:                       # a fragment survives if ANY of its copies does
-            if reachable is not None and node not in reachable:
-                continue
-            try:
-                b = get(node, _frag_key(manifest.root, x))
-            except Exception:  # noqa: BLE001 — an errored fetch is an unreachable copy, not a healthy one
-                b = None
-            if b is not None:
-                avail[x] = b
-                break                                # one good copy of this fragment suffices
+    served_by: Dict[int, str] = {}
+    if io is None:
+        for x, node_list in manifest.fragment_nodes.items():
+            for node in node_list:                   # a fragment survives if ANY of its copies does
+                if reachable is not None and node not in reachable:
+                    continue
+                try:
+                    b = get(node, _frag_key(manifest.root, x))
+                except Exception:  # noqa: BLE001 — an errored fetch is an unreachable copy, not a healthy one
+                    b = None
+                if b is not None:
+                    avail[x] = b
+                    served_by[x] = node
+                    break                            # one good copy of this fragment suffices
+        if len(avail) < manifest.k:
+            raise LeafUnavailable(f"{len(avail)} fragments reachable; need {manifest.k}")
+        return _decode(manifest, avail, served_by, max_attempts, identify_liars)
+
+    candidates = {x: [node for node in node_list if reachable is None or node in reachable]
+                  for x, node_list in manifest.fragment_nodes.items()}
+
+    def gather(xs: Sequence[int], need: int) -> None:
+        got = io.gather({x: candidates[x] for x in xs},
+                        lambda node, x: get(node, _frag_key(manifest.root, x)), need)
+        for x, (node, b) in got.items():
+            avail[x] = b
+            served_by[x] = node
+
+    gather(list(candidates), manifest.k)
     if len(avail) < manifest.k:
         raise LeafUnavailable(f"{len(avail)} fragments reachable; need {manifest.k}")
+    rest = [x for x in candidates if x not in avail]
+    try:
+        return _decode(manifest, avail, served_by, max_attempts, identify_liars)
+    except IntegrityError:
+        if not rest:
+            raise
+    gather(rest, len(rest))                          # the quorum lied: widen to every fragment
+    return _decode(manifest, avail, served_by, max_attempts, identify_liars)
 
+
+def _decode(manifest: PropagationManifest, avail: Dict[int, bytes], served_by: Dict[int, str],
+            max_attempts: int, identify_liars: bool) -> FetchReport:
+    """Reconstruct + verify from the gathered fragments (the error-locating half of fetch_report)."""
+    k = manifest.k
     xs = sorted(avail)
-    # Fast path: the full-reachable first-k almost always is clean.
+    flen = len(avail[xs[0]])
+
+    def verified(leaf: bytes, rounds: int, chosen: Sequence[int] = ()) -> FetchReport:
+        if not identify_liars:
+            return FetchReport(leaf=leaf, liars=[], liar_nodes=[], reconstructions=rounds)
+        # The decoded leaf verified, so the fragments it was decoded from are honest except
+        # possibly in the zero padding of the last block; only the rest need re-encoding.
+        rest = [x for x in xs if x not in chosen]
+        clean = encode_at(leaf, k, rest)
+        if chosen and len(leaf) % k:
+            tail = list(leaf[len(leaf) - len(leaf) % k:]) + [0] * (-len(leaf) % k)
+            clean.update({x: avail[x][:-1] + bytes([_eval_poly(tail, x)]) for x in chosen})
+        else:
+            clean.update({x: avail[x] for x in chosen})
+        liars = [x for x in xs if avail[x] != clean[x]]
+        return FetchReport(leaf=leaf, liars=liars, liar_nodes=[served_by[x] for x in liars],
+                           reconstructions=rounds)
+
+    suspects: set = set()
+    rounds = 0
+    if all(len(avail[x]) == flen for x in xs):
+        while len(xs) - len(suspects) >= k:
+            chosen = [x for x in xs if x not in suspects][:k]
+            rec = reconstruct({x: avail[x] for x in chosen}, k, manifest.orig_len)
+            rounds += 1
+            if merkle_root(rec) == manifest.root:
+                return verified(rec, rounds, chosen)
+            # Some chosen fragment lied. Find a byte where an unsuspected fragment disagrees with
+            # the codeword just decoded, and let Berlekamp–Welch name the liars at that byte.
+            encoded = encode_at(rec, k, xs)
+            pos = next((p for p in (_first_difference(avail[x], encoded[x])
+                                    for x in xs if x not in suspects and x not in chosen) if p >= 0), -1)
+            if pos < 0:
+                break
+            located = berlekamp_welch(xs, [avail[x][pos] for x in xs], k)
+            if located is None or set(located[1]) <= suspects:
+                break                                # beyond the unique-decoding radius
+            suspects.update(located[1])
+
     attempts = 0
-    for combo in itertools.combinations(xs, manifest.k):
+    for combo in itertools.combinations(xs, k):
         attempts += 1
         if attempts > max_attempts:
             break
-        rec = reconstruct({x: avail[x] for x in combo}, manifest.k, manifest.orig_len)
+        rec = reconstruct({x: avail[x] for x in combo}, k, manifest.orig_len)
+        rounds += 1
         if merkle_root(rec) == manifest.root:
-            return rec
+            return verified(rec, rounds, combo)
     raise IntegrityError("no reachable k-subset reconstructs the committed root "
-                         f"(tried {attempts} of C({len(xs)},{manifest.k}))")
+                         f"(tried {attempts} of C({len(xs)},{k}) after error location)")
+
+
+def fetch(manifest: PropagationManifest, *, get: GetFn,
+          reachable: Optional[set] = None, max_attempts: int = 500,
+          io: Optional[MeshIO] = None) -> bytes:
+    """READ a leaf (see ``fetch_report``); returns just the verified bytes."""
+    return fetch_report(manifest, get=get, reachable=reachable, max_attempts=max_attempts,
+                        identify_liars=False, io=io).leaf
+
+
+# ── streaming: a large leaf as a sequence of stripe leaves ───────────────────────────────────
+
+@dataclass(frozen=True)
+class StripedManifest:
+    """A leaf written stripe by stripe. Every stripe is an ordinary leaf (fragments keyed by the
+    stripe's own root) at the same k/n and placement; ``root`` is the Merkle tree root over the
+    stripe roots, which is what a reader trusts and every stripe is verified against."""
+    root: str                             # stripe_tree_root of the stripe roots ("merkle:…")
+    k: int
+    n: int
+    orig_len: int
+    tier: str
+    replicas: int
+    fragment_nodes: Dict[int, List[str]]
+    stripe_size: int
+    stripes: List[Tuple[str, int]]        # (stripe root, stripe length), in order
+
+    def stripe(self, i: int) -> PropagationManifest:
+        """Stripe ``i`` as a plain leaf manifest (what ``fetch`` reads)."""
+        root, length = self.stripes[i]
+        return PropagationManifest(root=root, k=self.k, n=self.n, orig_len=length, tier=self.tier,
+                                   replicas=self.replicas, fragment_nodes=self.fragment_nodes)
+
+
+def propagate_stream(reader: BinaryIO, *, nodes: Sequence[str], put: PutFn,
+                     placement: Optional[Placement] = None, tier: str = "runtime",
+                     io: Optional[MeshIO] = None, write_quorum: Optional[int] = None,
+                     stripe_size: int = STRIPE_SIZE) -> StripedManifest:
+    """WRITE a leaf of any size from ``reader``: each ``stripe_size`` stripe is dispersed and its
+    fragments written before the next stripe is read, so uploading starts with the first stripe
+    and at most one stripe and its n fragments are held. The placement is fixed once for the
+    whole leaf; ``io`` / ``write_quorum`` apply per stripe as in ``propagate``."""
+    placement = placement if placement is not None else load_runtime_placement()
+    k, n, r = placement.rs_k, placement.rs_n, placement.shard_replicas
+    if write_quorum is not None and not k <= write_quorum <= n:
+        raise ValueError(f"write_quorum must be in {k}..{n}")
+    mapping = _place(nodes, list(range(1, n + 1)), r)
+    stripes: List[Tuple[str, int]] = []
+    for stripe_root, d in disperse_stream(reader, k, n, stripe_size=stripe_size):
+        _write(stripe_root, d, mapping, put, io, write_quorum)
+        stripes.append((stripe_root, d.orig_len))
+    return StripedManifest(root=stripe_tree_root([s for s, _ in stripes]), k=k, n=n,
+                           orig_len=sum(length for _, length in stripes), tier=tier, replicas=r,
+                           fragment_nodes=mapping, stripe_size=stripe_size, stripes=stripes)
+
+
+def fetch_stream(manifest: StripedManifest, out: BinaryIO, *, get: GetFn,
+                 reachable: Optional[set] = None, max_attempts: int = 500,
+                 io: Optional[MeshIO] = None) -> int:
+    """READ a striped leaf into ``out``, stripe by stripe: each stripe is fetched (quorum, error
+    location, Merkle check — see ``fetch_report``) and written only once it verifies. The stripe
+    list is checked against ``manifest.root`` before any fragment is read. Raises as ``fetch``
+    does, after the stripes before the failing one have been written. Returns bytes written."""
+    if stripe_tree_root([s for s, _ in manifest.stripes]) != manifest.root:
+        raise IntegrityError(f"stripe list does not hash to {manifest.root}")
+    written = 0
+    for i in range(len(manifest.stripes)):
+        stripe = fetch(manifest.stripe(i), get=get, reachable=reachable, max_attempts=max_attempts,
+                       io=io)
+        out.write(stripe)
+        written += len(stripe)
+    return written
 
 
 def in_memory_store() -> tuple:
@@ -19,7 +19,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional
 
-from automation.durable_queue import DurableQueue, state_dir
+from automation import decision_aggregate
+from automation.durable_queue import open_queue, state_dir
 from automation.policy import VERDICTS, ResponsePolicy, load_policy
 
 DEFAULT_MIN_SAMPLES = 10          # need enough attempts before recommending a change
@@ -35,29 +36,19 @@ def _demote(law: str) -> Optional[str]:
     return VERDICTS[idx - 1] if idx > 0 else None
 
 
-def _outcomes_by_kind(decisions: List[dict]) -> dict:
-    """Per class: attempts (an executor ran) and failures (it did not resolve)."""
-    stats: dict = {}
-    for r in decisions:
-        ex = r.get("execution")
-        if not ex:
-            continue  # no executor ran (pure decision) — not an outcome to learn from
-        kind = str(r.get("beacon_kind", "unknown"))
-        s = stats.setdefault(kind, {"attempts": 0, "failures": 0})
-        s["attempts"] += 1
-        if not (ex.get("healed") or ex.get("proposed") or ex.get("quarantined")):
-            s["failures"] += 1
-    return stats
-
-
 def analyze(state: Optional[Path] = None, *, policy: Optional[ResponsePolicy] = None,
             min_samples: int = DEFAULT_MIN_SAMPLES,
             failure_threshold: float = DEFAULT_FAILURE_THRESHOLD) -> List[dict]:
-    """Return safe demotion recommendations from the receipt stream. Does not mutate anything."""
+    """Return safe demotion recommendations from the receipt stream.
+
+    Never touches governance or the queues. It does advance the shared
+    decision-aggregate checkpoint (see ``decision_aggregate.update``), folding in
+    receipts telemetry has not yet seen, exactly as a telemetry scrape would.
+    """
     root = Path(state) if state is not None else state_dir()
     policy = policy or load_policy()
-    decisions = DurableQueue(root / "decisions").peek_all()
-    stats = _outcomes_by_kind(decisions)
+    # Per-class attempts/failures, folded incrementally alongside telemetry's counters.
+    stats = decision_aggregate.update(root)["outcomes_by_kind"]
 
     recs: List[dict] = []
     for kind, s in sorted(stats.items()):
@@ -93,9 +84,8 @@ def run_once(state: Optional[Path] = None, **kw) -> List[dict]:
     root = Path(state) if state is not None else state_dir()
     recs = analyze(root, **kw)
     if recs:
-        sink = DurableQueue(root / "policy-recommendations")
-        for rec in recs:
-            sink.put(rec)
+        with open_queue(root / "policy-recommendations") as sink:
+            sink.put_many(recs)
     return recs
 
 
@@ -18,7 +18,8 @@ import hashlib
 import json
 from typing import Callable, List, Optional, Sequence
 
-from automation.leaf_propagation import PropagationManifest
+from automation.holographic_ida import stripe_tree_root
+from automation.leaf_propagation import PropagationManifest, StripedManifest
 
 # put_blob(node, key, bytes) -> None ; get_blob(node, key) -> bytes | None
 PutBlob = Callable[[str, str, bytes], None]
@@ -91,3 +92,55 @@ def resolve_manifest(root: str, *, nodes: Sequence[str], get_blob: GetBlob,
             continue  # this node served a manifest for a DIFFERENT root — reject, try the next
         return m
     raise ManifestUnavailable(f"manifest for {root} not reachable on any of its {replicas} replicas")
+
+
+# ── striped manifests (leaf_propagation.propagate_stream) ─────────────────────────────────────
+
+def _stripes_key(root: str) -> str:
+    return f"stripes:{root}"
+
+
+def publish_striped_manifest(manifest: StripedManifest, *, nodes: Sequence[str], put_blob: PutBlob,
+                             replicas: int = 3) -> List[str]:
+    """Replicate a striped manifest to its ``replicas`` deterministic nodes. Returns the targets."""
+    blob = json.dumps({
+        "root": manifest.root, "k": manifest.k, "n": manifest.n, "orig_len": manifest.orig_len,
+        "tier": manifest.tier, "replicas": manifest.replicas, "stripe_size": manifest.stripe_size,
+        "fragment_nodes": {str(x): list(nl) for x, nl in manifest.fragment_nodes.items()},
+        "stripes": [list(s) for s in manifest.stripes],
+    }, sort_keys=True).encode("utf-8")
+    targets = manifest_nodes(manifest.root, nodes, replicas)
+    for node in targets:
+        put_blob(node, _stripes_key(manifest.root), blob)
+    return targets
+
+
+def resolve_striped_manifest(root: str, *, nodes: Sequence[str], get_blob: GetBlob,
+                             replicas: int = 3, reachable: Optional[set] = None) -> StripedManifest:
+    """The striped manifest for ``root`` from any reachable replica whose stripe list hashes to
+    ``root`` — a replica serving another leaf's list, or a doctored one, is skipped. Raises
+    ManifestUnavailable when none does."""
+    for node in manifest_nodes(root, nodes, replicas):
+        if reachable is not None and node not in reachable:
+            continue
+        try:
+            blob = get_blob(node, _stripes_key(root))
+        except Exception:  # noqa: BLE001 — an errored read is an unreachable replica, not absence of proof
+            blob = None
+        if blob is None:
+            continue
+        try:
+            d = json.loads(blob)
+            stripes = [(str(r), int(length)) for r, length in d["stripes"]]
+            m = StripedManifest(
+                root=d["root"], k=int(d["k"]), n=int(d["n"]), orig_len=int(d["orig_len"]),
+                tier=d["tier"], replicas=int(d["replicas"]), stripe_size=int(d["stripe_size"]),
+                fragment_nodes={int(x): list(nl) for x, nl in d["fragment_nodes"].items()},
+                stripes=stripes,
+            )
+        except (ValueError, KeyError, TypeError):
+            continue
+        if m.root != root or stripe_tree_root([r for r, _ in stripes]) != root:
+            continue
+        return m
+    raise ManifestUnavailable(f"striped manifest for {root} not reachable on any of its {replicas} replicas")
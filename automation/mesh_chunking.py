@@ -0,0 +1,94 @@
+"""Content-defined chunking for mesh leaves — edits re-upload what changed, duplicates are stored once.
+
+A Drive file used to be ONE leaf: change a byte of a 200 MB artifact and all of it was re-dispersed;
+store the same file under two paths and it was dispersed twice. Splitting files at fixed offsets
+does not help — an insertion shifts every later boundary. This cuts where the CONTENT says to: a
+Gear rolling hash (FastCDC, Xia et al., USENIX ATC '16) runs over the bytes and a boundary falls
+wherever the hash's top bits are zero, so boundaries move with the content and an edit disturbs
+only the chunks around it.
+
+FastCDC's refinements, all kept here:
+  * cut-point skipping — no boundary is looked for in the first ``min_size`` bytes of a chunk;
+  * normalized chunking — a stricter mask (more bits) before ``avg_size`` and a looser one after,
+    which pulls chunk sizes toward the average;
+  * a hard ``max_size`` cut.
+
+Each chunk is then an ordinary content-addressed leaf (its root is its sha256), dispersed and
+Merkle-verified like any other; mesh_sync stores a file as the ordered list of its chunk roots.
+The Gear table is derived from sha256, so every device cuts identical bytes identically — the
+property cross-device deduplication depends on. Pure Python, a few MB/s per core — the same order
+as the Reed-Solomon dispersal each chunk then goes through.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import List
+
+_M64 = (1 << 64) - 1
+_GEAR = [int.from_bytes(hashlib.sha256(b"sociosphere-gear" + bytes([i])).digest()[:8], "big")
+         for i in range(256)]
+
+
+def _top_mask(bits: int) -> int:
+    """``bits`` one-bits at the top of a 64-bit word (the Gear hash's best-mixed bits)."""
+    return ((1 << bits) - 1) << (64 - bits)
+
+
+class Chunker:
+    """FastCDC chunk boundaries for one (min, avg, max) size policy. ``avg_size`` is a power of two."""
+
+    def __init__(self, min_size: int = 16 * 1024, avg_size: int = 64 * 1024,
+                 max_size: int = 256 * 1024):
+        if not 0 < min_size <= avg_size <= max_size:
+            raise ValueError("require 0 < min_size <= avg_size <= max_size")
+        if avg_size & (avg_size - 1):
+            raise ValueError("avg_size must be a power of two")
+        self.min_size, self.avg_size, self.max_size = min_size, avg_size, max_size
+        bits = avg_size.bit_length() - 1
+        self.mask_s = _top_mask(bits + 2)          # before avg_size: harder to cut
+        self.mask_l = _top_mask(max(1, bits - 2))  # after avg_size: easier to cut
+
+    def _cut(self, data: bytes, start: int, end: int) -> int:
+        """End offset of the chunk that starts at ``start``."""
+        if end - start <= self.min_size:
+            return end
+        stop = min(start + self.max_size, end)
+        norm = min(start + self.avg_size, stop)
+        gear, mask_s, mask_l = _GEAR, self.mask_s, self.mask_l
+        h = 0
+        i = start + self.min_size
+        while i < norm:
+            h = ((h << 1) + gear[data[i]]) & _M64
+            if not h & mask_s:
+                return i + 1
+            i += 1
+        while i < stop:
+            h = ((h << 1) + gear[data[i]]) & _M64
+            if not h & mask_l:
+                return i + 1
+            i += 1
+        return stop
+
+    def boundaries(self, data: bytes) -> List[int]:
+        """Chunk end offsets, ascending; the last is ``len(data)`` (empty data: ``[]``)."""
+        out: List[int] = []
+        start, end = 0, len(data)
+        while start < end:
+            start = self._cut(data, start, end)
+            out.append(start)
+        return out
+
+    def split(self, data: bytes) -> List[bytes]:
+        """``data`` as its content-defined chunks (an empty input is one empty chunk)."""
+        if not data:
+            return [data]
+        view = memoryview(data)
+        out: List[bytes] = []
+        start = 0
+        for end in self.boundaries(data):
+            out.append(bytes(view[start:end]))
+            start = end
+        return out
+
+
+DEFAULT_CHUNKER = Chunker()
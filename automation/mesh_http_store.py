@@ -10,49 +10,168 @@ different implementation of it.
 Seizure / partition is modelled exactly as it happens: a node whose server is down or unroutable
 raises on connect, which the client turns into ``None`` on read — an unreachable fragment, never a
 healthy one. Writes fail loud (the writer must know a node rejected its fragment). Stdlib only
-(urllib, http.server, threading) — no dependency, works on any silicon.
+(http.client, http.server, threading) — no dependency, works on any silicon.
+
+Throughput: the client keeps a pool of HTTP/1.1 keep-alive connections per node, so a Drive push
+costs a handful of TCP handshakes rather than one per fragment. On top of the single-key routes a
+node serves ``POST /batch/put`` and ``POST /batch/get`` (many keys per round trip, framed with
+``_pack``); ``put_many`` / ``get_many`` (and the blob twins) use them, and ``batching()`` turns plain
+fragment ``put`` calls into batch writes. ``put_stream`` / ``get_stream`` move a large fragment in
+``CHUNK``-sized pieces from a file object to a file object without holding it in client memory.
 """
 from __future__ import annotations
 
+import socket
+import struct
+import sys
 import threading
+from contextlib import contextmanager
+from http.client import BadStatusLine, HTTPConnection, HTTPException, HTTPResponse
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Dict, Optional, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.parse import quote
-from urllib.request import Request, urlopen
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.error import HTTPError
+from urllib.parse import quote, urlsplit
+
+CHUNK = 64 * 1024                      # streaming unit for bodies, both directions
+
+_KEY_LEN = struct.Struct(">I")
+_DATA_LEN = struct.Struct(">q")        # -1 marks an absent key in a batch-get answer
+
+
+def _pack(items: Iterable[Tuple[str, Optional[bytes]]]) -> bytes:
+    """Frame ``(key, data)`` pairs for the batch routes: key length, key, data length, data."""
+    out = bytearray()
+    for key, data in items:
+        k = key.encode("utf-8")
+        out += _KEY_LEN.pack(len(k)) + k + _DATA_LEN.pack(-1 if data is None else len(data))
+        if data:
+            out += data
+    return bytes(out)
+
+
+def _unpack(buf: bytes) -> List[Tuple[str, Optional[bytes]]]:
+    view = memoryview(buf)
+    out: List[Tuple[str, Optional[bytes]]] = []
+    pos = 0
+    try:
+        while pos < len(view):
+            (klen,) = _KEY_LEN.unpack_from(view, pos)
+            key = bytes(view[pos + 4:pos + 4 + klen]).decode("utf-8")
+            pos += 4 + klen
+            (dlen,) = _DATA_LEN.unpack_from(view, pos)
+            pos += 8
+            if dlen < 0:
+                out.append((key, None))
+                continue
+            if pos + dlen > len(view):
+                raise ValueError("truncated batch frame")
+            out.append((key, bytes(view[pos:pos + dlen])))
+            pos += dlen
+    except struct.error as e:
+        raise ValueError(f"truncated batch frame: {e}") from None
+    return out
 
 
 # ── the node server: a tiny key/value HTTP face over an injected backend ─────────────────────
 class _NodeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # keep-alive: one connection carries many requests
+    disable_nagle_algorithm = True      # headers and body are separate writes; don't wait on an ACK
+
     def _key(self) -> str:
         return self.path  # e.g. /frag/3 or /blob/<quoted>
 
-    def do_PUT(self) -> None:
+    def _body(self) -> bytes:
         length = int(self.headers.get("Content-Length", 0) or 0)
-        data = self.rfile.read(length)
-        self.server.kv[self._key()] = data  # type: ignore[attr-defined]
-        self.send_response(204)
+        buf = bytearray()
+        while len(buf) < length:
+            chunk = self.rfile.read(min(CHUNK, length - len(buf)))
+            if not chunk:
+                raise ConnectionError("client closed the connection mid-body")
+            buf += chunk
+        return bytes(buf)
+
+    def _reply(self, code: int, data: bytes = b"") -> None:
+        self.send_response(code)
+        self.send_header("Content-Length", str(len(data)))
         self.end_headers()
+        view = memoryview(data)
+        for i in range(0, len(view), CHUNK):
+            self.wfile.write(view[i:i + CHUNK])
+
+    def do_PUT(self) -> None:
+        data = self._body()
+        self.server.kv[self._key()] = data  # type: ignore[attr-defined]
+        self._reply(204)
 
     def do_GET(self) -> None:
         data = self.server.kv.get(self._key())  # type: ignore[attr-defined]
         if data is None:
-            self.send_response(404)
-            self.end_headers()
+            self._reply(404)
             return
-        self.send_response(200)
-        self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
+        self._reply(200, data)
+
+    def do_POST(self) -> None:
+        kv = self.server.kv  # type: ignore[attr-defined]
+        try:
+            items = _unpack(self._body())
+        except ValueError:
+            self._reply(400)
+            return
+        if self.path == "/batch/put":
+            for key, data in items:
+                if data is not None:
+                    kv[key] = data
+            self._reply(204)
+        elif self.path == "/batch/get":
+            self._reply(200, _pack((key, kv.get(key)) for key, _ in items))
+        else:
+            self._reply(404)
 
     def log_message(self, *args) -> None:  # keep tests/servers quiet
         pass
 
 
+class _NodeServer(ThreadingHTTPServer):
+    """Tracks open connections so ``shutdown`` also drops the keep-alive ones a client is pooling —
+    otherwise a "seized" node would keep answering on connections opened before the seizure."""
+
+    daemon_threads = True
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._open: set = set()
+        self._open_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._open_lock:
+            self._open.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request):
+        with self._open_lock:
+            self._open.discard(request)
+        super().shutdown_request(request)
+
+    def handle_error(self, request, client_address) -> None:
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return                     # a client dropping an idle keep-alive connection is routine
+        super().handle_error(request, client_address)
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        with self._open_lock:
+            live = list(self._open)
+        for sock in live:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
 def make_node_server(kv: Optional[Dict[str, bytes]] = None) -> Tuple[ThreadingHTTPServer, str]:
     """Start a node's HTTP store on 127.0.0.1:<ephemeral> in a daemon thread. Returns (server, url).
     Call ``server.shutdown()`` to model that node being seized / partitioned away."""
-    srv = ThreadingHTTPServer(("127.0.0.1", 0), _NodeHandler)
+    srv = _NodeServer(("127.0.0.1", 0), _NodeHandler)
     srv.kv = kv if kv is not None else {}      # type: ignore[attr-defined]
     threading.Thread(target=srv.serve_forever, daemon=True).start()
     host, port = srv.server_address
@@ -60,39 +179,299 @@ def make_node_server(kv: Optional[Dict[str, bytes]] = None) -> Tuple[ThreadingHT
 
 
 # ── the client: the put/get/put_blob/get_blob seams over HTTP ────────────────────────────────
+class _ConnectionPool:
+    """Idle keep-alive connections to one node, most recently used first (at most ``max_idle``)."""
+
+    def __init__(self, url: str, timeout: float, max_idle: int):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: List[HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Tuple[HTTPConnection, bool]:
+        """A connection, and whether it is a reused one (which the node may have closed since)."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return HTTPConnection(self.host, self.port, timeout=self.timeout, blocksize=CHUNK), False
+
+    def release(self, conn: HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
 class MeshHttpStore:
     """Reaches each node at ``node_urls[node]``. Unknown/unreachable node on read -> None."""
 
-    def __init__(self, node_urls: Dict[str, str], *, timeout: float = 3.0):
+    def __init__(self, node_urls: Dict[str, str], *, timeout: float = 3.0, max_idle: int = 8,
+                 max_batch_bytes: int = 8 << 20, max_batch_keys: int = 1024):
         self.node_urls = dict(node_urls)
         self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_keys = max_batch_keys
+        self._pools: Dict[str, _ConnectionPool] = {}
+        self._lock = threading.Lock()
+        self._pending: Optional[Dict[str, Dict[str, bytes]]] = None   # batching(): node -> path -> data
+
+    def close(self) -> None:
+        """Close every pooled connection (the store stays usable; it reconnects on demand)."""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
 
-    def _put(self, url: str, data: bytes) -> None:
-        req = Request(url, data=data, method="PUT")
-        with urlopen(req, timeout=self.timeout):  # noqa: S310 — trusted internal mesh URLs
-            pass
+    # ── one request over a pooled connection ────────────────────────────────────────────────
+    def _pool(self, node: str) -> _ConnectionPool:
+        with self._lock:
+            pool = self._pools.get(node)
+            if pool is None:
+                pool = self._pools[node] = _ConnectionPool(self.node_urls[node], self.timeout,
+                                                           self.max_idle)
+            return pool
 
-    def _get(self, url: str) -> Optional[bytes]:
+    def _send(self, node: str, method: str, path: str, body=None,
+              headers: Optional[Dict[str, str]] = None) -> Tuple[_ConnectionPool, HTTPConnection, HTTPResponse]:
+        pool = self._pool(node)
+        retry = not hasattr(body, "read")            # a half-sent stream cannot be replayed
+        while True:
+            conn, reused = pool.acquire()
+            try:
+                conn.request(method, pool.prefix + path, body=body, headers=headers or {})
+                return pool, conn, conn.getresponse()
+            except (ConnectionError, BadStatusLine):
+                conn.close()
+                if not (reused and retry):
+                    raise
+                # the node closed an idle keep-alive connection; one retry on a fresh one
+                retry = False
+            except (OSError, HTTPException):
+                conn.close()
+                raise
+
+    @staticmethod
+    def _done(pool: _ConnectionPool, conn: HTTPConnection, resp: HTTPResponse) -> None:
+        if resp.will_close:
+            conn.close()
+        else:
+            pool.release(conn)
+
+    def _request(self, node: str, method: str, path: str, body=None,
+                 headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+        pool, conn, resp = self._send(node, method, path, body, headers)
         try:
-            with urlopen(url, timeout=self.timeout) as resp:  # noqa: S310
-                return resp.read()
-        except HTTPError as e:
-            if e.code == 404:
-                return None            # absent fragment on a reachable node
+            data = resp.read()
+        except (OSError, HTTPException):
+            conn.close()
             raise
-        except (URLError, OSError):
+        self._done(pool, conn, resp)
+        return resp.status, data
+
+    def _error(self, node: str, path: str, status: int) -> HTTPError:
+        return HTTPError(f"{self.node_urls[node]}{path}", status, f"node answered {status}", None, None)  # type: ignore[arg-type]
+
+    def _put(self, node: str, path: str, data: bytes) -> None:
+        status, _ = self._request(node, "PUT", path, data)
+        if not 200 <= status < 300:
+            raise self._error(node, path, status)
+
+    def _get(self, node: str, path: str) -> Optional[bytes]:
+        if node not in self.node_urls:
+            return None
+        try:
+            status, data = self._request(node, "GET", path)
+        except (OSError, HTTPException):
             return None                # node down / partitioned -> unreachable, not healthy
+        if status == 404:
+            return None                # absent fragment on a reachable node
+        if status != 200:
+            raise self._error(node, path, status)
+        return data
+
+    @staticmethod
+    def _frag_path(frag) -> str:
+        return f"/frag/{quote(str(frag), safe='')}"
+
+    @staticmethod
+    def _blob_path(key: str) -> str:
+        return f"/blob/{quote(key, safe='')}"
 
+    # ── the seams ───────────────────────────────────────────────────────────────────────────
     def put(self, node: str, frag, data: bytes) -> None:
-        self._put(f"{self.node_urls[node]}/frag/{quote(str(frag), safe='')}", data)
+        path = self._frag_path(frag)
+        if self._pending is not None:
+            self.node_urls[node]                       # unknown node: fail loud now, not at flush
+            with self._lock:
+                pending = self._pending
+                if pending is not None:
+                    queued = pending.setdefault(node, {})
+                    queued[path] = data
+                    full = (len(queued) >= self.max_batch_keys
+                            or sum(map(len, queued.values())) >= self.max_batch_bytes)
+                    if full:
+                        del pending[node]
+                    else:
+                        return
+            if pending is not None:
+                self._put_batch(node, queued)
+                return
+        self._put(node, path, data)
 
     def get(self, node: str, frag) -> Optional[bytes]:
-        base = self.node_urls.get(node)
-        return None if base is None else self._get(f"{base}/frag/{quote(str(frag), safe='')}")
+        path = self._frag_path(frag)
+        if self._pending is not None:
+            with self._lock:
+                queued = (self._pending or {}).get(node, {}).get(path)
+            if queued is not None:
+                return queued                          # read-your-writes inside batching()
+        return self._get(node, path)
 
     def put_blob(self, node: str, key: str, data: bytes) -> None:
-        self._put(f"{self.node_urls[node]}/blob/{quote(key, safe='')}", data)
+        self._put(node, self._blob_path(key), data)
 
     def get_blob(self, node: str, key: str) -> Optional[bytes]:
-        base = self.node_urls.get(node)
-        return None if base is None else self._get(f"{base}/blob/{quote(key, safe='')}")
+        return self._get(node, self._blob_path(key))
+
+    # ── batch routes: many keys per round trip ──────────────────────────────────────────────
+    def _batches(self, items: Sequence[Tuple[str, Optional[bytes]]]) -> Iterator[List[Tuple[str, Optional[bytes]]]]:
+        batch: List[Tuple[str, Optional[bytes]]] = []
+        size = 0
+        for item in items:
+            batch.append(item)
+            size += len(item[1] or b"")
+            if len(batch) >= self.max_batch_keys or size >= self.max_batch_bytes:
+                yield batch
+                batch, size = [], 0
+        if batch:
+            yield batch
+
+    def _put_batch(self, node: str, items: Dict[str, bytes]) -> None:
+        for batch in self._batches(list(items.items())):
+            status, _ = self._request(node, "POST", "/batch/put", _pack(batch))
+            if not 200 <= status < 300:
+                raise self._error(node, "/batch/put", status)
+
+    def _get_batch(self, node: str, paths: Sequence[str]) -> Dict[str, Optional[bytes]]:
+        out: Dict[str, Optional[bytes]] = {path: None for path in paths}
+        if node not in self.node_urls:
+            return out
+        for batch in self._batches([(path, None) for path in paths]):
+            try:
+                status, data = self._request(node, "POST", "/batch/get", _pack(batch))
+            except (OSError, HTTPException):
+                return out                             # unreachable: every key absent
+            if status != 200:
+                raise self._error(node, "/batch/get", status)
+            out.update(_unpack(data))
+        return out
+
+    def put_many(self, node: str, items: Dict[object, bytes]) -> None:
+        """Write several fragments to one node in as few round trips as the batch limits allow."""
+        self._put_batch(node, {self._frag_path(frag): data for frag, data in items.items()})
+
+    def get_many(self, node: str, frags: Sequence[object]) -> Dict[object, Optional[bytes]]:
+        """Read several fragments from one node; absent (or unreachable) fragments map to None."""
+        paths = {self._frag_path(frag): frag for frag in frags}
+        return {paths[p]: data for p, data in self._get_batch(node, list(paths)).items()}
+
+    def put_blobs(self, node: str, items: Dict[str, bytes]) -> None:
+        self._put_batch(node, {self._blob_path(key): data for key, data in items.items()})
+
+    def get_blobs(self, node: str, keys: Sequence[str]) -> Dict[str, Optional[bytes]]:
+        paths = {self._blob_path(key): key for key in keys}
+        return {paths[p]: data for p, data in self._get_batch(node, list(paths)).items()}
+
+    @contextmanager
+    def batching(self) -> Iterator["MeshHttpStore"]:
+        """Queue fragment ``put`` calls per node and send them through ``/batch/put`` — when a node's
+        queue reaches the batch limits, at each ``flush_pending()``, and for everything left on exit.
+        Fragment reads see queued writes; blobs are not deferred (manifests and refs are read back by
+        other writers), so a writer must ``flush_pending()`` before publishing anything that points
+        at queued fragments. A node rejecting a deferred write raises at the flush, so the block as a
+        whole still fails loud."""
+        if self._pending is not None:
+            yield self                                 # already batching: join the outer block
+            return
+        self._pending = {}
+        try:
+            yield self
+        finally:
+            with self._lock:
+                pending, self._pending = self._pending, None
+            self._send_pending(pending)
+
+    def flush_pending(self) -> None:
+        """Send every fragment ``put`` queued by ``batching()`` now, and return only once each node
+        has acknowledged its batch. Every node is tried; the first rejection is then raised (the
+        rejected fragments are not re-queued — the write they belong to has failed). Batching stays
+        on. A no-op outside ``batching()``."""
+        with self._lock:
+            if self._pending is None:
+                return
+            pending, self._pending = self._pending, {}
+        self._send_pending(pending)
+
+    def _send_pending(self, pending: Dict[str, Dict[str, bytes]]) -> None:
+        first: Optional[BaseException] = None
+        for node, items in pending.items():
+            try:
+                self._put_batch(node, items)
+            except Exception as exc:  # noqa: BLE001 — flush the other nodes, then fail loud
+                first = first or exc
+        if first is not None:
+            raise first
+
+    # ── streaming: large fragments without holding them in client memory ────────────────────
+    def put_stream(self, node: str, frag, stream: BinaryIO, length: int) -> None:
+        """PUT ``length`` bytes read from ``stream`` as fragment ``frag``, sent ``CHUNK`` at a time."""
+        path = self._frag_path(frag)
+        pool, conn, resp = self._send(node, "PUT", path, stream, {"Content-Length": str(length)})
+        try:
+            resp.read()
+        except (OSError, HTTPException):
+            conn.close()
+            raise
+        self._done(pool, conn, resp)
+        if not 200 <= resp.status < 300:
+            raise self._error(node, path, resp.status)
+
+    def get_stream(self, node: str, frag, sink: BinaryIO) -> bool:
+        """Copy fragment ``frag`` into ``sink`` ``CHUNK`` at a time. False when absent or unreachable
+        (``sink`` untouched); a connection lost mid-body raises, as ``sink`` is then partial."""
+        if node not in self.node_urls:
+            return False
+        path = self._frag_path(frag)
+        try:
+            pool, conn, resp = self._send(node, "GET", path)
+        except (OSError, HTTPException):
+            return False
+        if resp.status != 200:
+            resp.read()
+            self._done(pool, conn, resp)
+            if resp.status == 404:
+                return False
+            raise self._error(node, path, resp.status)
+        try:
+            while True:
+                chunk = resp.read(CHUNK)
+                if not chunk:
+                    break
+                sink.write(chunk)
+        except (OSError, HTTPException):
+            conn.close()
+            raise
+        self._done(pool, conn, resp)
+        return True
@@ -0,0 +1,175 @@
+"""The Drive's directory listing as a sharded, append-only index — O(batch) per write, not O(Drive).
+
+mesh_sync used to keep the listing in ONE replicated blob (``__index__``): every ``put_file`` read
+the whole path list from each replica, added one path and rewrote all of it, so pushing N files
+moved O(N²) bytes of index. This splits the listing by a hash of the path into ``shards`` shards,
+each made of two replicated blobs under their own rendezvous nodes:
+
+  * ``__index__/NNNN``      — the BASE segment: the shard's compacted, sorted path list;
+  * ``__index__/NNNN.log``  — the DELTA log: paths added since the last compaction.
+
+A write appends only to the logs of the shards it touches (bounded by ``compact_at`` paths); when
+a log reaches ``compact_at`` it is folded into its base and emptied. A small ROOT manifest
+(``__index__.root``) records the shard count and which shards are in use, so a listing reads only
+live shards. ``add_paths`` takes a whole batch, so mesh_sync.put_files updates each touched shard
+once per batch instead of the whole index once per file.
+
+Semantics are unchanged: the listing is a grow-only set, every blob is merged as the UNION of its
+reachable replicas, and the per-path last-writer-wins ref (mesh_namespace) stays the authority for
+what a path currently holds — the index only says which names exist. A mesh written before the
+index was sharded keeps its legacy ``__index__`` list; the first sharded write folds it in.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from automation.mesh_namespace import publish_blob, read_all
+
+LEGACY_INDEX = "__index__"
+INDEX_ROOT = "__index__.root"
+DEFAULT_SHARDS = 64
+COMPACT_AT = 256            # delta-log paths per shard before it is folded into the base segment
+
+
+def shard_of(path: str, shards: int) -> int:
+    return int.from_bytes(hashlib.sha256(path.encode("utf-8")).digest()[:4], "big") % shards
+
+
+def _segment(shard: int) -> str:
+    return f"{LEGACY_INDEX}/{shard:04d}"
+
+
+def _log(shard: int) -> str:
+    return f"{LEGACY_INDEX}/{shard:04d}.log"
+
+
+def _read_set(store, name: str, nodes: Sequence[str], replicas: int,
+              reachable: Optional[set] = None) -> Set[str]:
+    """The union of every reachable replica's JSON path list for ``name``."""
+    paths: Set[str] = set()
+    for b in read_all(name, nodes=nodes, get_blob=store.get_blob, replicas=replicas, reachable=reachable):
+        try:
+            paths |= set(json.loads(b))
+        except (ValueError, TypeError):
+            continue
+    return paths
+
+
+def _write_set(store, name: str, paths: Iterable[str], nodes: Sequence[str], replicas: int) -> None:
+    publish_blob(name, json.dumps(sorted(paths)).encode("utf-8"),
+                 nodes=nodes, put_blob=store.put_blob, replicas=replicas)
+
+
+def read_root(store, nodes: Sequence[str], replicas: int,
+              reachable: Optional[set] = None) -> Optional[dict]:
+    """The merged root manifest — ``{"shards", "used", "migrated"}`` — or None on an unsharded mesh.
+    Replicas merge by union of ``used`` and OR of ``migrated``; the shard count is fixed at creation."""
+    root: Optional[dict] = None
+    for b in read_all(INDEX_ROOT, nodes=nodes, get_blob=store.get_blob, replicas=replicas,
+                      reachable=reachable):
+        try:
+            d = json.loads(b)
+            shards, used, migrated = int(d["shards"]), set(d["used"]), bool(d["migrated"])
+        except (ValueError, TypeError, KeyError):
+            continue
+        if root is None:
+            root = {"shards": shards, "used": used, "migrated": migrated}
+        elif shards == root["shards"]:
+            root["used"] |= used
+            root["migrated"] = root["migrated"] or migrated
+    return root
+
+
+def _write_root(store, root: dict, nodes: Sequence[str], replicas: int) -> None:
+    blob = json.dumps({"shards": root["shards"], "used": sorted(root["used"]),
+                       "migrated": root["migrated"]}, sort_keys=True).encode("utf-8")
+    publish_blob(INDEX_ROOT, blob, nodes=nodes, put_blob=store.put_blob, replicas=replicas)
+
+
+def list_paths(store, nodes: Sequence[str], *, replicas: int = 5,
+               reachable: Optional[set] = None) -> Set[str]:
+    """Every indexed path: base ∪ log of each live shard (plus the legacy list until migrated)."""
+    root = read_root(store, nodes, replicas, reachable)
+    if root is None or not root["migrated"]:
+        paths = _read_set(store, LEGACY_INDEX, nodes, replicas, reachable)
+    else:
+        paths = set()
+    if root is not None:
+        for shard in sorted(root["used"]):
+            paths |= _read_set(store, _segment(shard), nodes, replicas, reachable)
+            paths |= _read_set(store, _log(shard), nodes, replicas, reachable)
+    return paths
+
+
+def add_paths(store, nodes: Sequence[str], paths: Iterable[str], *, replicas: int = 5,
+              shards: int = DEFAULT_SHARDS, compact_at: int = COMPACT_AT) -> int:
+    """Index a batch of paths: one log append per touched shard. Returns how many were new.
+
+    ``shards`` applies only when the mesh has no index root yet; an existing root's count wins."""
+    root = read_root(store, nodes, replicas)
+    migrating = root is None or not root["migrated"]
+    if root is None:
+        root = {"shards": shards, "used": set(), "migrated": False}
+    batch = set(paths)
+    if migrating:
+        batch |= _read_set(store, LEGACY_INDEX, nodes, replicas)
+    by_shard: Dict[int, Set[str]] = {}
+    for path in batch:
+        by_shard.setdefault(shard_of(path, root["shards"]), set()).add(path)
+    if not set(by_shard) <= root["used"]:
+        root["used"] |= set(by_shard)
+        _write_root(store, root, nodes, replicas)   # before the shards: a listed empty shard is harmless
+    added = 0
+    for shard, new in sorted(by_shard.items()):
+        log = _read_set(store, _log(shard), nodes, replicas)
+        fresh = new - log
+        if fresh:
+            fresh -= _read_set(store, _segment(shard), nodes, replicas)
+        if not fresh:
+            continue
+        added += len(fresh)
+        _append(store, shard, log | fresh, nodes, replicas, compact_at)
+    if migrating:
+        root["migrated"] = True
+        _write_root(store, root, nodes, replicas)
+    return added
+
+
+def _append(store, shard: int, log: Set[str], nodes: Sequence[str], replicas: int,
+            compact_at: int) -> None:
+    if len(log) < compact_at:
+        _write_set(store, _log(shard), log, nodes, replicas)
+        return
+    _fold(store, shard, log, nodes, replicas)
+
+
+def _fold(store, shard: int, log: Set[str], nodes: Sequence[str], replicas: int) -> None:
+    # base first, then the empty log: a crash in between leaves duplicates, never a lost path
+    base = _read_set(store, _segment(shard), nodes, replicas)
+    _write_set(store, _segment(shard), base | log, nodes, replicas)
+    _write_set(store, _log(shard), (), nodes, replicas)
+
+
+def compact(store, nodes: Sequence[str], *, replicas: int = 5) -> int:
+    """Fold every non-empty delta log into its base segment. Returns the shards compacted."""
+    root = read_root(store, nodes, replicas)
+    if root is None:
+        return 0
+    done = 0
+    for shard in sorted(root["used"]):
+        log = _read_set(store, _log(shard), nodes, replicas)
+        if log:
+            _fold(store, shard, log, nodes, replicas)
+            done += 1
+    return done
+
+
+def shard_sizes(store, nodes: Sequence[str], *, replicas: int = 5) -> List[tuple]:
+    """``(shard, base paths, log paths)`` for every live shard — for inspection and tests."""
+    root = read_root(store, nodes, replicas)
+    if root is None:
+        return []
+    return [(s, len(_read_set(store, _segment(s), nodes, replicas)),
+             len(_read_set(store, _log(s), nodes, replicas))) for s in sorted(root["used"])]
@@ -0,0 +1,273 @@
+"""Concurrent fan-out / fan-in for mesh fragment I/O — quorum writes, hedged reads, slow nodes last.
+
+``leaf_propagation`` calls its ``put`` / ``get`` seams one copy at a time, so a write costs the SUM
+of every node's latency and a read waits out each dead or slow node in turn (over HTTP, a partitioned
+node costs a full timeout before the next copy is tried). The seams are plain functions, so the
+concurrency can live entirely on this side of them: the same MeshFsStore / MeshHttpStore methods are
+called, just from a thread pool.
+
+  * WRITE — every fragment copy is issued at once; ``write`` returns as soon as the write quorum has
+            acknowledged (by default: every fragment has at least one durable copy) and lets the
+            remaining replicas finish in the background. A write that can no longer reach its quorum
+            fails loud, like a sequential ``put`` would; a background replica that fails afterwards
+            is logged, kept in ``replica_failures()`` and raised from ``close()``.
+  * READ  — ``gather`` starts with the k fastest-looking fragments and HEDGES: if nothing has come
+            back within a few typical round trips it asks one more fragment or replica, until every
+            candidate copy is in flight. A failed or absent copy fails over to the next replica at
+            once. It stops, and cancels what has not started, when the needed count has arrived;
+            Merkle verification stays with the caller (a single fragment cannot be verified alone).
+  * ORDER — each call's wall time feeds a per-node EWMA (``NodeLatency``); unreachable, errored or
+            empty answers are charged a penalty, so nodes that are slow or seized are tried last.
+
+Requests already running when a read completes are not interrupted (a thread cannot be cancelled);
+they finish against the store's own timeout and only update the latency table. Stdlib only.
+"""
+from __future__ import annotations
+
+import logging
+import statistics
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# put(node, key, bytes) -> None ; get(node, group) -> bytes | None (group: whatever the caller fans in on)
+PutFn = Callable[[str, str, bytes], None]
+GetFn = Callable[[str, Hashable], Optional[bytes]]
+
+logger = logging.getLogger(__name__)
+
+
+class WriteQuorumError(Exception):
+    """Too many copy writes failed for the write quorum to be acknowledged."""
+
+
+class ReplicaWriteError(Exception):
+    """Replica writes that were still in flight when their write was acknowledged later failed.
+
+    ``failures`` lists ``(group, node, key, error)``; the data is readable (the quorum held) but
+    has fewer copies than asked for until those replicas are rewritten."""
+
+    def __init__(self, failures: List[Tuple[Hashable, str, str, BaseException]]):
+        self.failures = failures
+        super().__init__(f"{len(failures)} background replica write(s) failed; first: "
+                         f"{failures[0][1]}/{failures[0][2]}: {failures[0][3]!r}")
+
+
+class NodeLatency:
+    """Exponentially weighted per-node latency, in seconds. Thread-safe.
+
+    A failed call (raised, unreachable, or nothing to serve) is charged at least ``failure_penalty``,
+    so a seized node sinks to the back of the order even when its failures are fast. Nodes never
+    observed estimate 0.0 — optimistic, so a new node gets measured rather than starved."""
+
+    def __init__(self, alpha: float = 0.3, failure_penalty: float = 1.0):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.failure_penalty = failure_penalty
+        self._ewma: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, node: str, seconds: float, ok: bool = True) -> None:
+        sample = seconds if ok else max(seconds, self.failure_penalty)
+        with self._lock:
+            prev = self._ewma.get(node)
+            self._ewma[node] = sample if prev is None else prev + self.alpha * (sample - prev)
+
+    def estimate(self, node: str) -> float:
+        return self._ewma.get(node, 0.0)
+
+    def order(self, nodes: Sequence[str]) -> List[str]:
+        """``nodes`` fastest first; ties (e.g. never observed) keep their given order."""
+        return sorted(nodes, key=self.estimate)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._ewma)
+
+
+class MeshIO:
+    """A shared worker pool plus the latency table that orders it. One per process (or per store)
+    is enough; pass it as ``io=`` to ``propagate`` / ``fetch`` / ``fetch_report`` / mesh_sync.
+
+    ``hedge_after`` fixes the hedge delay in seconds (``0`` asks every candidate copy at once);
+    by default it is twice the median latency estimate of the candidates, clamped to
+    [``min_hedge``, ``max_hedge``]."""
+
+    def __init__(self, *, workers: int = 32, latency: Optional[NodeLatency] = None,
+                 hedge_after: Optional[float] = None, min_hedge: float = 0.01, max_hedge: float = 0.5):
+        self.latency = latency if latency is not None else NodeLatency()
+        self.hedge_after = hedge_after
+        self.min_hedge = min_hedge
+        self.max_hedge = max_hedge
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mesh-io")
+        self._failures: List[Tuple[Hashable, str, str, BaseException]] = []
+        self._failures_lock = threading.Lock()
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the pool; with ``wait`` (the default) background replica writes finish first,
+        and any that failed are raised as ReplicaWriteError."""
+        self._pool.shutdown(wait=wait)
+        failures = self.replica_failures() if wait else []
+        if failures:
+            raise ReplicaWriteError(failures)
+
+    def __enter__(self) -> "MeshIO":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self.close()
+        except ReplicaWriteError:
+            pass  # already logged; do not mask the exception that is unwinding the block
+
+    def replica_failures(self) -> List[Tuple[Hashable, str, str, BaseException]]:
+        """Take the background replica failures recorded so far (``(group, node, key, error)``)."""
+        with self._failures_lock:
+            failures, self._failures = self._failures, []
+        return failures
+
+    def _background(self, fut: Future, group: Hashable, node: str, key: str) -> None:
+        err = fut.exception() if not fut.cancelled() else None
+        if err is None:
+            return
+        logger.warning("background replica write %s -> %s failed: %r", key, node, err)
+        with self._failures_lock:
+            self._failures.append((group, node, key, err))
+
+    # ── timed seams: every call, foreground or background, feeds the latency table ──────────
+    def _timed_put(self, put: PutFn, node: str, key: str, data: bytes) -> None:
+        t0 = time.perf_counter()
+        try:
+            put(node, key, data)
+        except Exception:
+            self.latency.observe(node, time.perf_counter() - t0, ok=False)
+            raise
+        self.latency.observe(node, time.perf_counter() - t0)
+
+    def _timed_get(self, get: GetFn, node: str, group: Hashable) -> Optional[bytes]:
+        t0 = time.perf_counter()
+        try:
+            data = get(node, group)
+        except Exception:  # noqa: BLE001 — an errored read is an unreachable copy, not a healthy one
+            data = None
+        self.latency.observe(node, time.perf_counter() - t0, ok=data is not None)
+        return data
+
+    def _hedge_delay(self, nodes: Sequence[str]) -> float:
+        if self.hedge_after is not None:
+            return self.hedge_after
+        known = [e for e in map(self.latency.estimate, nodes) if e > 0.0]
+        typical = statistics.median(known) if known else 0.0
+        return min(self.max_hedge, max(self.min_hedge, 2.0 * typical))
+
+    # ── fan-out write ───────────────────────────────────────────────────────────────────────
+    def write(self, copies: Sequence[Tuple[Hashable, str, str, bytes]], put: PutFn, *,
+              quorum: Optional[int] = None) -> int:
+        """Issue every ``(group, node, key, data)`` copy concurrently; return once ``quorum`` distinct
+        groups (default: all of them) have at least one acknowledged copy. Copies still in flight then
+        complete in the background. Returns the number of groups acknowledged at that point.
+
+        Raises WriteQuorumError (chained to the first put error) as soon as the quorum is out of
+        reach."""
+        groups = {g for g, _, _, _ in copies}
+        quorum = len(groups) if quorum is None else quorum
+        if not 1 <= quorum <= len(groups):
+            raise ValueError(f"write quorum must be in 1..{len(groups)}")
+        ordered = sorted(copies, key=lambda c: self.latency.estimate(c[1]))
+        copy_of: Dict[Future, Tuple[Hashable, str, str]] = {
+            self._pool.submit(self._timed_put, put, node, key, data): (g, node, key)
+            for g, node, key, data in ordered}
+        futures: Dict[Future, Hashable] = {fut: g for fut, (g, _, _) in copy_of.items()}
+        outstanding = Counter(futures.values())
+        acked: set = set()
+        first_error: Optional[BaseException] = None
+        pending = set(futures)
+        while pending and len(acked) < quorum:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                g = futures[fut]
+                outstanding[g] -= 1
+                err = fut.exception()
+                if err is None:
+                    acked.add(g)
+                elif first_error is None:
+                    first_error = err
+            reachable = len(acked) + sum(1 for g in groups if g not in acked and outstanding[g] > 0)
+            if reachable < quorum:
+                break
+        if len(acked) < quorum:
+            raise WriteQuorumError(f"{len(acked)} of {len(groups)} groups acknowledged; "
+                                   f"write quorum is {quorum}") from first_error
+        for fut in pending:
+            g, node, key = copy_of[fut]
+            fut.add_done_callback(lambda f, g=g, node=node, key=key: self._background(f, g, node, key))
+        return len(acked)
+
+    # ── hedged fan-in read ──────────────────────────────────────────────────────────────────
+    def gather(self, candidates: Dict[Hashable, Sequence[str]], get: GetFn,
+               need: int) -> Dict[Hashable, Tuple[str, bytes]]:
+        """Fetch ``need`` distinct groups, each from any one of its candidate nodes. Returns
+        ``{group: (node, bytes)}`` — fewer than ``need`` only when every candidate copy failed.
+
+        Groups whose fastest node looks fastest go first; a failed copy fails over to the group's
+        next replica; a quiet spell of one hedge delay launches one more request (an unstarted
+        group, else another replica of a group still waiting)."""
+        queues: Dict[Hashable, Deque[str]] = {
+            g: deque(self.latency.order(nodes)) for g, nodes in candidates.items() if nodes}
+        order = sorted(queues, key=lambda g: self.latency.estimate(queues[g][0]))
+        unstarted: Deque[Hashable] = deque(order)
+        delay = self._hedge_delay([n for q in queues.values() for n in q])
+        got: Dict[Hashable, Tuple[str, bytes]] = {}
+        inflight: Dict[Future, Tuple[Hashable, str]] = {}
+        live: Counter = Counter()
+
+        def launch(g: Hashable) -> None:
+            node = queues[g].popleft()
+            inflight[self._pool.submit(self._timed_get, get, node, g)] = (g, node)
+            live[g] += 1
+
+        def top_up() -> None:
+            # keep enough groups in play that ``need`` can still be met without waiting on a hedge
+            while unstarted and len(got) + sum(1 for g in live if live[g] and g not in got) < need:
+                launch(unstarted.popleft())
+
+        def hedge() -> bool:
+            if unstarted:
+                launch(unstarted.popleft())
+                return True
+            for g in order:
+                if g not in got and queues[g]:
+                    launch(g)
+                    return True
+            return False
+
+        can_hedge = True
+        top_up()
+        try:
+            while inflight and len(got) < need:
+                done, _ = wait(list(inflight), timeout=delay if can_hedge else None,
+                               return_when=FIRST_COMPLETED)
+                if not done:
+                    can_hedge = hedge()
+                    continue
+                for fut in done:
+                    g, node = inflight.pop(fut)
+                    live[g] -= 1
+                    data = fut.result()
+                    if g in got:
+                        continue
+                    if data is not None:
+                        got[g] = (node, data)
+                    elif not live[g] and queues[g]:
+                        launch(g)                        # fail over to the next replica now
+                top_up()
+        finally:
+            for fut in inflight:
+                fut.cancel()                             # not-yet-started requests never run
+        return got
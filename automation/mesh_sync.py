@@ -6,6 +6,12 @@ Composes the three primitives into a file service that "just works" across devic
   * LOCATION — the fragment manifest is findable by the content's Merkle root (manifest_store).
   * NAME — a mutable, versioned pointer maps the human path to the current root (mesh_namespace),
     so any device resolves "the current /notes/todo.md" by name, and it updates on every write.
+  * LISTING — which names exist lives in a sharded, append-only index (mesh_index), updated once
+    per ``put_files`` batch.
+  * CHUNKS — a file is cut at content-defined boundaries (mesh_chunking) and each chunk is its own
+    leaf, named by its root; a file larger than one chunk is a chunk list published under
+    ``chunks:<file root>``. A chunk already on the mesh is never dispersed again, so an edit
+    re-uploads only the chunks it touched and a file stored twice costs one copy.
 
 The result: put a file on one device, read it by name on another; edit it, the other device sees the
 new version; and none of it lives with a custodian who can lock you out — it lives on your own nodes,
@@ -18,18 +24,28 @@ over the network), so the same Drive runs on local volumes or across physical no
 from __future__ import annotations
 
 import json
+import os
+from collections import Counter
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from automation.leaf_propagation import fetch, propagate
-from automation.manifest_store import publish_manifest, resolve_manifest
-from automation.mesh_namespace import (
-    NamespaceRef, publish_blob, publish_ref, read_all, resolve_ref,
+from automation import mesh_index
+from automation.holographic_ida import merkle_root
+from automation.leaf_propagation import (
+    GetFn, IntegrityError, PropagationManifest, _frag_key, fetch, propagate,
 )
+from automation.manifest_store import ManifestUnavailable, publish_manifest, resolve_manifest
+from automation.mesh_chunking import DEFAULT_CHUNKER, Chunker
+from automation.mesh_io import MeshIO
+from automation.mesh_namespace import NamespaceRef, publish_blob, publish_ref, read_all, resolve_ref
+from automation.mesh_sync_state import SyncReport, SyncState, state_path
 from automation.storage_resilience import Placement
 
-_INDEX = "__index__"
+_PUSH_BATCH = 256           # files per put_files batch (one directory-index update each)
+_PUSH_BATCH_BYTES = 64 << 20
+_PULL_WINDOW = 256          # files whose fragments pull_dir prefetches together
 
 
 class FileNotFound(Exception):
@@ -40,81 +56,367 @@ def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _index_read(store, nodes: Sequence[str], replicas: int, reachable: Optional[set] = None) -> set:
-    """The directory listing — a grow-only union of every reachable index replica's path set."""
-    paths: set = set()
-    for b in read_all(_INDEX, nodes=nodes, get_blob=store.get_blob, replicas=replicas, reachable=reachable):
-        try:
-            paths |= set(json.loads(b))
-        except (ValueError, TypeError):
-            continue
-    return paths
+def _chunks_name(root: str) -> str:
+    return "chunks:" + root
+
+
+def _put_chunk(store, nodes: Sequence[str], chunk: bytes, known: set, written: set, *,
+               placement: Optional[Placement], replicas: int,
+               io: Optional[MeshIO]) -> Tuple[str, int, Optional[PropagationManifest]]:
+    """Disperse one chunk unless it is already on the mesh (its manifest resolves; added to
+    ``known``), was published earlier in this run (in ``known``) or was dispersed earlier in this
+    batch (in ``written``; added there). Returns (chunk root, bytes uploaded, the manifest still to
+    publish — None when nothing was dispersed)."""
+    root = merkle_root(chunk)
+    if root in known or root in written:
+        return root, 0, None
+    try:
+        resolve_manifest(root, nodes=nodes, get_blob=store.get_blob, replicas=replicas)
+        known.add(root)
+        return root, 0, None
+    except ManifestUnavailable:
+        pass
+    m = propagate(chunk, nodes=nodes, put=store.put, placement=placement, io=io)
+    written.add(root)
+    return root, len(chunk), m
+
+
+def _flush_fragments(store) -> None:
+    """Wait until the fragment writes a batching store has queued are on their nodes
+    (MeshHttpStore.flush_pending); stores that write through have nothing to flush."""
+    flush = getattr(store, "flush_pending", None)
+    if flush is not None:
+        flush()
 
 
-def _index_add(store, nodes: Sequence[str], path: str, replicas: int) -> None:
-    paths = _index_read(store, nodes, replicas)
-    paths.add(path)
-    publish_blob(_INDEX, json.dumps(sorted(paths)).encode("utf-8"),
-                 nodes=nodes, put_blob=store.put_blob, replicas=replicas)
+def _put_files(store, nodes: Sequence[str], files: Iterable[Tuple[str, bytes]], *, writer: str,
+               placement: Optional[Placement], replicas: int, io: Optional[MeshIO],
+               chunker: Optional[Chunker], known: set) -> Tuple[List[NamespaceRef], int]:
+    """put_files, also returning the chunk bytes actually uploaded. ``known`` holds the chunk roots
+    already on the mesh as far as this run knows; the chunks this batch disperses join it only once
+    their fragments are flushed and their manifests published, so a batch that fails partway leaves
+    none of them there for a retry to skip.
+
+    Every new chunk is dispersed first; the store's queued fragment writes are then flushed, and only
+    after that succeeds are manifests, chunk lists and refs published — so nothing on the mesh ever
+    points at fragments that were not written, even when the flush fails or the process dies."""
+    staged: List[Tuple[str, str, int, list]] = []
+    written: set = set()
+    manifests: List[PropagationManifest] = []
+    uploaded = 0
+    for path, data in files:
+        chunks = chunker.split(data) if chunker is not None else [data]
+        listing = []
+        for chunk in chunks:
+            chunk_root, sent, m = _put_chunk(store, nodes, chunk, known, written, placement=placement,
+                                             replicas=replicas, io=io)
+            listing.append([chunk_root, len(chunk)])
+            uploaded += sent
+            if m is not None:
+                manifests.append(m)
+        staged.append((path, merkle_root(data), len(data), listing))
+    _flush_fragments(store)
+
+    for m in manifests:
+        publish_manifest(m, nodes=nodes, put_blob=store.put_blob, replicas=replicas)
+    known |= written
+    refs: List[NamespaceRef] = []
+    for path, root, size, listing in staged:
+        if len(listing) > 1:
+            blob = json.dumps({"root": root, "size": size, "chunks": listing}).encode("utf-8")
+            publish_blob(_chunks_name(root), blob, nodes=nodes, put_blob=store.put_blob, replicas=replicas)
+        cur = resolve_ref(path, nodes=nodes, get_blob=store.get_blob, replicas=replicas)
+        version = (cur.version + 1) if cur else 1
+        ref = NamespaceRef(path=path, root=root, version=version, updated_at=_now(), writer=writer)
+        publish_ref(ref, nodes=nodes, put_blob=store.put_blob, replicas=replicas)
+        refs.append(ref)
+    if refs:
+        mesh_index.add_paths(store, nodes, [r.path for r in refs], replicas=replicas)
+    return refs, uploaded
+
+
+def put_files(store, nodes: Sequence[str], files: Iterable[Tuple[str, bytes]], *, writer: str,
+              placement: Optional[Placement] = None, replicas: int = 5,
+              io: Optional[MeshIO] = None, chunker: Optional[Chunker] = DEFAULT_CHUNKER) -> List[NamespaceRef]:
+    """WRITE a batch of files: split each into content-defined chunks (``chunker``; None keeps the
+    whole file as one leaf) and disperse every chunk not already on the mesh; once the fragments are
+    written (flushed, on a batching store), publish the new chunks' manifests, each file's chunk list
+    when it has more than one, and its bumped versioned name pointer; then add the whole batch to the
+    directory index in one update (mesh_index.add_paths). A ref's root is always the sha256 root of
+    the whole file. Returns the new refs, in order."""
+    return _put_files(store, nodes, files, writer=writer, placement=placement, replicas=replicas,
+                      io=io, chunker=chunker, known=set())[0]
 
 
 def put_file(store, nodes: Sequence[str], path: str, data: bytes, *, writer: str,
-             placement: Optional[Placement] = None, replicas: int = 5) -> NamespaceRef:
-    """WRITE a file: disperse its bytes, publish the manifest, bump the versioned name pointer, and
-    add it to the directory index. Returns the new ref (version, root)."""
-    m = propagate(data, nodes=nodes, put=store.put, placement=placement)
-    publish_manifest(m, nodes=nodes, put_blob=store.put_blob, replicas=replicas)
-    cur = resolve_ref(path, nodes=nodes, get_blob=store.get_blob, replicas=replicas)
-    version = (cur.version + 1) if cur else 1
-    ref = NamespaceRef(path=path, root=m.root, version=version, updated_at=_now(), writer=writer)
-    publish_ref(ref, nodes=nodes, put_blob=store.put_blob, replicas=replicas)
-    _index_add(store, nodes, path, replicas)
-    return ref
+             placement: Optional[Placement] = None, replicas: int = 5,
+             io: Optional[MeshIO] = None, chunker: Optional[Chunker] = DEFAULT_CHUNKER) -> NamespaceRef:
+    """WRITE a file: disperse its new chunks, publish their manifests, bump the versioned name
+    pointer, and add it to the directory index. Returns the new ref (version, root). ``io`` writes
+    the fragments concurrently (see ``leaf_propagation.propagate``)."""
+    return put_files(store, nodes, [(path, data)], writer=writer, placement=placement,
+                     replicas=replicas, io=io, chunker=chunker)[0]
+
+
+def _plans(store, nodes: Sequence[str], root: str, *, replicas: int,
+           reachable: Optional[set]) -> List[List[PropagationManifest]]:
+    """The ways to read the file ``root``, each an ordered list of chunk manifests: its own manifest
+    when it is a single leaf, else one plan per distinct chunk list its replicas serve (a replica may
+    lie; ``_assemble`` verifies). Raises ManifestUnavailable when there is no way to read it."""
+    try:
+        return [[resolve_manifest(root, nodes=nodes, get_blob=store.get_blob, replicas=replicas,
+                                  reachable=reachable)]]
+    except ManifestUnavailable as e:
+        missing = e
+    plans: List[List[PropagationManifest]] = []
+    seen: set = set()
+    for blob in read_all(_chunks_name(root), nodes=nodes, get_blob=store.get_blob, replicas=replicas,
+                         reachable=reachable):
+        try:
+            d = json.loads(blob)
+            chunks = tuple(str(c) for c, _ in d["chunks"])
+            ok = d["root"] == root and sum(int(n) for _, n in d["chunks"]) == int(d["size"])
+        except (ValueError, KeyError, TypeError):
+            continue
+        if not ok or chunks in seen:
+            continue
+        seen.add(chunks)
+        try:
+            plans.append([resolve_manifest(c, nodes=nodes, get_blob=store.get_blob, replicas=replicas,
+                                           reachable=reachable) for c in chunks])
+        except ManifestUnavailable as e:
+            missing = e
+    if not plans:
+        raise missing
+    return plans
+
+
+def _assemble(root: str, plans: Sequence[List[PropagationManifest]],
+              fetch_chunk: Callable[[PropagationManifest], bytes]) -> bytes:
+    """The first plan whose chunks join to bytes with Merkle root ``root``. Raises IntegrityError
+    when none does."""
+    for plan in plans:
+        if len(plan) == 1 and plan[0].root == root:
+            return fetch_chunk(plan[0])                  # a single leaf: fetch already verified it
+        data = b"".join(fetch_chunk(m) for m in plan)
+        if merkle_root(data) == root:
+            return data
+    raise IntegrityError(f"no chunk list for {root} reassembles the committed root")
 
 
 def get_file(store, nodes: Sequence[str], path: str, *, replicas: int = 5,
-             reachable: Optional[set] = None) -> Tuple[bytes, NamespaceRef]:
-    """READ a file by NAME: resolve the current pointer, find its manifest by root, reconstruct a
-    quorum of fragments (Merkle-verified). Raises FileNotFound if the name isn't reachable."""
+             reachable: Optional[set] = None, io: Optional[MeshIO] = None) -> Tuple[bytes, NamespaceRef]:
+    """READ a file by NAME: resolve the current pointer, find the manifests of its chunks, reconstruct
+    each from a quorum of fragments (Merkle-verified; hedged and concurrent with ``io``) and verify
+    the joined bytes against the file's root. Raises FileNotFound if the name isn't reachable."""
     ref = resolve_ref(path, nodes=nodes, get_blob=store.get_blob, replicas=replicas, reachable=reachable)
     if ref is None:
         raise FileNotFound(path)
-    m = resolve_manifest(ref.root, nodes=nodes, get_blob=store.get_blob, replicas=replicas, reachable=reachable)
-    return fetch(m, get=store.get, reachable=reachable), ref
+    plans = _plans(store, nodes, ref.root, replicas=replicas, reachable=reachable)
+    return _assemble(ref.root, plans, lambda m: fetch(m, get=store.get, reachable=reachable, io=io)), ref
 
 
 def list_files(store, nodes: Sequence[str], *, replicas: int = 5,
                reachable: Optional[set] = None) -> List[str]:
-    return sorted(_index_read(store, nodes, replicas, reachable))
+    return sorted(mesh_index.list_paths(store, nodes, replicas=replicas, reachable=reachable))
 
 
 # ── directory reconcile — the "it just syncs" loop across devices ────────────────────────────
 
-def push_dir(store, nodes: Sequence[str], local_dir: Path, *, writer: str,
-             placement: Optional[Placement] = None, replicas: int = 5) -> List[str]:
-    """Upload every file under ``local_dir`` (logical path = its path relative to the dir)."""
+def _batching(store):
+    """The store's fragment write batching (MeshHttpStore.batching), or a no-op for stores without it."""
+    batching = getattr(store, "batching", None)
+    return batching() if batching is not None else nullcontext(store)
+
+
+def _prefetch(store, manifests: Sequence, reachable: Optional[set]) -> GetFn:
+    """A fragment ``get`` for ``fetch`` that first serves from one ``get_many`` per node — the first
+    reachable copy of every fragment of ``manifests`` — and falls back to ``store.get`` for anything
+    else (a missing copy, a replica fetch needs after a miss). Stores without ``get_many``: store.get."""
+    get_many = getattr(store, "get_many", None)
+    if get_many is None:
+        return store.get
+    wanted: Dict[str, List[str]] = {}
+    for m in manifests:
+        for x, node_list in m.fragment_nodes.items():
+            node = next((n for n in node_list if reachable is None or n in reachable), None)
+            if node is not None:
+                wanted.setdefault(node, []).append(_frag_key(m.root, x))
+    cache: Dict[Tuple[str, str], bytes] = {}
+    for node, frags in wanted.items():
+        for frag, data in get_many(node, frags).items():
+            if data is not None:
+                cache[(node, frag)] = data
+
+    def get(node: str, frag: str) -> Optional[bytes]:
+        data = cache.pop((node, frag), None)
+        return data if data is not None else store.get(node, frag)
+
+    return get
+
+
+def _sync_state(local_dir: Path, nodes: Sequence[str], state: Optional[Path]) -> SyncState:
+    return SyncState(state if state is not None else state_path(local_dir, nodes))
+
+
+def push_dir_report(store, nodes: Sequence[str], local_dir: Path, *, writer: str,
+                    placement: Optional[Placement] = None, replicas: int = 5,
+                    io: Optional[MeshIO] = None, state: Optional[Path] = None,
+                    chunker: Optional[Chunker] = DEFAULT_CHUNKER) -> SyncReport:
+    """Upload what changed under ``local_dir`` (logical path = its path relative to the dir).
+
+    A file is skipped — and its bytes never read — when its size and mtime match the sync state
+    (mesh_sync_state); otherwise it is hashed, and still skipped if it matches the recorded root or
+    the path's current remote ref. The rest is written ``_PUSH_BATCH`` files (or ``_PUSH_BATCH_BYTES``)
+    at a time through ``put_files``, with fragment writes batched when the store supports it; only
+    chunks not already on the mesh are uploaded, and ``bytes_moved`` counts those.
+    Files recorded last run but gone now are reported as deleted; the Drive's names are grow-only,
+    so they stay on the mesh."""
     local_dir = Path(local_dir)
-    pushed: List[str] = []
-    for p in sorted(local_dir.rglob("*")):
-        if p.is_file():
+    cache = _sync_state(local_dir, nodes, state)
+    report = SyncReport()
+    pending: List[Tuple[str, os.stat_result, bytes]] = []
+    known: set = set()
+
+    def flush() -> None:
+        # _put_files returns only after the batch's fragments are flushed and its refs published,
+        # so the state saved here never claims an upload that has not landed. Each file is recorded
+        # with the stat taken BEFORE it was read: if it was edited since, the next run sees a new
+        # stat and re-hashes it instead of trusting the old root forever.
+        refs, uploaded = _put_files(store, nodes, [(rel, data) for rel, _, data in pending],
+                                    writer=writer, placement=placement, replicas=replicas, io=io,
+                                    chunker=chunker, known=known)
+        for (rel, st, _), ref in zip(pending, refs):
+            cache.record(rel, st, ref.root, ref.version)
+        report.bytes_moved += uploaded
+        pending.clear()
+        cache.save()
+
+    seen: set = set()
+    with _batching(store):
+        for p in sorted(local_dir.rglob("*")):
+            if not p.is_file():
+                continue
             rel = "/" + str(p.relative_to(local_dir)).replace("\\", "/")
-            put_file(store, nodes, rel, p.read_bytes(), writer=writer, placement=placement, replicas=replicas)
-            pushed.append(rel)
-    return pushed
+            seen.add(rel)
+            st = p.stat()
+            if cache.unchanged(rel, st):
+                report.skipped.append(rel)
+                continue
+            data = p.read_bytes()
+            root = merkle_root(data)
+            entry = cache.get(rel)
+            remote = None
+            if entry is not None and entry["root"] == root:
+                version: Optional[int] = entry["version"]        # touched, not changed
+            else:
+                remote = resolve_ref(rel, nodes=nodes, get_blob=store.get_blob, replicas=replicas)
+                version = remote.version if remote is not None and remote.root == root else None
+            if version is not None:
+                cache.record(rel, st, root, version)
+                report.skipped.append(rel)
+                continue
+            (report.changed if entry is not None or remote is not None else report.added).append(rel)
+            pending.append((rel, st, data))
+            if len(pending) >= _PUSH_BATCH or sum(len(d) for _, _, d in pending) >= _PUSH_BATCH_BYTES:
+                flush()
+        if pending:
+            flush()
+    for rel in sorted(cache.paths() - seen):
+        report.deleted.append(rel)
+        cache.forget(rel)
+    cache.save()
+    return report
 
 
-def pull_dir(store, nodes: Sequence[str], local_dir: Path, *, replicas: int = 5,
-             reachable: Optional[set] = None) -> List[str]:
-    """Materialize every named file into ``local_dir`` — the other device's view of the Drive."""
+def push_dir(store, nodes: Sequence[str], local_dir: Path, *, writer: str,
+             placement: Optional[Placement] = None, replicas: int = 5,
+             io: Optional[MeshIO] = None, state: Optional[Path] = None,
+             chunker: Optional[Chunker] = DEFAULT_CHUNKER) -> List[str]:
+    """Upload what changed under ``local_dir`` (see ``push_dir_report``); returns the paths written."""
+    return push_dir_report(store, nodes, local_dir, writer=writer, placement=placement,
+                           replicas=replicas, io=io, state=state, chunker=chunker).synced
+
+
+def pull_dir_report(store, nodes: Sequence[str], local_dir: Path, *, replicas: int = 5,
+                    reachable: Optional[set] = None, io: Optional[MeshIO] = None,
+                    state: Optional[Path] = None,
+                    chunker: Optional[Chunker] = DEFAULT_CHUNKER) -> SyncReport:
+    """Materialize every named file into ``local_dir`` — the other device's view of the Drive.
+
+    Each path's remote ref is compared with the sync state and the local file BEFORE any fragment
+    traffic: a file whose recorded root matches the ref and whose stat is unchanged is skipped
+    unread; an existing local file that hashes to the ref's root is skipped too. The rest is pulled
+    ``_PULL_WINDOW`` files at a time, each window's fragments prefetched with one ``get_many`` per
+    node when the store has it. A chunk is fetched once per window however many files share it, and
+    not at all when the old local copy of the file still holds it (cut with ``chunker``, which must
+    match the writer's to find anything); ``bytes_moved`` counts the chunk bytes fetched. Every chunk
+    and every file is Merkle-verified. Recorded paths no longer listed on the mesh are reported as
+    deleted (the local file is left alone)."""
     local_dir = Path(local_dir)
-    pulled: List[str] = []
-    for path in list_files(store, nodes, replicas=replicas, reachable=reachable):
-        try:
-            data, _ = get_file(store, nodes, path, replicas=replicas, reachable=reachable)
-        except FileNotFound:
-            continue
-        dest = local_dir / path.lstrip("/")
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_bytes(data)
-        pulled.append(path)
-    return pulled
+    cache = _sync_state(local_dir, nodes, state)
+    report = SyncReport()
+    paths = list_files(store, nodes, replicas=replicas, reachable=reachable)
+    for start in range(0, len(paths), _PULL_WINDOW):
+        window = []
+        for path in paths[start:start + _PULL_WINDOW]:
+            ref = resolve_ref(path, nodes=nodes, get_blob=store.get_blob, replicas=replicas,
+                              reachable=reachable)
+            if ref is None:
+                continue
+            dest = local_dir / path.lstrip("/")
+            try:
+                st: Optional[os.stat_result] = dest.stat()
+            except FileNotFoundError:
+                st = None
+            entry = cache.get(path)
+            if st is not None and ((entry is not None and entry["root"] == ref.root
+                                    and cache.unchanged(path, st))
+                                   or merkle_root(dest.read_bytes()) == ref.root):
+                cache.record(path, st, ref.root, ref.version)
+                report.skipped.append(path)
+                continue
+            window.append((path, ref, dest, st is not None,
+                           _plans(store, nodes, ref.root, replicas=replicas, reachable=reachable)))
+        needed = Counter(m.root for *_, plans in window for m in plans[0])
+        have: Dict[str, bytes] = {}
+        for _, _, dest, existed, plans in window:
+            if existed and chunker is not None and len(plans[0]) > 1:
+                for chunk in chunker.split(dest.read_bytes()):
+                    chunk_root = merkle_root(chunk)
+                    if chunk_root in needed:
+                        have[chunk_root] = chunk
+        get = _prefetch(store, list({m.root: m for *_, plans in window for plan in plans
+                                     for m in plan if m.root not in have}.values()), reachable)
+
+        def fetch_chunk(m: PropagationManifest) -> bytes:
+            if m.root not in have:
+                have[m.root] = fetch(m, get=get, reachable=reachable, io=io)
+                report.bytes_moved += len(have[m.root])
+            return have[m.root]
+
+        for path, ref, dest, existed, plans in window:
+            data = _assemble(ref.root, plans, fetch_chunk)
+            for m in plans[0]:                  # drop chunks no later file in the window needs
+                needed[m.root] -= 1
+                if needed[m.root] <= 0:
+                    have.pop(m.root, None)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(data)
+            cache.record(path, dest.stat(), ref.root, ref.version)
+            (report.changed if existed else report.added).append(path)
+        cache.save()
+    for path in sorted(cache.paths() - set(paths)):
+        report.deleted.append(path)
+        cache.forget(path)
+    cache.save()
+    return report
+
+
+def pull_dir(store, nodes: Sequence[str], local_dir: Path, *, replicas: int = 5,
+             reachable: Optional[set] = None, io: Optional[MeshIO] = None,
+             state: Optional[Path] = None, chunker: Optional[Chunker] = DEFAULT_CHUNKER) -> List[str]:
+    """Bring ``local_dir`` up to date with the Drive (see ``pull_dir_report``); returns the paths
+    written."""
+    return pull_dir_report(store, nodes, local_dir, replicas=replicas, reachable=reachable, io=io,
+                           state=state, chunker=chunker).synced
@@ -0,0 +1,94 @@
+"""Local sync state for mesh_sync's directory reconcile — turn a no-op resync into a stat walk.
+
+Without it, ``push_dir`` re-read, re-dispersed and re-uploaded every file on every run, and
+``pull_dir`` re-fetched and reconstructed every file even when the local copy already matched.
+This records, per synced local directory and mesh, what each file was when it was last synced:
+``path -> (size, mtime_ns, sha256 root, ref version)``. A file whose size and mtime still match is
+skipped without reading it; a file whose bytes still hash to the recorded (or the remote) root is
+skipped without any fragment traffic.
+
+Stat trust follows git's "racy clean" rule: a file modified within ``RACY_NS`` of the moment it
+was recorded could have changed again inside the filesystem's timestamp granularity, so its stat is
+not trusted and its bytes are hashed instead. The state is a JSON file replaced atomically, kept
+under ``state_dir()`` unless a path is given; losing it costs one full hash pass, never data.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from automation.durable_queue import state_dir
+
+RACY_NS = 2_000_000_000     # 2 s: covers the coarsest common mtime granularity (FAT)
+
+
+def state_path(local_dir: Path, nodes: Sequence[str]) -> Path:
+    """The default state file for syncing ``local_dir`` against the mesh of ``nodes``."""
+    key = str(Path(local_dir).resolve()) + "\0" + "\0".join(sorted(nodes))
+    return state_dir() / "mesh-sync" / (hashlib.sha256(key.encode("utf-8")).hexdigest()[:24] + ".json")
+
+
+@dataclass
+class SyncReport:
+    """What one push/pull run did. Paths are Drive paths ("/notes/todo.md")."""
+    added: List[str] = field(default_factory=list)      # new on the destination
+    changed: List[str] = field(default_factory=list)    # destination held another version
+    deleted: List[str] = field(default_factory=list)    # recorded last run, gone from the source now
+    skipped: List[str] = field(default_factory=list)    # already in sync — no bytes moved
+    bytes_moved: int = 0                                 # chunk bytes uploaded / fetched
+
+    @property
+    def synced(self) -> List[str]:
+        return sorted(self.added + self.changed)
+
+    def summary(self) -> str:
+        return (f"added {len(self.added)}, changed {len(self.changed)}, deleted {len(self.deleted)}, "
+                f"skipped {len(self.skipped)}, {self.bytes_moved} bytes moved")
+
+
+class SyncState:
+    """``path -> entry`` for one local directory + mesh, loaded from and saved to ``path``."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.entries: Dict[str, dict] = dict(data.get("entries", {}))
+        except (FileNotFoundError, ValueError, AttributeError):
+            self.entries = {}
+
+    def get(self, rel: str) -> Optional[dict]:
+        return self.entries.get(rel)
+
+    def paths(self) -> set:
+        return set(self.entries)
+
+    def unchanged(self, rel: str, st: os.stat_result) -> bool:
+        """True when ``st`` matches the recorded file and that record is not racy."""
+        e = self.entries.get(rel)
+        return (e is not None and e["size"] == st.st_size and e["mtime_ns"] == st.st_mtime_ns
+                and st.st_mtime_ns < e["recorded_ns"] - RACY_NS)
+
+    def record(self, rel: str, st: os.stat_result, root: str, version: int) -> None:
+        self.entries[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "root": root,
+                             "version": version, "recorded_ns": time.time_ns()}
+
+    def forget(self, rel: str) -> None:
+        self.entries.pop(rel, None)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"entries": self.entries}, fh, sort_keys=True)
+            os.replace(tmp, self.path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
@@ -75,6 +75,18 @@ def aggregate_vantages(reports: Sequence[VantageReport], *, quorum: int) -> Thre
                          partition=partition, vantages=len(reports))
 
 
+def vantage_from_fetches(vantage: str, fetches: Sequence["object"], *, unreachable_fraction: float,
+                         partition_suspected: bool = False) -> VantageReport:
+    """Build a vantage's report from the leaf reads it performed (``leaf_propagation.FetchReport``).
+
+    Every distinct node the decoder caught serving a lying fragment is one witnessed anomaly, so
+    Byzantine storage nodes feed the same quorum-resolved threat signal as any other anomaly.
+    """
+    liars = {node for f in fetches for node in getattr(f, "liar_nodes", ())}
+    return VantageReport(vantage=vantage, unreachable_fraction=unreachable_fraction,
+                         anomalies_seen=len(liars), partition_suspected=partition_suspected)
+
+
 # ── policy (declared in the registry) ─────────────────────────────────────────────────────────
 
 @dataclass(frozen=True)
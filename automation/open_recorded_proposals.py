@@ -21,7 +21,7 @@ import tempfile
 from pathlib import Path
 from typing import Callable, List, Optional
 
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import open_queue, state_dir
 from automation.pr_opener import open_pr
 from automation.self_heal import remediate_via_pr
 
@@ -69,21 +69,14 @@ def drain_and_open(
     there; otherwise the PR is opened in *repo_dir* (the local checkout).
     """
     checkout = checkout if checkout is not None else clone_target
-    proposals = DurableQueue(proposals_dir if proposals_dir is not None else state_dir() / "proposals")
-    dead = DurableQueue(dead_letter_dir if dead_letter_dir is not None else state_dir() / "proposals-dead")
+    proposals = open_queue(proposals_dir if proposals_dir is not None else state_dir() / "proposals")
+    dead = open_queue(dead_letter_dir if dead_letter_dir is not None else state_dir() / "proposals-dead")
     repo_dir = Path(repo_dir) if repo_dir is not None else _repo_toplevel()
 
     # Snapshot the current queue into a batch FIRST, then process. A failure re-queued
     # below must wait for the NEXT run, not be re-consumed (and burn all its attempts) in
     # this one — draining up front makes each run cost each proposal exactly one attempt.
-    batch: List[dict] = []
-    while not proposals.empty():
-        if limit is not None and len(batch) >= limit:
-            break
-        try:
-            batch.append(proposals.get_nowait())
-        except Exception:
-            break
+    batch: List[dict] = proposals.get_many(limit)
 
     results: List[dict] = []
     for entry in batch:
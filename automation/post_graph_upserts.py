@@ -16,7 +16,7 @@ import urllib.request
 from pathlib import Path
 from typing import Callable, List, Optional
 
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import open_queue, state_dir
 
 MAX_ATTEMPTS = 5
 ENDPOINT_ENV = "CRYSTAL_ATLAS_GRAPH_UPSERT_URL"
@@ -46,15 +46,10 @@ def drain_and_post(*, upserts_dir: Optional[Path] = None, dead_letter_dir: Optio
                    max_attempts: int = MAX_ATTEMPTS) -> List[dict]:
     """Drain graph-upserts and POST each; dead-letter after max_attempts. Returns per-item results."""
     poster = poster or _http_post
-    q = DurableQueue(upserts_dir if upserts_dir is not None else state_dir() / "graph-upserts")
-    dead = DurableQueue(dead_letter_dir if dead_letter_dir is not None else state_dir() / "graph-upserts-dead")
+    q = open_queue(upserts_dir if upserts_dir is not None else state_dir() / "graph-upserts")
+    dead = open_queue(dead_letter_dir if dead_letter_dir is not None else state_dir() / "graph-upserts-dead")
 
-    batch: List[dict] = []
-    while not q.empty():
-        try:
-            batch.append(q.get_nowait())
-        except Exception:
-            break
+    batch: List[dict] = q.get_many()
 
     results: List[dict] = []
     for upsert in batch:
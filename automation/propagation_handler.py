@@ -49,6 +49,11 @@ class PropagationHandler:
     event_log:
         Optional list that receives immutable event log entries.  If not
         provided, a module-level list is used.
+    engine:
+        Optional :class:`~engines.propagation_engine.ResidentPropagationEngine`.
+        Repos missing from ``registry`` are looked up in its current snapshot
+        instead of being skipped; the snapshot is reloaded only when the
+        registry files change, so this costs nothing per event.
     """
 
     def __init__(
@@ -57,8 +62,10 @@ class PropagationHandler:
         devops_orchestrator=None,
         rate_limiter=None,
         event_log: Optional[List] = None,
+        engine=None,
     ) -> None:
         self.registry = registry or {}
+        self.engine = engine
         self.orchestrator = devops_orchestrator
         self.rate_limiter = rate_limiter
         self.event_log: List[dict] = event_log if event_log is not None else []
@@ -91,6 +98,12 @@ class PropagationHandler:
         )
 
         repo_meta = self.registry.get(repo)
+        if repo_meta is None and self.engine is not None:
+            owner, _, name = repo.rpartition("/")
+            prefix = f"{owner}/" if owner else ""
+            repo_meta = {
+                "dependents": [prefix + d for d in self.engine.current().dependents_of(name)],
+            }
         if repo_meta is None:
             logger.info("Repo %s not found in registry — skipping propagation", repo)
             return
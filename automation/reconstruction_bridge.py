@@ -24,7 +24,7 @@ from __future__ import annotations
 from typing import List, Optional, Tuple
 
 from automation.crystal_atlas import INTERNAL, _rfc3339
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import DurableQueue, open_queue, state_dir
 from automation.envelope import ulid
 
 DEFAULT_TENANT = "sociosphere"
@@ -116,5 +116,5 @@ def emit_reconstruction(records: List[dict], manifest: dict, *,
     """Produce the upsert and record it to the shared graph-upserts queue for the poster to drain."""
     upsert, skipped = to_graph_upsert(records, manifest, tenant_id=tenant_id)
     if upsert["claims"]:  # nothing grounded → nothing to say; don't emit an empty, claimless upsert
-        (sink if sink is not None else DurableQueue(state_dir() / "graph-upserts")).put(upsert)
+        (sink if sink is not None else open_queue(state_dir() / "graph-upserts")).put(upsert)
     return upsert, skipped
@@ -35,7 +35,7 @@ if _VENDOR not in sys.path:
 
 from procyber.semantic import BOTTOM, SemanticAddress, meet, prim  # vendored kernel
 
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import DurableQueue, open_queue, state_dir
 
 # Decision governance is a declared, overridable policy with an opinionated default
 # (automation/policy.py + registry/self-heal-policy.yaml). These module-level names remain as
@@ -303,16 +303,12 @@ def run_once(inbox: Optional[DurableQueue] = None,
     from automation.suppression import fingerprint
 
     active_policy = policy or DEFAULT_POLICY
-    inbox = inbox if inbox is not None else DurableQueue(state_dir() / "beacons")
-    decisions = decisions if decisions is not None else DurableQueue(state_dir() / "decisions")
+    inbox = inbox if inbox is not None else open_queue(state_dir() / "beacons")
+    decisions = decisions if decisions is not None else open_queue(state_dir() / "decisions")
 
     # 1. Drain and suppress-filter (a condition decided within the cooldown is skipped).
     survivors: List[dict] = []
-    while not inbox.empty():
-        try:
-            beacon = inbox.get_nowait()
-        except Exception:
-            break
+    for beacon in inbox.get_many():
         if suppressor is not None and not suppressor.should_process(
             fingerprint(beacon), cooldown_seconds=active_policy.suppression_cooldown_seconds
         ):
@@ -0,0 +1,199 @@
+"""Persistent per-blob result cache for the repository content scanners.
+
+A content scanner's verdict on a file depends only on the file's bytes and on
+the rules it ran, so it is stored under (ruleset hash, git blob SHA). The blob
+SHAs of every tracked file come from one ``git ls-files -s`` call (plus one
+``git hash-object`` for files modified in the working tree), so a rerun reads
+and scans only the files whose content changed since the cache was filled.
+
+Stdlib-only: the cache is a SQLite WAL file, one row per (ruleset, blob).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+# Regular files only: symlinks (120000) hash their target path, gitlinks (160000) are directories.
+_CACHEABLE_MODES = {b"100644", b"100755"}
+# Rows per ``IN (...)`` lookup; below SQLite's historical 999 bound-parameter limit.
+_LOOKUP_BATCH = 500
+
+
+def ruleset_hash(*parts: Any) -> str:
+    """A stable digest of everything a scan result depends on besides the file bytes."""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _git(root: Path, *args: str, stdin: bytes | None = None) -> bytes | None:
+    try:
+        cp = subprocess.run(
+            ["git", *args],
+            cwd=str(root),
+            input=stdin,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return cp.stdout
+
+
+def blob_shas(root: Path) -> dict[str, str] | None:
+    """Map each tracked regular file under ``root`` (posix path relative to it) to its blob SHA.
+
+    The SHA is that of the working-tree content: files the index says are
+    modified are re-hashed with ``git hash-object``, and tracked files missing
+    from the working tree are left out. None when ``root`` is not in a git
+    work tree.
+    """
+    staged = _git(root, "ls-files", "-s", "-z")
+    if staged is None:
+        return None
+    shas: dict[str, str] = {}
+    for entry in staged.split(b"\0"):
+        if not entry:
+            continue
+        meta, _, raw_path = entry.partition(b"\t")
+        mode, sha, _stage = meta.split(b" ")
+        if mode in _CACHEABLE_MODES:
+            shas[raw_path.decode("utf-8", errors="replace")] = sha.decode("ascii")
+
+    modified = _git(root, "ls-files", "-m", "-z") or b""
+    changed = [p for p in modified.decode("utf-8", errors="replace").split("\0") if p in shas]
+    present = [p for p in changed if (root / p).is_file()]
+    for path in set(changed) - set(present):
+        del shas[path]
+    if present:
+        hashed = _git(root, "hash-object", "--stdin-paths", stdin="\n".join(present).encode("utf-8") + b"\n")
+        if hashed is None:
+            for path in present:
+                del shas[path]
+        else:
+            for path, sha in zip(present, hashed.decode("ascii").split()):
+                shas[path] = sha
+    return shas
+
+
+class ScanCache:
+    """(ruleset, blob SHA) -> JSON scan result, in a SQLite file shared by every scanner.
+
+    ``scope`` names the scanner; opening a scope with a new ruleset hash drops
+    that scope's rows for older rulesets, so a policy edit does not leave dead
+    results behind. ``hits`` and ``misses`` count lookups since opening.
+    """
+
+    def __init__(self, path: Path, scope: str, ruleset: str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.scope = scope
+        self.ruleset = ruleset
+        self.hits = 0
+        self.misses = 0
+        self._db = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS scans (ruleset TEXT NOT NULL, blob TEXT NOT NULL, "
+            "scope TEXT NOT NULL, result TEXT NOT NULL, PRIMARY KEY (ruleset, blob)) WITHOUT ROWID"
+        )
+        self._db.execute("DELETE FROM scans WHERE scope = ? AND ruleset != ?", (scope, ruleset))
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ScanCache":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def get_many(self, blobs: Iterable[str]) -> dict[str, Any]:
+        """The cached result of every blob in ``blobs`` that has one."""
+        wanted = list(dict.fromkeys(blobs))
+        found: dict[str, Any] = {}
+        for i in range(0, len(wanted), _LOOKUP_BATCH):
+            batch = wanted[i:i + _LOOKUP_BATCH]
+            rows = self._db.execute(
+                f"SELECT blob, result FROM scans WHERE ruleset = ? AND blob IN ({','.join('?' * len(batch))})",
+                (self.ruleset, *batch),
+            )
+            found.update((blob, json.loads(result)) for blob, result in rows)
+        self.hits += len(found)
+        self.misses += len(wanted) - len(found)
+        return found
+
+    def put_many(self, results: Iterable[tuple[str, Any]]) -> None:
+        """Store ``(blob, result)`` pairs in one transaction."""
+        rows = [(self.ruleset, blob, self.scope, json.dumps(result, separators=(",", ":")))
+                for blob, result in results]
+        if not rows:
+            return
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._db.executemany("INSERT OR REPLACE INTO scans VALUES (?, ?, ?, ?)", rows)
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+
+
+def scan_files(
+    root: Path,
+    files: Iterable[Path],
+    scan: Callable[[Path], Any],
+    *,
+    scope: str,
+    rules: Any,
+    cache_path: Path | None = None,
+    variant: Callable[[Path], str] | None = None,
+) -> list[tuple[Path, Any]]:
+    """``(path, scan(path))`` for each of ``files``, in order; files whose scan raises OSError are left out.
+
+    With ``cache_path``, a tracked file under ``root`` whose blob was scanned
+    before under the same ``scope`` and ``rules`` is answered from the cache
+    without calling ``scan``; fresh results (which must be JSON-serialisable)
+    are stored for the next run. When the result also depends on the path,
+    ``variant(path)`` is made part of the key.
+    """
+    files = list(files)
+    if cache_path is None:
+        return list(_scan_each(files, scan))
+
+    shas = blob_shas(root) or {}
+    blobs: list[str | None] = []
+    for path in files:
+        try:
+            blob = shas.get(path.relative_to(root).as_posix())
+        except ValueError:
+            blob = None
+        blobs.append(f"{blob}:{variant(path)}" if blob is not None and variant is not None else blob)
+    with ScanCache(cache_path, scope, ruleset_hash(scope, rules)) as cache:
+        cached = cache.get_many(b for b in blobs if b is not None)
+        results: list[tuple[Path, Any]] = []
+        fresh: list[tuple[str, Any]] = []
+        for path, blob in zip(files, blobs):
+            if blob in cached:
+                results.append((path, cached[blob]))
+                continue
+            for _, value in _scan_each([path], scan):
+                results.append((path, value))
+                if blob is not None:
+                    fresh.append((blob, value))
+        cache.put_many(fresh)
+    return results
+
+
+def _scan_each(files: list[Path], scan: Callable[[Path], Any]) -> Iterable[tuple[Path, Any]]:
+    for path in files:
+        try:
+            value = scan(path)
+        except OSError:
+            continue
+        yield path, value
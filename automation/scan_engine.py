@@ -0,0 +1,373 @@
+"""One-walk, multi-rule content scanning shared by the compliance validators.
+
+Checkers register ``Rule``s (owning check, compiled pattern, severity, path
+globs) on a ``ScanEngine``; ``ScanEngine.scan`` then reads each file of one
+walk once and runs every rule that applies at its path over that one buffer,
+returning the hits grouped by check so each checker builds its own report.
+
+Two kinds of rule:
+
+- per-line: one hit per matching line, tested line by line as the checkers
+  always did;
+- per-file: a search of the whole buffer; the first per-file rule of a check
+  that matches (in registration order) is that check's only hit for the file.
+
+Before any regex runs, a rule is dropped for a file whose buffer lacks all of
+the rule's required literals (``rule_literals``; case-insensitive rules with
+ASCII literals compare them against ``_fold``ed text). A surviving per-line
+rule is then searched for in the whole buffer — as written when its match
+cannot depend on what surrounds a line, else with its anchors and lookarounds
+dropped (``buffer_pattern``; rules that cannot be widened exactly skip this
+step) — and the line loop runs only the rules still left, so a clean file
+costs a few substring tests.
+
+With ``cache_path`` the per-file results go through the blob-SHA scan cache.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+from automation import scan_cache
+
+try:
+    from re import _compiler as sre_compile, _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_compile  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+
+# Bump when ScanEngine's hits for the same bytes and rules change; keys the scan cache.
+CONTENT_SCAN_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A pattern owned by ``check``, applied to files whose path matches ``include`` and not ``exclude``.
+
+    Globs are matched against the lower-cased file name, or against the
+    lower-cased path relative to the scan root when they contain a ``/``.
+    """
+
+    check: str
+    id: str
+    pattern: re.Pattern[str]
+    severity: str = "error"
+    include: tuple[str, ...] = ("*",)
+    exclude: tuple[str, ...] = ()
+    per_line: bool = True
+
+    def signature(self) -> list[Any]:
+        return [self.check, self.id, self.pattern.pattern, self.pattern.flags, self.severity,
+                list(self.include), list(self.exclude), self.per_line]
+
+
+class Hit(NamedTuple):
+    path: Path
+    rule: Rule
+    line: int | None  # None for per-file rules
+    text: str | None  # the stripped line, for per-line rules
+
+
+def _glob_matches(globs: tuple[str, ...], name: str, rel: str) -> bool:
+    return any(fnmatch.fnmatchcase(rel if "/" in g else name, g) for g in globs)
+
+
+# Zero-width assertions that look only at word/non-word neighbours; every
+# str.splitlines() separator is a non-word character, so they judge a line's
+# edges the same inside the buffer as on the split line.
+_LOCAL_AT = {sre_parse.AT_BOUNDARY, sre_parse.AT_NON_BOUNDARY}
+_POSSESSIVE_REPEAT = getattr(sre_parse, "POSSESSIVE_REPEAT", None)  # Python 3.11+
+_REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, _POSSESSIVE_REPEAT}
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+
+
+def _is_line_local(items: Any) -> bool:
+    """True when a match of the parsed pattern never depends on text outside the matched span."""
+    for op, av in items:
+        if op is sre_parse.AT:
+            local = av in _LOCAL_AT
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            local = False
+        elif op is sre_parse.SUBPATTERN:
+            local = _is_line_local(av[3])
+        elif op is sre_parse.BRANCH:
+            local = all(_is_line_local(b) for b in av[1])
+        elif op in _REPEATS:
+            local = _is_line_local(av[2])
+        elif op is _ATOMIC_GROUP:
+            local = _is_line_local(av)
+        elif op is sre_parse.GROUPREF_EXISTS:
+            local = _is_line_local(av[1]) and (av[2] is None or _is_line_local(av[2]))
+        else:
+            local = True
+        if not local:
+            return False
+    return True
+
+
+def _relax(items: Any) -> Any:
+    """The parsed pattern without its non-local assertions: it matches wherever the original does.
+
+    Dropping a zero-width condition (anchor or lookaround, with everything inside
+    it) only widens a pattern, and what remains is line-local. Raises ValueError
+    for patterns with group references, which a dropped lookaround could affect,
+    and for atomic groups and possessive repeats: these never give back what they
+    consumed, so a widened body can commit to a longer match and make the rest of
+    the pattern fail where the original matched (``(?>a(?=c)|ab)c`` on "abc").
+    """
+    data = []
+    for op, av in items:
+        if (op is sre_parse.AT and av not in _LOCAL_AT) or op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            continue
+        if op in (_ATOMIC_GROUP, _POSSESSIVE_REPEAT):
+            raise ValueError("atomic groups and possessive repeats are not relaxed")
+        if op is sre_parse.SUBPATTERN:
+            av = (av[0], av[1], av[2], _relax(av[3]))
+        elif op is sre_parse.BRANCH:
+            av = (av[0], [_relax(b) for b in av[1]])
+        elif op in _REPEATS:
+            av = (av[0], av[1], _relax(av[2]))
+        elif op in (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS):
+            raise ValueError("group references are not relaxed")
+        data.append((op, av))
+    return sre_parse.SubPattern(items.state, data)
+
+
+def buffer_pattern(pattern: re.Pattern[str]) -> re.Pattern[str] | None:
+    """A pattern that matches a buffer whenever ``pattern`` matches one of its lines, or None.
+
+    ``pattern`` itself when it is line-local, else its ``_relax``ed form.
+    """
+    parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    if _is_line_local(parsed):
+        return pattern
+    try:
+        return sre_compile.compile(_relax(parsed), pattern.flags)
+    except (ValueError, re.error):
+        return None
+
+
+# Rules with at most this many expanded literal alternatives get a prefilter entry.
+_MAX_LITERAL_ALTERNATIVES = 64
+
+
+def _literal_set(items: list[Any]) -> list[str] | None:
+    """Every string the parsed pattern ``items`` can match, if that set is finite and small."""
+    out = [""]
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            alts = [chr(av)]
+        elif op is sre_parse.AT:
+            alts = [""]  # zero-width: consumes nothing
+        elif op is sre_parse.IN and all(o is sre_parse.LITERAL for o, _ in av):
+            alts = [chr(c) for _, c in av]
+        elif op is sre_parse.SUBPATTERN and not (av[1] or av[2]):
+            alts = _literal_set(av[3])
+        elif op is sre_parse.BRANCH:
+            branches = [_literal_set(b) for b in av[1]]
+            alts = None if any(b is None for b in branches) else [a for b in branches for a in b]
+        elif op is sre_parse.MAX_REPEAT and av[0] == 0 and av[1] == 1:
+            inner = _literal_set(av[2])
+            alts = None if inner is None else ["", *inner]
+        else:
+            return None
+        if alts is None or len(out) * len(alts) > _MAX_LITERAL_ALTERNATIVES:
+            return None
+        out = [a + b for a in out for b in alts]
+    return out
+
+
+def _required_literals(items: list[Any]) -> list[str] | None:
+    """Literals one of which every match of ``items`` contains (longest shortest one), or None."""
+    best: list[str] | None = None
+
+    def consider(alts: list[str] | None) -> None:
+        nonlocal best
+        if alts and all(alts) and (best is None or min(map(len, alts)) > min(map(len, best))):
+            best = sorted(set(alts))
+
+    run = [""]
+    for op, av in items:
+        alts = _literal_set([(op, av)])
+        if alts is not None and len(run) * len(alts) <= _MAX_LITERAL_ALTERNATIVES:
+            run = [a + b for a in run for b in alts]
+            continue
+        consider(run)
+        run = [""]
+        if op is sre_parse.SUBPATTERN and not (av[1] or av[2]):
+            consider(_required_literals(av[3]))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            consider(_required_literals(av[2]))
+        elif op is sre_parse.BRANCH:
+            branches = [_required_literals(b) for b in av[1]]
+            if all(b is not None for b in branches):
+                consider([a for b in branches for a in b])
+    consider(run)
+    return best
+
+
+def rule_literals(pattern: str, flags: int = 0) -> tuple[list[str], bool] | None:
+    """(literals, ignorecase) such that every match of ``pattern`` contains one literal.
+
+    None when no such set can be derived; the rule is then run on every line.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    literals = _required_literals(list(parsed))
+    if literals is None:
+        return None
+    return literals, bool(parsed.state.flags & re.IGNORECASE)
+
+
+# Non-ASCII characters that re.IGNORECASE matches to an ASCII letter: those whose
+# simple lowercase is ASCII, and re's extra case equivalences (re._casefix).
+_ASCII_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _fold(text: str) -> str:
+    """Lower-cased ``text`` containing ``a.lower()`` wherever ``a`` (ASCII) matches case-insensitively."""
+    if text.isascii() or not any(c in text for c in "\u0130\u0131\u017f\u212a"):
+        return text.lower()
+    return text.translate(_ASCII_FOLDS).lower()
+
+
+class _Plan(NamedTuple):
+    filtered: tuple[int, ...]  # per-line rules tried on the buffer first
+    always: tuple[int, ...]  # per-line rules run on every line
+    per_file: tuple[tuple[int, ...], ...]  # per-file rules, one tuple per check
+
+
+class ScanEngine:
+    """Rules from any number of checks, run over one walk; see the module docstring."""
+
+    def __init__(self, rules: Iterable[Rule] = (), *, encoding_errors: str = "replace") -> None:
+        self.rules: list[Rule] = []
+        self.encoding_errors = encoding_errors
+        self._buffer_patterns: list[re.Pattern[str] | None] = []
+        self._literals: list[tuple[tuple[str, ...], bool] | None] = []
+        self._selectors: dict[tuple[tuple[str, ...], tuple[str, ...]], list[int]] = {}
+        self._plans: dict[frozenset[tuple[tuple[str, ...], tuple[str, ...]]], _Plan] = {}
+        for rule in rules:
+            self.add(rule)
+
+    def add(self, rule: Rule) -> None:
+        self.rules.append(rule)
+        self._buffer_patterns.append(buffer_pattern(rule.pattern))
+        derived = rule_literals(rule.pattern.pattern, rule.pattern.flags)
+        if derived is not None:
+            literals, ignorecase = derived
+            if ignorecase and not all(map(str.isascii, literals)):
+                derived = None  # only ASCII literals are folded exactly; always search
+            else:
+                derived = (tuple(a.lower() for a in literals) if ignorecase else tuple(literals), ignorecase)
+        self._literals.append(derived)
+        self._selectors.setdefault((rule.include, rule.exclude), []).append(len(self.rules) - 1)
+        self._plans.clear()
+
+    def signature(self) -> list[Any]:
+        """Everything besides a file's bytes and path that its hits depend on."""
+        return [CONTENT_SCAN_VERSION, self.encoding_errors, [rule.signature() for rule in self.rules]]
+
+    def _applicable(self, path: Path, root: Path) -> frozenset[tuple[tuple[str, ...], tuple[str, ...]]]:
+        name = path.name.lower()
+        try:
+            rel = path.relative_to(root).as_posix().lower()
+        except ValueError:
+            rel = path.as_posix().lower()
+        return frozenset(
+            selector for selector in self._selectors
+            if _glob_matches(selector[0], name, rel) and not _glob_matches(selector[1], name, rel)
+        )
+
+    def _plan(self, selectors: frozenset[tuple[tuple[str, ...], tuple[str, ...]]]) -> _Plan:
+        plan = self._plans.get(selectors)
+        if plan is None:
+            indices = sorted(i for s in selectors for i in self._selectors[s])
+            per_line = [i for i in indices if self.rules[i].per_line]
+            checks: dict[str, list[int]] = {}
+            for i in indices:
+                if not self.rules[i].per_line:
+                    checks.setdefault(self.rules[i].check, []).append(i)
+            plan = self._plans[selectors] = _Plan(
+                filtered=tuple(i for i in per_line if self._buffer_patterns[i] is not None),
+                always=tuple(i for i in per_line if self._buffer_patterns[i] is None),
+                per_file=tuple(map(tuple, checks.values())),
+            )
+        return plan
+
+    def _may_match(self, i: int, text: str, folded: str) -> bool:
+        """False only when rule ``i`` cannot match anywhere in ``text``."""
+        derived = self._literals[i]
+        if derived is None:
+            return True
+        literals, ignorecase = derived
+        haystack = folded if ignorecase else text
+        return any(a in haystack for a in literals)
+
+    def _scan_text(self, text: str, plan: _Plan) -> list[list[Any]]:
+        rules = self.rules
+        folded = _fold(text) if any(d is not None and d[1] for d in self._literals) else text
+        hits: list[list[Any]] = []
+        for group in plan.per_file:
+            for i in group:
+                if self._may_match(i, text, folded) and rules[i].pattern.search(text):
+                    hits.append([i, None, None])
+                    break
+        line_rules = sorted((
+            *(i for i in plan.filtered
+              if self._may_match(i, text, folded) and self._buffer_patterns[i].search(text)),  # type: ignore[union-attr]
+            *(i for i in plan.always if self._may_match(i, text, folded)),
+        ))
+        if line_rules:
+            patterns = [(i, rules[i].pattern.search) for i in line_rules]
+            for lineno, line in enumerate(text.splitlines(), start=1):
+                for i, search in patterns:
+                    if search(line):
+                        hits.append([i, lineno, line.strip()])
+        return hits
+
+    def scan(
+        self,
+        root: Path,
+        files: Iterable[Path],
+        *,
+        scope: str,
+        cache_path: Path | None = None,
+    ) -> dict[str, list[Hit]]:
+        """Hits per check over ``files`` (read once each), in file, line and rule order.
+
+        Files that cannot be read are skipped. ``scope`` names the caller in the
+        scan cache; cached results are keyed by blob and by which rules apply
+        at the file's path.
+        """
+        plans: dict[Path, frozenset[tuple[tuple[str, ...], tuple[str, ...]]]] = {}
+        selected = []
+        for path in files:
+            selectors = self._applicable(path, root)
+            if selectors:
+                plans[path] = selectors
+                selected.append(path)
+
+        def scan(path: Path) -> list[list[Any]]:
+            text = path.read_text(encoding="utf-8", errors=self.encoding_errors)
+            return self._scan_text(text, self._plan(plans[path]))
+
+        def variant(path: Path) -> str:
+            return ",".join(str(self._selectors[s][0]) for s in sorted(plans[path]))
+
+        results = scan_cache.scan_files(
+            root, selected, scan, scope=scope, rules=self.signature(), cache_path=cache_path, variant=variant,
+        )
+        out: dict[str, list[Hit]] = {rule.check: [] for rule in self.rules}
+        for path, hits in results:
+            for i, line, text in hits:
+                rule = self.rules[i]
+                out[rule.check].append(Hit(path, rule, line, text))
+        return out
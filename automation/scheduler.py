@@ -70,7 +70,7 @@ except ImportError:  # pragma: no cover
     BackgroundScheduler = None  # type: ignore[assignment,misc]
 
 from automation.rate_limiter import RateLimiter
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import DurableQueue, open_queue, state_dir
 from automation import liveness
 
 # API call cost estimates
@@ -452,7 +452,25 @@ class RegistryScheduler:
 
 def _beacon_inbox() -> DurableQueue:
     """The responder inbox: structured beacons a reasoned responder will consume."""
-    return DurableQueue(state_dir() / "beacons")
+    return open_queue(state_dir() / "beacons")
+
+
+def _cascade_for(repo: Optional[str]) -> Optional[list]:
+    """The cascade a change to *repo* would trigger, from the resident propagation graph.
+
+    The process-wide ResidentPropagationEngine reloads only when the registry files
+    change, so each drained event costs a few stat() calls instead of a YAML parse
+    and graph rebuild. None when there is no repo or the graph cannot be loaded —
+    the beacon is still emitted without it.
+    """
+    if not repo:
+        return None
+    try:
+        from engines.propagation_engine import resident_engine  # lazy: keeps yaml off import
+        return resident_engine().current().compute_cascade(repo.rpartition("/")[2])
+    except Exception:
+        logger.exception("Propagation graph unavailable; beaconing %s without a cascade", repo)
+        return None
 
 
 def observe_and_beacon(event: dict) -> None:
@@ -462,7 +480,8 @@ def observe_and_beacon(event: dict) -> None:
     It deliberately takes NO world-remediating action: choosing fix vs. alert vs.
     escalate is the job of a reasoned responder (not wired in this change), so the
     honest default is to record and beacon, never to silently act or to pretend a
-    simulation was a fix.
+    simulation was a fix. The beacon carries the dependents' cascade so the
+    responder sees the blast radius without reloading the registry.
     """
     beacon = {
         "kind": "event_observed",
@@ -470,6 +489,9 @@ def observe_and_beacon(event: dict) -> None:
         "observed_at": datetime.now(timezone.utc).isoformat(),
         "decision": "deferred: no reasoned responder wired yet",
     }
+    cascade = _cascade_for(event.get("repo"))
+    if cascade is not None:
+        beacon["cascade"] = cascade
     _beacon_inbox().put(beacon)
     logger.info("Observed event; emitted beacon (repo=%s)", event.get("repo", "?"))
 
@@ -486,7 +508,7 @@ def build_scheduler(event_queue=None, propagation_handler: Optional[Callable] =
     """
     return RegistryScheduler(
         rate_limiter=RateLimiter(),
-        event_queue=event_queue if event_queue is not None else DurableQueue(),
+        event_queue=event_queue if event_queue is not None else open_queue(),
         propagation_handler=propagation_handler or observe_and_beacon,
     )
 
@@ -507,6 +529,10 @@ def run(heartbeat_interval: float = 30.0) -> None:
 
     # Refuse to run a daemon that would beat a green heartbeat while every job fails.
     preflight()
+    # Load the registry graph once up front; drained events then hit the resident
+    # snapshot, which reloads only when registry files change.
+    from engines.propagation_engine import resident_engine
+    resident_engine().current()
 
     scheduler = build_scheduler()
     scheduler.start()
@@ -16,13 +16,29 @@ reconcile()
     conversation_id / parent_id / workspace_id / task_id
   → matched  → attach to session, mark recovered
   → unmatched after TTL → quarantine + emit OrphanEventReceipt
+
+Matching is a lookup: every event attached to a session is indexed under each
+reconcile key it carries, so an orphan is matched in four dict probes instead of
+a walk over every event of every session.
+
+Retention
+---------
+By default nothing is ever forgotten.  With ``session_ttl_seconds`` a session
+idle that long is dropped (with its events and their index entries); with
+``retention_seconds`` settled orphan entries and receipts are dropped that long
+after they settled.  Expiry runs at the start of every ``reconcile()`` (or on an
+explicit ``expire()``), off a deadline heap, so it costs O(expired · log n).
 """
 
+import heapq
+import itertools
 import logging
+import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -118,10 +134,28 @@ class SessionQuarantineProtocol:
     ttl_seconds:
         Time-to-live (seconds) for orphan events before they are quarantined.
         Defaults to :data:`DEFAULT_TTL_SECONDS`.
+    session_ttl_seconds:
+        Drop a session after this many seconds without a registration or an
+        attached event.  ``None`` (default) keeps sessions forever.
+    retention_seconds:
+        Drop settled (recovered or quarantined) orphan entries and receipts this
+        many seconds after they settled.  ``None`` (default) keeps them forever.
+    clock:
+        Monotonic clock for the two retention windows above.
     """
 
-    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        *,
+        session_ttl_seconds: Optional[float] = None,
+        retention_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self.ttl_seconds = ttl_seconds
+        self.session_ttl_seconds = session_ttl_seconds
+        self.retention_seconds = retention_seconds
+        self._clock = clock
 
         # session_id → DAG node
         self._sessions: Dict[str, SessionDAGNode] = {}
@@ -129,12 +163,29 @@ class SessionQuarantineProtocol:
         # event_id → OrphanEntry
         self._orphan_queue: Dict[str, OrphanEntry] = {}
 
+        # event_id → OrphanEntry, unreconciled only (the entries reconcile() visits)
+        self._pending: Dict[str, OrphanEntry] = {}
+
         # All emitted receipts (quarantined and recovered)
         self._receipts: List[OrphanEventReceipt] = []
 
         # Reconciliation attempt count per event_id
         self._reconcile_counts: Dict[str, int] = {}
 
+        # reconcile key → value → {session_id: events on it carrying that value}
+        self._index: Dict[str, Dict[object, Dict[str, int]]] = {k: {} for k in _RECONCILE_KEYS}
+        # session_id → how many of its events are in the index; registration order
+        self._indexed: Dict[str, int] = {}
+        self._order: Dict[str, int] = {}
+        self._registrations = itertools.count()
+
+        # Retention: session deadline heap (lazily refreshed from _last_seen), and
+        # settled orphans / receipts in the order they settled.
+        self._session_heap: List[Tuple[float, int, str]] = []
+        self._last_seen: Dict[str, float] = {}
+        self._settled: Deque[Tuple[float, str, OrphanEntry]] = deque()
+        self._receipt_deadlines: Deque[float] = deque()
+
     # ------------------------------------------------------------------
     # Session management
     # ------------------------------------------------------------------
@@ -143,6 +194,14 @@ class SessionQuarantineProtocol:
         """Register a new known session and return its DAG node."""
         if session_id not in self._sessions:
             self._sessions[session_id] = SessionDAGNode(session_id=session_id)
+            self._indexed[session_id] = 0
+            self._order[session_id] = order = next(self._registrations)
+            if self.session_ttl_seconds is not None:
+                now = self._clock()
+                self._last_seen[session_id] = now
+                heapq.heappush(
+                    self._session_heap, (now + self.session_ttl_seconds, order, session_id)
+                )
             logger.info("Session registered: %s", session_id)
         return self._sessions[session_id]
 
@@ -192,10 +251,12 @@ class SessionQuarantineProtocol:
         - if matched: attaches the event, marks it recovered, and emits a receipt
         - if TTL exceeded without a match: quarantines the event and emits a receipt
         """
+        self.expire()
+        self._sync_index()
         now = datetime.now(timezone.utc)
         to_quarantine = []
 
-        for entry in list(self._orphan_queue.values()):
+        for entry in list(self._pending.values()):
             if entry.reconciled:
                 continue
 
@@ -208,6 +269,7 @@ class SessionQuarantineProtocol:
                 self._attach_to_session(matched_session, entry.event)
                 entry.reconciled = True
                 entry.recovered_session_id = matched_session
+                self._settle(entry)
                 self._emit_receipt(entry, status="recovered")
                 logger.info(
                     "Orphan event %s recovered → session %s",
@@ -227,13 +289,46 @@ class SessionQuarantineProtocol:
         for entry in to_quarantine:
             self._quarantine(entry)
 
+    def expire(self) -> int:
+        """Drop whatever has outlived its retention window; return how many items went.
+
+        Called by :meth:`reconcile`; exposed for callers that ingest without
+        reconciling.  A no-op for any window left at ``None``.
+        """
+        now = self._clock()
+        dropped = 0
+        heap = self._session_heap
+        while heap and heap[0][0] <= now:
+            _, order, session_id = heapq.heappop(heap)
+            if self._order.get(session_id) != order:
+                continue  # dropped already, or re-registered under a new entry
+            idle_until = self._last_seen[session_id] + self.session_ttl_seconds
+            if idle_until > now:
+                heapq.heappush(heap, (idle_until, order, session_id))
+                continue
+            self._drop_session(session_id)
+            dropped += 1
+        while self._settled and self._settled[0][0] <= now:
+            _, event_id, entry = self._settled.popleft()
+            if self._orphan_queue.get(event_id) is entry:
+                del self._orphan_queue[event_id]
+                self._reconcile_counts.pop(event_id, None)
+                dropped += 1
+        expired_receipts = 0
+        while self._receipt_deadlines and self._receipt_deadlines[0] <= now:
+            self._receipt_deadlines.popleft()
+            expired_receipts += 1
+        if expired_receipts:
+            del self._receipts[:expired_receipts]
+        return dropped + expired_receipts
+
     # ------------------------------------------------------------------
     # Accessors
     # ------------------------------------------------------------------
 
     def get_orphan_queue(self) -> List[OrphanEntry]:
         """Return pending (unreconciled) orphan entries."""
-        return [e for e in self._orphan_queue.values() if not e.reconciled]
+        return [e for e in self._pending.values() if not e.reconciled]
 
     def get_receipts(self) -> List[OrphanEventReceipt]:
         """Return all emitted receipts (quarantined and recovered)."""
@@ -250,6 +345,11 @@ class SessionQuarantineProtocol:
     def _attach_to_session(self, session_id: str, event: dict) -> None:
         node = self._sessions[session_id]
         node.events.append(event)
+        if self._indexed[session_id] == len(node.events) - 1:
+            self._index_event(session_id, event, +1)
+            self._indexed[session_id] += 1
+        if self.session_ttl_seconds is not None:
+            self._last_seen[session_id] = self._clock()
         logger.debug(
             "Event %s attached to session %s (total events: %d)",
             event.get("event_id", "?"),
@@ -264,24 +364,84 @@ class SessionQuarantineProtocol:
             received_at=_now_iso(),
         )
         self._orphan_queue[event_id] = entry
+        self._pending[event_id] = entry
         logger.info("Orphan event queued: event_id=%s", event_id)
 
     def _find_matching_session(self, event: dict) -> Optional[str]:
-        """Return a session_id if the event can be reconciled, else ``None``."""
+        """Return a session_id if the event can be reconciled, else ``None``.
+
+        The first reconcile key (in :data:`_RECONCILE_KEYS` order) that any
+        session shares decides; among the sessions sharing it, the earliest
+        registered wins — the answer the exhaustive scan gives.
+        """
         for key in _RECONCILE_KEYS:
             value = event.get(key)
             if not value:
                 continue
-            for session_id, node in self._sessions.items():
-                # Check whether any existing event on the session shares the key
-                for session_event in node.events:
-                    if session_event.get(key) == value:
-                        return session_id
+            try:
+                holders = self._index[key].get(value)
+            except TypeError:  # unhashable value: not indexable, scan for it
+                holders = self._scan_holders(key, value)
+            if holders:
+                return min(holders, key=self._order.__getitem__)
         return None
 
+    def _scan_holders(self, key: str, value: object) -> List[str]:
+        for session_id, node in self._sessions.items():
+            if any(session_event.get(key) == value for session_event in node.events):
+                return [session_id]
+        return []
+
+    def _index_event(self, session_id: str, event: dict, delta: int) -> None:
+        for key in _RECONCILE_KEYS:
+            value = event.get(key)
+            if not value:
+                continue
+            try:
+                holders = self._index[key].setdefault(value, {})
+            except TypeError:
+                continue  # unhashable: matched by _scan_holders instead
+            count = holders.get(session_id, 0) + delta
+            if count > 0:
+                holders[session_id] = count
+            else:
+                holders.pop(session_id, None)
+                if not holders:
+                    del self._index[key][value]
+
+    def _sync_index(self) -> None:
+        """Index events put on a session's DAG node without going through ingest."""
+        for session_id, node in self._sessions.items():
+            done = self._indexed[session_id]
+            if done == len(node.events):
+                continue
+            if done > len(node.events):  # events were removed: rebuild from scratch
+                self._index = {k: {} for k in _RECONCILE_KEYS}
+                self._indexed = dict.fromkeys(self._sessions, 0)
+                self._sync_index()
+                return
+            for event in node.events[done:]:
+                self._index_event(session_id, event, +1)
+            self._indexed[session_id] = len(node.events)
+
+    def _drop_session(self, session_id: str) -> None:
+        node = self._sessions.pop(session_id)
+        for event in node.events[:self._indexed.pop(session_id)]:
+            self._index_event(session_id, event, -1)
+        del self._order[session_id]
+        self._last_seen.pop(session_id, None)
+        logger.info("Session expired: %s (%d events)", session_id, len(node.events))
+
+    def _settle(self, entry: OrphanEntry) -> None:
+        """Take a reconciled entry off the pending queue and start its retention."""
+        self._pending.pop(entry.event_id, None)
+        if self.retention_seconds is not None:
+            self._settled.append((self._clock() + self.retention_seconds, entry.event_id, entry))
+
     def _quarantine(self, entry: OrphanEntry) -> None:
         """Quarantine an irreconcilable orphan and emit a receipt."""
         entry.reconciled = True  # remove from active queue
+        self._settle(entry)
         self._emit_receipt(entry, status="quarantined")
         logger.warning(
             "Event quarantined: event_id=%s (attempts=%d)",
@@ -302,6 +462,8 @@ class SessionQuarantineProtocol:
             recovered_session_id=entry.recovered_session_id,
         )
         self._receipts.append(receipt)
+        if self.retention_seconds is not None:
+            self._receipt_deadlines.append(self._clock() + self.retention_seconds)
 
     def _build_evidence_refs(self, entry: OrphanEntry) -> List[EvidenceRef]:
         """Build evidence refs that reference payload metadata without dumping full context."""
@@ -6,7 +6,8 @@ no signal a human could see. This aggregates those receipts into Prometheus-form
 into SRE ALERTS: an alert fires when something genuinely needs attention (a policy breach was
 quarantined; escalations pile up; a healing attempt failed to resolve).
 
-Reads are non-destructive (`DurableQueue.peek_all`), so scraping never drains the queues.
+Reads are non-destructive, so scraping never drains the queues. Decision counters come from
+the checkpointed `decision_aggregate`, so a scrape parses only receipts written since the last one.
 """
 
 from __future__ import annotations
@@ -16,60 +17,37 @@ import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from automation.durable_queue import DurableQueue, state_dir
+from automation import decision_aggregate
+from automation.durable_queue import open_queue, state_dir
 
 # Default alert thresholds (overridable by the caller / scheduler job).
 DEFAULT_ESCALATION_ALERT_THRESHOLD = 5
 
 
 def collect(state: Optional[Path] = None) -> dict:
-    """Aggregate self-heal receipts into a metrics dict. Non-destructive."""
+    """Aggregate self-heal receipts into a metrics dict. Never drains a queue.
+
+    The only write is the shared decision-aggregate checkpoint, advanced past the
+    receipts this scrape folded in.
+    """
     root = Path(state) if state is not None else state_dir()
-    decisions = DurableQueue(root / "decisions").peek_all()
-
-    by_action: Dict[str, int] = {}
-    by_kind: Dict[str, int] = {}
-    by_verdict: Dict[str, int] = {}
-    heals = proposals = quarantines = escalations = healing_failures = 0
-
-    for r in decisions:
-        action = str(r.get("action", "unknown"))
-        by_action[action] = by_action.get(action, 0) + 1
-        by_kind[str(r.get("beacon_kind", "unknown"))] = by_kind.get(str(r.get("beacon_kind", "unknown")), 0) + 1
-        by_verdict[str(r.get("verdict", "unknown"))] = by_verdict.get(str(r.get("verdict", "unknown")), 0) + 1
-        if action == "escalate_human":
-            escalations += 1
-        ex = r.get("execution") or {}
-        if ex.get("healed"):
-            heals += 1
-        if ex.get("proposed"):
-            proposals += 1
-        if ex.get("quarantined"):
-            quarantines += 1
-        # A healing FAILURE is a remediation that was ATTEMPTED and undone — i.e. a fix
-        # executor wrote/regenerated and had to roll back. It is NOT an intended escalation
-        # (e.g. stale_vendor's propose_pr correctly declining because the fix is cross-repo):
-        # counting those inflates the drift signal and would teach the learning loop that a
-        # working class is failing. `rolled_back` marks exactly "tried to fix, undid it".
-        if ex.get("rolled_back"):
-            healing_failures += 1
+    agg = decision_aggregate.update(root)
+    depth: Dict[str, int] = {}
+    for name in ("beacons", "decisions", "proposals", "quarantine"):
+        with open_queue(root / name) as q:
+            depth[name] = q.qsize()
 
     return {
-        "decisions_total": len(decisions),
-        "by_action": by_action,
-        "by_kind": by_kind,
-        "by_verdict": by_verdict,
-        "heals_total": heals,
-        "proposals_total": proposals,
-        "quarantines_total": quarantines,
-        "escalations_total": escalations,
-        "healing_failures_total": healing_failures,
-        "queue_depth": {
-            "beacons": DurableQueue(root / "beacons").qsize(),
-            "decisions": len(decisions),
-            "proposals": DurableQueue(root / "proposals").qsize(),
-            "quarantine": DurableQueue(root / "quarantine").qsize(),
-        },
+        "decisions_total": agg["decisions_total"],
+        "by_action": dict(agg["by_action"]),
+        "by_kind": dict(agg["by_kind"]),
+        "by_verdict": dict(agg["by_verdict"]),
+        "heals_total": agg["heals_total"],
+        "proposals_total": agg["proposals_total"],
+        "quarantines_total": agg["quarantines_total"],
+        "escalations_total": agg["escalations_total"],
+        "healing_failures_total": agg["healing_failures_total"],
+        "queue_depth": depth,
     }
 
 
@@ -18,7 +18,7 @@ from typing import Optional
 
 from flask import Flask, Response, jsonify, request
 
-from automation.durable_queue import DurableQueue
+from automation.durable_queue import open_queue
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +40,11 @@ def _sanitize_for_log(value) -> str:
 # ---------------------------------------------------------------------------
 # Durable, cross-process event queue.
 # Previously an in-process ``queue.Queue()`` — unreachable by the separate
-# scheduler process, so nothing was ever drained. The file-backed DurableQueue is
-# shared via a common directory (a volume in deployment), so webhook-produced
+# scheduler process, so nothing was ever drained. The durable queue (file or
+# SQLite backend, see ``open_queue``) is shared via a common directory (a volume in deployment), so webhook-produced
 # events are actually consumed by the scheduler daemon.
 # ---------------------------------------------------------------------------
-event_queue = DurableQueue()
+event_queue = open_queue()
 
 # ---------------------------------------------------------------------------
 # Simple in-process metrics store
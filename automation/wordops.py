@@ -24,7 +24,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
 
-from automation.durable_queue import DurableQueue, state_dir
+from automation.durable_queue import DurableQueue, open_queue, state_dir
 from automation.envelope import ulid
 
 # Decisions that a human / containment must SEE — the alerts that were landing in the void.
@@ -68,5 +68,5 @@ def route(receipt: dict, *, claim_ref: Optional[str] = None,
     if receipt.get("action") not in ESCALATION_ACTIONS:
         return None
     incident = to_incident(receipt, claim_ref=claim_ref)
-    (sink if sink is not None else DurableQueue(state_dir() / "wordops-incidents")).put(incident)
+    (sink if sink is not None else open_queue(state_dir() / "wordops-incidents")).put(incident)
     return incident
@@ -1,13 +1,14 @@
 """engines/__init__.py — public surface for the registry engines package."""
 
 from engines.ontology_engine import OntologyEngine
-from engines.propagation_engine import PropagationEngine
+from engines.propagation_engine import PropagationEngine, ResidentPropagationEngine
 from engines.devops_orchestrator import DevOpsOrchestrator
 from engines.metrics_collector import MetricsCollector
 
 __all__ = [
     "OntologyEngine",
     "PropagationEngine",
+    "ResidentPropagationEngine",
     "DevOpsOrchestrator",
     "MetricsCollector",
 ]
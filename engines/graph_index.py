@@ -0,0 +1,250 @@
+"""Compiled, read-only index over a repo dependency graph.
+
+PropagationEngine keeps its adjacency as ``dict[str, list[str]]`` because that is the
+shape the registry loader naturally produces. Queries over that shape re-walk string
+keyed dicts on every call, and the cycle check was a recursive DFS -- fine for the
+estate's few hundred repos, quadratic on dense graphs and a RecursionError on long
+chains. This module compiles the same adjacency once, at load time, into:
+
+- integer-interned node ids (``ids`` / ``names``),
+- CSR arrays for both directions, preserving each node's neighbour order so BFS
+  results are identical to walking the original lists,
+- Tarjan strongly connected components (iterative, no recursion limit) and their
+  condensation DAG.
+
+Per-node reachability (every transitive dependent with its BFS depth) is computed on
+first request from the CSR arrays and memoized, so repeated cascade queries for the
+same repo are lookups. Full closure is not materialized up front: on a 100k-node graph
+that is quadratic memory for answers nobody asked for.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Mapping, Sequence
+
+
+def _csr(n: int, rows: list[list[int]]) -> tuple[array, array]:
+    offsets = array("l", [0]) * (n + 1)
+    total = 0
+    for i, row in enumerate(rows):
+        offsets[i] = total
+        total += len(row)
+    offsets[n] = total
+    targets = array("l", [0]) * total
+    pos = 0
+    for row in rows:
+        for t in row:
+            targets[pos] = t
+            pos += 1
+    return offsets, targets
+
+
+class GraphIndex:
+    """Immutable CSR + SCC view of a directed graph of repo ids.
+
+    ``adjacency`` maps a repo to the repos it depends on; ``reverse_adjacency`` maps a
+    repo to its dependents. Both are passed (rather than one derived from the other) so
+    the index keeps the exact neighbour order the engine recorded.
+    """
+
+    def __init__(
+        self,
+        adjacency: Mapping[str, Sequence[str]],
+        reverse_adjacency: Mapping[str, Sequence[str]],
+        nodes: Iterable[str] = (),
+    ) -> None:
+        ids: dict[str, int] = {}
+        names: list[str] = []
+
+        def intern(name: str) -> int:
+            i = ids.get(name)
+            if i is None:
+                i = ids[name] = len(names)
+                names.append(name)
+            return i
+
+        for name in nodes:
+            intern(name)
+        for src, dsts in adjacency.items():
+            intern(src)
+            for dst in dsts:
+                intern(dst)
+        for dst, srcs in reverse_adjacency.items():
+            intern(dst)
+            for src in srcs:
+                intern(src)
+
+        n = len(names)
+        fwd: list[list[int]] = [[] for _ in range(n)]
+        rev: list[list[int]] = [[] for _ in range(n)]
+        for src, dsts in adjacency.items():
+            fwd[ids[src]] = [ids[d] for d in dsts]
+        for dst, srcs in reverse_adjacency.items():
+            rev[ids[dst]] = [ids[s] for s in srcs]
+
+        self.ids = ids
+        self.names = names
+        self.fwd_offsets, self.fwd_targets = _csr(n, fwd)
+        self.rev_offsets, self.rev_targets = _csr(n, rev)
+        self.scc_of, self.sccs = self._tarjan()
+        self._reach: dict[int, tuple[tuple[int, int, int], ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ── neighbours ──────────────────────────────────────────────────────────
+
+    def dependencies(self, node: int) -> array:
+        return self.fwd_targets[self.fwd_offsets[node]:self.fwd_offsets[node + 1]]
+
+    def dependents(self, node: int) -> array:
+        return self.rev_targets[self.rev_offsets[node]:self.rev_offsets[node + 1]]
+
+    # ── strongly connected components ──────────────────────────────────────
+
+    def _tarjan(self) -> tuple[array, list[list[int]]]:
+        """Iterative Tarjan over the dependency direction.
+
+        Returns ``scc_of`` (node -> component id) and the components, numbered in the
+        order Tarjan completes them, which is a reverse topological order of the
+        condensation: a component's dependencies always have smaller ids.
+        """
+        n = len(self.names)
+        off, tgt = self.fwd_offsets, self.fwd_targets
+        index = array("l", [-1]) * n
+        low = array("l", [0]) * n
+        on_stack = bytearray(n)
+        scc_of = array("l", [-1]) * n
+        sccs: list[list[int]] = []
+        stack: list[int] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            work = [(root, off[root])]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            while work:
+                node, edge = work[-1]
+                if edge < off[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    nxt = tgt[edge]
+                    if index[nxt] == -1:
+                        index[nxt] = low[nxt] = counter
+                        counter += 1
+                        stack.append(nxt)
+                        on_stack[nxt] = 1
+                        work.append((nxt, off[nxt]))
+                    elif on_stack[nxt] and index[nxt] < low[node]:
+                        low[node] = index[nxt]
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    comp: list[int] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        scc_of[member] = len(sccs)
+                        comp.append(member)
+                        if member == node:
+                            break
+                    sccs.append(comp)
+        return scc_of, sccs
+
+    def condensation(self) -> list[list[int]]:
+        """Component -> sorted list of components it depends on (self-edges dropped)."""
+        out: list[set[int]] = [set() for _ in self.sccs]
+        for node in range(len(self.names)):
+            c = self.scc_of[node]
+            for dep in self.dependencies(node):
+                d = self.scc_of[dep]
+                if d != c:
+                    out[c].add(d)
+        return [sorted(s) for s in out]
+
+    def cycles(self) -> list[list[str]]:
+        """Every cycle closed by a DFS back edge, as ``[a, b, ..., a]``.
+
+        The same cycles the engine's original recursive DFS reported -- one per back
+        edge, ``path[path.index(n):] + [n]``, duplicates dropped -- but walked
+        iteratively over the CSR arrays, with each node's position on the DFS path
+        kept in an array instead of found by ``path.index``. Roots are taken in index
+        order (first appearance in the graph), so the output is deterministic; the
+        original's roots came from a set and varied between runs.
+        """
+        off, tgt = self.fwd_offsets, self.fwd_targets
+        n = len(self.names)
+        state = bytearray(n)  # 0 unvisited, 1 on the DFS path, 2 finished
+        pos = array("l", [0]) * n
+        path: list[int] = []
+        found: list[list[str]] = []
+        seen: set[tuple[int, ...]] = set()
+        for root in range(n):
+            if state[root]:
+                continue
+            work = [(root, off[root])]
+            state[root] = 1
+            pos[root] = 0
+            path.append(root)
+            while work:
+                node, edge = work[-1]
+                if edge == off[node + 1]:
+                    work.pop()
+                    path.pop()
+                    state[node] = 2
+                    continue
+                work[-1] = (node, edge + 1)
+                nxt = tgt[edge]
+                if state[nxt] == 0:
+                    state[nxt] = 1
+                    pos[nxt] = len(path)
+                    path.append(nxt)
+                    work.append((nxt, off[nxt]))
+                elif state[nxt] == 1:
+                    cycle = (*path[pos[nxt]:], nxt)
+                    if cycle not in seen:
+                        seen.add(cycle)
+                        found.append([self.names[i] for i in cycle])
+        return found
+
+    # ── reachability ────────────────────────────────────────────────────────
+
+    def reachable_dependents(self, node: int) -> tuple[tuple[int, int, int], ...]:
+        """Every transitive dependent of ``node`` as ``(id, depth, via)`` in BFS order.
+
+        ``depth`` is the shortest hop count and ``via`` the node it was first reached
+        from (``node`` itself for depth 1). Memoized: the second query for a repo is a
+        dict lookup. Because BFS depth is a shortest distance, a depth-bounded query is
+        a prefix filter of this tuple, not a new walk.
+        """
+        cached = self._reach.get(node)
+        if cached is not None:
+            return cached
+        off, tgt = self.rev_offsets, self.rev_targets
+        seen = {node}
+        out: list[tuple[int, int, int]] = []
+        frontier = [node]
+        depth = 0
+        while frontier:
+            depth += 1
+            nxt_frontier: list[int] = []
+            for cur in frontier:
+                for i in range(off[cur], off[cur + 1]):
+                    dep = tgt[i]
+                    if dep in seen:
+                        continue
+                    seen.add(dep)
+                    out.append((dep, depth, cur))
+                    nxt_frontier.append(dep)
+            frontier = nxt_frontier
+        result = tuple(out)
+        self._reach[node] = result
+        return result
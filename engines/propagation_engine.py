@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import subprocess
 import sys
+import threading
+import time
 from collections import defaultdict, deque
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,6 +21,11 @@ except ImportError:  # pragma: no cover
     yaml = None  # type: ignore
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:  # run as `python3 engines/propagation_engine.py`
+    sys.path.insert(0, str(ROOT))
+
+from engines.graph_index import GraphIndex  # noqa: E402
+
 REGISTRY_DIR = ROOT / "registry"
 METRICS_DIR = ROOT / "metrics"
 DEP_GRAPH_FILE = REGISTRY_DIR / "dependency-graph.yaml"
@@ -284,23 +292,25 @@ DEFAULT_DISPATCH_DEPTH = 1
 
 def propagate(repo_name: str, ref: str = "refs/heads/main",
               *, execute: bool = False,
-              dispatch_depth: int = DEFAULT_DISPATCH_DEPTH) -> int:
+              dispatch_depth: int = DEFAULT_DISPATCH_DEPTH,
+              engine: PropagationEngine | None = None) -> int:
     """Fan a merge out to the repos the rules say should hear about it.
 
     Dry run unless ``execute`` is set: this opens issues and fires repository_dispatch
     in other repositories, which is not something to do as a side effect of importing a
     module or running a validation job.
+
+    The graph comes from the process-wide resident engine (see resident_engine()), so a
+    push event costs a few stat() calls rather than a full YAML parse and graph rebuild.
     """
     if not ref.endswith("/main"):
         print(f"INFO: skipping propagation for non-main ref '{ref}'")
         return 0
 
-    dep_graph = _load_yaml(DEP_GRAPH_FILE)
-    dependents = get_dependents(repo_name, dep_graph)
-
-    engine = PropagationEngine()
-    engine.load()
-    policy = (_load_yaml(PROP_RULES_FILE).get("cascade_policy") or {})
+    if engine is None:
+        engine = resident_engine().current()
+    dependents = engine.graph_dependents(repo_name)
+    policy = engine.cascade_policy()
     max_depth = int(policy.get("max_notification_depth", 3))
     steps = engine.compute_cascade(repo_name, max_depth=max_depth)
 
@@ -383,11 +393,25 @@ class PropagationEngine:
         self._reference_edges: list[dict[str, Any]] = []
         self._ref_adjacency: dict[str, list[str]] = defaultdict(list)
         self._ref_reverse_adjacency: dict[str, list[str]] = defaultdict(list)
+        #: The webhook-shaped ``dependencies:`` block and ``cascade_policy:`` as loaded,
+        #: so propagate() never has to re-read the YAML they came from.
+        self._dependencies_raw: dict[str, Any] = {}
+        self._cascade_policy: dict[str, Any] = {}
+        #: Compiled at the end of load(); see _compile().
+        self._index: GraphIndex | None = None
+        self._nodes: frozenset[str] = frozenset()
+        self._merge_order: tuple[str, ...] = ()
+        self._rule_by_trigger: dict[str, dict[str, Any]] = {}
+        self._cascade_cache: dict[tuple[str, int], tuple[dict[str, Any], ...]] = {}
         self._loaded = False
+        self._frozen = False
 
     def load(self) -> None:
+        if self._frozen:
+            raise RuntimeError("PropagationEngine snapshot is frozen; build a new engine to reload")
         dep_raw = _load_yaml(self._dir / "dependency-graph.yaml")
         self._edges = []
+        self._dependencies_raw = dict(dep_raw.get("dependencies") or {})
 
         def add_edge(src: str | None, dst: str | None, edge_type: str = "depends_on") -> None:
             normalized_src = _normalize_repo_id(src)
@@ -472,6 +496,7 @@ class PropagationEngine:
                     self._dep_levels[normalized_repo] = level
 
         rules_raw = _load_yaml(self._dir / "change-propagation-rules.yaml")
+        self._cascade_policy = dict(rules_raw.get("cascade_policy") or {})
         normalized_rules: list[dict[str, Any]] = []
         for rule in rules_raw.get("rules", []):
             if not isinstance(rule, dict):
@@ -554,12 +579,59 @@ class PropagationEngine:
                 }
             )
         self._rules = normalized_rules
+        self._compile()
         self._loaded = True
 
+    def _compile(self) -> None:
+        """Derive the query-side structures once, so queries are lookups.
+
+        The GraphIndex interns node ids and lays both adjacency directions out as CSR
+        arrays with Tarjan components (cycles, reachability); cascades are memoized
+        per (repo, depth) until the next load().
+        """
+        nodes: set[str] = set()
+        for edge in self._edges:
+            nodes.add(edge["from"])
+            nodes.add(edge["to"])
+        self._nodes = frozenset(nodes)
+        self._index = GraphIndex(self._adjacency, self._reverse_adjacency, sorted(nodes))
+        by_level = sorted(self._dep_levels.items(), key=lambda kv: kv[1])
+        self._merge_order = tuple(repo for repo, level in by_level if level >= 0)
+        self._rule_by_trigger = {}
+        for rule in self._rules:
+            self._rule_by_trigger.setdefault(rule.get("trigger", {}).get("repo"), rule)
+        self._cascade_cache = {}
+
     def _ensure_loaded(self) -> None:
         if not self._loaded:
             self.load()
 
+    def freeze(self) -> "PropagationEngine":
+        """Mark a loaded engine read-only so it can be shared across threads.
+
+        Every query only reads the adjacency maps, so once load() has finished a frozen
+        engine is safe to hand to concurrent callers; refusing a second load() is what
+        guarantees no reader ever sees a graph half way through being rebuilt.
+        """
+        self._ensure_loaded()
+        self._frozen = True
+        return self
+
+    def watched_files(self) -> list[Path]:
+        """The registry files load() reads, i.e. the ones whose change means a reload."""
+        files = [self._dir / "dependency-graph.yaml", self._dir / "change-propagation-rules.yaml"]
+        files.extend(sorted(self._dir.glob("*-dependency-edges.yaml")))
+        return files
+
+    def graph_dependents(self, repo_name: str) -> list[str]:
+        """Dependents as declared in the ``dependencies:`` block (see get_dependents)."""
+        self._ensure_loaded()
+        return get_dependents(repo_name, {"dependencies": self._dependencies_raw})
+
+    def cascade_policy(self) -> dict[str, Any]:
+        self._ensure_loaded()
+        return dict(self._cascade_policy)
+
     def dependencies_of(self, repo_id: str) -> list[str]:
         self._ensure_loaded()
         return list(self._adjacency.get(_normalize_repo_id(repo_id) or repo_id, []))
@@ -592,11 +664,7 @@ class PropagationEngine:
 
     def get_rule(self, repo_id: str) -> dict[str, Any] | None:
         self._ensure_loaded()
-        normalized_repo = _normalize_repo_id(repo_id)
-        for rule in self._rules:
-            if rule.get("trigger", {}).get("repo") == normalized_repo:
-                return rule
-        return None
+        return self._rule_by_trigger.get(_normalize_repo_id(repo_id))
 
     def all_rules(self) -> list[dict[str, Any]]:
         self._ensure_loaded()
@@ -604,36 +672,69 @@ class PropagationEngine:
 
     def all_graph_nodes(self) -> set[str]:
         self._ensure_loaded()
-        nodes: set[str] = set()
-        for edge in self._edges:
-            nodes.add(edge["from"])
-            nodes.add(edge["to"])
-        return nodes
+        return set(self._nodes)
+
+    def graph_index(self) -> GraphIndex:
+        self._ensure_loaded()
+        assert self._index is not None
+        return self._index
+
+    def transitive_dependents(self, repo_id: str, max_depth: int | None = None) -> list[tuple[str, int]]:
+        """Every repo that (transitively) depends on ``repo_id``, with its hop depth,
+        in BFS order. Pure graph reachability: no rules, memoized per repo."""
+        index = self.graph_index()
+        node = index.ids.get(_normalize_repo_id(repo_id) or repo_id)
+        if node is None:
+            return []
+        return [
+            (index.names[dep], depth)
+            for dep, depth, _via in index.reachable_dependents(node)
+            if max_depth is None or depth <= max_depth
+        ]
 
     def compute_cascade(self, changed_repo: str, max_depth: int = 3) -> list[dict[str, Any]]:
         self._ensure_loaded()
         changed_repo = _normalize_repo_id(changed_repo) or changed_repo
-        results: list[dict[str, Any]] = []
-        visited: set[str] = {changed_repo}
-        queue: deque[tuple[str, int, str]] = deque()
-
         rule = self.get_rule(changed_repo)
-        seed_targets: list[dict[str, Any]] = list(rule.get("propagate_to", [])) if rule else []
         rule_max = rule.get("max_cascade_depth") if rule else None
         if isinstance(rule_max, int):
             max_depth = min(max_depth, rule_max)
 
+        key = (changed_repo, max_depth)
+        steps = self._cascade_cache.get(key)
+        if steps is None:
+            steps = self._cascade_cache[key] = tuple(self._walk_cascade(changed_repo, max_depth, rule))
+        # Steps hold only scalars, so a shallow copy keeps callers from editing the cache.
+        return [dict(step) for step in steps]
+
+    def _walk_cascade(self, changed_repo: str, max_depth: int, rule: dict[str, Any] | None) -> list[dict[str, Any]]:
+        index = self.graph_index()
+        ids, names = index.ids, index.names
+        off, tgt = index.rev_offsets, index.rev_targets
+        results: list[dict[str, Any]] = []
+        # Graph nodes are marked by id; rule targets outside the graph by name.
+        seen = bytearray(len(names))
+        visited: set[str] = {changed_repo}
+        if changed_repo in ids:
+            seen[ids[changed_repo]] = 1
+        queue: deque[tuple[int, int, str]] = deque()
+
+        seed_targets: list[dict[str, Any]] = list(rule.get("propagate_to", [])) if rule else []
         explicit = {t.get("repo") for t in seed_targets}
         for dep in self.dependents_of(changed_repo):
             if dep not in explicit:
                 seed_targets.append({"repo": dep, "action": "notify", "message": f"{changed_repo} changed"})
 
+        source_rule = rule.get("id", "dependency_graph") if rule else "dependency_graph"
         for target in seed_targets:
             repo = target.get("repo")
             if not repo or repo in visited:
                 continue
             visited.add(repo)
-            queue.append((repo, 1, rule.get("id", "dependency_graph") if rule else "dependency_graph"))
+            node = ids.get(repo)
+            if node is not None:
+                seen[node] = 1
+                queue.append((node, 1, source_rule))
             results.append(
                 {
                     "depth": 1,
@@ -642,29 +743,30 @@ class PropagationEngine:
                     "message": target.get("message", ""),
                     "auto_pr": target.get("auto_pr", False),
                     "pr_title": target.get("pr_title", ""),
-                    "source_rule": rule.get("id", "dependency_graph") if rule else "dependency_graph",
+                    "source_rule": source_rule,
                 }
             )
 
         while queue:
-            current, depth, source_rule = queue.popleft()
+            current, depth, step_rule = queue.popleft()
             if depth >= max_depth:
                 continue
-            for downstream in self.dependents_of(current):
-                if downstream in visited:
+            for i in range(off[current], off[current + 1]):
+                downstream = tgt[i]
+                if seen[downstream]:
                     continue
-                visited.add(downstream)
+                seen[downstream] = 1
                 nd = depth + 1
-                queue.append((downstream, nd, source_rule))
+                queue.append((downstream, nd, step_rule))
                 results.append(
                     {
                         "depth": nd,
-                        "repo": downstream,
+                        "repo": names[downstream],
                         "action": "notify",
-                        "message": f"Cascade from {current}",
+                        "message": f"Cascade from {names[current]}",
                         "auto_pr": False,
                         "pr_title": "",
-                        "source_rule": source_rule,
+                        "source_rule": step_rule,
                     }
                 )
 
@@ -672,36 +774,162 @@ class PropagationEngine:
         return results
 
     def detect_cycles(self) -> list[list[str]]:
-        self._ensure_loaded()
-        visited: set[str] = set()
-        stack: set[str] = set()
-        path: list[str] = []
-        cycles: list[list[str]] = []
-
-        def dfs(node: str) -> None:
-            visited.add(node)
-            stack.add(node)
-            path.append(node)
-            for neighbor in self._adjacency.get(node, []):
-                if neighbor not in visited:
-                    dfs(neighbor)
-                elif neighbor in stack:
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    if cycle not in cycles:
-                        cycles.append(cycle)
-            stack.remove(node)
-            path.pop()
-
-        for node in list(self.all_graph_nodes()):
-            if node not in visited:
-                dfs(node)
-        return cycles
+        """Every back-edge cycle of a DFS over the dependency graph (see GraphIndex.cycles).
+
+        Iterative, so a long dependency chain cannot exhaust the recursion limit, and
+        linear in edges plus output rather than rescanning the found-cycles list per
+        back edge.
+        """
+        return self.graph_index().cycles()
 
     def merge_order(self) -> list[str]:
         self._ensure_loaded()
-        by_level = sorted(self._dep_levels.items(), key=lambda kv: kv[1])
-        return [repo for repo, _level in by_level if _level >= 0]
+        return list(self._merge_order)
+
+
+class ResidentPropagationEngine:
+    """A long-lived PropagationEngine that reloads only when the registry changes.
+
+    The webhook and scheduler paths used to build a fresh engine per event, re-parsing
+    every registry YAML to answer one cascade query. This holds one frozen snapshot and,
+    on each current() call, stats the watched files; only when an mtime or size moved is
+    the content hashed, and only when a hash actually differs is a new engine built. The
+    new snapshot is fully loaded and frozen before it replaces the old one in a single
+    reference assignment, so a concurrent reader holds either the old graph or the new
+    one, never a partial rebuild.
+
+    ``min_check_interval`` throttles the stat walk for very hot callers; the default of
+    zero checks on every call, which is a handful of stat() calls.
+    """
+
+    def __init__(self, registry_dir: str | Path | None = None, min_check_interval: float = 0.0) -> None:
+        self._dir = Path(registry_dir) if registry_dir else REGISTRY_DIR
+        self._min_check_interval = min_check_interval
+        self._lock = threading.Lock()
+        self._snapshot: PropagationEngine | None = None
+        #: path -> (mtime_ns, size, sha256) as of the current snapshot.
+        self._fingerprint: dict[str, tuple[int, int, str]] = {}
+        self._last_check = 0.0
+        self._metrics: dict[str, Any] = {
+            "loads": 0,
+            "rebuilds": 0,
+            "checks": 0,
+            "unchanged_touches": 0,
+            "last_load_seconds": 0.0,
+            "total_load_seconds": 0.0,
+            "last_check_seconds": 0.0,
+            "loaded_at": None,
+            "generation": 0,
+        }
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int] | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _digest(path: Path) -> str:
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except FileNotFoundError:
+            return ""
+
+    def _watched(self) -> list[Path]:
+        engine = self._snapshot or PropagationEngine(self._dir)
+        return engine.watched_files()
+
+    def _changed(self) -> dict[str, tuple[int, int, str]] | None:
+        """Return the new fingerprint if registry content differs, else None.
+
+        A file whose stat is unchanged is trusted without reading it; a file that was
+        merely touched (new mtime, same bytes) has its stat refreshed but does not
+        trigger a rebuild.
+        """
+        current: dict[str, tuple[int, int, str]] = {}
+        watched = self._watched()
+        content_changed = set(self._fingerprint) - {str(p) for p in watched}
+        for path in watched:
+            key = str(path)
+            st = self._stat(path)
+            if st is None:
+                if key in self._fingerprint:
+                    content_changed.add(key)
+                continue
+            prev = self._fingerprint.get(key)
+            if prev is not None and prev[:2] == st:
+                current[key] = prev
+                continue
+            digest = self._digest(path)
+            current[key] = (st[0], st[1], digest)
+            if prev is None or prev[2] != digest:
+                content_changed.add(key)
+            else:
+                self._metrics["unchanged_touches"] += 1
+        if content_changed or self._snapshot is None:
+            return current
+        self._fingerprint = current
+        return None
+
+    def _rebuild(self, fingerprint: dict[str, tuple[int, int, str]]) -> None:
+        t0 = time.perf_counter()
+        engine = PropagationEngine(self._dir)
+        engine.load()
+        engine.freeze()
+        elapsed = time.perf_counter() - t0
+        first = self._snapshot is None
+        self._snapshot = engine
+        self._fingerprint = fingerprint
+        m = self._metrics
+        m["loads"] += 1
+        if not first:
+            m["rebuilds"] += 1
+        m["generation"] += 1
+        m["last_load_seconds"] = round(elapsed, 6)
+        m["total_load_seconds"] = round(m["total_load_seconds"] + elapsed, 6)
+        m["loaded_at"] = datetime.now(tz=timezone.utc).isoformat()
+
+    def refresh(self, force: bool = False) -> bool:
+        """Reload if the registry changed (or ``force``). Returns True if it rebuilt."""
+        with self._lock:
+            t0 = time.perf_counter()
+            self._last_check = time.monotonic()
+            self._metrics["checks"] += 1
+            fingerprint = self._changed()
+            if force and fingerprint is None:
+                fingerprint = dict(self._fingerprint)
+            self._metrics["last_check_seconds"] = round(time.perf_counter() - t0, 6)
+            if fingerprint is None:
+                return False
+            self._rebuild(fingerprint)
+            return True
+
+    def current(self) -> PropagationEngine:
+        """The up-to-date frozen snapshot. Safe to call from any thread."""
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._last_check < self._min_check_interval:
+            return snapshot
+        self.refresh()
+        return self._snapshot  # type: ignore[return-value]
+
+    def get_metrics(self) -> dict[str, Any]:
+        return dict(self._metrics)
+
+
+_RESIDENT: dict[Path, ResidentPropagationEngine] = {}
+_RESIDENT_LOCK = threading.Lock()
+
+
+def resident_engine(registry_dir: str | Path | None = None) -> ResidentPropagationEngine:
+    """The process-wide resident engine for ``registry_dir`` (default: registry/)."""
+    key = (Path(registry_dir) if registry_dir else REGISTRY_DIR).resolve()
+    with _RESIDENT_LOCK:
+        engine = _RESIDENT.get(key)
+        if engine is None:
+            engine = _RESIDENT[key] = ResidentPropagationEngine(key)
+        return engine
 
 
 def main() -> int:
@@ -10,7 +10,8 @@ that sink.
 "No invisible authority": every decision to admit or refuse a cell into a review
 context is written here as one JSONL line, each line carrying its own sha256
 seal computed over its canonical content. The ledger is append-only (opened in
-``"a"`` mode, never truncated).
+``"a"`` mode, never truncated — except to roll back a batch that a crash left
+half-written, see :func:`append_batch`).
 
 Two record shapes are written into ledger files by two single-writer producers:
 
@@ -21,6 +22,11 @@ Two record shapes are written into ledger files by two single-writer producers:
     ``prev_hash`` — a GENESIS-anchored HASH-CHAIN. These are chain-sealed: each
     record proves its content AND its position/predecessor.
 
+Both share one file (the default ledger takes gate decisions, MCP events and
+supply-chain events), so a chained event's ``prev_hash`` is the seal of the
+record before it (:func:`head`): the previous event's ``hash``, or — the MIXED
+FILE case — the ``receipt`` of a decision appended in between.
+
 TAMPER-EVIDENCE IS ENFORCED, NOT COSMETIC. :func:`verify_ledger` recomputes every
 record's seal and walks the ``prev_hash`` chain from :data:`GENESIS`, failing on
 the first bad seal, broken link, reorder, insertion, or deletion. The public read
@@ -35,17 +41,68 @@ as internally ``ok`` — because it is. Detecting that whole-file substitution
 requires an OUT-OF-BAND anchor: pin the expected head hash somewhere the attacker
 cannot also rewrite and compare it against ``VerifyResult.head`` (see
 :func:`verify_head`). Chain-order tampers (reorder/insert/delete) and per-record
-content tampers ARE detected without any anchor.
+content tampers ARE detected without any anchor. Decisions are not themselves
+chained, so an event that links to a decision's receipt vouches for that
+decision but not for the records before it.
+
+APPENDING IS O(1). A writer needs only the current head to chain the next
+record, and re-verifying the whole file for that made N appends cost O(N²)
+hashing. :func:`head` instead resumes from a CHECKPOINT sidecar
+(``<ledger>.head``: last seal, chain head, byte offset, record count — written
+atomically and fsync'd after each append) and verifies only the records past
+it. The checkpoint is only as trusted as the ledger file beside it: :func:`head`
+re-checks the seal of the record ending at the checkpointed offset, and falls
+back to a full walk when the sidecar is missing, stale or inconsistent. Full
+verification remains :func:`verify_ledger`'s job. :func:`head` itself writes
+nothing, so read-only and dry-run callers leave the ledger directory as they
+found it; only the appenders move the checkpoint. Appenders serialize on an
+exclusive ``flock`` of ``<ledger>.lock`` (:func:`locked`);
+:func:`append_chained` holds it across the head lookup and the write, so
+concurrent writers never fork the chain.
+
+BATCHES ARE ALL-OR-NOTHING. :func:`append_batch` chains a list of records in
+memory and commits them with ONE write and ONE fsync. Before writing, it
+fsyncs an intent record (``<ledger>.txn``: start offset, length, sha256 of the
+batch bytes); after the ledger fsync it removes it. Whoever next takes the
+append lock finds a leftover intent and either keeps the batch (its bytes are
+all there) or truncates the file back to the start offset — so a crash never
+leaves a prefix of a batch on disk.
+
+SEGMENTS AND RANDOM ACCESS. Past a size threshold (``segment_bytes`` on the
+appenders, default :data:`SEGMENT_BYTES`, 64 MiB) an append that finds the
+active file at or past it first ROTATES it into ``<ledger>.segments/<first seq>.jsonl``;
+the next record chains to the sealed tail exactly as it would have in one
+file, so the chain runs unbroken across segments. Every segment carries a
+sidecar index — ``.idx`` (byte offset + seal key per record, in order) and,
+once sealed, ``.hix`` (seal key -> seq, sorted) — behind :func:`get`,
+:func:`get_by_hash`, :func:`tail` and :func:`iter_range`. The active file's
+``<ledger>.idx`` is a cache: readers catch it up in memory, appenders on disk,
+and a missing or stale one is rebuilt. A hash lookup binary-searches each
+sealed segment's ``.hix`` but scans the active file's index linearly, so its
+cost is bounded by the segment threshold, not the ledger size. Random reads check each record against its own
+seal; the chain is still :func:`verify_ledger`'s, which can verify sealed
+segments in parallel (``workers``) and then checks they link end to end.
 """
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
+import mmap
 import os
-from dataclasses import dataclass
+import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator, Sequence
+
+try:  # POSIX advisory locks; elsewhere appends are serialized per process only
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
 
 # Default durable sink location: gbrg/governance/ledger/decisions.jsonl
 LEDGER_DIR = Path(__file__).resolve().parent / "ledger"
@@ -57,6 +114,15 @@ DEFAULT_LEDGER = LEDGER_DIR / "decisions.jsonl"
 GENESIS = "sha256:" + hashlib.sha256(b"gbrg-mcp-ledger-genesis").hexdigest()
 
 
+# Active-file size at which appends rotate it into a sealed segment. It also
+# bounds the one linear scan left in a hash lookup (the active file has no sorted
+# index). ``segment_bytes=`` overrides per call; 0 keeps a single, unbounded file.
+SEGMENT_BYTES: int = 64 * 1024 * 1024
+
+_ENTRY = struct.Struct("<Q32s")   # .idx: (byte offset, seal key) per record, in file order
+_KEYED = struct.Struct("<32sQ")   # .hix: (seal key, seq), sorted by key
+
+
 class LedgerTamperError(RuntimeError):
     """Raised by the verified read paths when the ledger fails verification."""
 
@@ -70,22 +136,209 @@ def _sha(obj: Any) -> str:
     return "sha256:" + hashlib.sha256(_canonical(obj).encode("utf-8")).hexdigest()
 
 
-def append(record: dict[str, Any], *, ledger_path: Path | str | None = None) -> Path:
+def _path(ledger_path: Path | str | None) -> Path:
+    return Path(ledger_path) if ledger_path is not None else DEFAULT_LEDGER
+
+
+@contextmanager
+def locked(ledger_path: Path | str | None = None) -> Iterator[Path]:
+    """Hold the ledger's exclusive append lock (``flock`` on ``<ledger>.lock``).
+
+    Every open takes its own lock, so threads and processes both serialize.
+    Not re-entrant: call :func:`_append_locked`, not :func:`append`, inside it.
+    A batch a crashed writer left uncommitted is rolled back on acquisition.
+    """
+    path = _path(ledger_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a+b") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            _recover_batch(path)
+            yield path
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def append(
+    record: dict[str, Any],
+    *,
+    ledger_path: Path | str | None = None,
+    segment_bytes: int | None = None,
+) -> Path:
     """Append one decision record as a single JSONL line. Returns the ledger path.
 
     Append-only by construction: the file is opened in ``"a"`` mode and flushed +
     fsync'd so the durable record survives a crash. The record is expected to
     already carry its seal (``receipt`` for governance decisions, ``hash`` +
     ``prev_hash`` for chained MCP events); we never rewrite or reorder lines.
+    Writers that chain to the head should use :func:`append_chained`.
+    ``segment_bytes`` (default :data:`SEGMENT_BYTES`) is the rotation threshold.
     """
-    path = Path(ledger_path) if ledger_path is not None else DEFAULT_LEDGER
-    path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(record, sort_keys=True, separators=(",", ":"))
-    with path.open("a", encoding="utf-8") as fh:
-        fh.write(line + "\n")
+    with locked(ledger_path) as path:
+        _append_locked(path, record, segment_bytes=segment_bytes)
+    return path
+
+
+def append_chained(
+    build: Callable[[str], dict[str, Any]],
+    *,
+    ledger_path: Path | str | None = None,
+    genesis: str = GENESIS,
+    segment_bytes: int | None = None,
+) -> dict[str, Any]:
+    """Append ``build(prev_hash)`` atomically with respect to other appenders.
+
+    Under the append lock, ``prev_hash`` is the current head seal (``genesis``
+    for an empty ledger) from :func:`head`, so two writers can never chain to
+    the same predecessor. The record is checked as :func:`verify_ledger` would
+    before it is written, exactly as :func:`append_batch` checks each of its
+    records; one that does not verify raises ``ValueError`` and writes nothing.
+    Raises :class:`LedgerTamperError` if the records past the checkpoint do not
+    verify. Returns the appended record.
+    """
+    with locked(ledger_path) as path:
+        start = _locked_head(path, genesis)
+        record = build(start.head or genesis)
+        reason, _, _ = _check_record(start.count, record, start.chain, start.head)
+        if reason is not None:
+            raise ValueError(f"chained record does not verify: {reason}")
+        _append_locked(path, record, genesis=genesis, segment_bytes=segment_bytes)
+    return record
+
+
+def _append_locked(
+    path: Path,
+    record: dict[str, Any],
+    *,
+    genesis: str = GENESIS,
+    segment_bytes: int | None = None,
+) -> None:
+    """Write + fsync one line, then advance the checkpoint if it was current.
+
+    The caller holds :func:`locked`. A checkpoint that was already behind is
+    left alone — the next :func:`append_chained` or :func:`append_batch`
+    catches it up by verifying the tail. The active file is rotated first if
+    it has reached the segment threshold.
+    """
+    _maybe_rotate(path, genesis, segment_bytes)
+    line = (json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+    with path.open("ab") as fh:
+        before = fh.tell()
+        fh.write(line)
         fh.flush()
         os.fsync(fh.fileno())
-    return path
+    cp = _read_checkpoint(path, genesis)
+    if cp is None or cp.offset != before:
+        return
+    reason, chain, seal = _check_record(cp.count, record, cp.chain, cp.head)
+    if reason is None:
+        _write_checkpoint(path, LedgerHead(head=seal, chain=chain, offset=before + len(line),
+                                           count=cp.count + 1), genesis)
+    _catch_up_index(path)
+
+
+def append_batch(
+    builds: Sequence[Callable[[str], dict[str, Any]]],
+    *,
+    ledger_path: Path | str | None = None,
+    genesis: str = GENESIS,
+    segment_bytes: int | None = None,
+) -> list[dict[str, Any]]:
+    """Chain ``builds`` onto the head and commit them as ONE transaction.
+
+    Under the append lock, ``builds[0]`` receives the current head seal and each
+    later build the seal of the record before it. Every record is checked as
+    :func:`verify_ledger` would before anything is written (a bad one raises
+    ``ValueError`` and leaves the ledger untouched); the batch is then written
+    and fsync'd once, bracketed by the ``<ledger>.txn`` intent record so a crash
+    keeps all of it or none. A batch never straddles a segment rotation.
+    Returns the appended records, in order.
+    """
+    with locked(ledger_path) as path:
+        _maybe_rotate(path, genesis, segment_bytes)
+        start = _locked_head(path, genesis)
+        seal, chain = start.head, start.chain
+        records: list[dict[str, Any]] = []
+        lines: list[bytes] = []
+        for i, build in enumerate(builds):
+            record = build(seal or genesis)
+            reason, chain, seal = _check_record(start.count + i, record, chain, seal)
+            if reason is not None:
+                raise ValueError(f"batch record {i} does not verify: {reason}")
+            records.append(record)
+            lines.append((_canonical(record) + "\n").encode("utf-8"))
+        if not records:
+            return records
+        blob = b"".join(lines)
+        with path.open("ab") as fh:
+            before = fh.tell()
+            _write_atomic(_txn_path(path), {
+                "offset": before, "length": len(blob),
+                "sha256": hashlib.sha256(blob).hexdigest(),
+            })
+            _fsync_dir(path.parent)  # the intent must be durable before any batch byte is
+            fh.write(blob)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.unlink(_txn_path(path))
+        if before == start.offset:
+            _write_checkpoint(path, LedgerHead(head=seal, chain=chain, offset=before + len(blob),
+                                               count=start.count + len(records)), genesis)
+        _catch_up_index(path)
+    return records
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Make a rename / create in ``directory`` durable (no-op where unsupported)."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:  # pragma: no cover - e.g. Windows cannot open directories
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(fd)
+
+
+def _txn_path(path: Path) -> Path:
+    return path.with_name(path.name + ".txn")
+
+
+def _pending_batch_offset(path: Path) -> int | float:
+    """Where an uncommitted batch starts (``inf`` when none is pending)."""
+    try:
+        return int(json.loads(_txn_path(path).read_text(encoding="utf-8"))["offset"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return float("inf")
+
+
+def _recover_batch(path: Path) -> None:
+    """Settle a batch left in flight by a crashed :func:`append_batch`.
+
+    The caller holds :func:`locked`. A batch whose bytes are all on disk is
+    kept; anything less is truncated away, back to where the batch began.
+    """
+    txn = _txn_path(path)
+    try:
+        intent = json.loads(txn.read_text(encoding="utf-8"))
+        offset, length, digest = int(intent["offset"]), int(intent["length"]), intent["sha256"]
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError, KeyError, TypeError):
+        txn.unlink()  # _write_atomic never leaves a partial intent; nothing to settle
+        return
+    if path.exists():
+        with path.open("r+b") as fh:
+            fh.seek(offset)
+            if hashlib.sha256(fh.read(length)).hexdigest() != digest:
+                fh.truncate(offset)
+                fh.flush()
+                os.fsync(fh.fileno())
+    txn.unlink()
 
 
 def _read_raw(ledger_path: Path | str | None = None) -> list[dict[str, Any]]:
@@ -95,15 +348,16 @@ def _read_raw(ledger_path: Path | str | None = None) -> list[dict[str, Any]]:
     compute the next ``prev_hash``. Application code should prefer the verified
     read paths (:func:`read_all` / :func:`read_verified` / :func:`iter_receipts`).
     """
-    path = Path(ledger_path) if ledger_path is not None else DEFAULT_LEDGER
-    if not path.exists():
-        return []
+    path = _path(ledger_path)
     out: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if line:
-                out.append(json.loads(line))
+    for data in [*_segment_files(path), path]:
+        if not data.exists():
+            continue
+        with data.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if line:
+                    out.append(json.loads(line))
     return out
 
 
@@ -133,91 +387,149 @@ def _recompute_event_hash(record: dict[str, Any]) -> str:
     return _sha(core)
 
 
+def _check_record(
+    i: int, rec: dict[str, Any], chain_head: str, prev_seal: str | None = None
+) -> tuple[str | None, str, str | None]:
+    """Check record ``i`` against the running chain head.
+
+    ``prev_seal`` is the seal of record ``i - 1`` (None for the first record).
+    A chained event links to ``chain_head`` or, in a mixed file, to
+    ``prev_seal`` when that is a decision's receipt. Returns
+    ``(reason, chain_head, seal)``: ``reason`` is None when the record
+    verifies, and ``chain_head`` / ``seal`` are then the values after it.
+    """
+    if "hash" in rec and "prev_hash" in rec:
+        if rec["prev_hash"] != chain_head and (prev_seal is None or rec["prev_hash"] != prev_seal):
+            return (
+                f"broken chain link at index {i}: prev_hash="
+                f"{rec['prev_hash']!r} != expected {chain_head!r} "
+                "(reorder / insertion / deletion / wrong genesis)",
+                chain_head,
+                None,
+            )
+        recomputed = _recompute_event_hash(rec)
+        if recomputed != rec["hash"]:
+            return (
+                f"bad event hash at index {i}: recomputed {recomputed} "
+                f"!= stored {rec['hash']} (record content was altered)",
+                chain_head,
+                None,
+            )
+        return None, rec["hash"], rec["hash"]
+    if "receipt" in rec:
+        # Lazy import avoids a load-time cycle (gate imports ledger).
+        from . import gate  # noqa: PLC0415
+
+        try:
+            recomputed = gate.recompute_receipt(rec)
+        except (KeyError, TypeError) as exc:
+            return f"undecodable decision record at index {i}: {exc}", chain_head, None
+        if recomputed != rec["receipt"]:
+            return (
+                f"bad decision receipt at index {i}: recomputed {recomputed} "
+                f"!= stored {rec['receipt']} (record content was altered)",
+                chain_head,
+                None,
+            )
+        return None, chain_head, rec["receipt"]
+    return (
+        f"unknown record type at index {i} (no 'hash'/'prev_hash' or 'receipt')",
+        chain_head,
+        None,
+    )
+
+
 def verify_ledger(
     ledger_path: Path | str | None = None,
     *,
     genesis: str = GENESIS,
+    workers: int = 1,
 ) -> VerifyResult:
     """Verify the WHOLE ledger file. Recompute every seal, walk the chain.
 
     For each record, in file order:
       * chained MCP event (has ``hash`` + ``prev_hash``): its ``prev_hash`` must
         equal the running chain head (``genesis`` for the first chained record,
-        else the previous event's ``hash``), and its ``hash`` must recompute from
-        its core. A reorder, insertion, or deletion breaks a ``prev_hash`` link;
-        a content edit breaks the recomputed ``hash``.
+        else the previous event's ``hash``) or, in a mixed file, the ``receipt``
+        of the decision immediately before it; and its ``hash`` must recompute
+        from its core. A reorder, insertion, or deletion breaks a ``prev_hash``
+        link; a content edit breaks the recomputed ``hash``.
       * governance decision (has ``receipt``): its ``receipt`` must recompute from
         the decision core (:func:`gate.recompute_receipt`). Receipt-sealed but not
         chain-ordered (see module RESIDUAL).
       * anything else: unknown record type -> fail.
 
+    A rotated ledger is walked segment by segment with the record index running
+    on across them. With ``workers > 1`` each segment is verified in its own
+    process from the chain head its predecessor's metadata claims; every claim
+    is then checked against what the predecessor actually ended on, so the
+    result is the one a single sequential walk gives.
+
     FAILS on the FIRST break, returning its index + reason. Never raises for a
     tampered file (that is a verification *result*, ok=False, not an error); only
     genuinely malformed JSON would surface from the raw read.
     """
-    records = _read_raw(ledger_path)
-    chain_head = genesis
-    last_seal: str | None = None
+    path = _path(ledger_path)
+    try:
+        segments = _sealed_segments(path, genesis)
+    except LedgerTamperError as exc:
+        return VerifyResult(ok=False, records=0, broken_index=None, reason=str(exc))
+    parts = [(seg.data, seg.first, *((segments[k - 1].chain, segments[k - 1].head) if k else (genesis, None)))
+             for k, seg in enumerate(segments)]
+    parts.append((path, *((segments[-1].first + segments[-1].count, segments[-1].chain, segments[-1].head)
+                          if segments else (0, genesis, None))))
+    if workers > 1 and len(parts) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(parts))) as pool:
+            results = list(pool.map(_verify_part, *zip(*parts)))
+    else:
+        results = [_verify_part(*part) for part in parts]
 
-    for i, rec in enumerate(records):
-        if "hash" in rec and "prev_hash" in rec:
-            if rec["prev_hash"] != chain_head:
-                return VerifyResult(
-                    ok=False,
-                    records=len(records),
-                    broken_index=i,
-                    reason=(
-                        f"broken chain link at index {i}: prev_hash="
-                        f"{rec['prev_hash']!r} != expected {chain_head!r} "
-                        "(reorder / insertion / deletion / wrong genesis)"
-                    ),
-                )
-            recomputed = _recompute_event_hash(rec)
-            if recomputed != rec["hash"]:
-                return VerifyResult(
-                    ok=False,
-                    records=len(records),
-                    broken_index=i,
-                    reason=(
-                        f"bad event hash at index {i}: recomputed {recomputed} "
-                        f"!= stored {rec['hash']} (record content was altered)"
-                    ),
-                )
-            chain_head = rec["hash"]
-            last_seal = rec["hash"]
-        elif "receipt" in rec:
-            # Lazy import avoids a load-time cycle (gate imports ledger).
-            from . import gate  # noqa: PLC0415
-
-            try:
-                recomputed = gate.recompute_receipt(rec)
-            except (KeyError, TypeError) as exc:
-                return VerifyResult(
-                    ok=False,
-                    records=len(records),
-                    broken_index=i,
-                    reason=f"undecodable decision record at index {i}: {exc}",
-                )
-            if recomputed != rec["receipt"]:
-                return VerifyResult(
-                    ok=False,
-                    records=len(records),
-                    broken_index=i,
-                    reason=(
-                        f"bad decision receipt at index {i}: recomputed {recomputed} "
-                        f"!= stored {rec['receipt']} (record content was altered)"
-                    ),
-                )
-            last_seal = rec["receipt"]
-        else:
+    records = sum(r.count for r in results)
+    last_seal: str | None = None
+    for seg, r in zip([*segments, None], results):
+        if r.reason is not None:
+            return VerifyResult(ok=False, records=records, broken_index=r.broken_index,
+                                reason=r.reason)
+        if seg is not None and (r.count, r.chain, r.head) != (seg.count, seg.chain, seg.head):
             return VerifyResult(
-                ok=False,
-                records=len(records),
-                broken_index=i,
-                reason=f"unknown record type at index {i} (no 'hash'/'prev_hash' or 'receipt')",
+                ok=False, records=records, broken_index=seg.first + min(r.count, seg.count),
+                reason=(f"segment {seg.data.name} does not end where its metadata says "
+                        "(truncated / extended / replaced segment)"),
             )
+        last_seal = r.head or last_seal
+    return VerifyResult(ok=True, records=records, head=last_seal)
+
+
+@dataclass
+class _PartResult:
+    """One file's share of :func:`verify_ledger` (picklable for the pool)."""
+
+    count: int
+    chain: str
+    head: str | None
+    broken_index: int | None = None
+    reason: str | None = None
 
-    return VerifyResult(ok=True, records=len(records), head=last_seal)
+
+def _verify_part(data: Path, first: int, chain: str, seal: str | None) -> _PartResult:
+    """Verify one segment file whose first record is ``first``, from ``chain`` / ``seal``."""
+    out = _PartResult(count=0, chain=chain, head=seal)
+    if not data.exists():
+        return out
+    with data.open("rb") as fh:
+        for raw in fh:
+            line = raw.strip()
+            if not line:
+                continue
+            if out.reason is None:
+                reason, out.chain, seal = _check_record(first + out.count, json.loads(line), out.chain,
+                                                        out.head)
+                if reason is not None:
+                    out.broken_index, out.reason = first + out.count, reason
+                else:
+                    out.head = seal
+            out.count += 1
+    return out
 
 
 def verify_head(
@@ -248,6 +560,539 @@ def verify_head(
     return result
 
 
+# --------------------------------------------------------------------------- #
+# Head checkpoint — O(1) appends without re-verifying the whole chain.
+# --------------------------------------------------------------------------- #
+@dataclass
+class LedgerHead:
+    """The ledger's head as of byte ``offset`` (``count`` records).
+
+    ``head`` is the last record's seal (None when empty) — what the next chained
+    record's ``prev_hash`` is set to. ``chain`` is the running hash-chain head
+    :func:`verify_ledger` checks ``prev_hash`` against (``genesis`` before the
+    first chained event).
+    """
+
+    head: str | None
+    chain: str
+    offset: int
+    count: int
+
+
+def _checkpoint_path(path: Path) -> Path:
+    return path.with_name(path.name + ".head")
+
+
+def _read_checkpoint(path: Path, genesis: str) -> LedgerHead | None:
+    """The sidecar's checkpoint as written, or None if absent / unreadable."""
+    try:
+        d = json.loads(_checkpoint_path(path).read_text(encoding="utf-8"))
+        if d.get("genesis") != genesis:
+            return None
+        return LedgerHead(
+            head=d["head"], chain=str(d["chain"]), offset=int(d["offset"]), count=int(d["count"])
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_checkpoint(path: Path, cp: LedgerHead, genesis: str) -> None:
+    """Atomically replace the sidecar (temp + fsync + rename)."""
+    _write_atomic(_checkpoint_path(path), {**asdict(cp), "genesis": genesis})
+
+
+def _write_atomic(target: Path, obj: dict[str, Any]) -> None:
+    """Write ``obj`` as JSON to ``target`` via temp + fsync + rename."""
+    _write_bytes_atomic(target, json.dumps(obj, sort_keys=True).encode("utf-8"))
+
+
+def _write_bytes_atomic(target: Path, data: bytes) -> None:
+    """Write ``data`` to ``target`` via temp + fsync + rename."""
+    fd, tmp = tempfile.mkstemp(dir=str(target.parent), prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _last_line_before(fh: Any, offset: int) -> bytes | None:
+    """The complete line ending exactly at ``offset`` (without its newline)."""
+    if offset <= 0:
+        return None
+    fh.seek(offset - 1)
+    if fh.read(1) != b"\n":
+        return None
+    block = 4096
+    while True:
+        start = max(0, offset - 1 - block)
+        fh.seek(start)
+        buf = fh.read(offset - 1 - start)
+        nl = buf.rfind(b"\n")
+        if nl >= 0 or start == 0:
+            return buf[nl + 1:]
+        block *= 2
+
+
+def _ends_with(fh: Any, offset: int, head_seal: str | None, chain: str, count: int) -> bool:
+    """Whether the record ending at ``offset`` is record ``count - 1`` sealed ``head_seal``.
+
+    Its seal must recompute and equal ``head_seal``, and a chained record's hash
+    must be the running ``chain``.
+    """
+    line = _last_line_before(fh, offset)
+    try:
+        rec = json.loads(line) if line else None
+    except ValueError:
+        return False
+    if not isinstance(rec, dict) or head_seal not in (rec.get("hash"), rec.get("receipt")):
+        return False
+    reason, _, seal = _check_record(count - 1, rec, rec.get("prev_hash", chain))
+    return reason is None and seal == head_seal and ("hash" not in rec or chain == rec["hash"])
+
+
+def _trusted_checkpoint(
+    path: Path, fh: Any, size: int, genesis: str, base: LedgerHead
+) -> LedgerHead | None:
+    """The sidecar's checkpoint if it still describes this file, else None.
+
+    The record ending at the checkpointed offset must still be there, and its
+    seal must recompute and equal the checkpointed head. At offset 0 the
+    checkpoint must be ``base``, the head the sealed segments end on.
+    """
+    cp = _read_checkpoint(path, genesis)
+    if cp is None or not 0 <= cp.offset <= size or cp.count < base.count:
+        return None
+    if cp.offset == 0:
+        return cp if (cp.head, cp.chain, cp.count) == (base.head, base.chain, base.count) else None
+    return cp if _ends_with(fh, cp.offset, cp.head, cp.chain, cp.count) else None
+
+
+def head(ledger_path: Path | str | None = None, *, genesis: str = GENESIS) -> LedgerHead:
+    """The verified head of the ledger, verifying only records past the checkpoint.
+
+    Starts from the ``<ledger>.head`` checkpoint when it still matches the file
+    (else from the start of the active file — the tail of the last sealed
+    segment, if rotated) and verifies every later record exactly as
+    :func:`verify_ledger` does. Cost is the number of records appended since
+    the last checkpoint, not the ledger size. Read-only: the checkpoint is
+    moved forward only by the appenders, under :func:`locked`.
+
+    :raises LedgerTamperError: if a record past the checkpoint fails to verify,
+        or the sealed segments do not end where their metadata says.
+    """
+    return _scan_head(_path(ledger_path), genesis)[0]
+
+
+def _locked_head(path: Path, genesis: str) -> LedgerHead:
+    """:func:`head`, moving the checkpoint up to it. The caller holds :func:`locked`."""
+    result, cp = _scan_head(path, genesis)
+    if result != cp:
+        _write_checkpoint(path, result, genesis)
+    return result
+
+
+def _scan_head(path: Path, genesis: str) -> tuple[LedgerHead, LedgerHead | None]:
+    """``(head, checkpoint)``: the verified head, and the trusted checkpoint it
+    resumed from (None when it walked from the start of the active file; the
+    head itself when there is no active file, so there is nothing to record).
+    """
+    base = _segments_base(path, genesis)
+    if not path.exists():
+        return base, base
+    with path.open("rb") as fh:
+        # A batch still in flight (or left by a crash) is not part of the head until committed.
+        size = min(os.fstat(fh.fileno()).st_size, _pending_batch_offset(path))
+        cp = _trusted_checkpoint(path, fh, size, genesis, base)
+        start = cp or base
+        seal, chain, offset, count = start.head, start.chain, start.offset, start.count
+        fh.seek(offset)
+        for raw in fh:
+            if not raw.endswith(b"\n") or offset + len(raw) > size:
+                break  # a line still being written (or torn by a crash) — not part of the head yet
+            offset += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            reason, chain, record_seal = _check_record(count, json.loads(line), chain, seal)
+            if reason is not None:
+                raise LedgerTamperError(f"ledger verification FAILED at index {count}: {reason}")
+            seal = record_seal
+            count += 1
+    return LedgerHead(head=seal, chain=chain, offset=offset, count=count), cp
+
+
+# --------------------------------------------------------------------------- #
+# Segments — bounded files and an index for random access.
+# --------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class _Segment:
+    """A sealed segment: records ``first`` .. ``first + count - 1`` in ``data``.
+
+    ``head`` / ``chain`` are the seal and running chain head after its last
+    record — what the next segment's first record chains from.
+    """
+
+    first: int
+    count: int
+    head: str | None
+    chain: str
+    data: Path
+
+
+def _segments_dir(path: Path) -> Path:
+    return path.with_name(path.name + ".segments")
+
+
+def _segment_files(path: Path) -> list[Path]:
+    """Sealed segment files, oldest first (names are zero-padded first seqs)."""
+    directory = _segments_dir(path)
+    return sorted(directory.glob("*.jsonl")) if directory.is_dir() else []
+
+
+def _segment_meta(data: Path, genesis: str) -> _Segment:
+    try:
+        m = json.loads(data.with_suffix(".json").read_text(encoding="utf-8"))
+        seg = _Segment(first=int(m["first"]), count=int(m["count"]), head=m["head"],
+                       chain=str(m["chain"]), data=data)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise LedgerTamperError(f"segment {data.name} has no readable metadata: {exc}") from exc
+    if m.get("genesis") != genesis or data.stem != f"{seg.first:012d}":
+        raise LedgerTamperError(f"segment {data.name} metadata does not match its name / genesis")
+    return seg
+
+
+def _sealed_segments(path: Path, genesis: str) -> list[_Segment]:
+    """Every sealed segment, checked to number its records contiguously from 0."""
+    out: list[_Segment] = []
+    for data in _segment_files(path):
+        seg = _segment_meta(data, genesis)
+        if seg.first != (out[-1].first + out[-1].count if out else 0):
+            raise LedgerTamperError(f"segment {data.name} does not follow its predecessor")
+        out.append(seg)
+    return out
+
+
+def _segments_base(path: Path, genesis: str) -> LedgerHead:
+    """The head the sealed segments end on (offset 0 of the active file).
+
+    Trusted like the checkpoint: the last segment's final record must still be
+    the one its metadata names.
+    """
+    files = _segment_files(path)
+    if not files:
+        return LedgerHead(head=None, chain=genesis, offset=0, count=0)
+    seg = _segment_meta(files[-1], genesis)
+    count = seg.first + seg.count
+    with seg.data.open("rb") as fh:
+        if not _ends_with(fh, os.fstat(fh.fileno()).st_size, seg.head, seg.chain, count):
+            raise LedgerTamperError(f"segment {seg.data.name} does not end on its recorded head")
+    return LedgerHead(head=seg.head, chain=seg.chain, offset=0, count=count)
+
+
+def _seal_key(seal: str | None) -> bytes:
+    """Fixed-width index key of a seal (``hash`` or ``receipt``)."""
+    return hashlib.sha256((seal or "").encode("utf-8")).digest()
+
+
+def _record_seal(rec: dict[str, Any]) -> str | None:
+    """The seal :func:`_check_record` verifies: a chained ``hash``, else ``receipt``."""
+    return rec.get("hash") if "hash" in rec and "prev_hash" in rec else rec.get("receipt")
+
+
+def _line_key(line: bytes) -> bytes:
+    rec = json.loads(line)
+    return _seal_key(_record_seal(rec) if isinstance(rec, dict) else None)
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+def _committed_size(path: Path) -> int:
+    size = path.stat().st_size
+    pending = _pending_batch_offset(path)
+    return size if pending > size else int(pending)
+
+
+def _active_index(path: Path, size: int) -> tuple[int, list[tuple[int, bytes]]]:
+    """``(n, extra)``: the first ``n`` entries of ``<ledger>.idx`` still describe
+    the active file, and ``extra`` indexes the committed records past them.
+
+    Like the checkpoint, the on-disk index is trusted only if its last entry
+    still names the record at its offset; otherwise it is rebuilt from 0.
+    """
+    idx = _index_path(path)
+    try:
+        n = idx.stat().st_size // _ENTRY.size
+    except FileNotFoundError:
+        n = 0
+    resume = 0
+    with path.open("rb") as fh:
+        if n:
+            with idx.open("rb") as ih:
+                ih.seek((n - 1) * _ENTRY.size)
+                off, key = _ENTRY.unpack(ih.read(_ENTRY.size))
+            fh.seek(off)
+            line = fh.readline()
+            try:
+                ok = line.endswith(b"\n") and off + len(line) <= size and _line_key(line) == key
+            except ValueError:
+                ok = False
+            if ok:
+                resume = off + len(line)
+            else:
+                n = 0
+        extra: list[tuple[int, bytes]] = []
+        offset = resume
+        fh.seek(offset)
+        for raw in fh:
+            if not raw.endswith(b"\n") or offset + len(raw) > size:
+                break
+            if raw.strip():
+                extra.append((offset, _line_key(raw)))
+            offset += len(raw)
+    return n, extra
+
+
+def _catch_up_index(path: Path) -> None:
+    """Bring ``<ledger>.idx`` up to the committed end of the active file.
+
+    The caller holds :func:`locked`. The index is a rebuildable cache, so it is
+    not fsync'd.
+    """
+    if not path.exists():
+        return
+    n, extra = _active_index(path, _committed_size(path))
+    with _index_path(path).open("ab") as fh:
+        if fh.tell() != n * _ENTRY.size:
+            fh.truncate(n * _ENTRY.size)
+        fh.write(b"".join(_ENTRY.pack(off, key) for off, key in extra))
+
+
+def _maybe_rotate(path: Path, genesis: str, segment_bytes: int | None) -> None:
+    """Seal the active file as a segment if it has reached the threshold.
+
+    The caller holds :func:`locked`. The segment's index, sorted hash index and
+    metadata are written first; the rename of the active file is the commit
+    point, so a crash either leaves it active or fully sealed.
+    """
+    limit = SEGMENT_BYTES if segment_bytes is None else segment_bytes
+    if not limit or not path.exists() or path.stat().st_size < limit:
+        return
+    h = _locked_head(path, genesis)
+    if h.offset != path.stat().st_size:
+        return  # a torn tail or an unsettled batch — rotate once the file is clean
+    base = _segments_base(path, genesis)
+    _catch_up_index(path)
+    entries = _index_path(path).read_bytes()
+    directory = _segments_dir(path)
+    directory.mkdir(exist_ok=True)
+    stem = directory / f"{base.count:012d}"
+    _write_bytes_atomic(stem.with_suffix(".idx"), entries)
+    keyed = sorted((key, base.count + i) for i, (_, key) in enumerate(_ENTRY.iter_unpack(entries)))
+    _write_bytes_atomic(stem.with_suffix(".hix"), b"".join(_KEYED.pack(k, q) for k, q in keyed))
+    _write_atomic(stem.with_suffix(".json"), {
+        "first": base.count, "count": h.count - base.count, "head": h.head, "chain": h.chain,
+        "bytes": h.offset, "genesis": genesis,
+    })
+    _index_path(path).unlink()
+    os.replace(path, stem.with_suffix(".jsonl"))
+    _fsync_dir(directory)
+    _fsync_dir(path.parent)
+    _write_checkpoint(path, LedgerHead(head=h.head, chain=h.chain, offset=0, count=h.count), genesis)
+
+
+class _View:
+    """Random access into one segment file through its ``(offset, key)`` index."""
+
+    def __init__(self, first: int, data: Path, idx: Path, n_disk: int,
+                 extra: list[tuple[int, bytes]]):
+        self.first, self.data, self.idx, self.n_disk, self.extra = first, data, idx, n_disk, extra
+        self.count = n_disk + len(extra)
+
+    def entry(self, i: int) -> tuple[int, bytes]:
+        if i >= self.n_disk:
+            return self.extra[i - self.n_disk]
+        with self.idx.open("rb") as fh:
+            fh.seek(i * _ENTRY.size)
+            return _ENTRY.unpack(fh.read(_ENTRY.size))
+
+    def scan(self, key: bytes) -> int | None:
+        """Index of the record sealed ``key`` by a LINEAR pass over the index —
+        O(records in this file), which the segment threshold bounds.
+
+        For the active file, which has no sorted ``.hix`` until it is sealed. With
+        no on-disk index yet (``n_disk`` 0), only the in-memory ``extra`` is read.
+        """
+        if self.n_disk:
+            with self.idx.open("rb") as fh, \
+                    mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(key)
+                while pos >= 0:
+                    if pos % _ENTRY.size == 8 and pos // _ENTRY.size < self.n_disk:
+                        return pos // _ENTRY.size
+                    pos = mm.find(key, pos + 1)
+        return next((self.n_disk + j for j, (_, k) in enumerate(self.extra) if k == key), None)
+
+    def read(self, i: int) -> dict[str, Any]:
+        """Record ``i`` of this segment, checked against its own seal and index key."""
+        offset, key = self.entry(i)
+        with self.data.open("rb") as fh:
+            fh.seek(offset)
+            rec = _self_checked(self.first + i, fh.readline())
+        if _seal_key(_record_seal(rec)) != key:
+            raise LedgerTamperError(f"ledger index disagrees with record {self.first + i}")
+        return rec
+
+
+def _hix_find(hix: Path, key: bytes) -> int | None:
+    """Binary search of a sealed segment's sorted ``(key, seq)`` index."""
+    if not hix.exists():
+        raise LedgerTamperError(f"segment {hix.stem} has no hash index")
+    with hix.open("rb") as fh:
+        lo, hi = 0, os.fstat(fh.fileno()).st_size // _KEYED.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            fh.seek(mid * _KEYED.size)
+            k, seq = _KEYED.unpack(fh.read(_KEYED.size))
+            if k == key:
+                return seq
+            lo, hi = (mid + 1, hi) if k < key else (lo, mid)
+    return None
+
+
+def _self_checked(seq: int, line: bytes) -> dict[str, Any]:
+    """Parse record ``seq`` and recompute its own seal (not its chain position)."""
+    try:
+        rec = json.loads(line)
+    except ValueError as exc:
+        raise LedgerTamperError(f"undecodable ledger record {seq}: {exc}") from exc
+    if not isinstance(rec, dict):
+        raise LedgerTamperError(f"ledger record {seq} is not an object")
+    reason, _, _ = _check_record(seq, rec, rec.get("prev_hash", ""))
+    if reason is not None:
+        raise LedgerTamperError(f"ledger record {seq} fails its seal: {reason}")
+    return rec
+
+
+def _sealed_view(seg: _Segment) -> _View:
+    idx = seg.data.with_suffix(".idx")
+    n = idx.stat().st_size // _ENTRY.size if idx.exists() else -1
+    if n != seg.count:
+        raise LedgerTamperError(f"segment {seg.data.name} index does not cover its records")
+    return _View(seg.first, seg.data, idx, n, [])
+
+
+def _active_view(path: Path, first: int) -> _View:
+    n, extra = _active_index(path, _committed_size(path)) if path.exists() else (0, [])
+    return _View(first, path, _index_path(path), n, extra)
+
+
+def _views(path: Path, genesis: str, start: int = 0, stop: int | None = None) -> Iterator[_View]:
+    """Views of the segments holding records ``start`` .. ``stop - 1``, in order.
+
+    Segment files are named by their first record, so only the segments in the
+    range (and the last one, which fixes where the active file starts) are opened.
+    """
+    files = _segment_files(path)
+    firsts = [int(f.stem) for f in files]
+    k = max(0, bisect.bisect_right(firsts, start) - 1)
+    last = _segment_meta(files[-1], genesis) if files else None
+    for data in files[k:]:
+        seg = last if data == files[-1] else _segment_meta(data, genesis)
+        if stop is not None and seg.first >= stop:
+            return
+        yield _sealed_view(seg)
+    active_first = last.first + last.count if last else 0
+    if stop is None or active_first < stop:
+        yield _active_view(path, active_first)
+
+
+def _last_view(path: Path, genesis: str, files: list[Path]) -> _View:
+    """The active file's view (opening only the last sealed segment's metadata)."""
+    return list(_views(path, genesis, int(files[-1].stem) if files else 0))[-1]
+
+
+def get(
+    seq: int, *, ledger_path: Path | str | None = None, genesis: str = GENESIS
+) -> dict[str, Any]:
+    """Record number ``seq`` (0-based, across segments) via the segment indexes.
+
+    O(log segments) to find the segment, O(1) within it. The record is checked
+    against its own seal; its place in the chain is :func:`verify_ledger`'s job.
+
+    :raises IndexError: if there is no record ``seq``.
+    :raises LedgerTamperError: if the record or its index entry does not check.
+    """
+    if seq >= 0:
+        for view in _views(_path(ledger_path), genesis, seq, seq + 1):
+            if view.first <= seq < view.first + view.count:
+                return view.read(seq - view.first)
+    raise IndexError(f"no ledger record {seq}")
+
+
+def get_by_hash(
+    seal: str, *, ledger_path: Path | str | None = None, genesis: str = GENESIS
+) -> tuple[int, dict[str, Any]] | None:
+    """``(seq, record)`` for the record sealed ``seal`` (``hash`` or ``receipt``).
+
+    O(log n) per sealed segment through its sorted ``.hix``; the active file's
+    index is scanned linearly (O(its records), bounded by the segment
+    threshold). None if no record carries that seal.
+    """
+    path = _path(ledger_path)
+    key = _seal_key(seal)
+    files = _segment_files(path)
+    active = _last_view(path, genesis, files)
+    i = active.scan(key)
+    # Sealed segments newest first; their .hix holds the seq, so no metadata is read to search.
+    seq = active.first + i if i is not None else next(
+        (q for q in (_hix_find(f.with_suffix(".hix"), key) for f in reversed(files)) if q is not None),
+        None,
+    )
+    if seq is None:
+        return None
+    rec = get(seq, ledger_path=path, genesis=genesis)
+    return (seq, rec) if _record_seal(rec) == seal else None
+
+
+def iter_range(
+    start: int, stop: int, *, ledger_path: Path | str | None = None, genesis: str = GENESIS
+) -> Iterator[dict[str, Any]]:
+    """Records ``start`` .. ``stop - 1`` in order (clamped to the ledger).
+
+    Seeks once per segment through its index, then reads sequentially; each
+    record is checked against its own seal.
+    """
+    for view in _views(_path(ledger_path), genesis, max(start, 0), stop):
+        lo, hi = max(start, view.first), min(stop, view.first + view.count)
+        if lo >= hi:
+            continue
+        with view.data.open("rb") as fh:
+            fh.seek(view.entry(lo - view.first)[0])
+            seq = lo
+            while seq < hi:
+                line = fh.readline()
+                if line.strip():
+                    yield _self_checked(seq, line)
+                    seq += 1
+
+
+def tail(
+    n: int, *, ledger_path: Path | str | None = None, genesis: str = GENESIS
+) -> list[dict[str, Any]]:
+    """The last ``n`` records, oldest first."""
+    path = _path(ledger_path)
+    active = _last_view(path, genesis, _segment_files(path))
+    end = active.first + active.count
+    return list(iter_range(max(0, end - n), end, ledger_path=path, genesis=genesis))
+
+
 # --------------------------------------------------------------------------- #
 # Verified read paths — do not silently trust the file.
 # --------------------------------------------------------------------------- #
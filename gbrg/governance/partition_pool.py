@@ -0,0 +1,75 @@
+"""Order-preserving partitioned maps over a process pool with per-worker state.
+
+Shared by the parallel paths of ``tools/check_source_exposure.py`` and
+``gbrg/governance/supply_chain_pipeline.py``. Each worker is given its state
+once, in the pool initializer, instead of with every task; work is cut into a
+few contiguous partitions per worker, which evens out stragglers, and the
+results are merged back in input order, so a parallel run returns exactly what
+the serial call does.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Sequence
+
+# Partitions per worker: enough to even out uneven partitions, few enough to keep pickling cheap.
+PARTITIONS_PER_WORKER = 4
+
+_STATE: Any = None
+
+
+def _install(factory: Callable[..., Any] | None, args: tuple[Any, ...]) -> None:
+    global _STATE
+    _STATE = factory(*args) if factory is not None else args[0]
+
+
+def _apply(fn: Callable[[Any, list[Any]], list[Any]], part: list[Any]) -> list[Any]:
+    return fn(_STATE, part)
+
+
+def partitions(items: Sequence[Any], workers: int) -> list[list[Any]]:
+    """``items`` cut into contiguous partitions, about PARTITIONS_PER_WORKER per worker."""
+    size = max(1, -(-len(items) // (max(1, workers) * PARTITIONS_PER_WORKER)))
+    return [list(items[i:i + size]) for i in range(0, len(items), size)]
+
+
+def state_pool(
+    workers: int,
+    state: Any = None,
+    *,
+    factory: Callable[..., Any] | None = None,
+    args: tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    """A pool whose every worker holds the state ``fn`` receives: ``state`` itself
+    (pickled once per worker), or ``factory(*args)`` built in the worker when the
+    state is cheaper to rebuild than to ship (e.g. compiled regexes)."""
+    initargs = (factory, args) if factory is not None else (None, (state,))
+    return ProcessPoolExecutor(max_workers=workers, initializer=_install, initargs=initargs)
+
+
+def map_partitioned(
+    fn: Callable[[Any, list[Any]], list[Any]],
+    items: Sequence[Any],
+    state: Any,
+    pool: ProcessPoolExecutor | None,
+    workers: int,
+) -> list[Any]:
+    """``fn(state, items)``, split into partitions across ``pool`` (a :func:`state_pool`).
+
+    ``fn`` returns one result per item and must be a picklable module-level
+    function. With no pool, or fewer than two items, it runs here on ``state``.
+    """
+    if pool is None or len(items) < 2:
+        return fn(state, list(items))
+    return [r for part in pool.map(partial(_apply, fn), partitions(items, workers)) for r in part]
+
+
+def submit(
+    pool: ProcessPoolExecutor, fn: Callable[[Any, list[Any]], list[Any]], items: list[Any]
+) -> Future:
+    """``fn(worker state, items)`` as one task — for work that should not be partitioned."""
+    return pool.submit(_apply, fn, items)
@@ -415,20 +415,26 @@ def _seal_and_persist(
     """Hash-chained receipt on the existing gbrg ledger. sha256 = FIPS-180-4."""
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     result.proof_id = "proof-ppb-" + uuid.uuid4().hex[:16]
-    records = ledger.read_all(ledger_path) if _ledger_exists(ledger_path) else []
-    prev = (records[-1].get("hash") or records[-1].get("receipt")) if records else ledger.GENESIS
-    core = {
-        "type": "PortfolioPositionBindingVerdict",
-        "ts": ts,
-        "prev_hash": prev,
-        "artifact": result.proof_artifact(),
-    }
-    event_hash = ledger._sha(core)
-    event = dict(core)
-    event["hash"] = event_hash
-    result.receipt = event_hash
+    artifact = result.proof_artifact()
+
+    def build(prev: str) -> dict[str, Any]:
+        core = {
+            "type": "PortfolioPositionBindingVerdict",
+            "ts": ts,
+            "prev_hash": prev,
+            "artifact": artifact,
+        }
+        event = dict(core)
+        event["hash"] = ledger._sha(core)
+        return event
+
     if persist:
-        ledger.append(event, ledger_path=ledger_path)
+        event = ledger.append_chained(build, ledger_path=ledger_path)
+    else:
+        event = build(
+            (ledger.head(ledger_path).head if _ledger_exists(ledger_path) else None) or ledger.GENESIS
+        )
+    result.receipt = event["hash"]
     return result
 
 
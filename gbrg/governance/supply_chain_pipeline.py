@@ -48,16 +48,19 @@ Cross-ref: SocioProphet/sociosphere#547, prophet-workspace#108 item 2.
 from __future__ import annotations
 
 import json
+import os
 import re
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 if __package__ in (None, ""):  # run as a plain script: bootstrap the package path
     import sys as _sys
     _sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-    from gbrg.governance import supply_chain_risk as scr
+    from gbrg.governance import partition_pool, supply_chain_risk as scr
 else:
-    from . import supply_chain_risk as scr
+    from . import partition_pool, supply_chain_risk as scr
 
 # --------------------------------------------------------------------------- #
 # Declared-data location (contracts/, consume-not-fork).
@@ -413,6 +416,77 @@ def derive_module_clusters(
 # --------------------------------------------------------------------------- #
 # (3) Orchestration: assess the estate over real topology.
 # --------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class _ScoringContext:
+    """Everything a scoring partition reads — shipped once to each worker."""
+
+    weights: dict[str, Any]
+    crosswalk: dict[str, Any]
+    signal_map: dict[str, Any]
+    evidence_index: dict[str, list[dict[str, Any]]] | None
+    crosswalk_refs: list[str]
+    tier0: bool
+
+
+def _score_nodes(ctx: _ScoringContext, artifacts: list[dict[str, Any]]) -> list[scr.Assessment]:
+    out = []
+    for art in artifacts:
+        cell_id = art["cell_id"]
+        out.append(scr.assess_node(
+            subject_id=cell_id,
+            factors=factors_from_artifact(art, ctx.signal_map),
+            controls_evidence=controls_from_index(cell_id, ctx.evidence_index),
+            kri_metrics=_external_kri(cell_id, ctx.evidence_index),
+            crosswalk_refs=ctx.crosswalk_refs,
+            weights=ctx.weights, crosswalk=ctx.crosswalk,
+            tier0=ctx.tier0, seal=False,
+        ))
+    return out
+
+
+def _score_paths(
+    ctx: _ScoringContext, paths: list[tuple[str, list[float]]]
+) -> list[scr.Assessment]:
+    return [
+        scr.assess_path(
+            subject_id=subject_id,
+            node_residuals=residuals,
+            kri_metrics=_external_kri(subject_id, ctx.evidence_index),
+            controls_evidence=controls_from_index(subject_id, ctx.evidence_index),
+            crosswalk_refs=ctx.crosswalk_refs,
+            weights=ctx.weights, crosswalk=ctx.crosswalk,
+            seal=False,
+        )
+        for subject_id, residuals in paths
+    ]
+
+
+def _score_clusters(
+    ctx: _ScoringContext, clusters: list[tuple[str, list[dict[str, Any]]]]
+) -> list[scr.Assessment]:
+    out = []
+    for subject_id, members in clusters:
+        components, shares = cluster_components_from_artifacts(members, ctx.signal_map)
+        hhi = scr.hhi_normalized(shares)
+        cluster_kri = cluster_kri_metrics(members, hhi, ctx.signal_map)
+        cluster_kri.update(_external_kri(subject_id, ctx.evidence_index))
+        a = scr.assess_cluster(
+            subject_id=subject_id,
+            components=components,
+            shares=shares,
+            resilience_control=_cluster_resilience(subject_id, ctx.evidence_index),
+            controls_evidence=controls_from_index(subject_id, ctx.evidence_index),
+            kri_metrics=cluster_kri,
+            crosswalk_refs=ctx.crosswalk_refs,
+            weights=ctx.weights, crosswalk=ctx.crosswalk,
+            seal=False,
+        )
+        if members:  # highest-blast member anchors the evidence-plane lift
+            a._anchorCellId = max(members, key=lambda m: m.get("blast_radius", 0.0))["cell_id"]
+        out.append(a)
+    return out
+
+
 def assess_estate(
     bundle: dict[str, Any],
     *,
@@ -425,95 +499,93 @@ def assess_estate(
     signal_map: dict[str, Any] | None = None,
     ledger_path: Path | str | None = None,
     persist: bool = False,
+    workers: int = 1,
 ) -> dict[str, Any]:
     """Score node / path / cluster subjects off a real gbrg-analyze bundle.
 
     Returns ``{"nodes": [Assessment...], "paths": [Assessment...],
-    "cluster": Assessment, "residual_by_cell": {cell_id: residual}}``.
+    "cluster": Assessment, "clusters": [Assessment...],
+    "residual_by_cell": {cell_id: residual}, "timings": {stage: seconds}}``.
 
     Every subject is scored through the UNMODIFIED :mod:`supply_chain_risk`
     scorer; only the INPUTS (factors, node residuals, cluster components,
     controls-evidence, KRI metrics) are now derived from the real graph. With no
     ``evidence_index`` and ``tier0=True``, every subject fails CLOSED (REJECTED)
     — the honest default when real controls evidence is absent.
+
+    Subjects are scored unsealed and then sealed together by
+    :func:`scr.seal_batch` (nodes, paths, estate cluster, module clusters — in
+    that order), so ``persist=True`` is a single all-or-nothing ledger commit.
+
+    Scoring is a pure function of the bundle and the declared contracts, so
+    ``workers > 1`` partitions each stage over a process pool; partitions merge
+    back in serial order and sealing stays in this process, so the ledger is
+    the same chain a ``workers=1`` run writes.
     """
     weights = weights or scr.load_weights()
     crosswalk = crosswalk or scr.load_crosswalk()
     signal_map = signal_map or load_signal_map()
-    node_crosswalk_refs = node_crosswalk_refs or []
+    ctx = _ScoringContext(
+        weights=weights, crosswalk=crosswalk, signal_map=signal_map,
+        evidence_index=evidence_index, crosswalk_refs=node_crosswalk_refs or [],
+        tier0=tier0,
+    )
 
     artifacts = bundle.get("artifacts", [])
     edges = bundle.get("edges", [])
-
-    # ── Nodes ────────────────────────────────────────────────────────────────
-    node_assessments: list[scr.Assessment] = []
-    residual_by_cell: dict[str, float] = {}
-    for art in artifacts:
-        cell_id = art["cell_id"]
-        factors = factors_from_artifact(art, signal_map)
-        controls = controls_from_index(cell_id, evidence_index)
-        node_kri = _external_kri(cell_id, evidence_index)
-        a = scr.assess_node(
-            subject_id=cell_id,
-            factors=factors,
-            controls_evidence=controls,
-            kri_metrics=node_kri,
-            crosswalk_refs=node_crosswalk_refs,
-            weights=weights, crosswalk=crosswalk,
-            tier0=tier0, ledger_path=ledger_path, persist=persist,
-        )
-        node_assessments.append(a)
-        residual_by_cell[cell_id] = a.residualScore
-
-    # ── Paths (real CALLS chains) ─────────────────────────────────────────────
-    path_assessments: list[scr.Assessment] = []
-    for chain in derive_call_paths(edges):
-        # Node residuals along the chain (0.0 for a member not in this bundle).
-        residuals = [residual_by_cell.get(cell, 0.0) for cell in chain]
-        head, tail = chain[0].split("#")[-1], chain[-1].split("#")[-1]
-        subject_id = f"path:{head}->{tail}:{len(chain)}nodes"
-        controls = controls_from_index(subject_id, evidence_index)
-        path_kri = _external_kri(subject_id, evidence_index)
-        a = scr.assess_path(
-            subject_id=subject_id,
-            node_residuals=residuals,
-            kri_metrics=path_kri,
-            controls_evidence=controls,
-            crosswalk_refs=node_crosswalk_refs,
-            weights=weights, crosswalk=crosswalk,
-            ledger_path=ledger_path, persist=persist,
-        )
-        a._anchorCellId = chain[0]  # head node anchors the evidence-plane lift
-        path_assessments.append(a)
-
-    def _score_cluster(subject_id: str, members: list[dict[str, Any]]) -> scr.Assessment:
-        components, shares = cluster_components_from_artifacts(members, signal_map)
-        hhi = scr.hhi_normalized(shares)
-        cluster_kri = cluster_kri_metrics(members, hhi, signal_map)
-        cluster_kri.update(_external_kri(subject_id, evidence_index))
-        a = scr.assess_cluster(
-            subject_id=subject_id,
-            components=components,
-            shares=shares,
-            resilience_control=_cluster_resilience(subject_id, evidence_index),
-            controls_evidence=controls_from_index(subject_id, evidence_index),
-            kri_metrics=cluster_kri,
-            crosswalk_refs=node_crosswalk_refs,
-            weights=weights, crosswalk=crosswalk,
-            ledger_path=ledger_path, persist=persist,
+    timings: dict[str, float] = {}
+
+    pool = partition_pool.state_pool(workers, ctx) if workers > 1 else None
+    try:
+        # ── Nodes ────────────────────────────────────────────────────────────
+        t0 = time.perf_counter()
+        node_assessments = partition_pool.map_partitioned(_score_nodes, artifacts, ctx, pool, workers)
+        residual_by_cell = {a.subjectId: a.residualScore for a in node_assessments}
+        timings["nodes"] = time.perf_counter() - t0
+
+        # ── Paths (real CALLS chains) ─────────────────────────────────────────
+        t0 = time.perf_counter()
+        chains = derive_call_paths(edges)
+        path_inputs = []
+        for chain in chains:
+            head, tail = chain[0].split("#")[-1], chain[-1].split("#")[-1]
+            # Node residuals along the chain (0.0 for a member not in this bundle).
+            path_inputs.append((
+                f"path:{head}->{tail}:{len(chain)}nodes",
+                [residual_by_cell.get(cell, 0.0) for cell in chain],
+            ))
+        path_assessments = partition_pool.map_partitioned(_score_paths, path_inputs, ctx, pool, workers)
+        for a, chain in zip(path_assessments, chains):
+            a._anchorCellId = chain[0]  # head node anchors the evidence-plane lift
+        timings["paths"] = time.perf_counter() - t0
+
+        # ── Clusters: the whole corpus (estate-level common-mode roll-up), then
+        #    one per real module boundary (common-mode concentration groups) ──
+        t0 = time.perf_counter()
+        estate_input = [(cluster_subject_id, artifacts)]
+        # The estate roll-up spans every artifact: its own task, not one partition's straggler.
+        estate = partition_pool.submit(pool, _score_clusters, estate_input) if pool else None
+        module_clusters = partition_pool.map_partitioned(
+            _score_clusters,
+            [(f"cluster:module:{locator}", members)
+             for locator, members in derive_module_clusters(artifacts)],
+            ctx, pool, workers,
         )
-        if members:  # highest-blast member anchors the evidence-plane lift
-            a._anchorCellId = max(members, key=lambda m: m.get("blast_radius", 0.0))["cell_id"]
-        return a
-
-    # ── Cluster: whole corpus (estate-level common-mode roll-up) ──────────────
-    cluster_assessment = _score_cluster(cluster_subject_id, artifacts)
-
-    # ── Clusters: per real module boundary (common-mode concentration groups) ─
-    module_clusters = [
-        _score_cluster(f"cluster:module:{locator}", members)
-        for locator, members in derive_module_clusters(artifacts)
-    ]
+        cluster_assessment = (
+            estate.result() if estate else _score_clusters(ctx, estate_input)
+        )[0]
+        timings["clusters"] = time.perf_counter() - t0
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # ── Seal: the whole estate is ONE chained run, committed with one fsync ──
+    t0 = time.perf_counter()
+    scr.seal_batch(
+        [*node_assessments, *path_assessments, cluster_assessment, *module_clusters],
+        ledger_path=ledger_path, persist=persist,
+    )
+    timings["seal"] = time.perf_counter() - t0
 
     return {
         "nodes": node_assessments,
@@ -521,6 +593,7 @@ def assess_estate(
         "cluster": cluster_assessment,     # estate-level roll-up
         "clusters": module_clusters,       # per-module concentration clusters
         "residual_by_cell": residual_by_cell,
+        "timings": timings,                # wall seconds per stage
     }
 
 
@@ -635,14 +708,15 @@ _DEFAULT_BUNDLE = (
 
 
 def main(argv: list[str] | None = None) -> int:
-    """``supply_chain_pipeline <bundle> [--evidence f.json] [--emit-evidence] [--ledger p]``.
+    """``supply_chain_pipeline <bundle> [--evidence f.json] [--emit-evidence] [--ledger p] [--workers n]``.
 
     Scores node/path/cluster off a real gbrg-analyze bundle (defaults to the
     committed fixture) and prints a governance summary to stdout. ``--evidence``
     supplies a real controls/KRI ``evidence_index`` (JSON); with none, tier-0
     subjects fail CLOSED. ``--emit-evidence`` prints the evidence-plane envelopes
     (evidence-only) as JSON. ``--ledger`` seals each assessment to a hash-chained
-    ledger and verifies the whole chain.
+    ledger and verifies the whole chain. ``--workers`` scores on a process pool
+    (0 = one per CPU); per-stage timings go to stderr.
     """
     import argparse
 
@@ -653,6 +727,8 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--emit-evidence", action="store_true",
                         help="print evidence-plane observation envelopes as JSON")
     parser.add_argument("--ledger", help="seal + verify assessments to this ledger path")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="scoring processes (default 1 = in-process; 0 = one per CPU)")
     args = parser.parse_args(argv)
 
     drift = validate_signal_map()
@@ -668,6 +744,7 @@ def main(argv: list[str] | None = None) -> int:
     result = assess_estate(
         bundle, evidence_index=evidence_index,
         ledger_path=args.ledger, persist=bool(args.ledger),
+        workers=args.workers or os.cpu_count() or 1,
     )
 
     # With --emit-evidence, stdout is PURE envelope JSON (pipeable) and the
@@ -675,6 +752,8 @@ def main(argv: list[str] | None = None) -> int:
     import sys as _sys
     summary = summarize_estate(result)
     print(json.dumps(summary, indent=2), file=_sys.stderr if args.emit_evidence else _sys.stdout)
+    print("timings: " + " ".join(f"{k}={v:.3f}s" for k, v in result["timings"].items()),
+          file=_sys.stderr)
 
     if args.ledger:
         from gbrg.governance import ledger
@@ -46,7 +46,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from . import ledger
 from .ledger import GENESIS
@@ -347,12 +347,35 @@ class Assessment:
 
 
 def _next_prev_hash(ledger_path: Path | str | None) -> str:
-    """Chain head of the ledger (GENESIS if empty). Reads the VERIFIED path."""
-    records = ledger.read_all(ledger_path)
-    if not records:
-        return GENESIS
-    last = records[-1]
-    return last.get("hash") or last["receipt"]
+    """Chain head of the ledger (GENESIS if empty). Verifies past the checkpoint."""
+    return ledger.head(ledger_path).head or GENESIS
+
+
+def _event_builder(assessment: Assessment, ts: str) -> Callable[[str], dict[str, Any]]:
+    """Stamp a proofId and return ``build(prev_hash)`` for the artifact's ledger event.
+
+    The event carries ``prev_hash`` + ``hash`` = ledger._sha(core), exactly the
+    chained-event shape ``ledger.verify_ledger`` recomputes and walks.
+    """
+    assessment.proofId = "proof-scr-" + uuid.uuid4().hex[:16]
+    artifact = assessment.proof_artifact()
+
+    def build(prev: str) -> dict[str, Any]:
+        core = {
+            "type": "SupplyChainRiskAssessment",
+            "ts": ts,
+            "prev_hash": prev,
+            "artifact": artifact,
+        }
+        event = dict(core)
+        event["hash"] = ledger._sha(core)  # sha256 over canonical core (FIPS-180-4)
+        return event
+
+    return build
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _seal_and_persist(
@@ -360,28 +383,46 @@ def _seal_and_persist(
 ) -> Assessment:
     """Build a hash-chained ledger event over the artifact and append it.
 
-    Reuses gbrg.governance.ledger unchanged: the event carries ``prev_hash`` +
-    ``hash`` = ledger._sha(core), exactly the chained-event shape
-    ``ledger.verify_ledger`` recomputes and walks. sha256 = FIPS-180-4.
+    Reuses gbrg.governance.ledger unchanged. sha256 = FIPS-180-4. Without
+    ``persist`` the event is chained in memory and nothing is written.
     """
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    assessment.proofId = "proof-scr-" + uuid.uuid4().hex[:16]
-    prev = _next_prev_hash(ledger_path)
-    core = {
-        "type": "SupplyChainRiskAssessment",
-        "ts": ts,
-        "prev_hash": prev,
-        "artifact": assessment.proof_artifact(),
-    }
-    event_hash = ledger._sha(core)  # sha256 over canonical core (FIPS-180-4)
-    event = dict(core)
-    event["hash"] = event_hash
-    assessment.receipt = event_hash
+    build = _event_builder(assessment, _now())
     if persist:
-        ledger.append(event, ledger_path=ledger_path)
+        event = ledger.append_chained(build, ledger_path=ledger_path)
+    else:
+        event = build(_next_prev_hash(ledger_path))
+    assessment.receipt = event["hash"]
     return assessment
 
 
+def seal_batch(
+    assessments: list[Assessment], *, ledger_path: Path | str | None, persist: bool = True
+) -> list[Assessment]:
+    """Seal many assessments as ONE chained run, in order.
+
+    With ``persist`` the events go to the ledger through ``ledger.append_batch``:
+    one write + one fsync, all-or-nothing on crash — the estate lands whole or
+    not at all. Without it the run is chained in memory from the current head
+    and nothing — not even the head checkpoint — is written. Each assessment's
+    ``proofId`` / ``receipt`` are filled in place.
+
+    Like ``assess_*(seal=True)``, this chains onto whatever record is last,
+    including a receipt-sealed gate decision in a shared ledger.
+    """
+    ts = _now()
+    builds = [_event_builder(a, ts) for a in assessments]
+    if persist:
+        events = ledger.append_batch(builds, ledger_path=ledger_path)
+    else:
+        prev, events = _next_prev_hash(ledger_path), []
+        for build in builds:
+            events.append(build(prev))
+            prev = events[-1]["hash"]
+    for a, event in zip(assessments, events):
+        a.receipt = event["hash"]
+    return assessments
+
+
 # --------------------------------------------------------------------------- #
 # The gate: score -> project verdict -> seal -> persist.
 # --------------------------------------------------------------------------- #
@@ -444,8 +485,12 @@ def assess_node(
     tier0: bool = True,
     ledger_path: Path | str | None = None,
     persist: bool = True,
+    seal: bool = True,
 ) -> Assessment:
-    """Score a single node, project a verdict, seal + persist the artifact."""
+    """Score a single node, project a verdict, seal + persist the artifact.
+
+    ``seal=False`` returns the assessment unsealed, for :func:`seal_batch`.
+    """
     weights = weights or load_weights()
     crosswalk = crosswalk or load_crosswalk()
     crosswalk_refs = crosswalk_refs or []
@@ -479,7 +524,7 @@ def assess_node(
         controlsEvidence=controls_evidence, kriEvaluations=kri_evals,
         crosswalkRefs=crosswalk_refs, derivation=derivation, _boundTerms=bound,
     )
-    return _seal_and_persist(a, ledger_path=ledger_path, persist=persist)
+    return _seal_and_persist(a, ledger_path=ledger_path, persist=persist) if seal else a
 
 
 def assess_path(
@@ -493,6 +538,7 @@ def assess_path(
     crosswalk: dict[str, Any] | None = None,
     ledger_path: Path | str | None = None,
     persist: bool = True,
+    seal: bool = True,
 ) -> Assessment:
     """Accumulate node residuals into a path risk, project a verdict, seal + persist.
 
@@ -529,7 +575,7 @@ def assess_path(
         controlsEvidence=controls_evidence, kriEvaluations=kri_evals,
         crosswalkRefs=crosswalk_refs, derivation=derivation, _boundTerms=bound,
     )
-    return _seal_and_persist(a, ledger_path=ledger_path, persist=persist)
+    return _seal_and_persist(a, ledger_path=ledger_path, persist=persist) if seal else a
 
 
 def assess_cluster(
@@ -545,6 +591,7 @@ def assess_cluster(
     crosswalk: dict[str, Any] | None = None,
     ledger_path: Path | str | None = None,
     persist: bool = True,
+    seal: bool = True,
 ) -> Assessment:
     """Score a common-mode concentration cluster, project a verdict, seal + persist.
 
@@ -586,4 +633,4 @@ def assess_cluster(
         controlsEvidence=controls_evidence, kriEvaluations=kri_evals,
         crosswalkRefs=crosswalk_refs, derivation=derivation, _boundTerms=bound,
     )
-    return _seal_and_persist(a, ledger_path=ledger_path, persist=persist)
+    return _seal_and_persist(a, ledger_path=ledger_path, persist=persist) if seal else a
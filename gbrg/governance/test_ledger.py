@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""Prove the ledger head checkpoint keeps appends O(1) WITHOUT trusting blindly.
+
+  (A) head() agrees with verify_ledger() and, once checkpointed, re-checks
+      only the checkpointed record on the next head lookup; head() itself
+      never writes — only the appenders move the checkpoint.
+  (B) records appended past the checkpoint ARE verified — a forged tail raises.
+  (C) a stale, forged or dangling checkpoint is ignored, never believed.
+  (D) concurrent append_chained() writers never fork the chain.
+  (E) append_batch() commits with one fsync, all-or-nothing across a crash.
+  (F) rotated segments chain end to end, verify in parallel, and answer
+      get / get_by_hash / tail / iter_range exactly as a full read would —
+      with or without the index sidecars — and rotation is on by default.
+
+Runs under pytest OR as `python3 test_ledger.py`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from gbrg.governance import ledger  # noqa: E402
+
+
+def _event(n: int):
+    def build(prev: str) -> dict:
+        core = {"type": "TestEvent", "n": n, "prev_hash": prev}
+        return {**core, "hash": ledger._sha(core)}
+
+    return build
+
+
+def _ledger(n: int) -> Path:
+    path = Path(tempfile.mkdtemp()) / "events.jsonl"
+    for i in range(n):
+        ledger.append_chained(_event(i), ledger_path=path)
+    return path
+
+
+def _counting_checks():
+    calls = []
+    real = ledger._check_record
+
+    def check(i, rec, chain, prev_seal=None):
+        calls.append(i)
+        return real(i, rec, chain, prev_seal)
+
+    return calls, check
+
+
+def test_head_matches_full_verification_and_resumes_from_the_checkpoint() -> None:
+    path = Path(tempfile.mkdtemp()) / "events.jsonl"
+    empty = ledger.head(path)
+    assert empty.head is None and empty.chain == ledger.GENESIS and empty.count == 0
+    for i in range(20):
+        ledger.append_chained(_event(i), ledger_path=path)
+    vr = ledger.verify_ledger(path)
+    h = ledger.head(path)
+    assert vr.ok and h.head == vr.head and h.count == 20 and h.offset == path.stat().st_size
+    assert json.loads(path.with_name("events.jsonl.head").read_text())["count"] == 20
+    calls, check = _counting_checks()
+    saved, ledger._check_record = ledger._check_record, check
+    try:
+        assert ledger.head(path) == h
+        ledger.append(_event(20)(h.head), ledger_path=path)
+        assert ledger.head(path).count == 21
+    finally:
+        ledger._check_record = saved
+    # each head() re-checks only the checkpointed record; append() verifies just the new one
+    assert calls == [19, 20, 20]
+
+
+def test_head_is_read_only_and_appenders_move_the_checkpoint() -> None:
+    path = Path(tempfile.mkdtemp()) / "events.jsonl"
+    sidecar = path.with_name("events.jsonl.head")
+    for i in range(3):
+        ledger.append(_event(i)(ledger.head(path).head or ledger.GENESIS), ledger_path=path)
+    assert not sidecar.exists()                          # append() never had a checkpoint to advance
+    before = sorted(p.name for p in path.parent.iterdir())
+    assert ledger.head(path).count == 3
+    assert sorted(p.name for p in path.parent.iterdir()) == before
+    ledger.append_chained(_event(3), ledger_path=path)   # the appender catches the checkpoint up
+    assert json.loads(sidecar.read_text())["count"] == 4
+
+
+def test_a_forged_record_past_the_checkpoint_is_refused() -> None:
+    path = _ledger(5)
+    h = ledger.head(path)
+    forged = _event(5)(h.head)
+    forged["n"] = 999            # content edited after sealing
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps(forged, sort_keys=True, separators=(",", ":")) + "\n")
+    raised = False
+    try:
+        ledger.head(path)
+    except ledger.LedgerTamperError as exc:
+        raised = "index 5" in str(exc)
+    assert raised
+
+
+def test_stale_forged_or_dangling_checkpoints_are_not_believed() -> None:
+    path = _ledger(6)
+    good = ledger.head(path)
+    sidecar = path.with_name("events.jsonl.head")
+
+    sidecar.write_text(json.dumps({**json.loads(sidecar.read_text()), "head": "sha256:" + "0" * 64}))
+    assert ledger.head(path) == good                     # forged head: full walk instead
+
+    sidecar.write_text("not json")
+    assert ledger.head(path) == good
+
+    lines = path.read_text().splitlines(keepends=True)
+    path.write_text("".join(lines[:4]))                  # tail truncated under the checkpoint
+    assert ledger.head(path).count == 4 and ledger.head(path).head == ledger.verify_ledger(path).head
+
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write('{"torn":')                             # a half-written line is not part of the head
+    assert ledger.head(path).count == 4
+
+
+def test_concurrent_appenders_never_fork_the_chain() -> None:
+    path = Path(tempfile.mkdtemp()) / "events.jsonl"
+
+    def writer(w: int) -> None:
+        for i in range(15):
+            ledger.append_chained(_event(w * 100 + i), ledger_path=path)
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    vr = ledger.verify_ledger(path)
+    assert vr.ok and vr.records == 90 and ledger.head(path).head == vr.head
+
+
+def test_a_batch_is_chained_and_committed_with_one_fsync() -> None:
+    path = _ledger(3)
+    fsyncs = []
+    real_fsync = os.fsync
+
+    def counting(fd):
+        if os.path.realpath(f"/proc/self/fd/{fd}") == str(path.resolve()):
+            fsyncs.append(fd)
+        return real_fsync(fd)
+
+    os.fsync = counting
+    try:
+        records = ledger.append_batch([_event(n) for n in range(3, 53)], ledger_path=path)
+    finally:
+        os.fsync = real_fsync
+    vr = ledger.verify_ledger(path)
+    assert vr.ok and vr.records == 53 and vr.head == records[-1]["hash"]
+    assert ledger.head(path).count == 53
+    if os.path.isdir("/proc/self/fd"):
+        assert len(fsyncs) == 1
+    assert not path.with_name("events.jsonl.txn").exists()
+
+
+def test_a_bad_record_aborts_the_whole_batch_before_any_write() -> None:
+    path = _ledger(2)
+    before = path.read_bytes()
+
+    def forged(prev: str) -> dict:
+        return {**_event(99)(prev), "n": 100}
+
+    raised = False
+    try:
+        ledger.append_batch([_event(2), forged, _event(4)], ledger_path=path)
+    except ValueError:
+        raised = True
+    assert raised and path.read_bytes() == before
+
+
+def _line(record: dict) -> bytes:
+    return (json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n").encode()
+
+
+def _intent(path: Path, offset: int, batch: bytes) -> None:
+    path.with_name(path.name + ".txn").write_text(json.dumps(
+        {"offset": offset, "length": len(batch), "sha256": hashlib.sha256(batch).hexdigest()}))
+
+
+def test_a_batch_torn_by_a_crash_is_rolled_back_and_a_complete_one_kept() -> None:
+    path = _ledger(4)
+    txn = path.with_name("events.jsonl.txn")
+
+    # crash mid-write: the intent is durable, only the first record of two reached the file
+    good = ledger.head(path)
+    first = _line(_event(4)(good.head))
+    _intent(path, good.offset, first + _line(_event(5)(json.loads(first)["hash"])))
+    with path.open("ab") as fh:
+        fh.write(first)
+    assert ledger.head(path) == good                     # readers never see an uncommitted batch
+    ledger.append_chained(_event(6), ledger_path=path)   # the next writer rolls it back first
+    assert not txn.exists() and ledger.verify_ledger(path).records == 5
+
+    # crash after the fsync but before the intent was removed: the batch stays
+    h = ledger.head(path)
+    batch = _line(_event(7)(h.head))
+    _intent(path, h.offset, batch)
+    with path.open("ab") as fh:
+        fh.write(batch)
+    ledger.append_chained(_event(8), ledger_path=path)
+    assert not txn.exists() and ledger.verify_ledger(path).records == 7
+
+
+def _rotated(n: int) -> Path:
+    path = Path(tempfile.mkdtemp()) / "events.jsonl"
+    for i in range(n):
+        ledger.append_chained(_event(i), ledger_path=path, segment_bytes=1500)
+    return path
+
+
+def test_segments_chain_across_rotation_and_verify_in_parallel() -> None:
+    path = _rotated(60)
+    ledger.append_batch([_event(n) for n in range(60, 90)], ledger_path=path, segment_bytes=1500)
+    segments = sorted(path.with_name("events.jsonl.segments").glob("*.jsonl"))
+    assert len(segments) >= 3
+    first = json.loads(segments[1].read_text().splitlines()[0])
+    last_of_prev = json.loads(segments[0].read_text().splitlines()[-1])
+    assert first["prev_hash"] == last_of_prev["hash"]
+    serial, parallel = ledger.verify_ledger(path), ledger.verify_ledger(path, workers=3)
+    assert serial.ok and serial == parallel and serial.records == 90
+    assert ledger.head(path).head == serial.head and ledger.head(path).count == 90
+    assert [r["n"] for r in ledger.read_all(path)] == list(range(90))
+
+
+def test_random_access_matches_a_full_read() -> None:
+    path = _rotated(70)
+    records = ledger.read_all(path)
+    assert all(ledger.get(i, ledger_path=path) == records[i] for i in (0, 1, 25, 44, 69))
+    for i in (0, 33, 69):
+        assert ledger.get_by_hash(records[i]["hash"], ledger_path=path) == (i, records[i])
+    assert ledger.get_by_hash("sha256:" + "0" * 64, ledger_path=path) is None
+    assert ledger.tail(7, ledger_path=path) == records[-7:]
+    assert list(ledger.iter_range(12, 40, ledger_path=path)) == records[12:40]
+    raised = False
+    try:
+        ledger.get(70, ledger_path=path)
+    except IndexError:
+        raised = True
+    assert raised
+
+    path.with_name("events.jsonl.idx").write_bytes(b"\x00" * 80)   # stale active index
+    assert ledger.tail(3, ledger_path=path) == records[-3:]
+    ledger.append_chained(_event(70), ledger_path=path)             # the appender rebuilds it
+    assert ledger.get(70, ledger_path=path)["n"] == 70
+
+
+def test_random_access_on_a_ledger_with_no_sidecars() -> None:
+    path = Path(tempfile.mkdtemp()) / "events.jsonl"
+    prev, records = ledger.GENESIS, []
+    for i in range(12):                                  # written by hand: no .idx / .head / .lock
+        records.append(_event(i)(prev))
+        prev = records[-1]["hash"]
+    path.write_text("".join(json.dumps(r, sort_keys=True, separators=(",", ":")) + "\n"
+                            for r in records))
+    assert ledger.get_by_hash(records[7]["hash"], ledger_path=path) == (7, records[7])
+    assert ledger.get_by_hash("sha256:" + "0" * 64, ledger_path=path) is None
+    assert ledger.get(11, ledger_path=path) == records[11]
+    assert ledger.tail(2, ledger_path=path) == records[-2:]
+    assert sorted(p.name for p in path.parent.iterdir()) == ["events.jsonl"]   # readers write nothing
+
+
+def test_appends_rotate_at_the_default_threshold() -> None:
+    assert ledger.SEGMENT_BYTES > 0                      # rotation is on unless a caller opts out
+    saved, ledger.SEGMENT_BYTES = ledger.SEGMENT_BYTES, 1500
+    try:
+        path = Path(tempfile.mkdtemp()) / "events.jsonl"
+        for i in range(30):
+            ledger.append_chained(_event(i), ledger_path=path)       # no segment_bytes= passed
+    finally:
+        ledger.SEGMENT_BYTES = saved
+    assert sorted(path.with_name("events.jsonl.segments").glob("*.jsonl"))
+    assert path.stat().st_size < 1500 + 200 and ledger.verify_ledger(path).records == 30
+
+
+def test_tampered_or_missing_segments_fail_verification() -> None:
+    path = _rotated(50)
+    segments = sorted(path.with_name("events.jsonl.segments").glob("*.jsonl"))
+    lines = segments[1].read_text().splitlines(keepends=True)
+    first_seq = int(segments[1].stem)
+    edited = json.loads(lines[2])
+    edited["n"] = 999
+    lines[2] = json.dumps(edited, sort_keys=True, separators=(",", ":")) + "\n"
+    original = segments[1].read_text()
+    segments[1].write_text("".join(lines))
+    for workers in (1, 4):
+        vr = ledger.verify_ledger(path, workers=workers)
+        assert not vr.ok and vr.broken_index == first_seq + 2
+    raised = False
+    try:
+        ledger.get(first_seq + 2, ledger_path=path)
+    except ledger.LedgerTamperError:
+        raised = True
+    assert raised
+
+    segments[1].write_text(original)
+    assert ledger.verify_ledger(path).ok
+    segments[1].unlink()                                  # a whole segment dropped
+    assert not ledger.verify_ledger(path, workers=2).ok
+
+
+def _main() -> int:
+    fns = [v for k, v in sorted(globals().items()) if k.startswith("test_") and callable(v)]
+    for fn in fns:
+        fn()
+    print(f"ledger: {len(fns)}/{len(fns)} tests pass")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_main())
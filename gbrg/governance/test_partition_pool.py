@@ -0,0 +1,39 @@
+"""The shared partitioned process-pool map returns exactly what the serial call returns."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from gbrg.governance import partition_pool  # noqa: E402
+
+
+def _tag(state, part):
+    return [(state, x) for x in part]
+
+
+def _offset(base):
+    return base + 1000
+
+
+def test_partitions_are_contiguous_and_cover_the_input():
+    items = list(range(37))
+    parts = partition_pool.partitions(items, 3)
+    assert [x for p in parts for x in p] == items
+    assert len(parts) <= 3 * partition_pool.PARTITIONS_PER_WORKER and all(parts)
+    assert partition_pool.partitions([], 4) == [] and partition_pool.partitions([1], 4) == [[1]]
+
+
+def test_pool_map_matches_the_serial_call_with_shipped_or_built_state():
+    items = list(range(50))
+    serial = _tag("ctx", items)
+    with partition_pool.state_pool(2, "ctx") as pool:
+        assert partition_pool.map_partitioned(_tag, items, "ctx", pool, 2) == serial
+        assert partition_pool.submit(pool, _tag, [7]).result() == [("ctx", 7)]
+    with partition_pool.state_pool(2, factory=_offset, args=(5,)) as pool:
+        assert partition_pool.map_partitioned(_tag, items, None, pool, 2) == _tag(1005, items)
+    assert partition_pool.map_partitioned(_tag, items, "ctx", None, 2) == serial
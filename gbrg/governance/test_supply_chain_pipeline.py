@@ -232,7 +232,21 @@ def test_estate_seals_and_whole_ledger_verifies() -> None:
 
     with tempfile.TemporaryDirectory() as td:
         lp = Path(td) / "scr-ledger.jsonl"
-        result = pipe.assess_estate(_bundle(), ledger_path=lp, persist=True)
+        commits: list[int] = []
+        real_batch, real_chained = ledger.append_batch, ledger.append_chained
+
+        def one_commit(builds, **kw):
+            commits.append(len(builds))
+            return real_batch(builds, **kw)
+
+        def per_record(*_a, **_kw):
+            raise AssertionError("estate sealed record-by-record, not as one batch")
+
+        ledger.append_batch, ledger.append_chained = one_commit, per_record
+        try:
+            result = pipe.assess_estate(_bundle(), ledger_path=lp, persist=True)
+        finally:
+            ledger.append_batch, ledger.append_chained = real_batch, real_chained
         n_sealed = (
             len(result["nodes"]) + len(result["paths"])
             + len(result["clusters"]) + 1  # + estate-level cluster
@@ -240,10 +254,36 @@ def test_estate_seals_and_whole_ledger_verifies() -> None:
         vr = ledger.verify_ledger(lp)
         assert vr.ok, f"live-pipeline ledger failed to verify: {vr.reason}"
         assert len(ledger.read_all(lp)) == n_sealed
+        assert commits == [n_sealed]  # the whole estate is ONE durable commit
         # every sealed assessment carries its chained receipt hash.
         assert all(a.receipt for a in result["nodes"])
 
 
+def test_process_pool_scoring_writes_the_same_ledger_bytes_as_serial() -> None:
+    import itertools
+    import tempfile
+    import types
+
+    bundle = _bundle()
+    # proofIds (uuid4) and the seal timestamp are the only non-determinism; pin them.
+    real_uuid, real_now = scr.uuid, scr._now
+    ledgers = []
+    try:
+        with tempfile.TemporaryDirectory() as td:
+            for workers in (1, 3):
+                counter = itertools.count()
+                scr.uuid = types.SimpleNamespace(
+                    uuid4=lambda: types.SimpleNamespace(hex=f"{next(counter):032x}"))
+                scr._now = lambda: "2026-01-01T00:00:00Z"
+                lp = Path(td) / f"w{workers}.jsonl"
+                result = pipe.assess_estate(bundle, ledger_path=lp, persist=True, workers=workers)
+                assert set(result["timings"]) == {"nodes", "paths", "clusters", "seal"}
+                ledgers.append(lp.read_bytes())
+    finally:
+        scr.uuid, scr._now = real_uuid, real_now
+    assert ledgers[0] and ledgers[0] == ledgers[1]
+
+
 # --------------------------------------------------------------------------- #
 # (8) Estate summary rolls verdicts/ratings up (reporting only, no decision).
 # --------------------------------------------------------------------------- #
@@ -18,6 +18,8 @@ asserts the four teeth from the work order:
 
 Plus receipt-spine reuse: every assessment is a hash-chained ledger event that
 gbrg.governance.ledger.verify_ledger walks; a single tampered field breaks it.
+A dry run (``persist=False``) writes nothing, and the batch and per-record
+sealers both chain onto a gate decision in a shared ledger.
 
 Runs under pytest OR as `python3 test_supply_chain_risk.py`.
 """
@@ -34,7 +36,7 @@ _REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
-from gbrg.governance import ledger, supply_chain_risk as scr  # noqa: E402
+from gbrg.governance import gate, ledger, supply_chain_risk as scr  # noqa: E402
 
 
 def _evidenced_controls() -> list[dict]:
@@ -227,6 +229,52 @@ def test_supply_chain_risk_has_teeth() -> None:
     assert checks, "no checks ran"
 
 
+def _node(subject: str, ledger_path: Path, **kw) -> scr.Assessment:
+    return scr.assess_node(
+        subject_id=subject,
+        factors={"criticality_K": 0.9, "privilege_P": 0.9, "execution_E": 0.9,
+                 "opacity_O": 0.5, "concentration_C": 0.7, "velocity_V": 0.7},
+        controls_evidence=_evidenced_controls(), kri_metrics={"KRI01": 98},
+        crosswalk_refs=["B001"], weights=scr.load_weights(), crosswalk=scr.load_crosswalk(),
+        ledger_path=ledger_path, **kw,
+    )
+
+
+def test_dry_runs_write_nothing_beside_the_ledger() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_path = Path(tmp) / "scr.jsonl"
+        _node("N003:sealed", ledger_path)
+        ledger_path.with_name("scr.jsonl.head").unlink(missing_ok=True)
+        before = {p.name: p.read_bytes() for p in Path(tmp).iterdir()}
+        dry = _node("N003:dry", ledger_path, persist=False)
+        batch = scr.seal_batch([_node("N003:a", ledger_path, seal=False),
+                                _node("N003:b", ledger_path, seal=False)],
+                               ledger_path=ledger_path, persist=False)
+        assert {p.name: p.read_bytes() for p in Path(tmp).iterdir()} == before
+        head = ledger.head(ledger_path).head
+        assert json.loads(ledger_path.read_text().splitlines()[-1])["hash"] == head
+        assert dry.receipt and batch[0].receipt and batch[1].receipt
+
+
+def test_batch_and_per_record_sealing_chain_onto_a_decision() -> None:
+    decision = gate.Decision(
+        recordType="GbrgContextDecision", schemaVersion="v0", agentRef="agent://test",
+        action="include", cell_id="code://x#y", epistemicLevel="empirical", proof_id="p",
+        verdict="INCLUDE", included=True, reason="r", priority="high", content_verdict="ok",
+        authority_verdict="allow", authority_reason_code="authority_active",
+        decided_at="2026-01-01T00:00:00Z",
+    ).seal()
+    for seal in (lambda path: _node("N003:one", path),
+                 lambda path: scr.seal_batch([_node("N003:many", path, seal=False)], ledger_path=path)[0]):
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger_path = Path(tmp) / "mixed.jsonl"
+            ledger.append(decision.to_dict(), ledger_path=ledger_path)   # last record: a gate receipt
+            seal(ledger_path)
+            event = json.loads(ledger_path.read_text().splitlines()[-1])
+            assert event["prev_hash"] == decision.receipt
+            assert ledger.verify_ledger(ledger_path).ok
+
+
 def _main() -> int:
     with tempfile.TemporaryDirectory() as tmp:
         ledger_path = Path(tmp) / "scr.jsonl"
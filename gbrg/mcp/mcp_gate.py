@@ -209,17 +209,15 @@ def _tool_target(name: str, registry_path: Path) -> dict[str, Any]:
 def _prev_hash(ledger_path: Path) -> str:
     """Next event's ``prev_hash`` = the current chain head (GENESIS if empty).
 
-    Reads through the VERIFIED path so we refuse to extend a tampered chain
-    (:class:`ledger.LedgerTamperError` propagates). L7: tolerate a mixed file by
-    reading the last record's chained ``hash`` OR (single-writer invariant aside)
-    its ``receipt``, instead of the old ``records[-1]["hash"]`` that KeyErrored on
-    a governance-decision record.
+    Reads through :func:`ledger.head`, which verifies every record past the
+    head checkpoint, so we refuse to extend a tampered tail
+    (:class:`ledger.LedgerTamperError` propagates). L7: the ledger is a mixed
+    file, so the head is the last record's chained ``hash`` OR, when a gate
+    decision was appended last, its ``receipt``; ``verify_ledger`` accepts
+    either link. :func:`emit_event` takes the head under the append lock
+    instead (:func:`ledger.append_chained`).
     """
-    records = ledger.read_all(ledger_path)
-    if not records:
-        return GENESIS
-    last = records[-1]
-    return last.get("hash") or last["receipt"]
+    return ledger.head(ledger_path).head or GENESIS
 
 
 def emit_event(
@@ -237,38 +235,40 @@ def emit_event(
     event_id = "evt_" + uuid.uuid4().hex[:16]
     payload_hash = _sha(payload)
     policy_hash = _policy_hash(registry_path)
-    prev_hash = _prev_hash(ledger_path)
     actor = {"spiffe_id": SPIFFE_ID}
     target = _tool_target(tool, registry_path)
     decision = {"allow": allow, "reason": reason}
 
-    core = {
-        "event_id": event_id,
-        "ts": ts,
-        "type": event_type,
-        "actor": actor,
-        "target": target,
-        "payload_hash": payload_hash,
-        "policy_hash": policy_hash,
-        "prev_hash": prev_hash,
-        "decision": decision,
-    }
-    event_hash = _sha(core)
-
-    event = {
-        "event_id": event_id,
-        "ts": ts,
-        "type": event_type,
-        "actor": actor,
-        "target": target,
-        "payload_hash": payload_hash,
-        "policy_hash": policy_hash,
-        "prev_hash": prev_hash,
-        "hash": event_hash,
-        "decision": decision,
-    }
-    # DURABLE append-only sink — the gate foundation's ledger mechanism.
-    ledger.append(event, ledger_path=ledger_path)
+    def build(prev_hash: str) -> dict[str, Any]:
+        core = {
+            "event_id": event_id,
+            "ts": ts,
+            "type": event_type,
+            "actor": actor,
+            "target": target,
+            "payload_hash": payload_hash,
+            "policy_hash": policy_hash,
+            "prev_hash": prev_hash,
+            "decision": decision,
+        }
+        event_hash = _sha(core)
+
+        return {
+            "event_id": event_id,
+            "ts": ts,
+            "type": event_type,
+            "actor": actor,
+            "target": target,
+            "payload_hash": payload_hash,
+            "policy_hash": policy_hash,
+            "prev_hash": prev_hash,
+            "hash": event_hash,
+            "decision": decision,
+        }
+
+    # DURABLE append-only sink — the gate foundation's ledger mechanism. The head
+    # lookup and the write happen under one lock, so concurrent calls never fork.
+    event = ledger.append_chained(build, ledger_path=ledger_path)
     return event
 
 
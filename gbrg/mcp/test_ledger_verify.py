@@ -14,6 +14,8 @@ TAMPERS it three ways and asserts :func:`ledger.verify_ledger` DETECTS each:
 
 Plus the happy path: an untampered chain verifies ok with head == anchor, and the
 verified read path (:func:`ledger.read_all`) raises ``LedgerTamperError`` on tamper.
+And the mixed file: MCP events written after a gate decision chain onto its
+receipt and verify, while deleting that decision still breaks the link.
 
 Runs under pytest OR as a plain script (``python3 test_ledger_verify.py``).
 """
@@ -34,7 +36,7 @@ if str(_MCP_DIR) not in sys.path:
     sys.path.insert(0, str(_MCP_DIR))
 
 import mcp_gate  # noqa: E402
-from gbrg.governance import ledger  # noqa: E402
+from gbrg.governance import gate, ledger  # noqa: E402
 
 
 # --------------------------------------------------------------------------- #
@@ -182,6 +184,42 @@ def test_ledger_tamper_is_detected() -> None:
     assert checks, "no checks ran"
 
 
+def test_events_after_a_gate_decision_chain_onto_its_receipt() -> None:
+    decision = gate.Decision(
+        recordType="GbrgContextDecision", schemaVersion="v0", agentRef="agent://test",
+        action="include", cell_id="code://x#y", epistemicLevel="empirical", proof_id="p",
+        verdict="INCLUDE", included=True, reason="r", priority="high", content_verdict="ok",
+        authority_verdict="allow", authority_reason_code="authority_active",
+        decided_at="2026-01-01T00:00:00Z",
+    ).seal()
+    with tempfile.TemporaryDirectory() as td:
+        tmp = Path(td)
+        registry_path = tmp / "capability_registry.json"
+        registry_path.write_text(json.dumps(mcp_gate.build_registry(), indent=2, sort_keys=True), "utf-8")
+        ledger_path = tmp / "mixed.jsonl"
+        mcp_gate.emit_event(event_type="MCP_CALL", tool="graph_status", payload={"tool": "graph_status"},
+                            allow=True, reason="authorize verdict=allow (ok)",
+                            ledger_path=ledger_path, registry_path=registry_path)
+        ledger.append(decision.to_dict(), ledger_path=ledger_path)
+        for tool in ("impact_query", "graph_status"):
+            mcp_gate.emit_event(event_type="MCP_CALL", tool=tool, payload={"tool": tool},
+                                allow=True, reason="authorize verdict=allow (ok)",
+                                ledger_path=ledger_path, registry_path=registry_path)
+
+        records = ledger._read_raw(ledger_path)
+        assert [("receipt" in r) for r in records] == [False, True, False, False]
+        assert records[2]["prev_hash"] == decision.receipt
+        assert records[3]["prev_hash"] == records[2]["hash"]
+        result = ledger.verify_ledger(ledger_path)
+        assert result.ok, result.reason
+        assert result.head == records[3]["hash"]
+
+        del records[1]  # drop the decision: the next event's link now dangles
+        _write_lines(ledger_path, records)
+        broken = ledger.verify_ledger(ledger_path)
+        assert broken.ok is False and "broken chain link" in (broken.reason or "")
+
+
 def _main() -> int:
     checks = run_checks()
     for c in checks:
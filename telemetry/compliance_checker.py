@@ -10,8 +10,8 @@ Exit codes:
   2 — usage error
 
 Usage:
-  python telemetry/compliance_checker.py check [--repo <name>] [--layer <layer>] [--format json]
-  python telemetry/compliance_checker.py summary [--format json]
+  python telemetry/compliance_checker.py check [--repo <name>] [--layer <layer>] [--format json] [--cache PATH]
+  python telemetry/compliance_checker.py summary [--format json] [--cache PATH]
 
 Stdlib + PyYAML only.
 """
@@ -33,6 +33,10 @@ except ImportError:
 REPO_ROOT = Path(__file__).resolve().parents[1]
 REGISTRY_DIR = REPO_ROOT / "registry"
 TELEMETRY_DIR = REPO_ROOT / "telemetry"
+if str(REPO_ROOT) not in sys.path:  # run as `python3 telemetry/compliance_checker.py`
+    sys.path.insert(0, str(REPO_ROOT))
+
+from automation.scan_engine import Rule, ScanEngine  # noqa: E402
 
 
 def _load(path: Path) -> Any:
@@ -90,7 +94,9 @@ class RepoResult:
 class ComplianceChecker:
     """Runs compliance checks against locally materialised repos."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache_path: Path | None = None) -> None:
+        self._cache_path = cache_path
+        self._prohibited_engine: ScanEngine | None = None
         self._repos = _load(REGISTRY_DIR / "canonical-repos.yaml").get("repos", [])
         self._policy = _load(TELEMETRY_DIR / "compliance-policy.yaml")
         self._global_reqs = self._policy.get("global", {}).get("requirements", [])
@@ -151,35 +157,26 @@ class ComplianceChecker:
         if not req:
             return
 
-        patterns = [re.compile(p) for p in req.get("patterns", [])]
-        excludes = req.get("excludes", [])
-
-        def should_exclude(p: Path) -> bool:
-            for exc in excludes:
-                if exc.startswith("*") and p.name.endswith(exc[1:]):
-                    return True
-                if exc.endswith("*") and p.name.startswith(exc[:-1]):
-                    return True
-                if "test" in p.name.lower() or "spec" in p.name.lower():
-                    return True
-            return False
-
-        for src_file in path.rglob("*.py"):
-            if should_exclude(src_file):
-                continue
-            try:
-                content = src_file.read_text("utf-8", errors="ignore")
-                for pattern in patterns:
-                    if pattern.search(content):
-                        result.violations.append(Violation(
-                            repo=repo["name"], req_id="REQ-G04",
-                            name="no_prohibited_algorithms",
-                            severity="error",
-                            detail=f"Prohibited algorithm pattern '{pattern.pattern}' found in {src_file.relative_to(path)}"
-                        ))
-                        break
-            except Exception:
-                continue
+        if self._prohibited_engine is None:
+            excludes = tuple(req.get("excludes", []))
+            if excludes:
+                excludes += ("*test*", "*spec*")
+            self._prohibited_engine = ScanEngine(
+                (Rule("REQ-G04", p, re.compile(p), "error", include=("*.py",), exclude=excludes, per_line=False)
+                 for p in req.get("patterns", [])),
+                encoding_errors="ignore",
+            )
+
+        hits = self._prohibited_engine.scan(
+            path, path.rglob("*.py"), scope="compliance-REQ-G04", cache_path=self._cache_path,
+        )
+        for hit in hits.get("REQ-G04", []):
+            result.violations.append(Violation(
+                repo=repo["name"], req_id="REQ-G04",
+                name="no_prohibited_algorithms",
+                severity=hit.rule.severity,
+                detail=f"Prohibited algorithm pattern '{hit.rule.pattern.pattern}' found in {hit.path.relative_to(path)}"
+            ))
 
     def _check_has_readme(self, repo: dict, path: Path | None, result: RepoResult) -> None:
         """REQ-G03: must have a README.md."""
@@ -315,8 +312,12 @@ def main() -> int:
     sp2 = sub.add_parser("summary", help="Print compliance summary")
     sp2.add_argument("--format", choices=["text", "json"], default="text")
 
+    for parser in (sp, sp2):
+        parser.add_argument("--cache", type=Path, default=None,
+                            help="SQLite scan cache; files whose git blob is unchanged are not rescanned")
+
     args = p.parse_args()
-    checker = ComplianceChecker()
+    checker = ComplianceChecker(cache_path=args.cache)
 
     if args.cmd in ("check", "summary"):
         fmt = getattr(args, "format", "text")
@@ -1,10 +1,13 @@
 """Tests for the durable cross-process event queue."""
 
 import queue
+import sqlite3
+import threading
+from pathlib import Path
 
 import pytest
 
-from automation.durable_queue import DurableQueue
+from automation.durable_queue import DurableQueue, SqliteQueue, open_queue
 
 
 def test_put_get_is_fifo(tmp_path):
@@ -43,3 +46,126 @@ def test_half_written_temp_files_are_invisible(tmp_path):
     q = DurableQueue(tmp_path)
     (tmp_path / ".tmp-partial.json").write_text("{ half", encoding="utf-8")
     assert q.empty() and q.qsize() == 0  # atomic-write temp is never consumed
+
+
+@pytest.fixture(params=["files", "sqlite"])
+def backend(request):
+    return request.param
+
+
+def test_batch_put_get_preserves_order(tmp_path, backend):
+    q = open_queue(tmp_path, backend)
+    q.put_many([{"n": i} for i in range(10)])
+    assert q.qsize() == 10
+    assert [e["n"] for e in q.get_many(4)] == [0, 1, 2, 3]
+    assert [e["n"] for e in q.peek_all()] == [4, 5, 6, 7, 8, 9]  # non-destructive
+    assert [e["n"] for e in q.get_many()] == [4, 5, 6, 7, 8, 9]
+    assert q.empty() and q.get_many() == []
+
+
+def test_concurrent_consumers_claim_each_entry_once(tmp_path, backend):
+    open_queue(tmp_path, backend).put_many([{"n": i} for i in range(400)])
+    seen: list = []
+    lock = threading.Lock()
+
+    def consume():
+        q = open_queue(tmp_path, backend)  # one instance per consumer, as across processes
+        while True:
+            got = q.get_many(7)
+            if not got:
+                return
+            with lock:
+                seen.extend(e["n"] for e in got)
+
+    workers = [threading.Thread(target=consume) for _ in range(4)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert sorted(seen) == list(range(400))
+
+
+def test_sqlite_cursor_persists_and_compaction_drops_claimed_rows(tmp_path):
+    q = SqliteQueue(tmp_path, compact_every=1_000_000)
+    q.put_many([{"n": i} for i in range(5)])
+    assert q.get_nowait() == {"n": 0}
+    q.close()
+
+    reopened = SqliteQueue(tmp_path)
+    assert reopened.qsize() == 4
+    assert reopened.compact() == 1
+    assert [e["n"] for e in reopened.get_many()] == [1, 2, 3, 4]
+    with pytest.raises(queue.Empty):
+        reopened.get_nowait()
+
+
+def test_sqlite_adopts_entries_left_by_file_backend(tmp_path):
+    DurableQueue(tmp_path).put_many([{"n": 1}, {"n": 2}])
+    q = SqliteQueue(tmp_path)
+    assert [e["n"] for e in q.get_many()] == [1, 2]
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_sqlite_adoption_loses_and_duplicates_nothing_on_failure(tmp_path, monkeypatch):
+    DurableQueue(tmp_path).put_many([{"n": 1}, {"n": 2}])
+
+    # The insert fails: the files must still be there for the next open.
+    real_connect = sqlite3.connect
+
+    class FailingInsert:
+        def __init__(self, db):
+            self._db = db
+
+        def executemany(self, sql, rows):
+            if sql.startswith("INSERT INTO entries"):
+                raise sqlite3.OperationalError("disk I/O error")
+            return self._db.executemany(sql, rows)
+
+        def __getattr__(self, name):
+            return getattr(self._db, name)
+
+    monkeypatch.setattr(sqlite3, "connect", lambda *a, **k: FailingInsert(real_connect(*a, **k)))
+    with pytest.raises(sqlite3.OperationalError):
+        SqliteQueue(tmp_path)
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    monkeypatch.undo()
+
+    # Committed but the process died before unlinking: reopening must not insert again.
+    def fail(self, *args, **kwargs):
+        raise OSError("killed before unlink")
+
+    unlink = Path.unlink
+    monkeypatch.setattr(Path, "unlink", fail)
+    with pytest.raises(OSError):
+        SqliteQueue(tmp_path).close()
+    monkeypatch.setattr(Path, "unlink", unlink)
+    with SqliteQueue(tmp_path) as q:
+        assert [e["n"] for e in q.get_many()] == [1, 2]
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_sqlite_forgets_adopted_names_once_their_files_are_gone(tmp_path):
+    def adopted(q):
+        return [name for (name,) in q._db.execute("SELECT name FROM adopted")]
+
+    DurableQueue(tmp_path).put_many([{"n": 1}, {"n": 2}])
+    with SqliteQueue(tmp_path) as q:
+        assert len(adopted(q)) == 2
+        assert q.compact() == 0
+        assert adopted(q) == []
+
+    DurableQueue(tmp_path).put({"n": 3})
+    with SqliteQueue(tmp_path):
+        pass
+    with SqliteQueue(tmp_path) as q:  # the next open drops the spent name
+        assert adopted(q) == []
+        assert [e["n"] for e in q.get_many()] == [1, 2, 3]
+
+
+def test_open_queue_backend_from_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOCIOSPHERE_QUEUE_BACKEND", "sqlite")
+    assert isinstance(open_queue(tmp_path), SqliteQueue)
+    monkeypatch.delenv("SOCIOSPHERE_QUEUE_BACKEND")
+    assert isinstance(open_queue(tmp_path), DurableQueue)
+    with pytest.raises(ValueError):
+        open_queue(tmp_path, "redis")
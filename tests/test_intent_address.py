@@ -0,0 +1,115 @@
+"""Intent routing through the compiled table answers exactly what the per-call route did.
+
+`route` used to rebuild both tiers and re-run `bind_tiered` on every query. It now looks
+the lexicon up in a cache of compiled `RoutingTable`s; these pin that the answers are
+unchanged, that an edited lexicon recompiles (and an equal one does not), that the cache
+keeps no term alive, and that one table serves concurrent callers.
+"""
+
+import gc
+import threading
+import weakref
+
+import pytest
+
+from procyber.semantic import BOTTOM, SemanticAddress, add, bind_tiered, mul, prim
+from procyber.semantic import intent_address as ia
+from procyber.semantic.semantic_algebra import ACT, NIL, PRIMITIVES, TRD
+
+
+def _per_call_route(column, addresses):
+    """The pre-compilation route, verbatim."""
+    topic_terms = [a.term for n, a in addresses.items()
+                   if n != ia.META_ROW and a.term is not BOTTOM and a.term.layer == 2]
+    if not topic_terms:
+        return BOTTOM
+    upper = add(*[ia.column_anchor(c) for c in ia.COLUMNS])
+    return bind_tiered(ia.column_anchor(column), upper, add(*topic_terms))
+
+
+def _lexicon(n):
+    cols = [c for c in ia.COLUMNS if c != "sense"]  # keep the thin column empty
+    diffs = [mul(prim(a), prim(b), prim(c)) for a in PRIMITIVES for b in PRIMITIVES for c in PRIMITIVES]
+    return {f"i{k}": SemanticAddress(term=mul(ia.column_anchor(cols[k % len(cols)]), diffs[k % len(diffs)]))
+            for k in range(n)}
+
+
+def test_compiled_routes_match_the_per_call_route():
+    for addresses in (ia.build_intent_addresses(), _lexicon(500), {}):
+        for column in ia.COLUMNS:
+            assert ia.route(column, addresses) is _per_call_route(column, addresses)
+    no_sense = {n: a for n, a in ia.build_intent_addresses().items() if n != "file_ingest"}
+    assert ia.route("sense", no_sense) is BOTTOM
+    with pytest.raises(ValueError, match="valid columns"):
+        ia.route("teleport", ia.build_intent_addresses())
+    assert ia.route("teleport", {"x": SemanticAddress(term=BOTTOM)}) is BOTTOM  # nothing to route
+
+
+def test_tables_are_reused_until_the_lexicon_content_changes(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ia, "bind_tiered", lambda *a: calls.append(a) or bind_tiered(*a))
+    addresses = _lexicon(300)
+    table = ia.compile_routes(addresses)
+    assert len(calls) == len(ia.COLUMNS)
+    for same in (dict(reversed(list(addresses.items()))), _lexicon(300)):  # equal content
+        again = ia.compile_routes(same)
+        assert again.content_hash == table.content_hash
+        assert all(again.route(c) is table.route(c) for c in ia.COLUMNS)
+    assert len(calls) == len(ia.COLUMNS)  # served from the cache, not recompiled
+    edited = dict(addresses, extra=SemanticAddress(term=mul(ia.column_anchor("sense"), mul(prim(NIL), prim(ACT)))))
+    recompiled = ia.compile_routes(edited)
+    assert recompiled.content_hash != table.content_hash
+    assert recompiled.route("sense") is _per_call_route("sense", edited) is not BOTTOM
+    assert table.route("sense") is BOTTOM
+    assert ia.compile_routes({ia.META_ROW: SemanticAddress(term=mul(prim(TRD), prim(TRD)))}) is None
+
+
+def test_a_lexicon_finds_its_table_by_identity_and_edit_count():
+    lexicon = ia.Lexicon(_lexicon(300))
+    table = ia.compile_routes(lexicon)
+    assert ia.compile_routes(lexicon) is table and isinstance(ia.build_intent_addresses(), ia.Lexicon)
+    lexicon["extra"] = SemanticAddress(term=mul(ia.column_anchor("sense"), mul(prim(NIL), prim(ACT))))
+    assert ia.route("sense", lexicon) is _per_call_route("sense", lexicon) is not BOTTOM
+    for edit in (lambda: lexicon.pop("extra"), lambda: lexicon.update(i0=lexicon["i1"]), lexicon.clear):
+        before = lexicon.version
+        edit()
+        assert lexicon.version > before
+        assert all(ia.route(c, lexicon) is _per_call_route(c, lexicon) for c in ia.COLUMNS)
+
+
+def test_cached_tables_do_not_keep_terms_alive():
+    def lexicon():  # topic terms no other test builds
+        mode = mul(prim(NIL), prim(NIL), prim(NIL))
+        return {f"u{k}": SemanticAddress(term=mul(ia.column_anchor(c), mul(prim(ACT), prim(PRIMITIVES[k])), mode))
+                for k, c in enumerate(ia.COLUMNS)}
+
+    plain = lexicon()
+    ids = {a.term.id for a in plain.values()}
+    probe = weakref.ref(plain["u0"].term)
+    ia.route("sense", plain)
+    ia.route("sense", ia.Lexicon(plain))
+    del plain
+    gc.collect()
+    assert probe() is None
+    rebuilt = lexicon()
+    assert not ids & {a.term.id for a in rebuilt.values()}  # ids retired, so no stale hit
+    assert all(ia.route(c, rebuilt) is _per_call_route(c, rebuilt) for c in ia.COLUMNS)
+
+
+def test_one_table_serves_concurrent_routes():
+    addresses = _lexicon(2000)
+    expected = {c: _per_call_route(c, addresses) for c in ia.COLUMNS}
+    mismatches = []
+
+    def worker():
+        for _ in range(20):
+            for column in ia.COLUMNS:
+                if ia.route(column, addresses) is not expected[column]:
+                    mismatches.append(column)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not mismatches
@@ -1,14 +1,17 @@
 """Tests for the live write/read propagation path — the thing that makes holographic dispersal
 HAPPEN on every leaf: adaptive write, CAP read, Byzantine route-around, fail-closed below quorum."""
+import io
 import os
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from automation.leaf_propagation import (  # noqa: E402
-    IntegrityError, LeafUnavailable, fetch, in_memory_store, propagate,
+    IntegrityError, LeafUnavailable, fetch, fetch_report, fetch_stream, in_memory_store, propagate,
+    propagate_stream,
 )
 from automation.storage_placement import load_placement  # noqa: E402
 from automation.storage_resilience import Placement
@@ -127,6 +130,100 @@ def test_write_defaults_to_runtime_placement():
     assert m.n <= len(NODES) and fetch(m, get=get) == leaf
 
 
+# ── error location: liars are NAMED, not just routed around ───────────────────────────────────
+
+WIDE = Placement(rs_k=4, rs_m=6)  # k=4, n=10 -> up to 3 liars located by Berlekamp–Welch
+
+
+def _corrupt(store, m, x, positions=None):
+    key = (m.fragment_nodes[x][0], f"{m.root}#{x}")
+    data = bytearray(store[key])
+    for p in (range(len(data)) if positions is None else positions):
+        data[p] ^= 0x5A
+    store[key] = bytes(data)
+    return m.fragment_nodes[x][0]
+
+
+def test_clean_read_reconstructs_once_and_reports_no_liars():
+    put, get, _ = in_memory_store()
+    leaf = os.urandom(200)
+    m = propagate(leaf, nodes=NODES, put=put, placement=WIDE)
+    r = fetch_report(m, get=get)
+    assert r.leaf == leaf and r.liars == [] and r.reconstructions == 1
+
+
+def test_decoder_names_every_liar_within_the_radius():
+    put, get, store = in_memory_store()
+    leaf = os.urandom(300)
+    m = propagate(leaf, nodes=NODES, put=put, placement=WIDE)
+    xs = sorted(m.fragment_nodes)
+    # liars inside the first-k subset (the fast path) and outside it, fully and partially corrupt
+    nodes = [_corrupt(store, m, xs[0]), _corrupt(store, m, xs[2], positions=[7, 40]),
+             _corrupt(store, m, xs[6], positions=[1])]
+    r = fetch_report(m, get=get)
+    assert r.leaf == leaf
+    assert r.liars == [xs[0], xs[2], xs[6]] and r.liar_nodes == nodes
+    assert r.reconstructions <= 4                  # liars + 1, never a subset search
+
+
+def test_beyond_the_radius_falls_back_to_the_subset_search():
+    # k=6, n=9: Berlekamp–Welch locates 1 liar; 2 liars still leave 7 >= k clean fragments.
+    put, get, store = in_memory_store()
+    leaf = os.urandom(90)
+    m = propagate(leaf, nodes=NODES, put=put, placement=P)
+    xs = sorted(m.fragment_nodes)
+    _corrupt(store, m, xs[0])
+    _corrupt(store, m, xs[1])
+    r = fetch_report(m, get=get)
+    assert r.leaf == leaf and r.liars == [xs[0], xs[1]]
+
+
+def test_liars_feed_mesh_threat_as_anomalies():
+    from automation.mesh_threat import vantage_from_fetches
+
+    put, get, store = in_memory_store()
+    leaf = os.urandom(120)
+    m = propagate(leaf, nodes=NODES, put=put, placement=WIDE)
+    liar = _corrupt(store, m, sorted(m.fragment_nodes)[1])
+    reads = [fetch_report(m, get=get), fetch_report(m, get=get)]
+    report = vantage_from_fetches("v1", reads, unreachable_fraction=0.0)
+    assert report.anomalies_seen == 1 and reads[0].liar_nodes == [liar]   # one node, seen twice
+
+
+def test_stream_roundtrip_holds_one_stripe_at_a_time():
+    put, get, store = in_memory_store()
+    leaf = os.urandom(50_000)
+    sizes = []
+    m = propagate_stream(io.BytesIO(leaf), nodes=NODES,
+                         put=lambda node, frag, data: sizes.append(len(data)) or put(node, frag, data),
+                         placement=P, stripe_size=6000)
+    assert len(m.stripes) == 9 and m.orig_len == len(leaf) and m.root.startswith("merkle:")
+    assert max(sizes) == 1000                                 # stripe_size / k, never the leaf
+    assert fetch(m.stripe(3), get=get) == leaf[18_000:24_000]  # a stripe is a plain leaf
+    out = io.BytesIO()
+    assert fetch_stream(m, out, get=get) == len(leaf) and out.getvalue() == leaf
+
+
+def test_stream_read_routes_around_liars_and_refuses_a_doctored_stripe_list():
+    put, get, store = in_memory_store()
+    leaf = os.urandom(20_000)
+    m = propagate_stream(io.BytesIO(leaf), nodes=NODES, put=put, placement=P, stripe_size=4096)
+    liar = m.fragment_nodes[1][0]
+    for (node, frag), data in list(store.items()):
+        if node == liar:
+            store[(node, frag)] = bytes(len(data))           # one node lies about every stripe
+    out = io.BytesIO()
+    fetch_stream(m, out, get=get)
+    assert out.getvalue() == leaf
+    swapped = list(m.stripes)
+    swapped[0], swapped[1] = swapped[1], swapped[0]
+    try:
+        fetch_stream(replace(m, stripes=swapped), io.BytesIO(), get=get)
+        raise AssertionError("a reordered stripe list was read")
+    except IntegrityError:
+        pass
+
+
 def _run_all():
     fns = [v for k, v in sorted(globals().items()) if k.startswith("test_") and callable(v)]
     for fn in fns:
@@ -1,5 +1,7 @@
 """Tests for manifest resolution — finding a leaf's manifest by its Merkle root alone, under
 seizure, with no directory. The decisive test reconstructs a leaf knowing ONLY the root."""
+import io
+import json
 import os
 import sys
 from pathlib import Path
@@ -7,9 +9,12 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
-from automation.leaf_propagation import fetch, in_memory_store, propagate  # noqa: E402
+from automation.leaf_propagation import (  # noqa: E402
+    fetch, fetch_stream, in_memory_store, propagate, propagate_stream,
+)
 from automation.manifest_store import (  # noqa: E402
-    ManifestUnavailable, manifest_nodes, publish_manifest, resolve_manifest,
+    ManifestUnavailable, manifest_nodes, publish_manifest, publish_striped_manifest, resolve_manifest,
+    resolve_striped_manifest,
 )
 from automation.storage_resilience import Placement
 
@@ -108,6 +113,29 @@ def test_endtoend_reconstruct_knowing_only_the_root():
     assert leaf_back == leaf and merkle_root(leaf_back) == root
 
 
+def test_striped_manifest_resolves_by_root_and_rejects_doctored_lists():
+    put, get, _ = in_memory_store()
+    pb, gb, blobs = _blob_store()
+    leaf = os.urandom(30_000)
+    m = propagate_stream(io.BytesIO(leaf), nodes=NODES, put=put, placement=P, stripe_size=8192)
+    targets = publish_striped_manifest(m, nodes=NODES, put_blob=pb, replicas=3)
+    doctored = json.loads(blobs[(targets[0], "stripes:" + m.root)])
+    doctored["stripes"] = doctored["stripes"][:-1]
+    blobs[(targets[0], "stripes:" + m.root)] = json.dumps(doctored).encode()
+    got = resolve_striped_manifest(m.root, nodes=NODES, get_blob=gb, replicas=3)
+    assert got == m
+    out = io.BytesIO()
+    fetch_stream(got, out, get=get)
+    assert out.getvalue() == leaf
+    for node in targets[1:]:
+        del blobs[(node, "stripes:" + m.root)]
+    try:
+        resolve_striped_manifest(m.root, nodes=NODES, get_blob=gb, replicas=3)
+        raise AssertionError("a doctored stripe list resolved")
+    except ManifestUnavailable:
+        pass
+
+
 def _run_all():
     fns = [v for k, v in sorted(globals().items()) if k.startswith("test_") and callable(v)]
     for fn in fns:
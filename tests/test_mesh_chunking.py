@@ -0,0 +1,161 @@
+"""Content-defined chunking: stable boundaries, chunk dedup on write, chunked reads and pulls."""
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from automation.holographic_ida import merkle_root  # noqa: E402
+from automation.leaf_propagation import IntegrityError  # noqa: E402
+from automation.mesh_chunking import Chunker  # noqa: E402
+from automation.mesh_fs_store import MeshFsStore  # noqa: E402
+from automation.mesh_namespace import publish_blob, ref_nodes  # noqa: E402
+from automation import mesh_sync  # noqa: E402
+from automation.mesh_sync import get_file, pull_dir_report, push_dir_report, put_file  # noqa: E402
+from automation.storage_resilience import Placement  # noqa: E402
+
+NODES = [f"n{i:02d}" for i in range(27)]
+HOST = Placement(rs_k=6, rs_m=3, shard_replicas=2)
+SMALL = Chunker(min_size=256, avg_size=1024, max_size=4096)
+
+
+def _bytes(n, seed=7):
+    return random.Random(seed).randbytes(n)
+
+
+class CountingStore(MeshFsStore):
+    """MeshFsStore that tallies the distinct leaves whose fragments were written."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.leaves = set()
+
+    def put(self, node, frag, data):
+        self.leaves.add(str(frag).split("#")[0])
+        super().put(node, frag, data)
+
+
+def _mesh():
+    return CountingStore(Path(tempfile.mkdtemp()))
+
+
+def test_chunks_are_bounded_and_cover_the_input():
+    data = _bytes(200_000)
+    chunks = SMALL.split(data)
+    assert b"".join(chunks) == data
+    assert all(256 <= len(c) <= 4096 for c in chunks[:-1]) and 0 < len(chunks[-1]) <= 4096
+    assert 50 < len(chunks) < 400                                        # around avg_size
+    assert SMALL.split(b"") == [b""] and SMALL.split(b"x" * 100) == [b"x" * 100]
+    assert SMALL.split(b"\0" * 10_000)[0] == b"\0" * 4096                # no cut found: max_size
+
+
+def test_an_insertion_only_disturbs_the_chunks_around_it():
+    data = _bytes(200_000)
+    edited = data[:100_000] + b"inserted" + data[100_000:]
+    before, after = set(SMALL.split(data)), SMALL.split(edited)
+    assert sum(c not in before for c in after) <= 2
+    assert Chunker(256, 1024, 4096).boundaries(data) == SMALL.boundaries(data)   # deterministic
+
+
+def test_chunker_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        Chunker(min_size=4096, avg_size=1024, max_size=8192)
+    with pytest.raises(ValueError):
+        Chunker(min_size=256, avg_size=1000, max_size=4096)
+
+
+def test_duplicate_chunks_are_dispersed_once():
+    m = _mesh()
+    data = _bytes(50_000)
+    ref = put_file(m, NODES, "/a.bin", data, writer="laptop", placement=HOST, chunker=SMALL)
+    first = set(m.leaves)
+    assert ref.root == merkle_root(data) and len(first) == len(SMALL.split(data)) > 1
+    put_file(m, NODES, "/copy.bin", data, writer="laptop", placement=HOST, chunker=SMALL)
+    assert m.leaves == first                                             # stored once
+    edited = bytearray(data)
+    edited[25_000] ^= 0xFF
+    put_file(m, NODES, "/a.bin", bytes(edited), writer="laptop", placement=HOST, chunker=SMALL)
+    assert len(m.leaves - first) == 1                                    # only the touched chunk
+    assert get_file(m, NODES, "/a.bin")[0] == bytes(edited)
+    assert get_file(m, NODES, "/copy.bin")[0] == data
+
+
+def test_a_failed_upload_leaves_no_chunk_marked_as_written():
+    m = _mesh()
+    data = _bytes(50_000)
+    real, calls = m.put, []
+
+    def dies_partway(node, frag, blob):
+        calls.append(frag)
+        if len(calls) == 200:
+            raise OSError("node went away")
+        real(node, frag, blob)
+
+    m.put = dies_partway
+    known: set = set()
+    with pytest.raises(OSError):
+        mesh_sync._put_files(m, NODES, [("/a.bin", data)], writer="laptop", placement=HOST, replicas=5,
+                             io=None, chunker=SMALL, known=known)
+    assert known == set()                         # a retry in the same run must re-disperse them
+    mesh_sync._put_files(m, NODES, [("/a.bin", data)], writer="laptop", placement=HOST, replicas=5,
+                         io=None, chunker=SMALL, known=known)
+    assert known == {merkle_root(c) for c in SMALL.split(data)}
+    assert get_file(m, NODES, "/a.bin")[0] == data
+
+
+def test_small_and_unchunked_files_stay_single_leaves():
+    m = _mesh()
+    put_file(m, NODES, "/small", b"tiny", writer="laptop", placement=HOST, chunker=SMALL)
+    put_file(m, NODES, "/whole", _bytes(20_000), writer="laptop", placement=HOST, chunker=None)
+    assert m.leaves == {merkle_root(b"tiny"), merkle_root(_bytes(20_000))}
+    assert get_file(m, NODES, "/whole")[0] == _bytes(20_000)
+
+
+def test_a_lying_chunk_list_is_routed_around_or_refused():
+    m = _mesh()
+    data, other = _bytes(30_000), _bytes(30_000, seed=8)
+    ref = put_file(m, NODES, "/doc", data, writer="laptop", placement=HOST, chunker=SMALL)
+    put_file(m, NODES, "/other", other, writer="laptop", placement=HOST, chunker=SMALL)
+    name = "chunks:" + ref.root
+    lie = json.dumps({"root": ref.root, "size": len(other),
+                      "chunks": [[merkle_root(c), len(c)] for c in SMALL.split(other)]}).encode()
+    targets = ref_nodes(name, NODES, 5)
+    m.put_blob(targets[0], "ns:" + name, lie)                            # one replica lies
+    assert get_file(m, NODES, "/doc")[0] == data
+    publish_blob(name, lie, nodes=NODES, put_blob=m.put_blob, replicas=5)   # every replica lies
+    with pytest.raises(IntegrityError):
+        get_file(m, NODES, "/doc")
+
+
+def test_push_and_pull_move_only_new_chunks():
+    tmp = Path(tempfile.mkdtemp())
+    src, dst = tmp / "src", tmp / "dst"
+    src.mkdir()
+    data = _bytes(60_000)
+    (src / "big.bin").write_bytes(data)
+    (src / "dup.bin").write_bytes(data)
+    m = _mesh()
+
+    def push():
+        return push_dir_report(m, NODES, src, writer="laptop", placement=HOST, state=tmp / "push.json",
+                               chunker=SMALL)
+
+    def pull():
+        return pull_dir_report(m, NODES, dst, state=tmp / "pull.json", chunker=SMALL)
+
+    assert push().bytes_moved == len(data)                               # dup.bin cost nothing
+    r = pull()
+    assert r.added == ["/big.bin", "/dup.bin"] and r.bytes_moved == len(data)
+    assert (dst / "dup.bin").read_bytes() == data
+    edited = data[:30_000] + b"edit" + data[30_000:]
+    (src / "big.bin").write_bytes(edited)
+    r = push()
+    assert r.changed == ["/big.bin"] and 0 < r.bytes_moved <= 2 * 4096
+    r = pull()
+    assert r.changed == ["/big.bin"] and 0 < r.bytes_moved <= 2 * 4096   # the rest came from the old copy
+    assert (dst / "big.bin").read_bytes() == edited
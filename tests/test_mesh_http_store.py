@@ -98,6 +98,112 @@ def test_manifest_resolve_and_reconstruct_over_http_knowing_only_root():
         assert back == leaf and merkle_root(back) == root
 
 
+def test_concurrent_io_over_http_with_a_seized_node():
+    from automation.mesh_io import MeshIO
+
+    with mesh(12) as (store, urls, servers):
+        leaf = b"fan-out over the wire " + os.urandom(256)
+        with MeshIO() as io:
+            m = propagate(leaf, nodes=list(urls), put=store.put,
+                          placement=Placement(rs_k=4, rs_m=2, shard_replicas=2), io=io)
+        seized = m.fragment_nodes[sorted(m.fragment_nodes)[0]][0]
+        servers[seized].shutdown()
+        servers[seized].server_close()
+        with MeshIO() as io:
+            assert fetch(m, get=store.get, io=io) == leaf
+            assert fetch(m, get=store.get, io=io) == leaf
+            assert io.latency.order([seized, m.fragment_nodes[sorted(m.fragment_nodes)[1]][0]])[-1] == seized
+
+
+def test_keep_alive_connection_is_reused_and_dropped_on_seizure():
+    with mesh(1) as (store, urls, servers):
+        for i in range(20):
+            store.put("n00", f"r#{i}", b"x" * i)
+        assert [store.get("n00", f"r#{i}") for i in (3, 19)] == [b"xxx", b"x" * 19]
+        assert len(store._pool("n00")._idle) == 1      # every request rode one connection
+        servers["n00"].shutdown()
+        servers["n00"].server_close()
+        assert store.get("n00", "r#3") is None         # the pooled connection died with the node
+
+
+def test_batch_routes_round_trip_fragments_and_blobs():
+    with mesh(2) as (store, urls, servers):
+        frags = {f"root#{i}": os.urandom(100 + i) for i in range(50)}
+        store.put_many("n00", frags)
+        store.put_blobs("n01", {"manifest:a": b"A", "ref:/x": b"X"})
+        assert store.get_many("n00", list(frags) + ["root#99"]) == {**frags, "root#99": None}
+        assert store.get("n00", "root#7") == frags["root#7"]           # same keys as single PUT
+        assert store.get_blobs("n01", ["manifest:a", "missing"]) == {"manifest:a": b"A", "missing": None}
+        assert store.get_many("nXX", ["root#1"]) == {"root#1": None}   # unknown node: absent
+
+
+def test_batching_defers_fragment_puts_until_flush():
+    with mesh(9) as (store, urls, servers):
+        leaf = os.urandom(1000)
+        with store.batching():
+            m = propagate(leaf, nodes=list(urls), put=store.put, placement=P)
+            assert all(servers[nd].kv == {} for nd in urls)             # nothing sent yet
+            assert fetch(m, get=store.get) == leaf                      # reads see queued writes
+        assert fetch(m, get=MeshHttpStore(urls).get) == leaf
+
+
+def test_put_files_flushes_fragments_before_publishing_refs():
+    from automation.manifest_store import ManifestUnavailable
+    from automation.mesh_namespace import resolve_ref
+    from automation.mesh_sync import put_files
+
+    with mesh(9) as (store, urls, servers):
+        leaf = os.urandom(1000)
+        with store.batching():
+            [ref] = put_files(store, list(urls), [("/a.bin", leaf)], writer="laptop", placement=P, replicas=3)
+            m = resolve_manifest(ref.root, nodes=list(urls), get_blob=store.get_blob, replicas=3)
+            assert fetch(m, get=MeshHttpStore(urls).get) == leaf     # on the nodes, not just queued
+
+        real = store._put_batch
+
+        def reject(node, items):
+            if node == "n03":
+                raise OSError("n03 rejected the batch")
+            real(node, items)
+
+        store._put_batch = reject
+        other = os.urandom(1000)
+        with pytest.raises(OSError), store.batching():
+            put_files(store, list(urls), [("/b.bin", other)], writer="laptop", placement=P, replicas=3)
+        assert resolve_ref("/b.bin", nodes=list(urls), get_blob=store.get_blob, replicas=3) is None
+        with pytest.raises(ManifestUnavailable):
+            resolve_manifest(merkle_root(other), nodes=list(urls), get_blob=store.get_blob, replicas=3)
+
+
+def test_streaming_put_and_get_of_a_large_fragment():
+    import io
+
+    with mesh(1) as (store, urls, _):
+        big = os.urandom(3 * 1024 * 1024 + 17)
+        store.put_stream("n00", "big#0", io.BytesIO(big), len(big))
+        sink = io.BytesIO()
+        assert store.get_stream("n00", "big#0", sink) and sink.getvalue() == big
+        assert store.get("n00", "big#0") == big
+        assert not store.get_stream("n00", "absent#0", io.BytesIO())
+
+
+def test_push_and_pull_dir_over_http():
+    import tempfile
+
+    from automation.mesh_sync import pull_dir, push_dir
+
+    tmp_path = Path(tempfile.mkdtemp())
+    with mesh(9) as (store, urls, _):
+        src, dst = tmp_path / "src", tmp_path / "dst"
+        for i in range(12):
+            (src / f"d{i % 3}").mkdir(parents=True, exist_ok=True)
+            (src / f"d{i % 3}" / f"f{i}.bin").write_bytes(os.urandom(64 + i))
+        pushed = push_dir(store, list(urls), src, writer="laptop", placement=P, replicas=3)
+        assert sorted(pull_dir(MeshHttpStore(urls), list(urls), dst, replicas=3)) == sorted(pushed)
+        for p in src.rglob("*.bin"):
+            assert (dst / p.relative_to(src)).read_bytes() == p.read_bytes()
+
+
 def _run_all():
     fns = [v for k, v in sorted(globals().items()) if k.startswith("test_") and callable(v)]
     for fn in fns:
@@ -0,0 +1,79 @@
+"""The sharded directory index: batched appends, compaction, legacy migration, replica union."""
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from automation import mesh_index  # noqa: E402
+from automation.mesh_fs_store import MeshFsStore  # noqa: E402
+from automation.mesh_namespace import publish_blob, ref_nodes  # noqa: E402
+from automation.mesh_sync import get_file, list_files, put_file, put_files  # noqa: E402
+from automation.storage_resilience import Placement
+
+NODES = [f"n{i:02d}" for i in range(27)]
+HOST = Placement(rs_k=6, rs_m=3, shard_replicas=2)
+
+
+def _mesh():
+    return MeshFsStore(Path(tempfile.mkdtemp()))
+
+
+def test_add_and_list_are_a_grow_only_set():
+    m = _mesh()
+    assert mesh_index.list_paths(m, NODES) == set()
+    assert mesh_index.add_paths(m, NODES, ["/a", "/b", "/c"], shards=8) == 3
+    assert mesh_index.add_paths(m, NODES, ["/b", "/d"]) == 1            # /b already indexed
+    assert mesh_index.list_paths(m, NODES) == {"/a", "/b", "/c", "/d"}
+    root = mesh_index.read_root(m, NODES, 5)
+    assert root["shards"] == 8 and root["migrated"]                     # first root fixes the count
+    assert root["used"] == {mesh_index.shard_of(p, 8) for p in "/a /b /c /d".split()}
+
+
+def test_log_is_folded_into_the_base_at_compact_at():
+    m = _mesh()
+    paths = [f"/f{i}" for i in range(10)]
+    for p in paths:
+        mesh_index.add_paths(m, NODES, [p], shards=1, compact_at=4)
+    assert mesh_index.shard_sizes(m, NODES) == [(0, 8, 2)]              # two folds of 4, 2 pending
+    assert mesh_index.compact(m, NODES) == 1
+    assert mesh_index.shard_sizes(m, NODES) == [(0, 10, 0)]
+    assert mesh_index.list_paths(m, NODES) == set(paths)
+
+
+def test_legacy_single_blob_index_is_read_then_migrated():
+    m = _mesh()
+    publish_blob(mesh_index.LEGACY_INDEX, json.dumps(["/old/a", "/old/b"]).encode(), nodes=NODES,
+                 put_blob=m.put_blob, replicas=5)
+    assert mesh_index.list_paths(m, NODES) == {"/old/a", "/old/b"}     # no root yet: legacy only
+    mesh_index.add_paths(m, NODES, ["/new"])
+    for node in ref_nodes(mesh_index.LEGACY_INDEX, NODES, 5):
+        m.seize(node)                                                   # the legacy blob is gone...
+    reachable = set(NODES) - set(ref_nodes(mesh_index.LEGACY_INDEX, NODES, 5))
+    listed = mesh_index.list_paths(m, NODES, reachable=reachable)
+    assert {"/old/a", "/old/b", "/new"} <= listed                       # ...but was folded into shards
+
+
+def test_put_files_updates_the_index_once_per_batch(monkeypatch):
+    m = _mesh()
+    calls = []
+    real = mesh_index.add_paths
+    monkeypatch.setattr(mesh_index, "add_paths", lambda *a, **kw: calls.append(a[2]) or real(*a, **kw))
+    files = [(f"/batch/{i}.txt", os.urandom(30)) for i in range(20)]
+    refs = put_files(m, NODES, files, writer="laptop", placement=HOST)
+    assert len(calls) == 1 and len(calls[0]) == 20
+    assert [r.version for r in refs] == [1] * 20
+    assert list_files(m, NODES) == sorted(p for p, _ in files)
+
+
+def test_last_writer_wins_is_unchanged_within_and_across_batches():
+    m = _mesh()
+    refs = put_files(m, NODES, [("/doc", b"v1"), ("/doc", b"v2")], writer="laptop", placement=HOST)
+    assert [r.version for r in refs] == [1, 2]
+    put_file(m, NODES, "/doc", b"v3", writer="phone", placement=HOST)
+    data, ref = get_file(m, NODES, "/doc")
+    assert data == b"v3" and ref.version == 3 and ref.writer == "phone"
+    assert list_files(m, NODES) == ["/doc"]
@@ -0,0 +1,172 @@
+"""Concurrent mesh fragment I/O: quorum-acknowledged parallel writes, hedged reads that stop at k,
+and latency ordering that tries slow or seized nodes last — over the same put/get seams."""
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from automation.leaf_propagation import (  # noqa: E402
+    IntegrityError, LeafUnavailable, fetch, fetch_report, in_memory_store, propagate,
+)
+from automation.mesh_fs_store import MeshFsStore  # noqa: E402
+from automation.mesh_io import MeshIO, NodeLatency, ReplicaWriteError, WriteQuorumError  # noqa: E402
+from automation.storage_resilience import Placement
+
+NODES = [f"n{i:02d}" for i in range(27)]
+P = Placement(rs_k=6, rs_m=3)                       # k=6, n=9, R=1
+R2 = Placement(rs_k=6, rs_m=3, shard_replicas=2)    # every fragment on two nodes
+
+
+def test_latency_orders_slow_and_failing_nodes_last():
+    lat = NodeLatency(alpha=0.5, failure_penalty=1.0)
+    lat.observe("a", 0.010)
+    lat.observe("b", 0.200)
+    lat.observe("c", 0.001, ok=False)               # fast refusal still costs the penalty
+    assert lat.order(["c", "b", "a", "new"]) == ["new", "a", "b", "c"]
+    lat.observe("b", 0.010)
+    assert lat.estimate("b") == pytest.approx(0.105)
+
+
+def test_write_returns_at_quorum_and_finishes_in_background():
+    put, get, store = in_memory_store()
+    release = threading.Event()
+
+    def gated(node, key, data):
+        if node == "slow":
+            release.wait(5)
+        put(node, key, data)
+
+    io = MeshIO(workers=8)
+    copies = [(0, "a", "k0", b"x"), (0, "slow", "k0", b"x"), (1, "b", "k1", b"y")]
+    t0 = time.perf_counter()
+    assert io.write(copies, gated) == 2            # both groups acknowledged by a fast copy
+    assert time.perf_counter() - t0 < 1.0
+    assert ("slow", "k0") not in store
+    release.set()
+    io.close()
+    assert store[("slow", "k0")] == b"x"           # the straggler replica still lands
+
+
+def test_write_fails_loud_once_quorum_is_out_of_reach():
+    def put(node, key, data):
+        if node == "bad":
+            raise OSError("node rejected the fragment")
+
+    with MeshIO() as io:
+        with pytest.raises(WriteQuorumError) as exc:
+            io.write([(0, "ok", "k0", b"x"), (1, "bad", "k1", b"y")], put)
+        assert isinstance(exc.value.__cause__, OSError)
+
+
+def test_background_replica_failures_surface_on_close(caplog):
+    release = threading.Event()
+
+    def put(node, key, data):
+        if node == "bad":
+            release.wait(5)
+            raise OSError("node rejected the fragment")
+
+    io = MeshIO()
+    assert io.write([(0, "ok", "k0", b"x"), (1, "bad", "k1", b"y")], put, quorum=1) == 1
+    release.set()
+    with pytest.raises(ReplicaWriteError) as exc:
+        io.close()
+    [(group, node, key, err)] = exc.value.failures
+    assert (group, node, key) == (1, "bad", "k1") and isinstance(err, OSError)
+    assert "k1 -> bad" in caplog.text
+
+
+def test_gather_hedges_past_a_slow_replica_and_fails_over_past_a_dead_one():
+    data = {("fast", 0): b"0", ("slow", 1): b"1", ("fast2", 1): b"1", ("dead", 2): None, ("alt", 2): b"2"}
+    release = threading.Event()
+
+    def get(node, g):
+        if node == "slow":
+            release.wait(5)
+        return data.get((node, g))
+
+    with MeshIO(hedge_after=0.02) as io:
+        t0 = time.perf_counter()
+        got = io.gather({0: ["fast"], 1: ["slow", "fast2"], 2: ["dead", "alt"]}, get, need=3)
+        assert time.perf_counter() - t0 < 1.0
+        assert {g: v[1] for g, v in got.items()} == {0: b"0", 1: b"1", 2: b"2"}
+        assert got[1][0] == "fast2" and got[2][0] == "alt"
+        assert io.latency.order(["dead", "alt"]) == ["alt", "dead"]
+        release.set()
+
+
+def test_gather_returns_short_when_every_copy_is_gone():
+    with MeshIO() as io:
+        got = io.gather({0: ["a"], 1: ["b"]}, lambda node, g: b"x" if node == "a" else None, need=2)
+    assert list(got) == [0]
+
+
+def test_concurrent_propagate_and_fetch_roundtrip():
+    put, get, _ = in_memory_store()
+    leaf = os.urandom(500)
+    with MeshIO() as io:
+        m = propagate(leaf, nodes=NODES, put=put, placement=R2, io=io)
+        io.close()                                   # let the background replicas land
+    with MeshIO() as io:
+        assert fetch(m, get=get, io=io) == leaf
+        first = [nd for lst in m.fragment_nodes.values() for nd in lst[:1]]
+        assert fetch(m, get=get, reachable=set(NODES) - set(first), io=io) == leaf
+        with pytest.raises(LeafUnavailable):
+            fetch(m, get=get, reachable=set(first[:5]), io=io)
+
+
+def test_hedged_read_stops_at_k():
+    put, get, _ = in_memory_store()
+    leaf = os.urandom(300)
+    m = propagate(leaf, nodes=NODES, put=put, placement=P)
+    calls = []
+    with MeshIO(hedge_after=1.0) as io:
+        report = fetch_report(m, get=lambda node, key: calls.append(node) or get(node, key), io=io)
+    assert report.leaf == leaf and report.liars == []
+    assert len(calls) == m.k                         # no spare fragment was ever asked for
+
+
+def test_hedged_read_widens_to_locate_liars():
+    put, get, store = in_memory_store()
+    leaf = os.urandom(300)
+    m = propagate(leaf, nodes=NODES, put=put, placement=Placement(rs_k=4, rs_m=6))
+    liar = sorted(m.fragment_nodes)[0]
+    key = (m.fragment_nodes[liar][0], f"{m.root}#{liar}")
+    store[key] = bytes(v ^ 0x5A for v in store[key])
+    with MeshIO(hedge_after=1.0) as io:
+        report = fetch_report(m, get=get, io=io)
+    assert report.leaf == leaf and report.liars == [liar]
+
+
+def test_hedged_read_still_fails_closed():
+    put, get, store = in_memory_store()
+    m = propagate(os.urandom(60), nodes=NODES, put=put, placement=P)
+    for x in list(m.fragment_nodes)[:4]:
+        key = (m.fragment_nodes[x][0], f"{m.root}#{x}")
+        store[key] = bytes([store[key][0] ^ 0xFF]) + store[key][1:]
+    with MeshIO() as io, pytest.raises(IntegrityError):
+        fetch(m, get=get, io=io)
+
+
+def test_write_quorum_below_k_is_rejected():
+    put, _, _ = in_memory_store()
+    with MeshIO() as io, pytest.raises(ValueError):
+        propagate(b"leaf", nodes=NODES, put=put, placement=P, io=io, write_quorum=5)
+
+
+def test_concurrent_io_over_mesh_fs_store():
+    store = MeshFsStore(Path(tempfile.mkdtemp()))
+    leaf = os.urandom(4096)
+    with MeshIO() as io:
+        m = propagate(leaf, nodes=NODES, put=store.put, placement=R2, io=io, write_quorum=6)
+    for nd in [lst[0] for lst in m.fragment_nodes.values()][:3]:
+        store.seize(nd)
+    with MeshIO() as io:
+        assert fetch(m, get=store.get, io=io) == leaf
@@ -3,14 +3,16 @@ import os
 import sys
 import tempfile
 from pathlib import Path
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from automation.mesh_fs_store import MeshFsStore  # noqa: E402
 from automation.mesh_namespace import NamespaceRef, publish_ref, resolve_ref  # noqa: E402
+from automation import mesh_sync  # noqa: E402
 from automation.mesh_sync import (  # noqa: E402
-    FileNotFound, get_file, list_files, pull_dir, push_dir, put_file,
+    FileNotFound, get_file, list_files, pull_dir, pull_dir_report, push_dir, push_dir_report, put_file,
 )
 from automation.storage_resilience import Placement
 
@@ -97,6 +99,117 @@ def test_two_device_dir_sync_roundtrip():
     assert (devB / "notes" / "todo.md").read_bytes() == b"buy milk and eggs"
 
 
+def _tree(root, files, age_s=60):
+    """Write ``files`` under ``root`` with mtimes ``age_s`` in the past (outside the racy window)."""
+    for rel, data in files.items():
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(data)
+        past = p.stat().st_mtime_ns - age_s * 1_000_000_000
+        os.utime(p, ns=(past, past))
+
+
+def test_noop_resync_is_a_stat_walk():
+    m, tmp_path = _mesh(), Path(tempfile.mkdtemp())
+    src = tmp_path / "src"
+    _tree(src, {"a.txt": b"alpha", "d/b.bin": os.urandom(300)})
+    first = push_dir_report(m, NODES, src, writer="laptop", placement=HOST, state=tmp_path / "s.json")
+    assert first.added == ["/a.txt", "/d/b.bin"] and first.bytes_moved == 305
+
+    with mock.patch.object(Path, "read_bytes", side_effect=AssertionError("read")), \
+            mock.patch.object(mesh_sync, "resolve_ref", side_effect=AssertionError("ref")):
+        again = push_dir_report(m, NODES, src, writer="laptop", placement=HOST, state=tmp_path / "s.json")
+    assert again.skipped == ["/a.txt", "/d/b.bin"] and again.bytes_moved == 0
+    assert again.added == again.changed == again.deleted == []
+
+
+def test_push_reports_added_changed_deleted_and_touched():
+    m, tmp_path = _mesh(), Path(tempfile.mkdtemp())
+    src, state = tmp_path / "src", tmp_path / "s.json"
+    _tree(src, {"keep.txt": b"same", "edit.txt": b"v1", "gone.txt": b"bye", "touch.txt": b"t"})
+    push_dir(m, NODES, src, writer="laptop", placement=HOST, state=state)
+    (src / "gone.txt").unlink()
+    _tree(src, {"edit.txt": b"v2!", "new.txt": b"fresh", "touch.txt": b"t"}, age_s=30)
+    r = push_dir_report(m, NODES, src, writer="laptop", placement=HOST, state=state)
+    assert (r.added, r.changed, r.deleted) == (["/new.txt"], ["/edit.txt"], ["/gone.txt"])
+    assert sorted(r.skipped) == ["/keep.txt", "/touch.txt"]       # touched: rehashed, not re-sent
+    assert r.bytes_moved == len(b"v2!") + len(b"fresh")
+    assert r.summary() == "added 1, changed 1, deleted 1, skipped 2, 8 bytes moved"
+    assert get_file(m, NODES, "/edit.txt")[1].version == 2
+    assert get_file(m, NODES, "/touch.txt")[1].version == 1
+
+
+def test_push_skips_content_another_device_already_pushed():
+    m, tmp_path = _mesh(), Path(tempfile.mkdtemp())
+    _tree(tmp_path / "a", {"x.txt": b"shared"})
+    _tree(tmp_path / "b", {"x.txt": b"shared"})
+    push_dir(m, NODES, tmp_path / "a", writer="laptop", placement=HOST, state=tmp_path / "a.json")
+    r = push_dir_report(m, NODES, tmp_path / "b", writer="phone", placement=HOST, state=tmp_path / "b.json")
+    assert r.skipped == ["/x.txt"] and r.bytes_moved == 0       # remote ref matched: no fragments
+
+
+def test_pull_compares_refs_before_fragment_traffic():
+    m, tmp_path = _mesh(), Path(tempfile.mkdtemp())
+    _tree(tmp_path / "src", {"a.txt": b"alpha", "b.txt": b"beta"})
+    push_dir(m, NODES, tmp_path / "src", writer="laptop", placement=HOST, state=tmp_path / "src.json")
+    dst, state = tmp_path / "dst", tmp_path / "dst.json"
+    assert pull_dir_report(m, NODES, dst, state=state).added == ["/a.txt", "/b.txt"]
+
+    with mock.patch.object(m, "get", side_effect=m.get) as fragment_get:
+        r = pull_dir_report(m, NODES, dst, state=state)
+    assert r.skipped == ["/a.txt", "/b.txt"] and r.bytes_moved == 0 and not fragment_get.called
+
+    put_file(m, NODES, "/b.txt", b"beta, edited elsewhere", writer="phone", placement=HOST)
+    r = pull_dir_report(m, NODES, dst, state=state)
+    assert r.changed == ["/b.txt"] and r.skipped == ["/a.txt"]
+    assert (dst / "b.txt").read_bytes() == b"beta, edited elsewhere"
+
+
+def test_pull_skips_a_matching_local_copy_without_state():
+    m, tmp_path = _mesh(), Path(tempfile.mkdtemp())
+    put_file(m, NODES, "/same.txt", b"already here", writer="laptop", placement=HOST)
+    _tree(tmp_path / "dst", {"same.txt": b"already here"})
+    r = pull_dir_report(m, NODES, tmp_path / "dst", state=tmp_path / "s.json")
+    assert r.skipped == ["/same.txt"] and r.bytes_moved == 0
+
+
+def test_push_records_the_stat_taken_before_the_read():
+    m, tmp_path = _mesh(), Path(tempfile.mkdtemp())
+    src, state = tmp_path / "src", tmp_path / "s.json"
+    _tree(src, {"a.txt": b"v1"})
+    real = mesh_sync._put_files
+
+    def edited_during_upload(*args, **kwargs):
+        _tree(src, {"a.txt": b"v2, saved mid-push"}, age_s=30)
+        return real(*args, **kwargs)
+
+    with mock.patch.object(mesh_sync, "_put_files", side_effect=edited_during_upload):
+        push_dir(m, NODES, src, writer="laptop", placement=HOST, state=state)
+    r = push_dir_report(m, NODES, src, writer="laptop", placement=HOST, state=state)
+    assert r.changed == ["/a.txt"]                              # not trusted as already uploaded
+    assert get_file(m, NODES, "/a.txt")[0] == b"v2, saved mid-push"
+
+
+def test_push_saves_no_state_for_a_batch_whose_fragments_did_not_land():
+    m, tmp_path = _mesh(), Path(tempfile.mkdtemp())
+    src, state = tmp_path / "src", tmp_path / "s.json"
+    _tree(src, {"a.txt": b"alpha"})
+    with mock.patch.object(mesh_sync, "_flush_fragments", side_effect=OSError("node rejected")):
+        try:
+            push_dir(m, NODES, src, writer="laptop", placement=HOST, state=state)
+        except OSError:
+            pass
+        else:
+            raise AssertionError("a failed fragment flush must fail the push")
+    try:
+        get_file(m, NODES, "/a.txt")
+        raise AssertionError("no ref may be published before its fragments land")
+    except FileNotFound:
+        pass
+    r = push_dir_report(m, NODES, src, writer="laptop", placement=HOST, state=state)
+    assert r.added == ["/a.txt"] and r.bytes_moved == len(b"alpha")
+
+
 def _run_all():
     fns = [v for k, v in sorted(globals().items()) if k.startswith("test_") and callable(v)]
     for fn in fns:
@@ -184,3 +184,20 @@ class TestPropagationHandler:
 
         m = handler.get_metrics()
         assert m["failures"] >= 1
+
+    def test_unregistered_repo_falls_back_to_resident_engine(self):
+        from pathlib import Path
+
+        from engines.propagation_engine import ResidentPropagationEngine
+
+        fixture = Path(__file__).parent / "fixtures" / "propagation"
+        orch = _make_orchestrator()
+        handler = PropagationHandler(
+            registry=SAMPLE_REGISTRY,
+            devops_orchestrator=orch,
+            engine=ResidentPropagationEngine(fixture),
+        )
+
+        handler.handle({"repo": "SocioProphet/event-bus", "ref": "refs/heads/main", "payload": {"commits": []}})
+
+        orch.rebuild.assert_called_once_with("SocioProphet/adapter-x")
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import json
+import os
+import random
+from collections import deque
+
 import pytest
 from pathlib import Path
 
-from engines.propagation_engine import PropagationEngine
+from engines import propagation_engine
+from engines.propagation_engine import PropagationEngine, ResidentPropagationEngine
 
 
 # Engine LOGIC is tested against a deterministic fixture registry, not the live
@@ -123,3 +129,192 @@ def test_real_registry_loads_and_is_acyclic() -> None:
     e.load()
     assert e.all_rules() is not None
     assert e.detect_cycles() == []
+
+
+# ── ResidentPropagationEngine: load once, reload only on real registry change ──
+
+
+@pytest.fixture
+def registry_copy(tmp_path: Path) -> Path:
+    for src in FIXTURE_DIR.iterdir():
+        (tmp_path / src.name).write_bytes(src.read_bytes())
+    return tmp_path
+
+
+def _touch(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_resident_engine_loads_once_and_serves_frozen_snapshot(registry_copy: Path) -> None:
+    resident = ResidentPropagationEngine(registry_copy)
+    first = resident.current()
+    assert resident.current() is first
+    assert "tritrpc" in first.dependencies_of("sociosphere")
+    m = resident.get_metrics()
+    assert m["loads"] == 1 and m["rebuilds"] == 0 and m["checks"] == 2
+    assert m["last_load_seconds"] >= 0
+    with pytest.raises(RuntimeError):
+        first.load()
+
+
+def test_resident_engine_ignores_touch_without_content_change(registry_copy: Path) -> None:
+    resident = ResidentPropagationEngine(registry_copy)
+    first = resident.current()
+    _touch(registry_copy / "dependency-graph.yaml")
+    assert resident.current() is first
+    assert resident.get_metrics()["unchanged_touches"] == 1
+
+
+def test_resident_engine_rebuilds_and_swaps_on_content_change(registry_copy: Path) -> None:
+    resident = ResidentPropagationEngine(registry_copy)
+    first = resident.current()
+    graph = registry_copy / "dependency-graph.yaml"
+    graph.write_text(
+        graph.read_text(encoding="utf-8").replace(
+            "edges:\n", "edges:\n  - { from: brand-new, to: tritrpc, type: depends_on }\n"
+        ),
+        encoding="utf-8",
+    )
+    _touch(graph)
+    second = resident.current()
+    assert second is not first
+    assert "brand-new" in second.dependents_of("tritrpc")
+    # The old snapshot a concurrent reader may still hold is untouched.
+    assert "brand-new" not in first.dependents_of("tritrpc")
+    assert resident.get_metrics()["rebuilds"] == 1
+
+
+def test_resident_engine_picks_up_new_edge_pack(registry_copy: Path) -> None:
+    resident = ResidentPropagationEngine(registry_copy)
+    first = resident.current()
+    (registry_copy / "lane-dependency-edges.yaml").write_text(
+        "edges:\n  - { from: lane-repo, to: event-bus, type: depends_on }\n", encoding="utf-8"
+    )
+    assert resident.current() is not first
+    assert "lane-repo" in resident.current().dependents_of("event-bus")
+
+
+def test_resident_engine_min_check_interval_skips_stat_walk(registry_copy: Path) -> None:
+    resident = ResidentPropagationEngine(registry_copy, min_check_interval=3600)
+    resident.current()
+    resident.current()
+    assert resident.get_metrics()["checks"] == 1
+
+
+def test_propagate_reuses_resident_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(propagation_engine, "METRICS_DIR", tmp_path)
+    monkeypatch.setattr(propagation_engine, "PROPAGATION_LOG", tmp_path / "log.jsonl")
+    resident = ResidentPropagationEngine(FIXTURE_DIR)
+    monkeypatch.setattr(propagation_engine, "resident_engine", lambda *a, **k: resident)
+
+    assert propagation_engine.propagate("tritrpc") == 0
+    assert propagation_engine.propagate("tritrpc") == 0
+    assert resident.get_metrics()["loads"] == 1
+    events = [json.loads(line) for line in (tmp_path / "log.jsonl").read_text().splitlines()]
+    assert events[0]["cascade_steps"] == events[1]["cascade_steps"] > 0
+
+
+# ── Compiled graph index ──────────────────────────────────────────────────────
+
+
+def _write_graph(directory: Path, edges: list[tuple[str, str]]) -> Path:
+    lines = ["edges:"] + [f"  - {{ from: {a}, to: {b}, type: depends_on }}" for a, b in edges]
+    (directory / "dependency-graph.yaml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return directory
+
+
+def test_detect_cycles_reports_each_back_edge_cycle(tmp_path: Path) -> None:
+    e = PropagationEngine(_write_graph(tmp_path, [("a", "b"), ("b", "c"), ("c", "a"), ("d", "d"), ("e", "a")]))
+    e.load()
+    assert e.detect_cycles() == [["a", "b", "c", "a"], ["d", "d"]]
+
+
+def _recursive_cycles(e: PropagationEngine) -> list[list[str]]:
+    """The pre-index recursive DFS, with roots in index order instead of set order."""
+    visited: set[str] = set()
+    stack: set[str] = set()
+    path: list[str] = []
+    cycles: list[list[str]] = []
+
+    def dfs(node: str) -> None:
+        visited.add(node)
+        stack.add(node)
+        path.append(node)
+        for neighbor in e._adjacency.get(node, []):
+            if neighbor not in visited:
+                dfs(neighbor)
+            elif neighbor in stack:
+                cycle = path[path.index(neighbor):] + [neighbor]
+                if cycle not in cycles:
+                    cycles.append(cycle)
+        stack.remove(node)
+        path.pop()
+
+    for node in e.graph_index().names:
+        if node not in visited:
+            dfs(node)
+    return cycles
+
+
+def _dict_cascade(e: PropagationEngine, repo: str, max_depth: int) -> list[dict]:
+    """The pre-index cascade: BFS over the reverse adjacency dict, no rules."""
+    results, visited, queue = [], {repo}, deque()
+    for dep in e._reverse_adjacency.get(repo, []):
+        if dep not in visited:
+            visited.add(dep)
+            queue.append((dep, 1))
+            results.append({"depth": 1, "repo": dep, "action": "notify", "message": f"{repo} changed",
+                            "auto_pr": False, "pr_title": "", "source_rule": "dependency_graph"})
+    while queue:
+        current, depth = queue.popleft()
+        if depth >= max_depth:
+            continue
+        for dep in e._reverse_adjacency.get(current, []):
+            if dep not in visited:
+                visited.add(dep)
+                queue.append((dep, depth + 1))
+                results.append({"depth": depth + 1, "repo": dep, "action": "notify",
+                                "message": f"Cascade from {current}", "auto_pr": False, "pr_title": "",
+                                "source_rule": "dependency_graph"})
+    return results
+
+
+def test_indexed_cycles_and_cascades_match_the_dict_walks(tmp_path: Path) -> None:
+    rng = random.Random(4)
+    several_per_component = False
+    for trial in range(6):
+        n = 12 + trial * 4
+        edges = sorted({(f"r{rng.randrange(n)}", f"r{rng.randrange(n)}") for _ in range(n * 2)})
+        directory = tmp_path / str(trial)
+        directory.mkdir()
+        e = PropagationEngine(_write_graph(directory, edges))
+        e.load()
+        cycles = e.detect_cycles()
+        assert cycles == _recursive_cycles(e)
+        cyclic = {e.graph_index().scc_of[e.graph_index().ids[c[0]]] for c in cycles}
+        several_per_component |= len(cycles) > len(cyclic)
+        for repo in e.graph_index().names:
+            for depth in (1, 3):
+                assert e.compute_cascade(repo, depth) == _dict_cascade(e, repo, depth)
+    assert several_per_component  # not just one witness per strongly connected component
+
+
+def test_detect_cycles_survives_chains_past_the_recursion_limit(tmp_path: Path) -> None:
+    n = 5000
+    e = PropagationEngine(_write_graph(tmp_path, [(f"r{i + 1}", f"r{i}") for i in range(n)] + [("r0", f"r{n}")]))
+    e.load()
+    cycles = e.detect_cycles()
+    assert len(cycles) == 1 and len(cycles[0]) == n + 2
+
+
+def test_transitive_dependents_carry_bfs_depth(engine: PropagationEngine) -> None:
+    assert engine.transitive_dependents("event-bus") == [("adapter-x", 1), ("service-y", 2)]
+    assert engine.transitive_dependents("event-bus", max_depth=1) == [("adapter-x", 1)]
+    assert engine.transitive_dependents("no-such-repo") == []
+
+
+def test_compute_cascade_is_memoized_but_returns_fresh_dicts(engine: PropagationEngine) -> None:
+    first = engine.compute_cascade("event-bus")
+    first[0]["repo"] = "mutated"
+    assert engine.compute_cascade("event-bus")[0]["repo"] != "mutated"
@@ -0,0 +1,172 @@
+"""Coverage for `runner.py fetch`: parallel, lock-revision-only clones.
+
+Remotes are local file:// repositories standing in for the estate, so the real git
+transport runs (protocol v2 fetch-by-SHA, shallow depth, the shared reference cache)
+with no network.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+RUNNER = Path(__file__).resolve().parents[1] / "tools" / "runner" / "runner.py"
+
+
+def _load_runner():
+    spec = importlib.util.spec_from_file_location("workspace_runner_fetch_under_test", RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+runner = _load_runner()
+
+GIT_ENV = ["-c", "user.email=test@example.invalid", "-c", "user.name=test"]
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.check_output(["git", *GIT_ENV, *args], cwd=cwd, text=True).strip()
+
+
+def _remote(tmp_path: Path, name: str, commits: int = 3) -> tuple[str, list[str]]:
+    src = tmp_path / "remotes" / name
+    src.mkdir(parents=True)
+    _git(src, "init", "-q", "-b", "main")
+    shas = []
+    for i in range(commits):
+        (src / "file.txt").write_text(f"{name} v{i}\n" * 200, encoding="utf-8")
+        _git(src, "add", "file.txt")
+        _git(src, "commit", "-q", "-m", f"v{i}")
+        shas.append(_git(src, "rev-parse", "HEAD"))
+    return f"file://{src}", shas
+
+
+def _repo(tmp_path: Path, ws: str, name: str, url: str) -> "runner.Repo":
+    return runner.Repo(name=name, role="component", local_path=tmp_path / ws / "components" / name, url=url, ref="main")
+
+
+def test_fetch_checks_out_locked_rev_shallow(tmp_path):
+    url, shas = _remote(tmp_path, "alpha")
+    r = _repo(tmp_path, "ws", "alpha", url)
+    r.local_path.parent.mkdir(parents=True)
+
+    row = runner.fetch_repo(r, shas[0], depth=1)
+
+    assert row["status"] == "cloned", row
+    assert row["rev"] == shas[0]
+    assert _git(r.local_path, "rev-parse", "HEAD") == shas[0]
+    # Only the locked commit came over: nothing newer, and history is cut at depth 1.
+    assert (r.local_path / ".git" / "shallow").exists()
+    assert _git(r.local_path, "rev-list", "--count", "HEAD") == "1"
+    assert row["bytes"] > 0 and row["seconds"] >= 0
+    assert not r.local_path.with_name(".alpha.fetch-tmp").exists()
+
+
+def test_fetch_without_lock_takes_ref_tip(tmp_path):
+    url, shas = _remote(tmp_path, "beta")
+    r = _repo(tmp_path, "ws", "beta", url)
+    r.local_path.parent.mkdir(parents=True)
+
+    row = runner.fetch_repo(r, None)
+
+    assert row["rev"] == shas[-1]
+
+
+def test_parallel_fetch_reports_in_work_order(tmp_path):
+    work = []
+    expected = {}
+    for name in ("c1", "c2", "c3", "c4"):
+        url, shas = _remote(tmp_path, name)
+        r = _repo(tmp_path, "ws", name, url)
+        r.local_path.parent.mkdir(parents=True, exist_ok=True)
+        work.append((r, shas[1]))
+        expected[name] = shas[1]
+
+    rows = runner.fetch_repos(work, jobs=4)
+
+    assert [row["name"] for row in rows] == ["c1", "c2", "c3", "c4"]
+    assert {row["name"]: row["rev"] for row in rows} == expected
+
+
+def test_shared_cache_is_reused_across_workspaces(tmp_path):
+    url, shas = _remote(tmp_path, "gamma")
+    cache = tmp_path / "cache"
+
+    first = _repo(tmp_path, "ws1", "gamma", url)
+    first.local_path.parent.mkdir(parents=True)
+    row1 = runner.fetch_repo(first, shas[1], cache_dir=cache)
+    second = _repo(tmp_path, "ws2", "gamma", url)
+    second.local_path.parent.mkdir(parents=True)
+    row2 = runner.fetch_repo(second, shas[1], cache_dir=cache)
+
+    assert row1["status"] == row2["status"] == "cloned"
+    assert _git(second.local_path, "rev-parse", "HEAD") == shas[1]
+    assert (second.local_path / ".git" / "objects" / "info" / "alternates").exists()
+    # The workspace borrows the cache's objects instead of holding its own pack.
+    assert row2["bytes"] < runner._dir_bytes(runner.git_cache_path(cache, url) / "objects")
+    assert _git(second.local_path, "remote", "get-url", "origin") == url
+
+
+def test_failed_fetch_leaves_nothing_behind(tmp_path):
+    r = _repo(tmp_path, "ws", "missing", f"file://{tmp_path}/does-not-exist")
+    r.local_path.parent.mkdir(parents=True)
+
+    row = runner.fetch_repo(r, "0" * 40)
+
+    assert row["status"] == "failed"
+    assert "error" in row
+    assert not r.local_path.exists()
+    assert not r.local_path.with_name(".missing.fetch-tmp").exists()
+
+
+def _protocol_v0(monkeypatch) -> None:
+    # Protocol v0 only serves advertised tips unless uploadpack.allowReachableSHA1InWant is set.
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "protocol.version")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "0")
+
+
+def test_unadvertised_sha_falls_back_to_ref_history(tmp_path, monkeypatch):
+    url, shas = _remote(tmp_path, "delta")
+    _protocol_v0(monkeypatch)
+    r = _repo(tmp_path, "ws", "delta", url)
+    r.local_path.parent.mkdir(parents=True)
+
+    row = runner.fetch_repo(r, shas[0], depth=1)
+
+    assert row["status"] == "cloned", row
+    assert _git(r.local_path, "rev-parse", "HEAD") == shas[0]
+    assert _git(r.local_path, "rev-parse", "origin/main") == shas[-1]
+
+
+def test_lock_rev_off_the_ref_falls_back_to_all_branches(tmp_path, monkeypatch):
+    url, shas = _remote(tmp_path, "eps")
+    src = tmp_path / "remotes" / "eps"
+    _git(src, "checkout", "-q", "-b", "release", shas[0])
+    (src / "file.txt").write_text("hotfix\n", encoding="utf-8")
+    _git(src, "commit", "-q", "-am", "hotfix")
+    hotfix = _git(src, "rev-parse", "HEAD")
+    _protocol_v0(monkeypatch)
+    r = _repo(tmp_path, "ws", "eps", url)
+    r.local_path.parent.mkdir(parents=True)
+
+    row = runner.fetch_repo(r, hotfix, depth=1)
+
+    assert row["status"] == "cloned", row
+    assert _git(r.local_path, "rev-parse", "HEAD") == hotfix
+
+
+def test_fetch_without_lock_checks_out_a_tracking_branch(tmp_path):
+    url, shas = _remote(tmp_path, "zeta")
+    r = _repo(tmp_path, "ws", "zeta", url)
+    r.local_path.parent.mkdir(parents=True)
+
+    row = runner.fetch_repo(r, None)
+
+    assert row["rev"] == shas[-1]
+    assert _git(r.local_path, "symbolic-ref", "--short", "HEAD") == "main"
+    assert _git(r.local_path, "rev-parse", "--abbrev-ref", "main@{upstream}") == "origin/main"
@@ -0,0 +1,150 @@
+"""Coverage for `runner.py run`: the bounded worker pool and the topological mode.
+
+The child processes are tiny shell scripts in tmp repos so the test exercises the
+real Popen path -- logs streamed to files, TaskRunArtifact per repo, one run-level
+summary -- without a workspace checkout.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+RUNNER = Path(__file__).resolve().parents[1] / "tools" / "runner" / "runner.py"
+
+
+def _load_runner():
+    spec = importlib.util.spec_from_file_location("workspace_runner_under_test", RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    # Registered first: @dataclass resolves the module's namespace via sys.modules.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+runner = _load_runner()
+
+
+class FakeEngine:
+    """Just the two PropagationEngine queries the topo mode consumes."""
+
+    def __init__(self, deps: dict[str, list[str]], order: list[str]):
+        self._deps = deps
+        self._order = order
+
+    def dependencies_of(self, repo_id: str) -> list[str]:
+        return list(self._deps.get(repo_id, []))
+
+    def merge_order(self) -> list[str]:
+        return list(self._order)
+
+
+def _repo(tmp_path: Path, name: str, script: str) -> "runner.Repo":
+    path = tmp_path / "components" / name
+    (path / "scripts").mkdir(parents=True)
+    (path / "scripts" / "test.sh").write_text(script, encoding="utf-8")
+    return runner.Repo(name=name, role="component", local_path=path)
+
+
+def test_parallel_run_streams_logs_and_writes_artifacts(tmp_path):
+    script = "echo out-$$; echo err-$$ 1>&2; sleep 0.3\n"
+    targets = [_repo(tmp_path, f"r{i}", script) for i in range(4)]
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+
+    t0 = time.monotonic()
+    results = runner.run_targets(targets, "test", run_dir, jobs=4)
+    wall = time.monotonic() - t0
+
+    # Four 0.3s children in a 4-wide pool overlap; serially they would take 1.2s.
+    assert wall < 1.0
+    for r in targets:
+        art = json.loads((run_dir / f"task-run-{r.name}.json").read_text())
+        assert art["kind"] == "TaskRunArtifact"
+        assert art["exitCode"] == 0
+        assert art["contractType"] == "script"
+        assert Path(art["stdoutRef"]).read_text().startswith("out-")
+        assert Path(art["stderrRef"]).read_text().startswith("err-")
+        assert "durationSeconds" not in art
+        assert results[r.name]["durationSeconds"] >= 0.3
+
+
+def test_parallel_run_echoes_each_task_log_whole(tmp_path, capsys):
+    ok = _repo(tmp_path, "ok", "echo ok-line-1; sleep 0.2; echo ok-line-2\n")
+    bad = _repo(tmp_path, "bad", "echo bad-out; echo bad-err 1>&2; exit 3\n")
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+
+    runner.run_targets([ok, bad], "test", run_dir, jobs=2)
+
+    out, err = capsys.readouterr()
+    assert "== ok: test ==\nok-line-1\nok-line-2\n" in out
+    assert "== bad: test ==\nbad-out\n" in out
+    assert "bad-err\nFAIL bad: exit 3\n" in err
+
+
+def test_topo_mode_waits_for_dependencies(tmp_path):
+    order_file = tmp_path / "order.txt"
+    a = _repo(tmp_path, "lib", f"sleep 0.2; echo lib >> {order_file}\n")
+    b = _repo(tmp_path, "app", f"echo app >> {order_file}\n")
+    c = _repo(tmp_path, "tool", f"echo tool >> {order_file}\n")
+    engine = FakeEngine({"app": ["lib", "outside-selection"]}, ["lib", "tool", "app"])
+    targets = [b, a, c]
+    deps = runner.target_dependencies(targets, engine)
+    assert deps == {"app": ["lib"], "lib": [], "tool": []}
+
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    results = runner.run_targets(
+        targets, "test", run_dir, jobs=3, deps=deps, priority=runner.topo_priority(targets, engine)
+    )
+    lines = order_file.read_text().split()
+    assert lines.index("lib") < lines.index("app")
+
+    summary = runner.run_summary_payload("test", results, deps, 3, "topo", runner.now_iso(), 0.5)
+    assert summary["kind"] == "TaskRunSummaryArtifact"
+    assert summary["result"] == "pass"
+    assert summary["criticalPath"]["repos"] == ["lib", "app"]
+    assert {r["name"]: r["dependsOn"] for r in summary["repos"]}["app"] == ["lib"]
+
+
+def test_failed_dependency_blocks_dependents(tmp_path):
+    marker = tmp_path / "ran"
+    lib = _repo(tmp_path, "lib", "exit 3\n")
+    app = _repo(tmp_path, "app", f"touch {marker}\n")
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+
+    results = runner.run_targets([lib, app], "test", run_dir, jobs=2, deps={"lib": [], "app": ["lib"]})
+
+    assert results["lib"]["exitCode"] == 3
+    assert results["app"]["exitCode"] == 2
+    assert results["app"]["blockedBy"] == ["lib"]
+    assert not marker.exists()
+    art = json.loads((run_dir / "task-run-app.json").read_text())
+    assert art["blockedBy"] == ["lib"]
+
+
+def test_cycle_in_selection_is_reported_not_hung(tmp_path):
+    a = _repo(tmp_path, "a", "true\n")
+    b = _repo(tmp_path, "b", "true\n")
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+
+    deps = {"a": ["b"], "b": ["a"]}
+    results = runner.run_targets([a, b], "test", run_dir, jobs=2, deps=deps)
+
+    assert {n: r["exitCode"] for n, r in results.items()} == {"a": 2, "b": 2}
+    assert runner.critical_path(results, deps)["seconds"] == 0.0
+
+
+def test_critical_path_handles_long_chains():
+    n = 5000
+    results = {f"r{i}": {"durationSeconds": 1.0} for i in range(n)}
+    deps = {f"r{i}": [f"r{i - 1}"] if i else [] for i in range(n)}
+    path = runner.critical_path(results, deps)
+    assert path["seconds"] == float(n)
+    assert path["repos"][0] == "r0" and path["repos"][-1] == f"r{n - 1}"
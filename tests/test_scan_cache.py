@@ -0,0 +1,140 @@
+"""The blob-SHA scan cache answers unchanged files from SQLite and changes no scanner's output.
+
+Each scanner (source exposure, the FIPS checker's content checks, the compliance
+checker's REQ-G04) must report exactly what an uncached run reports, and after a
+commit touching three files only those three are rescanned.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+sys.path.insert(0, str(ROOT / "telemetry"))
+import check_source_exposure as checker  # noqa: E402
+import fips_checker  # noqa: E402
+from automation import scan_cache  # noqa: E402
+
+POLICY = ROOT / "standards" / "source-exposure" / "policy.v0.json"
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.invalid", *args],
+        cwd=repo, check=True, text=True, stdout=subprocess.PIPE,
+    ).stdout
+
+
+def _repo(tmp_path: Path, files: int = 12) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    for i in range(files):
+        (repo / "src" / f"mod{i:02d}.py").write_text(f"value_{i} = {i}\n", "utf-8")
+    (repo / "src" / "cfg.py").write_text("min_version = 'TLS1_3'  # hashlib.sha256 only\n", "utf-8")
+    (repo / "src" / "legacy.py").write_text("import hashlib\nh = hashlib.md5(b'x')\n", "utf-8")
+    (repo / "src" / "token.txt").write_text("key = AKIA" + "Q" * 16 + "\n", "utf-8")
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "init")
+    return repo
+
+
+def _stable(report: dict) -> dict:
+    return {k: v for k, v in report.items() if k not in ("generated_at", "cache")}
+
+
+def test_blob_shas_track_the_working_tree(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+    (repo / "src" / "mod00.py").write_text("edited = True\n", "utf-8")
+    (repo / "src" / "mod01.py").unlink()
+    (repo / "untracked.py").write_text("x = 1\n", "utf-8")
+    (repo / "link.py").symlink_to("src/mod02.py")
+    _git(repo, "add", "link.py")
+
+    shas = scan_cache.blob_shas(repo)
+    assert "src/mod01.py" not in shas and "untracked.py" not in shas and "link.py" not in shas
+    for rel in ("src/mod00.py", "src/mod02.py", "src/legacy.py"):
+        assert shas[rel] == _git(repo, "hash-object", rel).strip()
+    assert scan_cache.blob_shas(repo / "src")["mod02.py"] == shas["src/mod02.py"]
+    assert scan_cache.blob_shas(tmp_path) is None
+
+
+def test_cache_round_trip_and_ruleset_change(tmp_path: Path) -> None:
+    db = tmp_path / "cache" / "scan.sqlite"
+    blobs = [f"{i:040x}" for i in range(1200)]  # more than one lookup batch
+    with scan_cache.ScanCache(db, "demo", scan_cache.ruleset_hash("demo", ["a"])) as cache:
+        cache.put_many((b, [int(b, 16), None]) for b in blobs[:1000])
+        got = cache.get_many(blobs)
+        assert len(got) == 1000 and got[blobs[7]] == [7, None]
+        assert (cache.hits, cache.misses) == (1000, 200)
+    with scan_cache.ScanCache(db, "other", scan_cache.ruleset_hash("other", ["a"])) as cache:
+        cache.put_many([(blobs[0], True)])
+    with scan_cache.ScanCache(db, "demo", scan_cache.ruleset_hash("demo", ["b"])) as cache:
+        assert cache.get_many(blobs) == {}
+    with scan_cache.ScanCache(db, "demo", scan_cache.ruleset_hash("demo", ["a"])) as cache:
+        assert cache.get_many(blobs) == {}  # the stale ruleset's rows were dropped
+    with scan_cache.ScanCache(db, "other", scan_cache.ruleset_hash("other", ["a"])) as cache:
+        assert cache.get_many(blobs[:1]) == {blobs[0]: True}  # other scopes are untouched
+
+
+def test_source_exposure_rescans_only_changed_blobs(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+    db = tmp_path / "scan.sqlite"
+    cold = checker.build_report(repo, POLICY, cache_path=db)
+    assert cold["cache"]["rescanned"] == cold["counts"]["files_scanned"] + cold["counts"]["files_skipped"]
+    assert _stable(cold) == _stable(checker.build_report(repo, POLICY))
+    assert any(f["path"] == "src/token.txt" for f in cold["findings"])
+
+    warm = checker.build_report(repo, POLICY, cache_path=db)
+    assert warm["cache"]["rescanned"] == 0 and _stable(warm) == _stable(cold)
+
+    (repo / "src" / "mod03.py").write_text("k = 'ghp_" + "z" * 36 + "'\n", "utf-8")
+    (repo / "src" / "mod04.py").write_text("value_4 = 44\n", "utf-8")
+    (repo / "src" / "token.txt").write_text("key = redacted\n", "utf-8")
+    _git(repo, "commit", "-qam", "three files")
+    diff = checker.build_report(repo, POLICY, cache_path=db)
+    assert diff["cache"]["rescanned"] == 3
+    assert _stable(diff) == _stable(checker.build_report(repo, POLICY))
+
+    (repo / "src" / "mod05.py").write_text("edited_but_not_committed = 1\n", "utf-8")
+    dirty = checker.build_report(repo, POLICY, cache_path=db, workers=2)
+    assert dirty["cache"]["rescanned"] == 1
+    assert _stable(dirty) == _stable(checker.build_report(repo, POLICY))
+
+
+def test_fips_content_checks_agree_with_and_without_cache(tmp_path: Path) -> None:
+    fips = fips_checker.load()
+    repo = _repo(tmp_path)
+    (repo / "src" / "store.py").write_text("bucket = 'object-lock'  # WORM\n", "utf-8")
+    db = tmp_path / "scan.sqlite"
+    checks = (fips.check_algo_scan, fips.check_tls_version, fips.check_audit_worm)
+    plain = [check(repo) for check in checks]
+    assert plain[0].status == "fail" and plain[1].evidence and plain[2].status == "pass"
+    assert [check(repo, db) for check in checks] == plain
+    assert [check(repo, db) for check in checks] == plain  # answered from the cache
+
+    (repo / "src" / "legacy.py").write_text("import hashlib\n", "utf-8")
+    (repo / "src" / "store.py").unlink()
+    again = [check(repo, db) for check in checks]
+    assert again == [check(repo) for check in checks]
+    assert again[0].status == "pass" and again[2].status == "fail"
+
+
+def test_prohibited_algorithm_check_agrees_with_and_without_cache(tmp_path: Path) -> None:
+    from compliance_checker import ComplianceChecker, RepoResult
+
+    repo = _repo(tmp_path)
+    (repo / "src" / "cipher.py").write_text("mode = 'AES-256-ECB'\n", "utf-8")
+    db = tmp_path / "scan.sqlite"
+
+    def violations(cache_path):
+        result = RepoResult(repo_name="demo", layer="", role="", priority="", status="")
+        ComplianceChecker(cache_path=cache_path)._check_no_prohibited_algorithms({"name": "demo"}, repo, result)
+        return sorted(v.detail for v in result.violations)
+
+    plain = violations(None)
+    assert len(plain) == 2 and any("legacy.py" in d for d in plain)
+    assert violations(db) == plain and violations(db) == plain
@@ -0,0 +1,187 @@
+"""The shared one-walk scan engine reports exactly what per-check, per-line scanning reports.
+
+Per-line rules must hit the same (file, line, rule) triples as testing every
+applicable rule against every line — the buffer prefilter may only skip work —
+and per-file rules must keep each check's first-match-per-file semantics. The
+FIPS content checks run together must equal the historical separate walks.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import random
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+import fips_checker  # noqa: E402
+from automation import scan_engine  # noqa: E402
+from automation.scan_engine import Rule, ScanEngine, _is_line_local, sre_parse  # noqa: E402
+
+
+def _line_local(pattern: str) -> bool:
+    return _is_line_local(sre_parse.parse(pattern))
+
+
+def test_line_local_classification() -> None:
+    for pattern in (r"\bmd5\b", r"AES.*ECB", r"(foo|ba[rz])+\B", r"(?P<q>['\"])x(?P=q)"):
+        assert _line_local(pattern), pattern
+    for pattern in (r"^import md5", r"md5$", r"\bdes\b(?![-_]?3)", r"(?<=x)y", r"a|(\Ab)", r"(a(?=b))*"):
+        assert not _line_local(pattern), pattern
+
+
+RULE_PATTERNS = [
+    r"\bmd5\b", r"^def ", r"ok$", r"des(?!3)", r"(?<![a-z])rc4", r"sha[-_]?1\b", r"x\s+y", r"AES.*ECB",
+    r"\Bmid\B", r"(?i)tls1_[012]",
+]
+WORDS = ["md5", "def ", "ok", "des3", "des", "xrc4", " rc4", "sha-1", "sha1x", "x  y", "AES_ECB", "amidb",
+         "TLS1_2", "plain", "\t"]
+SEPARATORS = ["\n", "\r\n", "\r", "\x0c", "\x1e", " "]
+
+
+def _reference(rules: list[Rule], root: Path, files: list[Path]) -> dict[str, list[tuple]]:
+    out: dict[str, list[tuple]] = {rule.check: [] for rule in rules}
+    for path in files:
+        name, rel = path.name.lower(), path.relative_to(root).as_posix().lower()
+
+        def match(globs: tuple[str, ...]) -> bool:
+            return any(fnmatch.fnmatchcase(rel if "/" in g else name, g) for g in globs)
+
+        def applies(rule: Rule) -> bool:
+            return match(rule.include) and not match(rule.exclude)
+
+        text = path.read_text("utf-8", errors="replace")
+        per_file: dict[str, tuple] = {}
+        for rule in rules:
+            if applies(rule) and not rule.per_line and rule.check not in per_file and rule.pattern.search(text):
+                per_file[rule.check] = (path, rule.id, None, None)
+        line_hits = [
+            (path, rule.id, lineno, line.strip())
+            for lineno, line in enumerate(text.splitlines(), start=1)
+            for rule in rules
+            if applies(rule) and rule.per_line and rule.pattern.search(line)
+        ]
+        for check in out:
+            out[check].extend(h for h in [per_file.get(check)] if h)
+            out[check].extend(h for h in line_hits if next(r for r in rules if r.id == h[1]).check == check)
+    return out
+
+
+def _flatten(hits):
+    return {check: [(h.path, h.rule.id, h.line, h.text) for h in found] for check, found in hits.items()}
+
+
+def test_engine_matches_per_line_reference(tmp_path: Path) -> None:
+    rng = random.Random(25)
+    rules = [Rule("lines", f"l{i}", re.compile(p)) for i, p in enumerate(RULE_PATTERNS)]
+    rules += [Rule("docs", f"d{i}", re.compile(p), include=("*.md",)) for i, p in enumerate(RULE_PATTERNS[:3])]
+    rules += [Rule("files", f"f{i}", re.compile(p), per_line=False, exclude=("sub/*",))
+              for i, p in enumerate(RULE_PATTERNS[::-1])]
+    files = []
+    for i in range(120):
+        path = tmp_path / ("sub" if i % 3 == 0 else "top") / f"f{i}.{'md' if i % 4 == 0 else 'py'}"
+        path.parent.mkdir(exist_ok=True)
+        lines = ["".join(rng.choice(WORDS) for _ in range(rng.randrange(0, 5))) for _ in range(rng.randrange(1, 12))]
+        path.write_bytes("".join(line + rng.choice(SEPARATORS) for line in lines).encode("utf-8"))
+        files.append(path)
+
+    got = _flatten(ScanEngine(rules).scan(tmp_path, files, scope="test"))
+    assert got == _reference(rules, tmp_path, files)
+    assert got["lines"] and got["docs"] and got["files"]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@example.invalid", *args],
+                   cwd=repo, check=True, stdout=subprocess.DEVNULL)
+
+
+def test_cached_results_depend_on_which_rules_apply(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("h = md5(x)\n", "utf-8")
+    (repo / "b.md").write_text("h = md5(x)\n", "utf-8")  # the same blob at a path the rule skips
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "init")
+    engine = ScanEngine([Rule("algo", "md5", re.compile(r"\bmd5\b"), exclude=("*.md",))])
+    db = tmp_path / "scan.sqlite"
+    for _ in range(2):
+        hits = engine.scan(repo, sorted(repo.glob("*.*")), scope="test", cache_path=db)
+        assert [(h.path.name, h.line) for h in hits["algo"]] == [("a.py", 1)]
+
+
+def test_cache_keys_cover_regex_flags_and_the_scan_version(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("h = MD5(x)\n", "utf-8")
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "init")
+    db = tmp_path / "scan.sqlite"
+
+    def scan(flags: int = 0) -> list[int | None]:
+        engine = ScanEngine([Rule("algo", "md5", re.compile(r"\bmd5\b", flags))])
+        return [h.line for h in engine.scan(repo, [repo / "a.py"], scope="test", cache_path=db)["algo"]]
+
+    assert scan() == [] and scan(re.IGNORECASE) == [1]
+    scanned: list[str] = []
+    real = ScanEngine._scan_text
+    monkeypatch.setattr(ScanEngine, "_scan_text", lambda self, text, plan: scanned.append(text) or real(self, text, plan))
+    assert scan(re.IGNORECASE) == [1] and scanned == []  # warm
+    monkeypatch.setattr(scan_engine, "CONTENT_SCAN_VERSION", scan_engine.CONTENT_SCAN_VERSION + 1)
+    assert scan(re.IGNORECASE) == [1] and len(scanned) == 1  # new scan code: rescanned
+
+
+def test_fips_content_checks_match_separate_walks() -> None:
+    fips = fips_checker.load()
+    source = ROOT / "tools"
+
+    algo = [(re.compile(p, re.IGNORECASE), d, r) for p, d, r in fips.DISALLOWED_ALGO_PATTERNS]
+    algo_findings = []
+    for path in fips._walk_source_files(source, skip_extensions=fips.ALGO_SCAN_SKIP_EXTENSIONS):
+        text = path.read_text(encoding="utf-8", errors="replace")
+        for lineno, line in enumerate(text.splitlines(), start=1):
+            algo_findings += [(str(path), lineno, d, line.strip()) for regex, d, _ in algo if regex.search(line)]
+    worm = [re.compile(p, re.IGNORECASE) for p in fips.WORM_PATTERNS]
+    worm_evidence = [
+        f"WORM/immutable storage reference found in: {path}"
+        for path in fips._walk_source_files(source)
+        if any(p.search(path.read_text(encoding="utf-8", errors="replace")) for p in worm)
+    ]
+
+    together = fips.run_content_checks(source)
+    assert list(together) == list(fips.CONTENT_CHECKS)
+    assert [(f.file, f.line, f.message.split(": ", 1)[1], f.detail)
+            for f in together["algo-scan"].findings] == algo_findings
+    assert together["audit-worm"].evidence == worm_evidence
+    assert together["tls-version"] == fips.check_tls_version(source)
+    assert together["algo-scan"] == fips.check_algo_scan(source)
+
+
+def test_buffer_patterns_widen_non_local_rules(tmp_path: Path) -> None:
+    from automation.scan_engine import buffer_pattern
+
+    local = re.compile(r"\bmd5\b", re.IGNORECASE)
+    assert buffer_pattern(local) is local
+    relaxed = buffer_pattern(re.compile(r"^\bdes\b(?![-_]?3)$", re.IGNORECASE))
+    assert relaxed.search("x\nuses DES-3 here\n") and not relaxed.search("desk")
+    assert buffer_pattern(re.compile(r"(a)(?=b)\1")) is None
+    for pattern in (r"(?>a(?=c)|ab)c", r"(?:a(?=c)|ab)++c"):  # widened, these would miss "abc"
+        assert re.search(pattern, "abc") and buffer_pattern(re.compile(pattern)) is None
+        (tmp_path / "a.txt").write_text("x\nabc\n", "utf-8")
+        engine = ScanEngine([Rule("t", "r", re.compile(pattern))])
+        assert [h.line for h in engine.scan(tmp_path, [tmp_path / "a.txt"], scope="test")["t"]] == [2]
+
+
+def test_ascii_folds_cover_every_case_insensitive_match() -> None:
+    import _sre
+
+    from automation.scan_engine import _ASCII_FOLDS, _fold
+
+    lowers = {cp: chr(_sre.unicode_tolower(cp)) for cp in range(0x80, 0x110000) if _sre.unicode_tolower(cp) < 0x80}
+    extra = {c: chr(a) for a, cs in re._casefix._EXTRA_CASES.items() if a < 0x80 for c in cs}
+    assert _ASCII_FOLDS == {**lowers, **extra}
+    assert re.search("sha1", "ſha1 K", re.IGNORECASE) and "sha1" in _fold("ſha1 K")
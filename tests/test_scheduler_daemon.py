@@ -47,3 +47,21 @@ def test_end_to_end_enqueue_then_drain_produces_beacon(tmp_path, monkeypatch):
     assert DurableQueue().empty()  # event consumed
     inbox = DurableQueue(state_dir() / "beacons")
     assert inbox.qsize() == 1  # and a beacon was emitted for it
+
+
+def test_beacons_carry_the_cascade_from_the_resident_engine(tmp_path, monkeypatch):
+    from engines.propagation_engine import resident_engine
+
+    monkeypatch.setenv("SOCIOSPHERE_STATE_DIR", str(tmp_path))
+    engine = resident_engine()
+    engine.current()
+    loads = engine.get_metrics()["loads"]
+
+    for _ in range(3):
+        scheduler.observe_and_beacon({"event": "push", "repo": "SocioProphet/albert-plugin-caffeine"})
+
+    inbox = DurableQueue(state_dir() / "beacons")
+    beacons = [inbox.get_nowait() for _ in range(3)]
+    want = engine.current().compute_cascade("albert-plugin-caffeine")
+    assert want and all(b["cascade"] == want for b in beacons)
+    assert engine.get_metrics()["loads"] == loads  # served from the resident snapshot, not reloaded
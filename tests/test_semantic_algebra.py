@@ -0,0 +1,166 @@
+"""The vendored kernel's Term is hash-consed, and interning changes no observable result.
+
+Structurally equal terms must be ONE object (so equality is identity and hashing is
+O(1)), carry a stable id, and keep the memoized layer/code/canonical JSON/role map in
+agreement with a from-scratch structural recomputation. Dataclass behaviour —
+`fields`, `replace`, `asdict`, repr, pickling — must be what it was.
+
+TermSet's indexed queries (`matching`/`pullback`, `neighbours`, `nearest`, `headed`)
+must return exactly what the brute-force scans return.
+"""
+
+import copy
+import dataclasses
+import gc
+import json
+import pickle
+import random
+
+import pytest
+
+from procyber.semantic import BOTTOM, LayerError, Term, add, distance, mul, prim, pullback
+from procyber.semantic.semantic_algebra import (
+    ACT, FST, NIL, POT, PRIMITIVES, ROLES, SND, TRD, TermSet, _pullback_scan, bind_tiered, neighbours,
+)
+
+
+def _structural_code(t):
+    if t.primitive is not None:
+        return t.primitive
+    return f"({_structural_code(t.ground)} {_structural_code(t.differentia)} {_structural_code(t.mode)})"
+
+
+def _structural_distance(a, b):
+    """The pre-interning definition: recursive, comparing by code."""
+    if _structural_code(a) == _structural_code(b):
+        return 0
+    if a.is_leaf or b.is_leaf:
+        return 1
+    return sum(_structural_distance(getattr(a, r), getattr(b, r)) > 0 for r in ROLES) or 1
+
+
+def _layer2():
+    l1 = [mul(prim(a), prim(b)) for a in (POT, ACT, FST) for b in (SND, TRD)]
+    return [mul(g, d, m) for g in l1[:3] for d in l1 for m in l1[:2]]
+
+
+def test_structurally_equal_terms_are_one_object():
+    a = mul(mul(prim(FST), prim(POT)), mul(prim(SND), prim(ACT)))
+    b = mul(mul(prim(FST), prim(POT)), mul(prim(SND), prim(ACT)))
+    assert a is b and a == b and hash(a) == hash(b) and a.id == b.id
+    assert Term(primitive=NIL) is prim(NIL)
+    assert mul(prim(FST), prim(POT)) is not mul(prim(POT), prim(FST))  # non-commutative
+    assert len({mul(prim(x), prim(y)) for x in PRIMITIVES for y in PRIMITIVES}) == 36
+    assert a != "(((FST POT NIL) (SND ACT NIL) ((NIL NIL NIL)))"
+
+
+def test_ids_are_stable_and_never_reused():
+    keep = mul(prim(TRD), prim(TRD))
+    first = keep.id
+    gone = mul(prim(ACT), prim(TRD), prim(POT)).id
+    gc.collect()
+    assert mul(prim(TRD), prim(TRD)).id == first
+    assert mul(prim(ACT), prim(TRD), prim(POT)).id != gone  # the dead term's id is retired
+
+
+def test_memoized_properties_match_structural_recomputation():
+    for t in _layer2():
+        assert t.layer == 2
+        assert t.code() == _structural_code(t)
+        assert t.canonical() == json.dumps(t.to_json(), sort_keys=True, separators=(",", ":"))
+        assert dict(t.roles()) == {"ground": t.ground, "differentia": t.differentia, "mode": t.mode}
+    assert prim(POT).roles() == {} and prim(POT).canonical() == '"POT"'
+    with pytest.raises(TypeError):
+        _layer2()[0].roles()["ground"] = prim(NIL)  # the shared role map is read-only
+
+
+def test_distance_matches_the_recursive_definition():
+    terms = _layer2()
+    for a in terms:
+        for b in terms:
+            assert distance(a, b) == _structural_distance(a, b)
+    with pytest.raises(LayerError):
+        distance(terms[0], prim(NIL))
+    with pytest.raises(LayerError):
+        distance(terms[0], BOTTOM)
+
+
+def test_dataclass_behaviour_is_unchanged():
+    t = mul(prim(FST), prim(POT))
+    assert [f.name for f in dataclasses.fields(Term)] == ["primitive", "ground", "differentia", "mode"]
+    assert dataclasses.replace(t, mode=prim(ACT)) is mul(prim(FST), prim(POT), prim(ACT))
+    assert dataclasses.asdict(prim(SND)) == {"primitive": "SND", "ground": None,
+                                             "differentia": None, "mode": None}
+    assert repr(prim(SND)) == "Term(primitive='SND', ground=None, differentia=None, mode=None)"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        t.primitive = NIL
+    assert pickle.loads(pickle.dumps(t)) is t
+    assert copy.deepcopy(t) is t and copy.copy(t) is t
+    with pytest.raises(ValueError):
+        Term()
+    with pytest.raises(ValueError):
+        Term(primitive=NIL, ground=prim(NIL))
+    with pytest.raises(ValueError):
+        Term(primitive="XYZ")
+
+
+def test_set_operations_see_interned_terms():
+    terms = _layer2()
+    cells = add(*terms)
+    kept = pullback(cells, {"ground": terms[0].ground})
+    assert kept is not BOTTOM
+    assert {t.code() for t in kept} == {t.code() for t in terms if t.ground is terms[0].ground}
+    assert add(*reversed(terms)) == cells
+
+
+def _random_set(seed, n, layer=2):
+    rng = random.Random(seed)
+
+    def term(level):
+        if level == 0:
+            return prim(rng.choice(PRIMITIVES[:3]))  # a small alphabet, so roles collide often
+        return mul(term(level - 1), term(level - 1), term(level - 1))
+
+    return add(*(term(layer) for _ in range(n)))
+
+
+def test_indexed_pullback_matches_the_scan():
+    cells = _random_set(1, 400)
+    fillers = sorted({t.ground for t in cells} | {t.mode for t in cells}, key=lambda t: t.code())
+    rng = random.Random(2)
+    for _ in range(200):
+        constraint = {r: rng.choice(fillers) for r in rng.sample(ROLES, rng.randrange(0, 4))}
+        got, want = pullback(cells, constraint), _pullback_scan(cells, constraint)
+        assert got is want if want is BOTTOM else got == want
+    assert pullback(add(prim(FST), prim(SND)), {"ground": prim(NIL)}) is BOTTOM
+    with pytest.raises(KeyError):
+        pullback(cells, {"genus": fillers[0]})
+
+
+def test_indexed_neighbours_and_nearest_match_brute_force():
+    for layer, n in ((0, 6), (1, 30), (2, 400)):
+        cells = _random_set(layer, n, layer)
+        probes = list(_random_set(layer + 10, 40, layer)) + list(cells)[:20]
+        for target in probes:
+            ranked = sorted(cells, key=lambda c: (distance(target, c), c.code()))
+            for radius in range(-1, 5):
+                assert cells.neighbours(target, radius) == neighbours(target, cells.terms, radius)
+            for k in (0, 1, 3, 25, n + 5):
+                assert cells.nearest(target, k) == tuple(ranked[:k])
+    cells = _random_set(3, 50)
+    assert cells.neighbours(prim(NIL)) == () and cells.nearest(prim(NIL), 3) == ()
+
+
+def test_headed_and_tiered_binding_use_the_index_consistently():
+    def head(t):
+        return head(t.ground) if t.ground is not None else t.primitive
+
+    cells = _random_set(4, 300)
+    for symbol in PRIMITIVES:
+        assert cells.headed(symbol) == {t for t in cells if head(t) == symbol}
+    upper = TermSet(frozenset({t.ground for t in cells}))
+    for query in list(upper)[:20] + list(_random_set(5, 20, 1)):
+        anchors = neighbours(query, upper.terms, radius=1)
+        admitted = sorted((c for c in cells if anchors and c.ground is anchors[0]), key=lambda t: t.code())
+        assert bind_tiered(query, upper, cells) is (admitted[0] if admitted else BOTTOM)
+    assert pickle.loads(pickle.dumps(cells)) == cells
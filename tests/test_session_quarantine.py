@@ -309,3 +309,138 @@ class TestReceiptSerialization:
         d = receipts[0].to_dict()
         assert d["recovered_session_id"] == "ses-ser"
         assert isinstance(d["receipt_id"], str) and len(d["receipt_id"]) > 0
+
+
+# ---------------------------------------------------------------------------
+# Correlation index and retention
+# ---------------------------------------------------------------------------
+
+def _scan_match(proto, event):
+    """The exhaustive pre-index match: first key, then first session, then first event."""
+    for key in ("conversation_id", "parent_id", "workspace_id", "task_id"):
+        value = event.get(key)
+        if not value:
+            continue
+        for session_id, node in proto._sessions.items():
+            if any(e.get(key) == value for e in node.events):
+                return session_id
+    return None
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCorrelationIndex:
+    """Index lookups must pick the session the exhaustive scan picks."""
+
+    def test_index_agrees_with_scan_on_random_traffic(self):
+        import random
+
+        rng = random.Random(22)
+        proto = SessionQuarantineProtocol(ttl_seconds=300)
+        keys = ("conversation_id", "parent_id", "workspace_id", "task_id")
+        for s in range(40):
+            proto.register_session(f"ses-{s}")
+        for i in range(600):
+            event = {"event_id": f"e{i}", "session_id": f"ses-{rng.randrange(60)}"}
+            for key in rng.sample(keys, rng.randrange(0, 3)):
+                event[key] = f"{key[:2]}-{rng.randrange(50)}"
+            if i % 50 == 0:
+                proto.register_session(f"late-{i}")
+                proto._sessions[f"late-{i}"].events.append(dict(event, event_id=f"seed{i}"))
+            probe = {k: f"{k[:2]}-{rng.randrange(50)}" for k in rng.sample(keys, 2)}
+            proto._sync_index()
+            assert proto._find_matching_session(probe) == _scan_match(proto, probe)
+            proto.event_received(event)
+            if i % 100 == 99:
+                proto.reconcile()
+
+    def test_key_priority_and_registration_order_decide(self):
+        proto = SessionQuarantineProtocol()
+        for sid in ("ses-old", "ses-new"):
+            proto.register_session(sid)
+        proto.event_received({"event_id": "n1", "session_id": "ses-new", "task_id": "t",
+                              "conversation_id": "c"})
+        proto.event_received({"event_id": "o1", "session_id": "ses-old", "task_id": "t"})
+        orphan = {"event_id": "x", "session_id": "gone", "task_id": "t", "conversation_id": "c"}
+        proto.event_received(orphan)
+        proto.reconcile()
+        # conversation_id outranks task_id, even though ses-old also carries the task
+        assert proto.get_receipts()[0].recovered_session_id == "ses-new"
+
+    def test_recovered_orphan_is_indexed_for_later_orphans(self):
+        proto = SessionQuarantineProtocol()
+        proto.register_session("ses-a")
+        proto.event_received({"event_id": "a0", "session_id": "ses-a", "parent_id": "p"})
+        proto.event_received({"event_id": "o1", "session_id": "?", "parent_id": "p", "task_id": "t"})
+        proto.event_received({"event_id": "o2", "session_id": "?", "task_id": "t"})
+        proto.reconcile()
+        assert [r.recovered_session_id for r in proto.get_receipts()] == ["ses-a", "ses-a"]
+
+    def test_unhashable_values_still_match(self):
+        proto = SessionQuarantineProtocol()
+        proto.register_session("ses-l")
+        proto._sessions["ses-l"].events.append({"event_id": "s", "workspace_id": ["w", 1]})
+        proto.event_received({"event_id": "o", "session_id": "?", "workspace_id": ["w", 1]})
+        proto.reconcile()
+        assert proto.get_receipts()[0].recovered_session_id == "ses-l"
+
+
+class TestRetention:
+    """Sessions, settled orphans and receipts expire only when a window is configured."""
+
+    def test_nothing_expires_by_default(self):
+        proto = SessionQuarantineProtocol(ttl_seconds=0)
+        proto.register_session("ses-a")
+        proto.event_received({"event_id": "o", "session_id": "?"})
+        proto.reconcile()
+        assert proto.expire() == 0
+        assert proto.get_session("ses-a") is not None
+        assert len(proto.get_receipts()) == 1 and "o" in proto._orphan_queue
+
+    def test_idle_sessions_expire_and_leave_the_index(self):
+        clock = _FakeClock()
+        proto = SessionQuarantineProtocol(session_ttl_seconds=60, clock=clock)
+        proto.register_session("ses-idle")
+        proto.register_session("ses-busy")
+        proto.event_received({"event_id": "i", "session_id": "ses-idle", "task_id": "t"})
+        clock.now += 45
+        proto.event_received({"event_id": "b", "session_id": "ses-busy", "task_id": "t"})
+        clock.now += 30  # idle: 75 s since its last event; busy: 30 s
+        assert proto.expire() == 1
+        assert proto.get_session("ses-idle") is None and proto.get_session("ses-busy") is not None
+        assert proto._find_matching_session({"task_id": "t"}) == "ses-busy"
+        assert proto.event_received({"event_id": "late", "session_id": "ses-idle"}) == "orphaned"
+        clock.now += 60
+        proto.expire()
+        assert proto.get_sessions() == {}
+        assert all(not v for v in proto._index.values())
+
+    def test_settled_orphans_and_receipts_expire_after_retention(self):
+        clock = _FakeClock()
+        proto = SessionQuarantineProtocol(ttl_seconds=0, retention_seconds=120, clock=clock)
+        proto.event_received({"event_id": "q1", "session_id": "?"})
+        proto.reconcile()
+        clock.now += 100
+        proto.event_received({"event_id": "q2", "session_id": "?"})
+        proto.reconcile()
+        assert [r.event_id for r in proto.get_receipts()] == ["q1", "q2"]
+        clock.now += 30
+        proto.reconcile()  # expiry runs first
+        assert [r.event_id for r in proto.get_receipts()] == ["q2"]
+        assert "q1" not in proto._orphan_queue and "q1" not in proto._reconcile_counts
+        assert "q2" in proto._orphan_queue
+
+    def test_pending_orphans_are_not_subject_to_retention(self):
+        clock = _FakeClock()
+        proto = SessionQuarantineProtocol(ttl_seconds=DEFAULT_TTL_SECONDS, retention_seconds=0,
+                                          clock=clock)
+        proto.event_received({"event_id": "wait", "session_id": "?"})
+        clock.now += 10_000
+        proto.reconcile()
+        assert [e.event_id for e in proto.get_orphan_queue()] == ["wait"]
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import json
 import subprocess
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+import check_source_exposure as checker  # noqa: E402
+
 
 def test_source_exposure_checker_blocks_private_key(tmp_path: Path) -> None:
     repo = tmp_path / "repo"
@@ -74,3 +78,65 @@ def test_source_exposure_checker_allows_redacted_example(tmp_path: Path) -> None
     assert cp.returncode == 0
     report = json.loads(cp.stdout)
     assert report["result"] == "pass"
+
+
+def _line_by_line(path: Path, root: Path, policy: dict) -> list:
+    """The previous content scan: every rule against every line."""
+    import re
+
+    raw = path.read_bytes()
+    if b"\0" in raw:
+        return []
+    out = []
+    for line_no, line in enumerate(raw.decode("utf-8", errors="replace").splitlines(), start=1):
+        for rule in policy["content_rules"]:
+            if re.search(rule["pattern"], line):
+                severity = rule.get("severity", "warn")
+                out.append({"rule_id": rule.get("id", "unnamed-rule"),
+                            "severity": severity if severity in ("block", "warn", "info") else "warn",
+                            "path": path.relative_to(root).as_posix(), "line": line_no,
+                            "message": rule.get("description", "source exposure rule matched")})
+    return out
+
+
+def test_rule_literals_are_required_by_every_match() -> None:
+    assert checker.rule_literals(r"\bAKIA[0-9A-Z]{16}\b") == (["AKIA"], False)
+    assert checker.rule_literals(r"(?i)\b(PROD|PRODUCTION)_X") == (["PRODUCTION_X", "PROD_X"], True)
+    assert checker.rule_literals(r"x(ab|cd)+y") == (["ab", "cd"], False)
+    assert checker.rule_literals(r"[^a]+\d") is None
+    assert checker.rule_literals(r"a|.") is None  # one branch requires nothing
+
+
+def test_compiled_scanner_matches_line_by_line_scan(tmp_path: Path) -> None:
+    import random
+
+    policy = json.loads(Path("standards/source-exposure/policy.v0.json").read_text("utf-8"))
+    policy["content_rules"] += [
+        {"id": "no-literal", "severity": "info", "pattern": r"^\s*[0-9a-f]{40}\s*$"},
+        {"id": "odd-severity", "severity": "loud", "pattern": r"(?i)kelvin"},
+    ]
+    pieces = ["AKIA" + "B" * 16, "ghp_" + "x" * 36, "xoxb-" + "1" * 12, "AIza" + "q" * 35,
+              "-----BEGIN " + "EC PRIVATE KEY-----", "production_api_key =", "PROD_TOKEN=",
+              "KELVIN Kelvin", "a" * 40, "plain words", "AKIA short", " ", "\r", "\x0c"]
+    rng = random.Random(23)
+    for i in range(60):
+        body = "".join(rng.choice(pieces) + rng.choice(["\n", " ", "\r\n", ""]) for _ in range(30))
+        (tmp_path / f"f{i}.txt").write_text(body, "utf-8")
+    scanner = checker.ContentScanner(policy)
+    for path in sorted(tmp_path.iterdir()):
+        findings, skipped = scanner.scan(path, tmp_path)
+        assert not skipped and findings == _line_by_line(path, tmp_path, policy)
+
+
+def test_parallel_report_equals_serial(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for i in range(40):
+        (repo / f"m{i}.py").write_text(f"x = 1\nPROD_SECRET = 'v{i}'\n" if i % 3 else "ok\n", "utf-8")
+    (repo / "id_rsa").write_text("-----BEGIN " + "PRIVATE KEY-----\n", "utf-8")
+    (repo / "blob.bin").write_bytes(b"AKIA\0")
+    policy = Path("standards/source-exposure/policy.v0.json").resolve()
+    serial = checker.build_report(repo, policy)
+    parallel = checker.build_report(repo, policy, workers=3)
+    assert serial["findings"] and parallel["findings"] == serial["findings"]
+    assert parallel["counts"] == serial["counts"]
@@ -1,5 +1,7 @@
 """Telemetry + alerting over the self-heal receipt streams."""
 
+from pathlib import Path
+
 import pytest
 
 from automation import telemetry
@@ -36,6 +38,26 @@ def test_collect_counts(tmp_path):
     assert m["queue_depth"]["decisions"] == 6
 
 
+def test_queue_depth_counts_pending_receipts_not_history(tmp_path):
+    dec = _seed(tmp_path)
+    telemetry.collect(state=tmp_path)
+    dec.get_many(4)                                    # a consumer drains part of the queue
+    m = telemetry.collect(state=tmp_path)
+    assert m["queue_depth"]["decisions"] == 2
+    assert m["decisions_total"] == 6                   # the cumulative counter keeps history
+
+
+def test_file_peek_since_reads_only_new_entries(tmp_path, monkeypatch):
+    dec = _seed(tmp_path)
+    last = dec.peek_since(None)[-1][0]
+    dec.put({"beacon_kind": "x", "action": "escalate_human"})
+    reads = []
+    real = Path.read_text
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **k: reads.append(self.name) or real(self, *a, **k))
+    assert [e["beacon_kind"] for _id, e in dec.peek_since(last)] == ["x"]
+    assert len(reads) == 1
+
+
 def test_decline_is_not_a_healing_failure(tmp_path):
     # a propose_pr that correctly declined (no computable fix) must not inflate the drift signal
     DurableQueue(tmp_path / "decisions").put(
@@ -97,3 +119,55 @@ def test_cli_alerts_exit_code(tmp_path, monkeypatch, capsys):
     assert telemetry.main(["--alerts"]) == 1           # alerts firing -> nonzero (probe with teeth)
     assert telemetry.main([]) == 0                      # metrics print -> ok
     assert "sociosphere_selfheal" in capsys.readouterr().out
+
+
+def test_collect_folds_only_new_receipts(tmp_path, monkeypatch):
+    from automation import decision_aggregate
+
+    dec = _seed(tmp_path)
+    assert telemetry.collect(state=tmp_path)["decisions_total"] == 6
+    folded = []
+    real_fold = decision_aggregate.fold
+    monkeypatch.setattr(decision_aggregate, "fold", lambda agg, r: folded.append(r) or real_fold(agg, r))
+    dec.put({"beacon_kind": "mirror_drift", "verdict": "sealed", "action": "auto_fix",
+             "execution": {"healed": True}})
+    m = telemetry.collect(state=tmp_path)
+    assert m["decisions_total"] == 7 and m["heals_total"] == 2
+    assert len(folded) == 1                            # the checkpoint covers the first six
+    telemetry.collect(state=tmp_path)
+    assert len(folded) == 1
+
+
+def test_late_receipt_below_watermark_is_counted_once(tmp_path):
+    _seed(tmp_path)
+    telemetry.collect(state=tmp_path)
+    # A slow writer publishes a receipt stamped just before the newest one already folded.
+    newest = sorted(p.stem for p in (tmp_path / "decisions").glob("*.json"))[-1]
+    stamp = int(newest.split("-", 1)[0]) - 1
+    (tmp_path / "decisions" / f"{stamp:020d}-late.json").write_text(
+        '{"beacon_kind": "x", "action": "escalate_human"}', encoding="utf-8")
+    assert telemetry.collect(state=tmp_path)["escalations_total"] == 3
+    assert telemetry.collect(state=tmp_path)["escalations_total"] == 3
+
+
+def test_aggregate_survives_restart_and_is_shared_with_learning(tmp_path):
+    from automation import decision_aggregate, learning
+
+    _seed(tmp_path)
+    telemetry.collect(state=tmp_path)
+    learning.analyze(tmp_path, min_samples=100)
+    agg = decision_aggregate._load(tmp_path / decision_aggregate.AGGREGATE_FILE)
+    assert agg["decisions_total"] == 6                  # one fold, not one per consumer
+    assert agg["outcomes_by_kind"]["mirror_drift"] == {"attempts": 2, "failures": 1}
+
+
+def test_sqlite_backed_decisions_fold_incrementally(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOCIOSPHERE_QUEUE_BACKEND", "sqlite")
+    from automation.durable_queue import open_queue
+
+    dec = open_queue(tmp_path / "decisions")
+    dec.put_many([{"action": "escalate_human"}, {"action": "auto_fix", "execution": {"healed": True}}])
+    assert telemetry.collect(state=tmp_path)["decisions_total"] == 2
+    dec.put({"action": "escalate_human"})
+    m = telemetry.collect(state=tmp_path)
+    assert m["decisions_total"] == 3 and m["escalations_total"] == 2
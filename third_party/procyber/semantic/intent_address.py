@@ -29,7 +29,12 @@ as data (the canon lives in Noetica) and does not import from Noetica.
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, Tuple
 
 from procyber.semantic.semantic_algebra import (
     ACT,
@@ -42,6 +47,7 @@ from procyber.semantic.semantic_algebra import (
     TRD,
     SemanticAddress,
     Term,
+    TermSet,
     add,
     bind_tiered,
     distance,
@@ -83,6 +89,11 @@ def column_anchor(column: str) -> Term:
     return mul(prim(SUBSTRATE_PRIM[substrate]), prim(POLARITY_PRIM[polarity]))
 
 
+#: Every column's anchor, and the upper tier they form — fixed, so built once.
+_ANCHORS: Dict[str, Term] = {c: column_anchor(c) for c in COLUMNS}
+_UPPER = add(*_ANCHORS.values())
+
+
 # --------------------------------------------------------------------------- #
 # The 23 rows, by primary column (Noetica intent-router INTENT_ACTION grouping)
 # --------------------------------------------------------------------------- #
@@ -126,14 +137,69 @@ _DISAMBIGUATORS: List[Term] = [mul(prim(a), prim(b)) for a in PRIMITIVES for b i
 _META_COLUMN_ANCHOR = mul(prim(NIL), prim(TRD))
 
 
-def build_intent_addresses() -> Dict[str, SemanticAddress]:
+class Lexicon(dict):
+    """An intent-address mapping that counts its own edits.
+
+    A plain dict in every other respect. `version` moves on every mutation, so a
+    routing table compiled for (this lexicon, this version) stays exact while both are
+    unchanged and `route` can find it without re-reading the lexicon.
+    """
+
+    __slots__ = ("version", "__weakref__")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self.version += 1
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args):
+        try:
+            return super().pop(*args)
+        finally:
+            self.version += 1
+
+    def popitem(self):
+        try:
+            return super().popitem()
+        finally:
+            self.version += 1
+
+    def setdefault(self, key, default=None):
+        try:
+            return super().setdefault(key, default)
+        finally:
+            self.version += 1
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
+def build_intent_addresses() -> "Lexicon":
     """Address every intent row. Topic intents at layer 2; the meta row at layer 3.
 
     Same-column intents land at distance 1; cross-column at distance 2. The meta row
     is built out of an action address, so it sits one layer up — the second-order
     row is a fixed point in the grading, comparable only to other second-order rows.
+    Returned as a `Lexicon`, so `route` over it finds its compiled table in O(1).
     """
-    addrs: Dict[str, SemanticAddress] = {}
+    addrs = Lexicon()
     for i, (name, column) in enumerate(sorted(INTENT_PRIMARY.items())):
         ground = _META_COLUMN_ANCHOR if column == "meta" else column_anchor(column)
         term = mul(ground, _DISAMBIGUATORS[i])
@@ -167,24 +233,121 @@ def route(query_column: str, addresses: Dict[str, SemanticAddress]) -> "Term | o
     Returns the admitted intent's term, or BOTTOM when the column has no intent in
     `addresses` — which is exactly what makes the `sense` wiring gap show up as an
     honest abstention rather than a mis-route.
+
+    Answers come from the compiled `RoutingTable` for the addresses' topic terms. Over
+    a `Lexicon` (what `build_intent_addresses` returns) the table is found by the
+    lexicon's identity and edit count, so a query is O(1); over a plain mapping it is
+    found by fingerprinting the topic terms, which is linear in the lexicon — callers
+    routing many queries over one plain mapping hold `compile_routes` instead.
+    """
+    table = _table_for(addresses)
+    if table is None:
+        return BOTTOM
+    return table.route(query_column)
+
+
+class RoutingTable:
+    """`route` compiled for one lexicon: every column's answer, computed once.
+
+    The six column anchors and their upper-tier TermSet are fixed; the lower tier is
+    the lexicon's layer-2 topic terms, indexed once. Since a query names one of six
+    columns, compiling resolves all six through `bind_tiered` up front and a query
+    is a lookup. Immutable after construction, so one table serves every thread.
+    `content_hash` identifies the lexicon it was compiled from.
     """
+
+    __slots__ = ("topics", "content_hash", "_routes")
+
+    def __init__(self, topics: FrozenSet[Term]) -> None:
+        self.topics = topics
+        self.content_hash = hashlib.sha256(
+            "\n".join(sorted(t.canonical() for t in topics)).encode("utf-8")
+        ).hexdigest()
+        lower = TermSet(topics)
+        self._routes: Dict[str, "Term | object"] = {
+            column: bind_tiered(anchor, _UPPER, lower) for column, anchor in _ANCHORS.items()
+        }
+
+    def route(self, query_column: str) -> "Term | object":
+        if query_column not in self._routes:
+            column_anchor(query_column)  # raises the ValueError naming the valid columns
+        return self._routes[query_column]
+
+
+def compile_routes(addresses: Dict[str, SemanticAddress]) -> "RoutingTable | None":
+    """The routing table for `addresses`; None when there is nothing to route to.
+
+    A caller routing many queries over one plain mapping keeps this and calls
+    `RoutingTable.route`, skipping the per-call fingerprint `route` does.
+    """
+    return _table_for(addresses)
+
+
+#: Tables compiled for live `Lexicon`s: id(lexicon) -> (weakref, version, table). The
+#: weakref's callback drops the entry when the lexicon dies, so a table (and the terms
+#: it holds) lives exactly as long as the lexicon it was compiled for.
+_BY_LEXICON: Dict[int, Tuple["weakref.ref[Lexicon]", int, "RoutingTable | None"]] = {}
+
+#: Compiled routes keyed by the set of topic-term ids — the lexicon's structural
+#: content, since terms are interned and an id is never reused: an edited lexicon
+#: misses, an unchanged one (however rebuilt) hits, and an entry outliving its terms
+#: can never match again. Entries hold the routed terms only weakly, so the cache pins
+#: nothing; a hit (all topic terms alive, the routed ones among them) revives them.
+#: Bounded LRU; the lock guards the bookkeeping.
+_ROUTING_CACHE: "OrderedDict[FrozenSet[int], Tuple[str, Dict[str, object]]]" = OrderedDict()
+_ROUTING_CACHE_SIZE = 16
+_ROUTING_LOCK = threading.Lock()
+_ID = attrgetter("_id")
+
+
+def _table_for(addresses: Dict[str, SemanticAddress]) -> "RoutingTable | None":
+    if not isinstance(addresses, Lexicon):
+        return _table_for_content(addresses)
+    entry = _BY_LEXICON.get(id(addresses))
+    if entry is not None and entry[0]() is addresses and entry[1] == addresses.version:
+        return entry[2]
+    version = addresses.version
+    table = _table_for_content(addresses)
+    key = id(addresses)
+    ref = weakref.ref(addresses, lambda r: _BY_LEXICON.pop(key, None)
+                      if _BY_LEXICON.get(key, (None,))[0] is r else None)
+    _BY_LEXICON[key] = (ref, version, table)
+    return table
+
+
+def _table_for_content(addresses: Dict[str, SemanticAddress]) -> "RoutingTable | None":
     # Guard abstaining addresses: `addr.term is BOTTOM` has no `.layer`, so skip them
     # rather than raise; and if there are no layer-2 topics to route within, abstain.
-    topic_terms = [
-        addr.term for name, addr in addresses.items()
-        if name != META_ROW and addr.term is not BOTTOM and addr.term.layer == 2
-    ]
-    if not topic_terms:
-        return BOTTOM
-    upper = add(*[column_anchor(c) for c in COLUMNS])
-    lower = add(*topic_terms)
-    return bind_tiered(column_anchor(query_column), upper, lower)
+    topics = frozenset(
+        a.term for name, a in addresses.items()
+        if name != META_ROW and a.term is not BOTTOM and a.term.layer == 2
+    )
+    if not topics:
+        return None
+    key = frozenset(map(_ID, topics))
+    with _ROUTING_LOCK:
+        cached = _ROUTING_CACHE.get(key)
+        if cached is not None:
+            _ROUTING_CACHE.move_to_end(key)
+    if cached is not None:
+        routes = {c: r if r is BOTTOM else r() for c, r in cached[1].items()}
+        if None not in routes.values():  # always so: the routed terms are among `topics`
+            table = RoutingTable.__new__(RoutingTable)
+            table.topics, table.content_hash, table._routes = topics, cached[0], routes
+            return table
+    table = RoutingTable(topics)  # compiled outside the lock
+    weak = {c: t if t is BOTTOM else weakref.ref(t) for c, t in table._routes.items()}
+    with _ROUTING_LOCK:
+        _ROUTING_CACHE[key] = (table.content_hash, weak)
+        while len(_ROUTING_CACHE) > _ROUTING_CACHE_SIZE:
+            _ROUTING_CACHE.popitem(last=False)
+    return table
 
 
 def column_fill(addresses: Dict[str, SemanticAddress]) -> Dict[str, int]:
     """How many intents sit under each column (their primary), by address ground."""
     fill = {c: 0 for c in COLUMNS}
-    anchors = {column_anchor(c).code(): c for c in COLUMNS}
+    anchors = {anchor.code(): c for c, anchor in _ANCHORS.items()}
     for name, addr in addresses.items():
         if name == META_ROW or addr.term.layer != 2:
             continue
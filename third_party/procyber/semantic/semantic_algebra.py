@@ -40,7 +40,8 @@ path of every retrieval and every boundary crossing must not take a round-trip.
 
 Conformance notes
 -----------------
-* Terms are immutable and hashable; equality is structural.
+* Terms are immutable and hashable; equality is structural. Terms are
+  hash-consed, so structural equality is object identity.
 * `add` is commutative and normalised (sorted canonical form), so no two
   formally different expressions denote the same set.
 * `mul` is NON-commutative and raises on mixed-layer operands — layer discipline
@@ -59,9 +60,13 @@ Conformance notes
 
 from __future__ import annotations
 
+import itertools
 import json
+import threading
+import weakref
 from dataclasses import dataclass, field
-from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Sequence, Tuple
 
 SPEC_VERSION = "0.2.0"
 
@@ -102,13 +107,20 @@ class LayerError(ValueError):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, eq=False)
 class Term:
     """A point in the algebra: either a primitive (layer 0) or a product.
 
     A product holds exactly three sub-terms, one per role, all at layer n-1;
     the product itself is at layer n. `mode` defaults to the neutral element,
     which is how most words are formed.
+
+    Terms are hash-consed: constructing a term structurally equal to a live one
+    returns that same object, so equality is identity, hashing is O(1), and
+    every term carries a stable integer `id` (never reused within a process)
+    plus memoized layer, code, canonical JSON and role map. Children are
+    interned before their parent, which is what lets the intern key be the
+    children themselves rather than a walk over the tree.
     """
 
     primitive: Optional[str] = None
@@ -116,51 +128,128 @@ class Term:
     differentia: Optional["Term"] = None
     mode: Optional["Term"] = None
 
-    def __post_init__(self) -> None:
-        is_leaf = self.primitive is not None
-        is_product = self.ground is not None
+    def __new__(
+        cls,
+        primitive: Optional[str] = None,
+        ground: Optional["Term"] = None,
+        differentia: Optional["Term"] = None,
+        mode: Optional["Term"] = None,
+    ) -> "Term":
+        key = (primitive, ground, differentia, mode)
+        term = _INTERNED.get(key)
+        if term is not None:
+            return term
+        is_leaf = primitive is not None
+        is_product = ground is not None
         if is_leaf == is_product:
             raise ValueError("a Term is either a primitive or a product, not both/neither")
-        if is_leaf and self.primitive not in PRIMITIVES:
-            raise ValueError(f"unknown primitive {self.primitive!r}")
+        if is_leaf and primitive not in PRIMITIVES:
+            raise ValueError(f"unknown primitive {primitive!r}")
+        with _INTERN_LOCK:
+            term = _INTERNED.get(key)
+            if term is None:
+                term = object.__new__(cls)
+                term.__dict__.update(
+                    primitive=primitive,
+                    ground=ground,
+                    differentia=differentia,
+                    mode=mode,
+                    _id=next(_TERM_IDS),
+                    _layer=0 if is_leaf else ground.layer + 1,  # type: ignore[union-attr]
+                )
+                _INTERNED[key] = term
+        return term
+
+    def __reduce__(self):
+        # Rebuild through the constructor so an unpickled (or copied) term is
+        # re-interned in the receiving process instead of duplicating one.
+        return (Term, (self.primitive, self.ground, self.differentia, self.mode))
+
+    # -- identity --------------------------------------------------------- #
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Term):
+            return self is other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._id
+
+    @property
+    def id(self) -> int:
+        """Stable interned id: equal terms share it, distinct terms never do."""
+        return self._id
 
     # -- grading ---------------------------------------------------------- #
 
     @property
     def layer(self) -> int:
-        if self.primitive is not None:
-            return 0
-        return self.ground.layer + 1  # type: ignore[union-attr]
+        return self._layer
 
     @property
     def is_leaf(self) -> bool:
         return self.primitive is not None
 
-    def roles(self) -> Dict[str, "Term"]:
-        if self.is_leaf:
-            return {}
-        return {
-            "ground": self.ground,  # type: ignore[dict-item]
-            "differentia": self.differentia,  # type: ignore[dict-item]
-            "mode": self.mode,  # type: ignore[dict-item]
-        }
+    def roles(self) -> Mapping[str, "Term"]:
+        roles = self.__dict__.get("_roles")
+        if roles is None:
+            roles = MappingProxyType({} if self.is_leaf else {
+                "ground": self.ground,
+                "differentia": self.differentia,
+                "mode": self.mode,
+            })
+            self.__dict__["_roles"] = roles
+        return roles
 
     # -- canonical form --------------------------------------------------- #
 
     def code(self) -> str:
         """Canonical string form. Layer is readable off the bracket depth."""
+        code = self.__dict__.get("_code")
+        if code is None:
+            if self.is_leaf:
+                code = str(self.primitive)
+            else:
+                code = (
+                    f"({self.ground.code()}"  # type: ignore[union-attr]
+                    f" {self.differentia.code()}"  # type: ignore[union-attr]
+                    f" {self.mode.code()})"  # type: ignore[union-attr]
+                )
+            self.__dict__["_code"] = code
+        return code
+
+    def to_json(self) -> object:
+        """Structural JSON form: a primitive's symbol, or a role -> sub-term object."""
         if self.is_leaf:
-            return str(self.primitive)
-        return (
-            f"({self.ground.code()}"  # type: ignore[union-attr]
-            f" {self.differentia.code()}"  # type: ignore[union-attr]
-            f" {self.mode.code()})"  # type: ignore[union-attr]
-        )
+            return self.primitive
+        return {role: sub.to_json() for role, sub in self.roles().items()}
+
+    def canonical(self) -> str:
+        """`canonical_json(self.to_json())`, memoized and assembled from the children's."""
+        text = self.__dict__.get("_canonical")
+        if text is None:
+            if self.is_leaf:
+                text = canonical_json(self.primitive)
+            else:
+                text = (
+                    f'{{"differentia":{self.differentia.canonical()}'  # type: ignore[union-attr]
+                    f',"ground":{self.ground.canonical()}'  # type: ignore[union-attr]
+                    f',"mode":{self.mode.canonical()}}}'  # type: ignore[union-attr]
+                )
+            self.__dict__["_canonical"] = text
+        return text
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         return self.code()
 
 
+#: The hash-cons table. Weak values: a term nothing references any more drops out,
+#: and its id is retired with it (ids come from a counter and are never reused).
+_INTERNED: "weakref.WeakValueDictionary[tuple, Term]" = weakref.WeakValueDictionary()
+_INTERN_LOCK = threading.Lock()
+_TERM_IDS = itertools.count()
+
+
 def prim(symbol: str) -> Term:
     """Lift a primitive symbol to a layer-0 term."""
     return Term(primitive=symbol)
@@ -222,12 +311,21 @@ def mul(ground: Term, differentia: Term, mode: Optional[Term] = None) -> Term:
 
 def _neutral_at(layer: int) -> Term:
     """The neutral element lifted to `layer` — NIL, NIL*NIL, and so on."""
-    term = NIL_TERM
-    for _ in range(layer):
+    if layer < len(_NEUTRAL):
+        return _NEUTRAL[layer]
+    term = _NEUTRAL[-1]
+    for _ in range(layer - MAX_LAYER):
         term = Term(ground=term, differentia=term, mode=term)
     return term
 
 
+#: Neutral elements by layer, held strongly so they stay interned.
+_NEUTRAL: Tuple[Term, ...] = tuple(itertools.accumulate(
+    range(MAX_LAYER), lambda term, _: Term(ground=term, differentia=term, mode=term),
+    initial=NIL_TERM,
+))
+
+
 @dataclass(frozen=True)
 class TermSet:
     """A normalised union of same-layer terms — the additive side of the ring.
@@ -259,6 +357,105 @@ class TermSet:
     def __len__(self) -> int:
         return len(self.terms)
 
+    def __getstate__(self) -> Dict[str, object]:
+        return {"terms": self.terms}  # the indexes are rebuilt on demand, never shipped
+
+    # -- indexed queries -------------------------------------------------- #
+    #
+    # Built on first use and memoized, like Term's structural properties. Within
+    # a layer `distance` between products is the Hamming distance over the three
+    # (interned) role fillers, so the (role, filler) postings that answer
+    # `pullback` also enumerate exactly the members within a radius: a member at
+    # distance d shares 3 - d fillers with the target. Each query touches only
+    # the target's three postings instead of every member. The brute-force scans
+    # (`neighbours`, `_pullback_scan`) stay as the reference they must agree with.
+
+    def _index(self) -> "_TermSetIndex":
+        index = self.__dict__.get("_term_index")
+        if index is None:
+            index = _TermSetIndex(self.terms)
+            self.__dict__["_term_index"] = index
+        return index
+
+    def headed(self, symbol: str) -> FrozenSet[Term]:
+        """Members whose head — the primitive at the root of the ground spine — is `symbol`."""
+        return self._index().by_head.get(symbol, frozenset())
+
+    def matching(self, constraint: Mapping[str, Term]) -> FrozenSet[Term]:
+        """Products agreeing with `constraint` on every role — `pullback` without the BOTTOM."""
+        if self.layer == 0:
+            return frozenset()
+        unknown = [role for role in constraint if role not in ROLES]
+        if unknown:
+            raise KeyError(unknown[0])
+        by_role = self._index().by_role
+        postings = sorted(
+            (by_role.get((role, want), frozenset()) for role, want in constraint.items()),
+            key=len,
+        )
+        if not postings:
+            return self._index().products
+        return postings[0].intersection(*postings[1:])
+
+    def neighbours(self, target: Term, radius: int = 1) -> Tuple[Term, ...]:
+        """Members within `radius` of `target`, nearest first — `neighbours` over this set."""
+        return tuple(c for _, _, c in sorted(self._within(target, radius)))
+
+    def nearest(self, target: Term, k: int = 1) -> Tuple[Term, ...]:
+        """The `k` members nearest `target`, ordered by (distance, code). Cross-layer: none."""
+        for radius in range(_MAX_ROLE_DISTANCE + 1):
+            scored = self._within(target, radius)
+            if len(scored) >= k:
+                break
+        return tuple(c for _, _, c in sorted(scored)[:max(k, 0)])
+
+    def _within(self, target: Term, radius: int) -> list:
+        if target.layer != self.layer or radius < 0:
+            return []
+        if self.layer == 0 or radius >= _MAX_ROLE_DISTANCE:
+            pool: Iterable[Term] = self.terms
+        else:
+            shared: Dict[Term, int] = {}
+            by_role = self._index().by_role
+            for role in ROLES:
+                for member in by_role.get((role, target.roles()[role]), ()):
+                    shared[member] = shared.get(member, 0) + 1
+            pool = [m for m, n in shared.items() if n >= len(ROLES) - radius]
+        scored = []
+        for c in pool:
+            d = distance(target, c)
+            if d <= radius:
+                scored.append((d, c.code(), c))
+        return scored
+
+
+#: The largest distance between two same-layer products: every role differs.
+_MAX_ROLE_DISTANCE = len(ROLES)
+
+
+class _TermSetIndex:
+    """Inverted indexes over a TermSet's members: head symbol and (role, filler)."""
+
+    __slots__ = ("by_head", "by_role", "products")
+
+    def __init__(self, terms: FrozenSet[Term]) -> None:
+        by_head: Dict[str, set] = {}
+        by_role: Dict[Tuple[str, Term], set] = {}
+        for t in terms:
+            by_head.setdefault(_head(t), set()).add(t)
+            if not t.is_leaf:
+                for role, filler in t.roles().items():
+                    by_role.setdefault((role, filler), set()).add(t)
+        self.by_head = {k: frozenset(v) for k, v in by_head.items()}
+        self.by_role = {k: frozenset(v) for k, v in by_role.items()}
+        self.products = frozenset(t for t in terms if not t.is_leaf)
+
+
+def _head(t: Term) -> str:
+    while not t.is_leaf:
+        t = t.ground  # type: ignore[assignment]
+    return str(t.primitive)
+
 
 def add(*terms: Term) -> TermSet:
     """Commutative, normalised union of same-layer terms."""
@@ -313,12 +510,16 @@ def distance(a: "Term | Abstain", b: "Term | Abstain") -> int:
             f"distance is undefined across layers ({a.layer} vs {b.layer}); "
             "compare within a layer or ground through the tier bridge"
         )
-    if a == b:
+    if a is b:
         return 0
     if a.is_leaf or b.is_leaf:
         return 1
-    return sum(
-        distance(a.roles()[r], b.roles()[r]) > 0 and 1 or 0 for r in ROLES
+    # Interned sub-terms are at distance zero iff they are the same object, so
+    # counting the differing roles needs no recursion.
+    return (
+        (a.ground is not b.ground)
+        + (a.differentia is not b.differentia)
+        + (a.mode is not b.mode)
     ) or 1
 
 
@@ -346,6 +547,12 @@ def pullback(candidates: TermSet, constraint: Dict[str, Term]) -> "TermSet | Abs
     first-class abstention the caller must reconcile, not an empty-but-fine result
     and not a smuggled ``None``.
     """
+    kept = candidates.matching(constraint)
+    return TermSet(kept) if kept else BOTTOM
+
+
+def _pullback_scan(candidates: TermSet, constraint: Dict[str, Term]) -> "TermSet | Abstain":
+    """`pullback` by testing every cell — the reference the indexed path must match."""
     kept = set()
     for cell in candidates.terms:
         if cell.is_leaf:
@@ -459,15 +666,11 @@ def bind_tiered(query: Term, upper: TermSet, lower: TermSet) -> "Term | Abstain"
         raise LayerError(
             f"query is at layer {query.layer}, upper tier at {upper.layer}"
         )
-    anchors = neighbours(query, upper.terms, radius=1)
+    anchors = upper.neighbours(query, radius=1)
     if not anchors:
         return BOTTOM
     anchor = anchors[0]
-    admitted = [
-        cell
-        for cell in lower.terms
-        if not cell.is_leaf and cell.roles()["ground"] == anchor
-    ]
+    admitted = lower.matching({"ground": anchor})
     if not admitted:
         return BOTTOM
     return sorted(admitted, key=lambda t: t.code())[0]
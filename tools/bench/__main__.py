@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""The repository's micro-benchmarks, behind one command.
+
+    python3 tools/bench -h                  # every case, one line each
+    python3 tools/bench <case> -h           # what a case measures and its options
+    python3 tools/bench <case> [options]
+
+Each case times a current code path against the one it replaced (replicated in
+the case) or across its own knobs, checks that both give the same answer, and
+prints one table. Cases live by subsystem in this package (automation,
+governance, mesh, scanning, semantic); the registry and the shared timing
+helpers are in ``harness``. Stdlib only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+_ROOT = _HERE.parents[1]
+# Run as ``python3 tools/bench``, this directory heads sys.path, where its case
+# modules would shadow the repository packages they are named after. Import
+# from the repository root (automation, engines, gbrg), tools/ (this package and
+# the check_* scripts), telemetry/ and the vendored third_party/ instead.
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+for _path in (_ROOT / "third_party", _ROOT / "telemetry", _ROOT / "tools", _ROOT):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from bench import automation, governance, mesh, scanning, semantic  # noqa: E402,F401  (registers the cases)
+from bench.harness import CASES  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="tools/bench", description=__doc__.splitlines()[0])
+    sub = ap.add_subparsers(dest="case", metavar="case", required=True)
+    for name in sorted(CASES):
+        bench_case = CASES[name]
+        parser = sub.add_parser(name, help=bench_case.doc.splitlines()[0], description=bench_case.doc,
+                                formatter_class=argparse.RawDescriptionHelpFormatter)
+        for param in bench_case.params:
+            param.add_to(parser)
+    args = ap.parse_args(argv)
+    CASES[args.case].run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
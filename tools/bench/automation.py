@@ -0,0 +1,331 @@
+"""Bench cases: the automation work queue, session quarantine and the propagation engine."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+from automation import session_quarantine as sq
+from automation.durable_queue import open_queue
+from engines import propagation_engine
+from engines.propagation_engine import PropagationEngine
+
+from .harness import Param, case, ints, timed
+
+# --------------------------------------------------------------------------- #
+# durable_queue
+# --------------------------------------------------------------------------- #
+
+
+def _queue_event(i: int) -> dict:
+    return {"event": "push", "repo": f"acme/repo-{i % 997}", "ref": "refs/heads/main", "seq": i}
+
+
+def _queue_run(backend: str, n: int, batch: int, sample: int) -> dict:
+    with tempfile.TemporaryDirectory() as td:
+        q = open_queue(Path(td), backend)
+        t0 = time.perf_counter()
+        if backend == "files":
+            for i in range(n):
+                q.put(_queue_event(i))
+        else:
+            for start in range(0, n, batch):
+                q.put_many(_queue_event(i) for i in range(start, min(n, start + batch)))
+        put_s = time.perf_counter() - t0
+
+        qsize_s, size = timed(q.qsize)
+        assert size == n, (size, n)
+
+        t0 = time.perf_counter()
+        for _ in range(sample):
+            q.get_nowait()
+        get_s = (time.perf_counter() - t0) / sample
+
+        t0 = time.perf_counter()
+        drained = sample
+        while True:
+            got = q.get_many(batch)
+            if not got:
+                break
+            drained += len(got)
+        drain_s = time.perf_counter() - t0
+        assert drained == n, (drained, n)
+    return {
+        "put_per_s": n / put_s,
+        "qsize_ms": qsize_s * 1e3,
+        "get_nowait_ms": get_s * 1e3,
+        "drain_per_s": (n - sample) / drain_s if drain_s else float("inf"),
+    }
+
+
+@case(
+    "durable_queue",
+    Param("--sizes", "10000,100000,1000000", ints),
+    Param("--batch", 1000, int, "put_many / get_many batch size"),
+    Param("--sample", 100, int, "get_nowait calls timed per run"),
+    Param("--files-max", 10000, int, "largest backlog to run the file backend at"),
+)
+def durable_queue(args: argparse.Namespace) -> None:
+    """The DurableQueue backends at 10k / 100k / 1M queued events.
+
+    For each backend and backlog size it reports:
+
+    - enqueue throughput (``put`` per event for the file backend, ``put_many`` in
+      batches for SQLite: one commit + fsync per batch),
+    - ``qsize()`` latency with the full backlog queued,
+    - ``get_nowait()`` latency (mean over a sample of claims from the full backlog;
+      this is the per-event cost ``RegistryScheduler._process_queue`` pays),
+    - full drain throughput with ``get_many(batch)``.
+
+    The file backend does one fsync and one inode per event and re-lists the directory
+    on every consumer call, so by default it is only run up to --files-max events.
+    """
+    print(f"{'backend':>8} {'events':>9} {'put/s':>10} {'qsize ms':>10} {'get_nowait ms':>14} {'drain/s':>10}")
+    for n in args.sizes:
+        for backend in ("files", "sqlite"):
+            if backend == "files" and n > args.files_max:
+                print(f"{backend:>8} {n:>9} {'(skipped: > --files-max)':>56}")
+                continue
+            r = _queue_run(backend, n, args.batch, min(args.sample, n))
+            print(f"{backend:>8} {n:>9} {r['put_per_s']:>10.0f} {r['qsize_ms']:>10.2f} "
+                  f"{r['get_nowait_ms']:>14.3f} {r['drain_per_s']:>10.0f}")
+
+
+# --------------------------------------------------------------------------- #
+# session_quarantine
+# --------------------------------------------------------------------------- #
+
+
+def _scan_match(proto: sq.SessionQuarantineProtocol, event: dict):
+    for key in sq._RECONCILE_KEYS:
+        value = event.get(key)
+        if not value:
+            continue
+        for session_id, node in proto._sessions.items():
+            for session_event in node.events:
+                if session_event.get(key) == value:
+                    return session_id
+    return None
+
+
+class _Clock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@case(
+    "session_quarantine",
+    Param("--sessions", 100_000, int),
+    Param("--events", 1_000_000, int),
+    Param("--orphans", 10_000, int),
+    Param("--scan-orphans", 3, int),
+)
+def session_quarantine(args: argparse.Namespace) -> None:
+    """Orphan reconciliation cost of ``SessionQuarantineProtocol``: exhaustive scan vs. correlation index.
+
+    Registers ``--sessions`` sessions and ingests ``--events`` events spread over them (each
+    carrying a conversation_id and task_id, some a workspace_id), then queues ``--orphans``
+    orphans, half of which share a key with some session, and times:
+
+    - ``ingest``: ``event_received`` for every event (index maintenance included);
+    - ``reconcile``: one ``reconcile()`` over all queued orphans (index lookups);
+    - ``scan``: the previous matcher — every key, every session, every event — on
+      ``--scan-orphans`` of them (it is O(sessions x events) per orphan);
+    - ``expire``: one ``expire()`` dropping every session after their idle TTL lapses.
+    """
+    rng = random.Random(22)
+    clock = _Clock()
+    proto = sq.SessionQuarantineProtocol(session_ttl_seconds=3600, clock=clock)
+    sq.logger.disabled = True
+    for s in range(args.sessions):
+        proto.register_session(f"ses-{s}")
+    events = []
+    for i in range(args.events):
+        s = rng.randrange(args.sessions)
+        event = {"event_id": f"e{i}", "session_id": f"ses-{s}", "conversation_id": f"conv-{s}",
+                 "task_id": f"task-{i}"}
+        if i % 4 == 0:
+            event["workspace_id"] = f"ws-{s % 997}"
+        events.append(event)
+
+    t0 = time.perf_counter()
+    for event in events:
+        proto.event_received(event)
+    ingest = time.perf_counter() - t0
+
+    orphans = []
+    for j in range(args.orphans):
+        key = "task_id" if j % 2 else "conversation_id"
+        value = f"task-{rng.randrange(args.events)}" if j % 2 else f"conv-{args.sessions + j}"
+        orphans.append({"event_id": f"o{j}", "session_id": "gone", key: value})
+    for orphan in orphans:
+        proto.event_received(orphan)
+
+    scan = orphans[:args.scan_orphans]
+    t0 = time.perf_counter()
+    expected = [_scan_match(proto, o) for o in scan]
+    scan_s = (time.perf_counter() - t0) / max(1, len(scan))
+    assert [proto._find_matching_session(o) for o in scan] == expected
+
+    reconcile_s, _ = timed(proto.reconcile)
+    recovered = sum(r.status == "recovered" for r in proto.get_receipts())
+
+    clock.now += 7200
+    expire_s, dropped = timed(proto.expire)
+
+    print(f"{args.sessions} sessions, {args.events} events, {args.orphans} orphans "
+          f"({recovered} recovered)")
+    print(f"{'ingest':>10} {ingest:>8.2f} s  {args.events / ingest:>10.0f} events/s")
+    print(f"{'reconcile':>10} {reconcile_s:>8.2f} s  {reconcile_s / args.orphans * 1e6:>10.1f} us/orphan")
+    print(f"{'scan':>10} {scan_s * args.orphans:>8.0f} s* {scan_s * 1e6:>10.0f} us/orphan "
+          f"(*extrapolated from {len(scan)})")
+    print(f"{'expire':>10} {expire_s:>8.2f} s  {dropped:>10} sessions dropped")
+
+
+# --------------------------------------------------------------------------- #
+# propagation_index
+# --------------------------------------------------------------------------- #
+
+
+def _synth_registry(directory: Path, n: int, fanout: int, chain: int, seed: int = 1948) -> None:
+    rng = random.Random(seed)
+    layers = 12
+    per_layer = max(1, n // layers)
+    edges = []
+    for i in range(n):
+        layer = min(i // per_layer, layers - 1)
+        if layer == 0:
+            continue
+        lo = 0
+        hi = layer * per_layer
+        for dst in {rng.randrange(lo, hi) for _ in range(fanout)}:
+            edges.append({"from": f"repo-{i}", "to": f"repo-{dst}", "type": "depends_on"})
+    # A long dependency chain: the recursive DFS's worst case.
+    for i in range(chain):
+        edges.append({"from": f"chain-{i + 1}", "to": f"chain-{i}", "type": "depends_on"})
+    edges.append({"from": "chain-0", "to": "repo-0", "type": "depends_on"})
+    rules = [
+        {"id": f"rule-{i}", "trigger": {"repo": f"repo-{i}"},
+         "cascades": [{"target": f"repo-{n - 1 - i}", "action": "notify", "reason": "synthetic"}]}
+        for i in range(0, min(n, 200))
+    ]
+    (directory / "dependency-graph.yaml").write_text(json.dumps({"edges": edges}), encoding="utf-8")
+    (directory / "change-propagation-rules.yaml").write_text(json.dumps({"rules": rules}), encoding="utf-8")
+
+
+def _legacy_cascade(engine: PropagationEngine, repo: str, max_depth: int) -> list[dict]:
+    """The pre-index compute_cascade: linear rule scan, dict adjacency, list copies per hop."""
+    rule = next((r for r in engine._rules if r.get("trigger", {}).get("repo") == repo), None)
+    source_rule = rule.get("id", "dependency_graph") if rule else "dependency_graph"
+    visited = {repo}
+    queue: deque[tuple[str, int]] = deque()
+    results: list[dict] = []
+    for dep in list(engine._reverse_adjacency.get(repo, [])):
+        if dep not in visited:
+            visited.add(dep)
+            queue.append((dep, 1))
+            results.append({"depth": 1, "repo": dep, "action": "notify", "message": f"{repo} changed",
+                            "auto_pr": False, "pr_title": "", "source_rule": source_rule})
+    while queue:
+        current, depth = queue.popleft()
+        if depth >= max_depth:
+            continue
+        for downstream in list(engine._reverse_adjacency.get(current, [])):
+            if downstream in visited:
+                continue
+            visited.add(downstream)
+            queue.append((downstream, depth + 1))
+            results.append({"depth": depth + 1, "repo": downstream, "action": "notify",
+                            "message": f"Cascade from {current}", "auto_pr": False, "pr_title": "",
+                            "source_rule": source_rule})
+    return results
+
+
+def _legacy_detect_cycles(engine: PropagationEngine) -> str:
+    """The pre-index recursive DFS with path.index and a list membership scan."""
+    visited: set[str] = set()
+    stack: set[str] = set()
+    path: list[str] = []
+    cycles: list[list[str]] = []
+
+    def dfs(node: str) -> None:
+        visited.add(node)
+        stack.add(node)
+        path.append(node)
+        for neighbor in engine._adjacency.get(node, []):
+            if neighbor not in visited:
+                dfs(neighbor)
+            elif neighbor in stack:
+                cycle = path[path.index(neighbor):] + [neighbor]
+                if cycle not in cycles:
+                    cycles.append(cycle)
+        stack.remove(node)
+        path.pop()
+
+    try:
+        for node in list(engine.all_graph_nodes()):
+            if node not in visited:
+                dfs(node)
+    except RecursionError:
+        return "RecursionError"
+    return f"{len(cycles)} cycles"
+
+
+def _per_query(fn, sample: list[str]) -> float:
+    t0 = time.perf_counter()
+    for repo in sample:
+        fn(repo, 3)
+    return (time.perf_counter() - t0) / len(sample)
+
+
+@case(
+    "propagation_index",
+    Param("--sizes", "10000,30000,100000", ints),
+    Param("--fanout", 3, int),
+    Param("--chain", 5000, int, "length of the deep dependency chain"),
+    Param("--queries", 200, int),
+    Param("--yaml", False, help="parse the registry with PyYAML"),
+)
+def propagation_index(args: argparse.Namespace) -> None:
+    """The compiled PropagationEngine graph index on synthetic registries.
+
+    Generates layered dependency graphs of 10k-100k repos (each repo depends on a few
+    repos in lower layers, plus a long chain to stress recursion), loads them through
+    PropagationEngine, and compares:
+
+    - load + compile time,
+    - compute_cascade: the pre-index per-call BFS over dict adjacency vs. the indexed
+      walk (first call) and the memoized lookup (repeat call),
+    - detect_cycles: the pre-index recursive DFS vs. the iterative CSR DFS.
+
+    The synthetic registry is written as JSON, which is valid YAML; by default the engine
+    reads it with json.loads so the numbers measure the engine rather than the pure-Python
+    YAML parser. Pass --yaml to go through PyYAML instead.
+    """
+    if not args.yaml:
+        propagation_engine._load_yaml = lambda p: json.loads(p.read_text("utf-8")) if p.exists() else {}
+
+    print(f"{'repos':>8} {'edges':>8} {'load s':>8} {'cascade ms':>11} {'indexed ms':>11} "
+          f"{'repeat ms':>10} {'dfs s':>8} {'dfs':>15} {'csr s':>9} {'csr':>10}")
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as td:
+            _synth_registry(Path(td), n, args.fanout, args.chain)
+            engine = PropagationEngine(Path(td))
+            load_s, _ = timed(engine.load)
+        rng = random.Random(7)
+        sample = [f"repo-{rng.randrange(0, max(1, n // 6))}" for _ in range(args.queries)]
+        legacy_q = _per_query(lambda repo, depth: _legacy_cascade(engine, repo, depth), sample)
+        first_q = _per_query(engine.compute_cascade, sample)
+        repeat_q = _per_query(engine.compute_cascade, sample)
+        dfs_s, dfs = timed(_legacy_detect_cycles, engine)
+        csr_s, cycles = timed(engine.detect_cycles)
+        print(f"{n + args.chain + 1:>8} {len(engine._edges):>8} {load_s:>8.2f} {legacy_q * 1e3:>11.3f} "
+              f"{first_q * 1e3:>11.3f} {repeat_q * 1e3:>10.4f} {dfs_s:>8.2f} "
+              f"{dfs:>15} {csr_s:>9.2f} {f'{len(cycles)} cycles':>10}")
@@ -0,0 +1,293 @@
+"""Bench cases: the gbrg governance ledger and estate sealing."""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+import types
+from pathlib import Path
+
+from gbrg.governance import ledger
+from gbrg.governance import supply_chain_pipeline as pipe
+from gbrg.governance import supply_chain_risk as scr
+
+from .harness import Param, case, ints, latencies, p50, p99, scratch, size, timed
+
+
+def _event(n: int, prev: str) -> dict:
+    core = {"type": "BenchEvent", "n": n, "ts": "2026-01-01T00:00:00Z", "prev_hash": prev,
+            "artifact": {"subject": f"node-{n:08d}", "score": n % 97}}
+    return {**core, "hash": ledger._sha(core)}
+
+
+def _chained(n: int):
+    return lambda prev: _event(n, prev)
+
+
+# --------------------------------------------------------------------------- #
+# ledger_append
+# --------------------------------------------------------------------------- #
+
+
+def _build_ledger(path: Path, n: int) -> None:
+    prev = ledger.GENESIS
+    with path.open("w", encoding="utf-8") as fh:
+        for i in range(n):
+            rec = _event(i, prev)
+            prev = rec["hash"]
+            fh.write(json.dumps(rec, sort_keys=True, separators=(",", ":")) + "\n")
+
+
+def _legacy_append(path: Path, n: int) -> None:
+    records = ledger.read_all(path)
+    prev = (records[-1].get("hash") or records[-1].get("receipt")) if records else ledger.GENESIS
+    ledger.append(_event(n, prev), ledger_path=path)
+
+
+def _append_row(label: str, entries: int, lat: list[float], prime: float | None) -> None:
+    print(f"{label:>9} {entries:>9} {p50(lat):>9.2f} {p99(lat):>9.2f} "
+          f"{'' if prime is None else f'{prime:.2f}':>8}")
+
+
+@case(
+    "ledger_append",
+    Param("--sizes", "1000,10000,100000,1000000", ints),
+    Param("--appends", 200, int),
+    Param("--legacy-max", 10000, int),
+)
+def ledger_append(args: argparse.Namespace) -> None:
+    """Append latency of the gbrg governance ledger vs. ledger size: full re-verify vs. head checkpoint.
+
+    For each size in ``--sizes`` a hash-chained ledger of that many events is written directly, then
+    ``--appends`` chained events are appended and timed one by one:
+
+    - ``read_all``: the previous writer path — ``ledger.read_all`` (full verification) to learn the
+      previous hash, then ``ledger.append`` (only up to ``--legacy-max`` entries; it is O(N) per append);
+    - ``head``: ``ledger.append_chained`` — head from the checkpoint sidecar, under the append lock.
+
+    The first ``append_chained`` on a ledger with no checkpoint walks it once and writes the
+    checkpoint (``head()`` alone is read-only); that append is reported as ``prime s``. Every
+    append fsyncs the ledger (and the checkpoint), so the flat floor is fsync latency.
+    """
+    with scratch() as tmp:
+        print(f"{'writer':>9} {'entries':>9} {'p50 ms':>9} {'p99 ms':>9} {'prime s':>8}")
+        for entries in args.sizes:
+            path = tmp / f"ledger-{entries}.jsonl"
+            appended = range(entries, entries + args.appends)
+            if entries <= args.legacy_max:
+                _build_ledger(path, entries)
+                _append_row("read_all", entries, latencies(lambda n: _legacy_append(path, n), appended), None)
+                for sidecar in (".head", ".lock"):
+                    path.with_name(path.name + sidecar).unlink(missing_ok=True)
+            _build_ledger(path, entries)
+            prime, _ = timed(lambda: ledger.append_chained(_chained(entries), ledger_path=path))
+            lat = latencies(lambda n: ledger.append_chained(_chained(n), ledger_path=path),
+                            (n + 1 for n in appended))
+            assert ledger.head(path).count == entries + 1 + args.appends
+            _append_row("head", entries, lat, prime)
+            path.unlink()
+
+
+# --------------------------------------------------------------------------- #
+# ledger_segments
+# --------------------------------------------------------------------------- #
+
+
+def _scan_get(path: Path, seq: int) -> dict:
+    i = 0
+    for data in [*ledger._segment_files(path), path]:
+        with data.open("rb") as fh:
+            for line in fh:
+                if line.strip():
+                    if i == seq:
+                        return json.loads(line)
+                    i += 1
+    raise IndexError(seq)
+
+
+def _lookup_row(label: str, fn, inputs) -> None:
+    lat = latencies(fn, inputs)
+    print(f"{label:>12} {len(lat):>7} {p50(lat):>10.3f} {p99(lat):>10.3f}")
+
+
+@case(
+    "ledger_segments",
+    Param("--entries", 10_000_000, int),
+    Param("--segment", 64 << 20, size),
+    Param("--batch", 50_000, int),
+    Param("--lookups", 1000, int),
+    Param("--scan-lookups", 3, int),
+    Param("--workers", "1,4", ints),
+    Param("--dir", None, str, "build (or reuse, if it already holds --entries) the ledger here"),
+)
+def ledger_segments(args: argparse.Namespace) -> None:
+    """Random access and verification of a rotated gbrg governance ledger at large entry counts.
+
+    Writes ``--entries`` chained events with ``ledger.append_batch`` (``--batch`` per commit) into a
+    ledger rotating at ``--segment`` bytes, then times, over ``--lookups`` random targets each:
+
+    - ``get``: ``ledger.get(seq)``; ``get_by_hash``: ``ledger.get_by_hash(hash)``;
+    - ``tail``: ``ledger.tail(100)``; ``range``: ``list(ledger.iter_range(a, a + 1000))``;
+    - ``scan``: the pre-index way to fetch one record — stream the files and parse up to it
+      (``--scan-lookups`` targets, it is O(n));
+
+    and one full ``verify_ledger`` per ``--workers`` value (segments verified in parallel).
+    """
+    with scratch(args.dir) as tmp:
+        path = tmp / "bench-ledger.jsonl"
+        t0 = time.perf_counter()
+        built = path.exists() and ledger.head(path).count == args.entries
+        for start in range(0, 0 if built else args.entries, args.batch):
+            stop = min(args.entries, start + args.batch)
+            ledger.append_batch([_chained(n) for n in range(start, stop)], ledger_path=path,
+                                segment_bytes=args.segment)
+        build_s = time.perf_counter() - t0
+        segments = ledger._segment_files(path)
+        total = sum(p.stat().st_size for p in segments) + path.stat().st_size
+        print(f"{args.entries} entries, {len(segments)} sealed segments + active, "
+              f"{total / 2**30:.2f} GiB, written in {build_s:.0f} s")
+
+        rng = random.Random(1)
+        seqs = [rng.randrange(args.entries) for _ in range(args.lookups)]
+        hashes = [ledger.get(s, ledger_path=path)["hash"] for s in seqs]
+        print(f"{'op':>12} {'calls':>7} {'p50 ms':>10} {'p99 ms':>10}")
+        _lookup_row("get", lambda s: ledger.get(s, ledger_path=path), seqs)
+        _lookup_row("get_by_hash", lambda h: ledger.get_by_hash(h, ledger_path=path), hashes)
+        _lookup_row("tail 100", lambda _: ledger.tail(100, ledger_path=path), range(args.lookups // 10))
+        _lookup_row("range 1000", lambda s: list(ledger.iter_range(s, s + 1000, ledger_path=path)),
+                    seqs[:args.lookups // 10])
+        _lookup_row("scan", lambda s: _scan_get(path, s), seqs[:args.scan_lookups])
+
+        print(f"{'verify':>12} {'workers':>7} {'s':>10} {'ok':>10}")
+        for workers in args.workers:
+            verify_s, vr = timed(lambda: ledger.verify_ledger(path, workers=workers))
+            print(f"{'':>12} {workers:>7} {verify_s:>10.1f} {str(vr.ok and vr.records == args.entries):>10}")
+        print(f"({os.cpu_count()} CPUs)")
+
+
+# --------------------------------------------------------------------------- #
+# estate_seal / estate_scoring
+# --------------------------------------------------------------------------- #
+
+_LEVELS = ("proved", "empirical", "speculative")
+
+
+def synthetic_bundle(n: int, per_module: int, seed: int = 7) -> dict:
+    """A deterministic gbrg-analyze bundle: ``n`` cells, ``per_module`` per source file, CALLS chains."""
+    rng = random.Random(seed)
+    artifacts, edges = [], []
+    for i in range(n):
+        module = f"code://rust/estate/crates/c{i // (per_module * 50):03d}/src/m{i // per_module:05d}.rs"
+        cell = f"{module}#f{i:06d}"
+        artifacts.append({
+            "cell_id": cell,
+            "blast_radius": round(rng.random(), 3),
+            "dependents_count": rng.randrange(0, 40),
+            "churn_frequency": round(rng.random() * 0.5, 4),
+            "test_coverage_reach": rng.random() < 0.6,
+            "generated": rng.random() < 0.02,
+            "claim": {"epistemicLevel": rng.choice(_LEVELS)},
+        })
+        if i and i % per_module:
+            edges.append({"from": artifacts[i - 1]["cell_id"], "kind": "CALLS", "to": cell})
+    return {"artifacts": artifacts, "edges": edges}
+
+
+def _per_record(assessments, *, ledger_path, persist=True):
+    for a in assessments:
+        scr._seal_and_persist(a, ledger_path=ledger_path, persist=persist)
+    return assessments
+
+
+def _seal_row(mode: str, bundle: dict, path: Path, scoring_s: float) -> None:
+    real_fsync, real_seal = os.fsync, scr.seal_batch
+    fsyncs = [0]
+    ledger_file = str(path.resolve())
+
+    def counting(fd):
+        if os.path.realpath(f"/proc/self/fd/{fd}") == ledger_file:
+            fsyncs[0] += 1
+        return real_fsync(fd)
+
+    os.fsync = counting
+    if mode == "record":
+        scr.seal_batch = _per_record
+    try:
+        total, result = timed(lambda: pipe.assess_estate(bundle, ledger_path=path, persist=True))
+    finally:
+        os.fsync, scr.seal_batch = real_fsync, real_seal
+    sealed = len(result["nodes"]) + len(result["paths"]) + len(result["clusters"]) + 1
+    vr = ledger.verify_ledger(path)
+    print(f"{mode:>7} {sealed:>8} {fsyncs[0]:>7} {total:>9.2f} {total - scoring_s:>9.2f} {str(vr.ok):>7}")
+
+
+@case(
+    "estate_seal",
+    Param("--nodes", 50000, int),
+    Param("--per-module", 10, int),
+    Param("--modes", "batch,record", lambda text: text.split(",")),
+)
+def estate_seal(args: argparse.Namespace) -> None:
+    """Sealing cost of ``supply_chain_pipeline.assess_estate`` on a synthetic repo graph: per-record vs. batch.
+
+    Builds a deterministic gbrg-analyze bundle of ``--nodes`` cells (``--per-module`` cells per source
+    file, so every file is a module cluster) with CALLS edges between neighbouring cells, then runs
+    ``assess_estate(..., persist=True)`` into a fresh ledger two ways:
+
+    - ``record``: every subject sealed with ``ledger.append_chained`` — one write + fsync (and a
+      checkpoint rewrite) per node, path and cluster; the previous behaviour;
+    - ``batch``: the estate sealed by ``scr.seal_batch`` — one ``ledger.append_batch`` commit.
+
+    Reported: records sealed, ledger fsyncs, total wall time, the durable part of it (total minus a
+    ``persist=False`` pass, which scores and chains in memory but writes nothing), and whether the
+    ledger verifies.
+    """
+    bundle = synthetic_bundle(args.nodes, args.per_module)
+    with scratch() as tmp:
+        scoring_s, _ = timed(lambda: pipe.assess_estate(bundle, ledger_path=tmp / "unsealed.jsonl", persist=False))
+        print(f"{args.nodes} nodes, {len(bundle['edges'])} CALLS edges; in-memory pass {scoring_s:.2f} s")
+        print(f"{'mode':>7} {'records':>8} {'fsyncs':>7} {'total s':>9} {'durable s':>9} {'verify':>7}")
+        for mode in args.modes:
+            _seal_row(mode, bundle, tmp / f"{mode}.jsonl", scoring_s)
+
+
+def _pin_nondeterminism() -> None:
+    counter = itertools.count()
+    scr.uuid = types.SimpleNamespace(uuid4=lambda: types.SimpleNamespace(hex=f"{next(counter):032x}"))
+    scr._now = lambda: "2026-01-01T00:00:00Z"
+
+
+@case(
+    "estate_scoring",
+    Param("--nodes", 50000, int),
+    Param("--per-module", 10, int),
+    Param("--workers", "1,2,4,8", ints),
+)
+def estate_scoring(args: argparse.Namespace) -> None:
+    """Per-stage wall time of ``supply_chain_pipeline.assess_estate`` vs. ``workers`` on a synthetic repo graph.
+
+    Uses the ``estate_seal`` bundle (``--nodes`` cells, ``--per-module`` per source file, CALLS
+    edges between neighbours) and scores it with ``persist=False`` at each worker count in
+    ``--workers``, printing the ``timings`` the pipeline records (nodes / paths / clusters / seal)
+    and checking every run produced the same receipts chain as ``workers=1`` (proofIds and the
+    seal timestamp pinned, so the chains are comparable).
+    """
+    bundle = synthetic_bundle(args.nodes, args.per_module)
+    print(f"{args.nodes} nodes, {len(bundle['edges'])} CALLS edges, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'nodes s':>8} {'paths s':>8} {'clust s':>8} {'seal s':>8} {'total s':>8} {'same':>5}")
+    serial = None
+    with scratch() as tmp:
+        empty = tmp / "none.jsonl"  # persist=False: only its (empty) head is read
+        for workers in args.workers:
+            _pin_nondeterminism()
+            total, result = timed(lambda: pipe.assess_estate(bundle, ledger_path=empty, workers=workers))
+            chain = [a.receipt for a in (*result["nodes"], *result["paths"], result["cluster"],
+                                         *result["clusters"])]
+            serial = serial or chain
+            t = result["timings"]
+            print(f"{workers:>7} {t['nodes']:>8.2f} {t['paths']:>8.2f} {t['clusters']:>8.2f} "
+                  f"{t['seal']:>8.2f} {total:>8.2f} {str(chain == serial):>5}")
@@ -0,0 +1,152 @@
+"""Case registry and shared measurement helpers of the bench harness.
+
+A case is a function taking the parsed options, registered with :func:`case`
+under a name together with the :class:`Param`s it accepts; its docstring is its
+``--help`` text (first line: the summary shown by ``python3 tools/bench -h``).
+Cases print their own tables; the helpers here are the timing, size-parsing and
+scratch-space plumbing they share.
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class Param:
+    """One ``--flag`` of a case. A ``bool`` default makes it a switch."""
+
+    flag: str
+    default: Any = None
+    type: Callable[[str], Any] = str
+    help: str | None = None
+
+    def add_to(self, parser: argparse.ArgumentParser) -> None:
+        if isinstance(self.default, bool):
+            parser.add_argument(self.flag, action="store_true", help=self.help)
+        else:
+            parser.add_argument(self.flag, type=self.type, default=self.default, help=self.help)
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    run: Callable[[argparse.Namespace], None]
+    params: tuple[Param, ...]
+
+    @property
+    def doc(self) -> str:
+        return (self.run.__doc__ or self.name).strip()
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, *params: Param) -> Callable[[Callable[[argparse.Namespace], None]], Callable]:
+    """Register the decorated function as bench case ``name`` taking ``params``."""
+    def register(fn: Callable[[argparse.Namespace], None]) -> Callable[[argparse.Namespace], None]:
+        if name in CASES:
+            raise ValueError(f"duplicate bench case {name!r}")
+        CASES[name] = Case(name, fn, params)
+        return fn
+
+    return register
+
+
+# -- option parsers ---------------------------------------------------------- #
+
+_UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def size(text: str) -> int:
+    """A byte count: ``4096``, ``64K``, ``1.5M``, ``2G``."""
+    text = text.strip().upper()
+    return int(float(text[:-1]) * _UNITS[text[-1]]) if text[-1] in _UNITS else int(text)
+
+
+def ints(text: str) -> list[int]:
+    """A comma-separated list of integers: ``1,2,4``."""
+    return [int(x) for x in text.split(",")]
+
+
+def words(text: str) -> list[str]:
+    """A comma-separated list, kept as written (e.g. size labels for a table)."""
+    return text.split(",")
+
+
+# -- measurement ------------------------------------------------------------- #
+
+
+def timed(fn: Callable[..., Any], *args: Any) -> tuple[float, Any]:
+    """``(seconds, fn(*args))`` for one call."""
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - t0, out
+
+
+def best(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """``(fastest seconds, last result)`` over ``repeat`` calls."""
+    fastest, out = float("inf"), None
+    for _ in range(repeat):
+        seconds, out = timed(fn)
+        fastest = min(fastest, seconds)
+    return fastest, out
+
+
+def latencies(fn: Callable[[Any], Any], inputs: Iterable[Any]) -> list[float]:
+    """Milliseconds per ``fn(x)`` for each of ``inputs``, sorted."""
+    out = []
+    for x in inputs:
+        t0 = time.perf_counter()
+        fn(x)
+        out.append((time.perf_counter() - t0) * 1e3)
+    return sorted(out)
+
+
+def p50(lat: list[float]) -> float:
+    return statistics.median(lat)
+
+
+def p99(lat: list[float]) -> float:
+    """The 99th percentile of sorted ``lat``."""
+    return lat[min(len(lat) - 1, int(len(lat) * 0.99))]
+
+
+def mib(nbytes: int, seconds: float) -> float:
+    """Throughput in MiB/s."""
+    return nbytes / (1 << 20) / seconds if seconds else float("inf")
+
+
+# -- scratch space ----------------------------------------------------------- #
+
+
+@contextmanager
+def scratch(keep: str | None = None) -> Iterator[Path]:
+    """A temporary directory removed afterwards, or ``keep`` (created, never removed)."""
+    if keep:
+        path = Path(keep)
+        path.mkdir(parents=True, exist_ok=True)
+        yield path
+        return
+    path = Path(tempfile.mkdtemp(prefix="bench-"))
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def git(repo: Path, *args: str) -> None:
+    """Run ``git`` in ``repo`` with a throwaway identity, quietly."""
+    subprocess.run(["git", "-c", "user.name=bench", "-c", "user.email=bench@example.invalid", *args],
+                   cwd=repo, check=True, stdout=subprocess.DEVNULL)
@@ -0,0 +1,685 @@
+"""Bench cases: dispersal codecs, leaf propagation and the mesh Drive (sync, index, transports)."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+
+import automation.holographic_ida as ida
+from automation import mesh_index
+from automation.holographic_ida import merkle_root, reconstruct
+from automation.leaf_propagation import (
+    IntegrityError, _frag_key, fetch, fetch_report, fetch_stream, in_memory_store, propagate, propagate_stream,
+)
+from automation.mesh_chunking import DEFAULT_CHUNKER
+from automation.mesh_fs_store import MeshFsStore
+from automation.mesh_http_store import MeshHttpStore, make_node_server
+from automation.mesh_io import MeshIO
+from automation.mesh_namespace import publish_blob, read_all
+from automation.mesh_sync import list_files, pull_dir, pull_dir_report, push_dir, push_dir_report
+from automation.storage_resilience import Placement
+
+from .harness import Param, best, case, mib, scratch, size, timed, words
+
+NODES = [f"n{i:02d}" for i in range(27)]
+PLACEMENT = Placement(rs_k=6, rs_m=3)
+
+
+def _ms(fn):
+    """``(milliseconds, fn())``; an IntegrityError counts as no result."""
+    t0 = time.perf_counter()
+    try:
+        out = fn()
+    except IntegrityError:
+        out = None
+    return (time.perf_counter() - t0) * 1e3, out
+
+
+def _age(p: Path, ns: int = 60 * 1_000_000_000) -> None:
+    """Push ``p``'s mtime past the sync-state racy window."""
+    past = p.stat().st_mtime_ns - ns
+    os.utime(p, ns=(past, past))
+
+
+def _stop(servers) -> None:
+    for srv in servers:
+        srv.shutdown()
+        srv.server_close()
+
+
+# --------------------------------------------------------------------------- #
+# holographic_ida
+# --------------------------------------------------------------------------- #
+
+
+def _scalar_disperse(leaf: bytes, k: int, xs):
+    data = leaf + b"\x00" * ((-len(leaf)) % k)
+    return {x: bytes(ida._eval_poly(data[s:s + k], x) for s in range(0, len(data), k)) for x in xs}
+
+
+def _scalar_reconstruct(frags, k: int, orig_len: int) -> bytes:
+    xs = sorted(frags)[:k]
+    out = bytearray()
+    for pos in range(len(frags[xs[0]])):
+        out.extend(ida._interpolate_coeffs(xs, [frags[x][pos] for x in xs]))
+    return bytes(out[:orig_len])
+
+
+@case(
+    "holographic_ida",
+    Param("--k", 4, int),
+    Param("--n", 8, int),
+    Param("--sizes", "1K,16K,256K,1M,4M,16M,64M", words),
+    Param("--scalar-max", "256K", size, "largest leaf to time the scalar reference on"),
+    Param("--pure-python", False, help="disable NumPy even if importable"),
+)
+def holographic_ida(args: argparse.Namespace) -> None:
+    """Throughput of holographic_ida dispersal and reconstruction, 1 KB to 64 MB leaves.
+
+    Reports MB/s (leaf bytes per second) for the table-driven codec — NumPy when importable,
+    else ``bytes.translate`` — and, up to --scalar-max, for the per-byte scalar reference
+    (Horner encode, per-position Lagrange decode) it replaced. Reconstruction uses the last
+    k fragments, so the decode matrix is a genuine inverse rather than the identity-like
+    first-k case.
+    """
+    if args.pure_python:
+        ida._np = None
+    backend = "numpy" if ida._np is not None else "bytes.translate"
+    print(f"k={args.k} n={args.n} codec={backend}")
+    print(f"{'leaf':>8} {'disperse MB/s':>14} {'reconstruct MB/s':>17} {'scalar enc MB/s':>16} {'scalar dec MB/s':>16}")
+    for label in args.sizes:
+        nbytes = size(label)
+        leaf = os.urandom(nbytes)
+        repeat = 5 if nbytes <= (1 << 20) else 1
+        enc_s, d = best(lambda: ida.disperse(leaf, args.k, args.n), repeat)
+        subset = {x: d.fragments[x] for x in d.xs[-args.k:]}
+        dec_s, out = best(lambda: ida.reconstruct(subset, args.k, d.orig_len), repeat)
+        assert out == leaf
+        senc = sdec = "-"
+        if nbytes <= args.scalar_max:
+            s_enc, ref = timed(_scalar_disperse, leaf, args.k, d.xs)
+            assert ref == d.fragments
+            s_dec, ref_out = timed(_scalar_reconstruct, subset, args.k, d.orig_len)
+            assert ref_out == leaf
+            senc, sdec = f"{mib(nbytes, s_enc):.2f}", f"{mib(nbytes, s_dec):.2f}"
+        print(f"{label:>8} {mib(nbytes, enc_s):>14.1f} {mib(nbytes, dec_s):>17.1f} {senc:>16} {sdec:>16}")
+
+
+# --------------------------------------------------------------------------- #
+# leaf_fetch
+# --------------------------------------------------------------------------- #
+
+
+def _subset_fetch(m, get, max_attempts):
+    avail = {x: get(nodes[0], _frag_key(m.root, x)) for x, nodes in m.fragment_nodes.items()}
+    for attempts, combo in enumerate(itertools.combinations(sorted(avail), m.k), 1):
+        if attempts > max_attempts:
+            break
+        rec = reconstruct({x: avail[x] for x in combo}, m.k, m.orig_len)
+        if merkle_root(rec) == m.root:
+            return rec, attempts
+    raise IntegrityError("no verifying subset")
+
+
+@case(
+    "leaf_fetch",
+    Param("--k", 4, int),
+    Param("--n", 10, int),
+    Param("--size", "64K", size),
+    Param("--max-attempts", 500, int),
+)
+def leaf_fetch(args: argparse.Namespace) -> None:
+    """Read latency of leaf_propagation.fetch vs. the number of Byzantine fragments.
+
+    Writes one leaf at the given (k, n), corrupts the first ``b`` fragments (the ones the fast path
+    reads first, i.e. the worst case for a subset search), and times:
+
+    - ``decoder``: the current fetch — Berlekamp–Welch error location, then one clean reconstruction;
+    - ``report``: fetch_report, which also re-encodes the leaf to name every liar;
+    - ``subset``: the previous fetch — reconstruct + sha256 every k-subset in order until one
+      verifies (capped at --max-attempts, as fetch was).
+    """
+    nodes = [f"n{i:03d}" for i in range(243)]
+    leaf = os.urandom(args.size)
+    print(f"k={args.k} n={args.n} leaf={args.size} bytes  (decoder radius: {(args.n - args.k) // 2} liars)")
+    print(f"{'liars':>5} {'decoder ms':>11} {'report ms':>10} {'recons':>7} {'named':>6} "
+          f"{'subset ms':>10} {'subsets':>8}")
+    for b in range(0, args.n - args.k + 1):
+        put, get, store = in_memory_store()
+        m = propagate(leaf, nodes=nodes, put=put, placement=Placement(rs_k=args.k, rs_m=args.n - args.k))
+        for x in sorted(m.fragment_nodes)[:b]:
+            key = (m.fragment_nodes[x][0], _frag_key(m.root, x))
+            store[key] = bytes(v ^ 0xA5 for v in store[key])
+        dec_ms, _leaf = _ms(lambda: fetch(m, get=get, max_attempts=args.max_attempts))
+        rep_ms, report = _ms(lambda: fetch_report(m, get=get, max_attempts=args.max_attempts))
+        sub_ms, sub = _ms(lambda: _subset_fetch(m, get, args.max_attempts))
+        recons = report.reconstructions if report else "fail"
+        located = len(report.liars) if report else "-"
+        subsets = sub[1] if sub else "fail"
+        print(f"{b:>5} {dec_ms:>11.2f} {rep_ms:>10.2f} {recons!s:>7} {located!s:>6} "
+              f"{sub_ms:>10.2f} {subsets!s:>8}")
+
+
+# --------------------------------------------------------------------------- #
+# stream_dispersal
+# --------------------------------------------------------------------------- #
+
+
+class _HashSink:
+    """A write-only file object that only hashes what it is given."""
+
+    def __init__(self):
+        self.h = hashlib.sha256()
+
+    def write(self, b: bytes) -> int:
+        self.h.update(b)
+        return len(b)
+
+
+def _stream_child(mode: str, path: Path, mesh: Path, stripe: int) -> dict:
+    """One dispersal run, in its own (spawned) process so ``ru_maxrss`` is this run's peak."""
+    store = MeshFsStore(mesh)
+    first = []
+
+    def put(node, frag, data):
+        if not first:
+            first.append(time.perf_counter())
+        store.put(node, frag, data)
+
+    t0 = time.perf_counter()
+    if mode == "whole":
+        data = path.read_bytes()
+        m = propagate(data, nodes=NODES, put=put, placement=PLACEMENT)
+        del data
+        wrote = time.perf_counter()
+        digest = hashlib.sha256(fetch(m, get=store.get)).hexdigest()
+    else:
+        with path.open("rb") as fh:
+            m = propagate_stream(fh, nodes=NODES, put=put, placement=PLACEMENT, stripe_size=stripe)
+        wrote = time.perf_counter()
+        sink = _HashSink()
+        fetch_stream(m, sink, get=store.get)
+        digest = sink.h.hexdigest()
+    read = time.perf_counter()
+    return {"write_s": wrote - t0, "read_s": read - wrote, "first_s": first[0] - t0, "sha256": digest,
+            "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+
+def _stream_row(mode: str, path: Path, tmp: Path, stripe: int) -> None:
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        r = pool.submit(_stream_child, mode, path, tmp / f"mesh-{mode}", stripe).result()
+    shutil.rmtree(tmp / f"mesh-{mode}", ignore_errors=True)
+    nbytes = path.stat().st_size
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    assert r["sha256"] == h.hexdigest(), "read back different bytes"
+    print(f"{mode:>7} {nbytes / 2**20:>9.0f} {mib(nbytes, r['write_s']):>9.1f} "
+          f"{mib(nbytes, r['read_s']):>9.1f} {r['first_s']:>8.2f} {r['rss_kb'] / 1024:>9.0f}")
+
+
+def _random_file(path: Path, nbytes: int) -> None:
+    with path.open("wb") as fh:
+        left = nbytes
+        while left:
+            n = min(left, 16 << 20)
+            fh.write(os.urandom(n))
+            left -= n
+
+
+@case(
+    "stream_dispersal",
+    Param("--size", 2 << 30, size, "streamed leaf size (e.g. 4G)"),
+    Param("--whole-size", 256 << 20, size, "whole-leaf size; 0 skips it"),
+    Param("--stripe", 4 << 20, size),
+)
+def stream_dispersal(args: argparse.Namespace) -> None:
+    """Peak memory and throughput of dispersing large leaves: whole-leaf propagate/fetch vs. stripes.
+
+    Writes a synthetic random file, then in a fresh (spawned) process per run (so ``ru_maxrss`` is
+    that run's peak) writes it to a MeshFsStore mesh and reads it back, Merkle-verified:
+
+    - ``whole``: ``propagate(path.read_bytes())`` then ``fetch`` — the leaf, its padded copy and all n
+      fragments in memory at once (run at ``--whole-size``; it needs several times the leaf in RAM);
+    - ``stream``: ``propagate_stream`` from the open file then ``fetch_stream`` into a hashing sink, at
+      ``--stripe`` bytes per stripe, on the ``--size`` file.
+
+    Reported per run: write / read MB/s, seconds until the first fragment reached the store (a whole
+    leaf cannot upload anything until it is fully encoded), and peak RSS.
+    """
+    with scratch() as tmp:
+        print(f"k=6 n=9 on MeshFsStore ({len(NODES)} nodes), stripe {args.stripe >> 10} KiB")
+        print(f"{'mode':>7} {'MiB':>9} {'write/s':>9} {'read/s':>9} {'first s':>8} {'peak MiB':>9}")
+        if args.whole_size:
+            _random_file(tmp / "whole.bin", args.whole_size)
+            _stream_row("whole", tmp / "whole.bin", tmp, args.stripe)
+            _stream_row("stream", tmp / "whole.bin", tmp, args.stripe)
+            (tmp / "whole.bin").unlink()
+        _random_file(tmp / "big.bin", args.size)
+        _stream_row("stream", tmp / "big.bin", tmp, args.stripe)
+
+
+# --------------------------------------------------------------------------- #
+# mesh_io
+# --------------------------------------------------------------------------- #
+
+
+class _DelayedKV(dict):
+    """A node backend that costs ``delay`` seconds per read and write."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def get(self, key, default=None):
+        time.sleep(self.delay)
+        return super().get(key, default)
+
+    def __setitem__(self, key, value):
+        time.sleep(self.delay)
+        super().__setitem__(key, value)
+
+
+@case(
+    "mesh_io",
+    Param("--k", 6, int),
+    Param("--m", 3, int),
+    Param("--replicas", 2, int),
+    Param("--size", 64 * 1024, int),
+    Param("--delay", 5.0, float, "per-request node latency, ms"),
+    Param("--slow", 2, int, "nodes with --slow-delay latency"),
+    Param("--slow-delay", 200.0, float, "ms"),
+    Param("--seized", 1, int, "nodes shut down before the reads"),
+    Param("--rounds", 5, int),
+)
+def mesh_io(args: argparse.Namespace) -> None:
+    """Write/read latency of leaf propagation over HTTP: sequential seams vs. MeshIO fan-out/fan-in.
+
+    Brings up one ``make_node_server`` per node on loopback. Each node's backend sleeps ``--delay`` ms
+    per request (a WAN round trip); ``--slow`` nodes sleep ``--slow-delay`` ms instead, and ``--seized``
+    nodes are shut down (connection refused). Times, per round:
+
+    - ``seq put`` / ``seq get``: propagate / fetch calling store.put / store.get one copy at a time;
+    - ``io put``: propagate with MeshIO, returning at the write quorum (all n fragments acknowledged);
+    - ``io get``: fetch with MeshIO — hedged, stopping at k; the latency table persists across rounds,
+      so later rounds show slow nodes being tried last.
+    """
+    placement = Placement(rs_k=args.k, rs_m=args.m, shard_replicas=args.replicas)
+    count = placement.rs_n * args.replicas
+    servers, urls = {}, {}
+    for i in range(count):
+        node = f"n{i:02d}"
+        delay = args.slow_delay if i % args.replicas == 0 and i // args.replicas < args.slow else args.delay
+        servers[node], urls[node] = make_node_server(_DelayedKV(delay / 1e3))
+    store = MeshHttpStore(urls, timeout=2.0)
+    nodes = list(urls)
+    io = MeshIO()
+    print(f"k={args.k} n={placement.rs_n} R={args.replicas} nodes={count} leaf={args.size} bytes  "
+          f"delay={args.delay}ms slow={args.slow}x{args.slow_delay}ms seized={args.seized}")
+    try:
+        leaves = [os.urandom(args.size) for _ in range(args.rounds)]
+        seq_put, io_put, manifests = [], [], []
+        for leaf in leaves:
+            ms, _ = _ms(lambda: propagate(leaf, nodes=nodes, put=store.put, placement=placement))
+            seq_put.append(ms)
+            ms, m = _ms(lambda: propagate(leaf, nodes=nodes, put=store.put, placement=placement, io=io))
+            io_put.append(ms)
+            manifests.append(m)
+        io.close()                                   # background replicas land before the reads
+        io = MeshIO(latency=io.latency)
+        victims = [lst[-1] for lst in manifests[0].fragment_nodes.values()][::-1][:args.seized]
+        _stop(servers.pop(node) for node in victims)
+        print(f"{'round':>5} {'seq put ms':>11} {'io put ms':>10} {'seq get ms':>11} {'io get ms':>10}")
+        seq_get, io_get = [], []
+        for i, (leaf, m) in enumerate(zip(leaves, manifests)):
+            ms_seq, got = _ms(lambda: fetch(m, get=store.get))
+            assert got == leaf
+            ms_io, got = _ms(lambda: fetch(m, get=store.get, io=io))
+            assert got == leaf
+            seq_get.append(ms_seq)
+            io_get.append(ms_io)
+            print(f"{i:>5} {seq_put[i]:>11.1f} {io_put[i]:>10.1f} {ms_seq:>11.1f} {ms_io:>10.1f}")
+        print(f"{'med':>5} {statistics.median(seq_put):>11.1f} {statistics.median(io_put):>10.1f} "
+              f"{statistics.median(seq_get):>11.1f} {statistics.median(io_get):>10.1f}")
+    finally:
+        io.close()
+        _stop(servers.values())
+
+
+# --------------------------------------------------------------------------- #
+# mesh_http
+# --------------------------------------------------------------------------- #
+
+
+class _UrllibStore:
+    """The pre-pool client: one urllib request (and TCP connection) per call."""
+
+    def __init__(self, node_urls: Dict[str, str], timeout: float = 3.0):
+        self.node_urls = node_urls
+        self.timeout = timeout
+
+    def _put(self, url: str, data: bytes) -> None:
+        with urlopen(Request(url, data=data, method="PUT"), timeout=self.timeout):  # noqa: S310
+            pass
+
+    def _get(self, url: str) -> Optional[bytes]:
+        try:
+            with urlopen(url, timeout=self.timeout) as resp:  # noqa: S310
+                return resp.read()
+        except HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        except (URLError, OSError):
+            return None
+
+    def put(self, node, frag, data):
+        self._put(f"{self.node_urls[node]}/frag/{quote(str(frag), safe='')}", data)
+
+    def get(self, node, frag):
+        return self._get(f"{self.node_urls[node]}/frag/{quote(str(frag), safe='')}")
+
+    def put_blob(self, node, key, data):
+        self._put(f"{self.node_urls[node]}/blob/{quote(key, safe='')}", data)
+
+    def get_blob(self, node, key):
+        return self._get(f"{self.node_urls[node]}/blob/{quote(key, safe='')}")
+
+
+class _PooledOnly:
+    """MeshHttpStore with only the four seams visible, so mesh_sync cannot batch."""
+
+    def __init__(self, store: MeshHttpStore):
+        self.put, self.get = store.put, store.get
+        self.put_blob, self.get_blob = store.put_blob, store.get_blob
+
+
+@case(
+    "mesh_http",
+    Param("--files", 200, int),
+    Param("--size", 4096, int),
+    Param("--nodes", 9, int),
+    Param("--replicas", 3, int, "name/manifest replicas"),
+)
+def mesh_http(args: argparse.Namespace) -> None:
+    """Drive push/pull throughput over local node servers: per-request urllib vs. the pooled client.
+
+    Brings up ``--nodes`` ``make_node_server`` stand-ins on loopback, writes ``--files`` random files of
+    ``--size`` bytes to a temp dir, and times ``mesh_sync.push_dir`` then ``mesh_sync.pull_dir`` with:
+
+    - ``urllib``: the previous client — a fresh urllib connection for every fragment / blob request;
+    - ``pooled``: MeshHttpStore's keep-alive pool, single-key requests only (batching hidden);
+    - ``batched``: MeshHttpStore as mesh_sync uses it — pooled, fragment puts through ``batching()``,
+      pulls prefetched with one ``get_many`` per node.
+    """
+    with scratch() as tmp:
+        src = tmp / "src"
+        for i in range(args.files):
+            p = src / f"d{i % 10}" / f"f{i:05d}.bin"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_bytes(os.urandom(args.size))
+        total_mb = args.files * args.size / 1e6
+        print(f"{args.files} files x {args.size} B = {total_mb:.1f} MB  nodes={args.nodes} k=6 n=9")
+        print(f"{'client':>8} {'push s':>8} {'push files/s':>13} {'pull s':>8} {'pull files/s':>13} {'pull MB/s':>10}")
+        for label in ("urllib", "pooled", "batched"):
+            servers, urls = [], {}
+            for i in range(args.nodes):
+                server, urls[f"n{i:02d}"] = make_node_server()
+                servers.append(server)
+            nodes = list(urls)
+            try:
+                http = MeshHttpStore(urls)
+                store = {"urllib": _UrllibStore(urls), "pooled": _PooledOnly(http), "batched": http}[label]
+                push_s, _ = timed(lambda: push_dir(store, nodes, src, writer="bench", placement=PLACEMENT,
+                                                   replicas=args.replicas, state=tmp / f"push-{label}.json"))
+                pull_s, pulled = timed(lambda: pull_dir(store, nodes, tmp / f"dst-{label}", replicas=args.replicas,
+                                                        state=tmp / f"pull-{label}.json"))
+                assert len(pulled) == args.files
+                http.close()
+            finally:
+                _stop(servers)
+            print(f"{label:>8} {push_s:>8.2f} {args.files / push_s:>13.1f} {pull_s:>8.2f} "
+                  f"{args.files / pull_s:>13.1f} {total_mb / pull_s:>10.2f}")
+
+
+# --------------------------------------------------------------------------- #
+# mesh_index
+# --------------------------------------------------------------------------- #
+
+
+class _BlobCountingStore(MeshFsStore):
+    """MeshFsStore that tallies blob bytes moved."""
+
+    moved = 0
+
+    def put_blob(self, node, key, data):
+        self.moved += len(data)
+        super().put_blob(node, key, data)
+
+    def get_blob(self, node, key):
+        data = super().get_blob(node, key)
+        self.moved += len(data or b"")
+        return data
+
+
+def _legacy_index_add(store, path: str) -> None:
+    paths: set = set()
+    for b in read_all("__index__", nodes=NODES, get_blob=store.get_blob, replicas=5):
+        paths |= set(json.loads(b))
+    paths.add(path)
+    publish_blob("__index__", json.dumps(sorted(paths)).encode("utf-8"), nodes=NODES,
+                 put_blob=store.put_blob, replicas=5)
+
+
+def _index_row(label: str, files: int, add_batch, batch: int, tmp: Path) -> None:
+    store = _BlobCountingStore(tmp / label.replace("/", "-"))
+    paths = [f"/photos/{i // 100:03d}/img_{i:06d}.jpg" for i in range(files)]
+    t0 = time.perf_counter()
+    for start in range(0, files, batch):
+        add_batch(store, paths[start:start + batch])
+    secs = time.perf_counter() - t0
+    assert len(mesh_index.list_paths(store, NODES) if label != "legacy" else
+               set(json.loads(read_all("__index__", nodes=NODES, get_blob=store.get_blob)[0]))) == files
+    print(f"{label:>12} {files:>7} {secs:>9.2f} {secs / files * 1e3:>9.3f} {store.moved / 1e6:>10.1f} "
+          f"{store.moved / files / 1e3:>9.1f}")
+
+
+@case(
+    "mesh_index",
+    Param("--files", 10000, int),
+    Param("--legacy-files", 2000, int),
+    Param("--batch", 256, int),
+    Param("--full", False),
+)
+def mesh_index_bench(args: argparse.Namespace) -> None:
+    """Directory-index cost of pushing many files through MeshFsStore: one-blob index vs. sharded index.
+
+    Index maintenance only (the per-file dispersal is identical in every mode), measured as wall time
+    and index bytes moved (read + written, all replicas):
+
+    - ``legacy``: the previous put_file index update — read the whole ``__index__`` list, add one path,
+      rewrite it (run on ``--legacy-files``; it is quadratic);
+    - ``sharded/1``: mesh_index.add_paths once per file (what put_file does);
+    - ``sharded/B``: mesh_index.add_paths once per ``--batch`` files (what put_files / push_dir do).
+
+    ``--full`` also times a complete ``push_dir`` of ``--files`` small files (dispersal included) and a
+    ``list_files`` of the result.
+    """
+    def sharded(store, paths):
+        mesh_index.add_paths(store, NODES, paths)
+
+    with scratch() as tmp:
+        print(f"{'mode':>12} {'files':>7} {'seconds':>9} {'ms/file':>9} {'index MB':>10} {'KB/file':>9}")
+        _index_row("legacy", args.legacy_files, lambda s, ps: [_legacy_index_add(s, p) for p in ps], 1, tmp)
+        _index_row("sharded/1", args.legacy_files, sharded, 1, tmp)
+        _index_row("sharded/1", args.files, sharded, 1, tmp / "big")
+        _index_row(f"sharded/{args.batch}", args.files, sharded, args.batch, tmp)
+        if args.full:
+            src = tmp / "src"
+            for i in range(args.files):
+                p = src / f"d{i // 100:03d}" / f"f{i:06d}.txt"
+                p.parent.mkdir(parents=True, exist_ok=True)
+                p.write_bytes(f"file {i}\n".encode())
+            store = MeshFsStore(tmp / "drive")
+            push_s, _ = timed(lambda: push_dir(store, NODES, src, writer="bench", placement=PLACEMENT,
+                                               state=tmp / "push-state.json"))
+            list_s, listed = timed(lambda: list_files(store, NODES))
+            assert len(listed) == args.files
+            print(f"push_dir {args.files} files: {push_s:.1f} s ({args.files / push_s:.0f} files/s); "
+                  f"list_files: {list_s * 1e3:.0f} ms")
+
+
+# --------------------------------------------------------------------------- #
+# mesh_sync_delta
+# --------------------------------------------------------------------------- #
+
+
+@case(
+    "mesh_sync_delta",
+    Param("--files", 2000, int),
+    Param("--size", 16384, int),
+    Param("--changed", 1.0, float, "percent of files edited"),
+)
+def mesh_sync_delta(args: argparse.Namespace) -> None:
+    """Resync cost of mesh_sync.push_dir / pull_dir with the sync-state cache, on MeshFsStore.
+
+    Creates ``--files`` files (mtimes aged past the racy window), then times:
+
+    - ``push cold``: first push — every file read, dispersed and uploaded;
+    - ``push no-op``: unchanged tree — a stat walk;
+    - ``push 1%``: ``--changed`` percent of files edited;
+    - ``pull cold`` / ``pull no-op``: a second device materializing the Drive, then resyncing.
+    """
+    with scratch() as tmp:
+        src, dst = tmp / "src", tmp / "dst"
+        files = []
+        for i in range(args.files):
+            p = src / f"d{i // 100:03d}" / f"f{i:06d}.bin"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_bytes(os.urandom(args.size))
+            _age(p)
+            files.append(p)
+        store = MeshFsStore(tmp / "mesh")
+
+        def push():
+            return push_dir_report(store, NODES, src, writer="bench", placement=PLACEMENT,
+                                   state=tmp / "push.json")
+
+        def pull():
+            return pull_dir_report(store, NODES, dst, state=tmp / "pull.json")
+
+        def row(label: str, fn) -> None:
+            secs, report = timed(fn)
+            print(f"{label:>11} {secs:>9.3f}  {report.summary()}")
+
+        print(f"{args.files} files x {args.size} B on MeshFsStore ({len(NODES)} nodes)")
+        print(f"{'run':>11} {'seconds':>9}  summary")
+        row("push cold", push)
+        row("push no-op", push)
+        for p in files[:max(1, int(args.files * args.changed / 100))]:
+            p.write_bytes(os.urandom(args.size))
+            _age(p)
+        row(f"push {args.changed:g}%", push)
+        row("pull cold", pull)
+        for p in dst.rglob("*.bin"):
+            _age(p)
+        row("pull no-op", pull)
+
+
+# --------------------------------------------------------------------------- #
+# mesh_chunking
+# --------------------------------------------------------------------------- #
+
+
+class _WireCountingStore(MeshFsStore):
+    """MeshFsStore that tallies fragment bytes written."""
+
+    wire = 0
+
+    def put(self, node, frag, data):
+        self.wire += len(data)
+        super().put(node, frag, data)
+
+
+def _edit(pattern: str, p: Path) -> None:
+    data = p.read_bytes()
+    mid = len(data) // 2
+    if pattern == "insert":
+        p.write_bytes(data[:mid] + os.urandom(100) + data[mid:])
+    elif pattern == "prepend":
+        p.write_bytes(os.urandom(100) + data)
+    elif pattern == "overwrite":
+        p.write_bytes(data[:mid] + os.urandom(4096) + data[mid + 4096:])
+    elif pattern == "append":
+        p.write_bytes(data + os.urandom(64 * 1024))
+    elif pattern == "duplicate":
+        (p.parent / ("copy-" + p.name)).write_bytes(data)
+
+
+def _chunking_rows(label: str, chunker, args: argparse.Namespace, tmp: Path) -> None:
+    src, dst = tmp / label / "src", tmp / label / "dst"
+    src.mkdir(parents=True)
+    for i in range(args.files):
+        (src / f"f{i:04d}.bin").write_bytes(os.urandom(args.size))
+    store = _WireCountingStore(tmp / label / "mesh")
+    logical = stored = 0
+    for pattern in ("cold", "insert", "prepend", "overwrite", "append", "duplicate"):
+        if pattern != "cold":
+            for p in sorted(src.glob("f*.bin"))[:max(1, args.files * args.edited // 100)]:
+                _edit(pattern, p)
+        store.wire = 0
+        push_s, pushed = timed(lambda: push_dir_report(store, NODES, src, writer="bench", placement=PLACEMENT,
+                                                       state=tmp / label / "push.json", chunker=chunker))
+        pulled = pull_dir_report(store, NODES, dst, state=tmp / label / "pull.json", chunker=chunker)
+        logical += sum((src / p.lstrip("/")).stat().st_size for p in pushed.synced)
+        stored += pushed.bytes_moved
+        print(f"{label:>7} {pattern:>10} {len(pushed.synced):>6} {pushed.bytes_moved / 1e6:>9.2f} "
+              f"{store.wire / 1e6:>9.2f} {pulled.bytes_moved / 1e6:>9.2f} {logical / max(stored, 1):>7.2f} "
+              f"{push_s:>7.2f}")
+
+
+@case(
+    "mesh_chunking",
+    Param("--files", 20, int),
+    Param("--size", 1 << 20, int),
+    Param("--edited", 25, int, "percent of files edited per pattern"),
+)
+def mesh_chunking(args: argparse.Namespace) -> None:
+    """Dedup ratio and bytes moved for Drive edits: whole-file leaves vs. content-defined chunks.
+
+    Pushes a tree of ``--files`` random files of ``--size`` bytes through ``mesh_sync.push_dir_report``
+    on MeshFsStore, then applies one edit pattern at a time to ``--edited`` percent of the files, pushing
+    and pulling (on a second device) after each:
+
+    - ``insert``: 100 bytes inserted mid-file (shifts every later byte);
+    - ``prepend``: 100 bytes at the start (the worst case for fixed-size blocks);
+    - ``overwrite``: 4 KiB overwritten in place;
+    - ``append``: 64 KiB appended (a growing log);
+    - ``duplicate``: the files copied to new paths.
+
+    For each run: ``push`` / ``pull`` = chunk bytes uploaded / fetched (SyncReport.bytes_moved), ``wire``
+    = fragment bytes written including parity and replicas, and ``dedup`` = logical bytes pushed so far
+    / unique bytes stored so far.
+    """
+    with scratch() as tmp:
+        print(f"{args.files} files x {args.size} B, {args.edited}% edited per pattern; "
+              f"chunks {DEFAULT_CHUNKER.min_size}/{DEFAULT_CHUNKER.avg_size}/{DEFAULT_CHUNKER.max_size} B")
+        print(f"{'leaves':>7} {'pattern':>10} {'files':>6} {'push MB':>9} {'wire MB':>9} {'pull MB':>9} "
+              f"{'dedup':>7} {'push s':>7}")
+        _chunking_rows("whole", None, args, tmp)
+        _chunking_rows("cdc", DEFAULT_CHUNKER, args, tmp)
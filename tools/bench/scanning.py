@@ -0,0 +1,274 @@
+"""Bench cases: the repository content scanners (source exposure, FIPS checks, REQ-G04) and their cache."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+from pathlib import Path
+
+import check_source_exposure as cse
+import fips_checker
+from compliance_checker import ComplianceChecker, RepoResult
+
+from .harness import ROOT, Param, best, case, git, scratch, timed, words
+
+POLICY = ROOT / "standards" / "source-exposure" / "policy.v0.json"
+WORDS = "def return import self value config token secret key prod data path user the for".split()
+
+
+def _write_tree(root: Path, files: int, lines: int, hit_every: int, hits: list[str], seed: int) -> None:
+    """``files`` source-like modules under ``root``, one in ``hit_every`` carrying one of ``hits``."""
+    rng = random.Random(seed)
+    for i in range(files):
+        d = root / f"pkg{i // 1000:03d}"
+        if i % 1000 == 0:
+            d.mkdir(parents=True, exist_ok=True)
+        body = [" ".join(rng.choice(WORDS) for _ in range(rng.randrange(3, 10))) for _ in range(lines)]
+        if i % hit_every == 0:
+            body[rng.randrange(lines)] += " " + rng.choice(hits)
+        (d / f"mod{i:06d}.py").write_text("\n".join(body) + "\n", "utf-8")
+
+
+# --------------------------------------------------------------------------- #
+# source_exposure
+# --------------------------------------------------------------------------- #
+
+_EXPOSURE_HITS = ["AKIA" + "Q" * 16, "ghp_" + "z" * 36, "PROD_DB_PASSWORD = os.environ['X']",
+                  "xoxb-" + "0123456789ab", "AIza" + "k" * 35]
+
+
+def _per_line_content(path: Path, root: Path, policy: dict) -> tuple[list, bool]:
+    max_bytes = int(policy.get("max_file_bytes", 1048576))
+    try:
+        if path.stat().st_size > max_bytes:
+            return [], True
+        raw = path.read_bytes()
+    except OSError:
+        return [], True
+    if b"\0" in raw:
+        return [], True
+    text = raw.decode("utf-8", errors="replace")
+    rules = [{**rule, "_compiled": re.compile(rule["pattern"])} for rule in policy.get("content_rules", [])]
+    findings = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        for rule in rules:
+            if rule["_compiled"].search(line):
+                severity = rule.get("severity", "warn")
+                findings.append({"rule_id": rule.get("id", "unnamed-rule"),
+                                 "severity": severity if severity in cse.SEVERITIES else "warn",
+                                 "path": cse.rel_path(path, root), "line": line_no,
+                                 "message": rule.get("description", "source exposure rule matched")})
+    return findings, False
+
+
+def _exposure_report(root: Path, workers: int, per_line: bool) -> tuple[float, dict]:
+    real = cse.ContentScanner.scan
+    if per_line:
+        policy = cse.load_policy(POLICY)
+        cse.ContentScanner.scan = lambda self, path, root: _per_line_content(path, root, policy)
+    try:
+        return timed(lambda: cse.build_report(root, POLICY, workers=workers))
+    finally:
+        cse.ContentScanner.scan = real
+
+
+@case(
+    "source_exposure",
+    Param("--files", 100_000, int),
+    Param("--lines", 40, int),
+    Param("--hit-every", 500, int),
+    Param("--workers", "4", words),
+)
+def source_exposure(args: argparse.Namespace) -> None:
+    """Wall time of ``check_source_exposure.build_report`` on a synthetic tree: per-line rules vs. compiled scanner.
+
+    Writes ``--files`` source-like files (``--lines`` lines each, one in ``--hit-every`` carrying
+    a secret-shaped token or a PROD_*_SECRET assignment) under a fresh directory that is not
+    a git checkout, so files come from the ``os.walk`` path, then times three reports:
+
+    - ``per-line``: the previous content scan — every rule recompiled per file and tested
+      against every line (replicated here), inside the same report loop;
+    - ``compiled``: ``build_report(..., workers=1)`` — one ``ContentScanner``, buffer prefilter;
+    - ``workers N``: ``build_report(..., workers=N)`` for each N in ``--workers``;
+
+    and checks every report has identical findings and counts.
+    """
+    with scratch() as tmp:
+        _write_tree(tmp, args.files, args.lines, args.hit_every, _EXPOSURE_HITS, seed=23)
+        runs = [("per-line", 1, True), ("compiled", 1, False),
+                *((f"workers {w}", int(w), False) for w in args.workers)]
+        print(f"{args.files} files x {args.lines} lines, {os.cpu_count()} CPUs")
+        print(f"{'scanner':>10} {'s':>8} {'files/s':>9} {'findings':>9} {'same':>5}")
+        baseline = None
+        for label, workers, per_line in runs:
+            elapsed, report = _exposure_report(tmp, workers, per_line)
+            key = (report["findings"], report["counts"])
+            baseline = baseline or key
+            print(f"{label:>10} {elapsed:>8.2f} {args.files / elapsed:>9.0f} "
+                  f"{len(report['findings']):>9} {str(key == baseline):>5}")
+
+
+# --------------------------------------------------------------------------- #
+# scan_engine
+# --------------------------------------------------------------------------- #
+
+
+def _separate_fips(fips, root: Path) -> dict:
+    """The three content checks as three walks with per-line loops; (file, line, message) tuples."""
+    def lines(skip, patterns):
+        found = []
+        for path in fips._walk_source_files(root, skip_extensions=skip):
+            text = path.read_text(encoding="utf-8", errors="replace")
+            for lineno, line in enumerate(text.splitlines(), start=1):
+                found += [(str(path), lineno, msg) for regex, msg in patterns if regex.search(line)]
+        return found
+
+    algo = [(re.compile(p, re.IGNORECASE), f"Disallowed algorithm detected: {d}")
+            for p, d, _ in fips.DISALLOWED_ALGO_PATTERNS]
+    tls = [(re.compile(p, re.IGNORECASE), d) for p, d in fips.DISALLOWED_TLS_PATTERNS]
+    tls13 = re.compile(fips.TLS13_PATTERN, re.IGNORECASE)
+    worm = [re.compile(p, re.IGNORECASE) for p in fips.WORM_PATTERNS]
+    out = {"algo-scan": lines(fips.ALGO_SCAN_SKIP_EXTENSIONS, algo),
+           "tls-version": lines(fips.ALGO_SCAN_SKIP_EXTENSIONS, tls)}
+    out["tls13"] = [str(p) for p in fips._walk_source_files(root, skip_extensions=fips.ALGO_SCAN_SKIP_EXTENSIONS)
+                    if tls13.search(p.read_text(encoding="utf-8", errors="replace"))]
+    out["audit-worm"] = [str(p) for p in fips._walk_source_files(root)
+                         if any(w.search(p.read_text(encoding="utf-8", errors="replace")) for w in worm)]
+    return out
+
+
+def _engine_fips(fips, root: Path) -> dict:
+    results = fips.run_content_checks(root)
+    prefix = "TLS 1.3 configuration found in: "
+    return {
+        "algo-scan": [(f.file, f.line, f.message) for f in results["algo-scan"].findings],
+        "tls-version": [(f.file, f.line, f.message) for f in results["tls-version"].findings if f.file],
+        "tls13": [e[len(prefix):] for e in results["tls-version"].evidence],
+        "audit-worm": [e.split(": ", 1)[1] for e in results["audit-worm"].evidence],
+    }
+
+
+def _separate_prohibited(checker: ComplianceChecker, root: Path) -> list[str]:
+    req = next(r for r in checker._global_reqs if r["id"] == "REQ-G04")
+    patterns = [re.compile(p) for p in req.get("patterns", [])]
+    found = []
+    for src in root.rglob("*.py"):
+        if req.get("excludes") and ("test" in src.name.lower() or "spec" in src.name.lower()):
+            continue
+        content = src.read_text("utf-8", errors="ignore")
+        hit = next((p for p in patterns if p.search(content)), None)
+        if hit is not None:
+            found.append(f"Prohibited algorithm pattern '{hit.pattern}' found in {src.relative_to(root)}")
+    return found
+
+
+def _engine_prohibited(checker: ComplianceChecker, root: Path) -> list[str]:
+    result = RepoResult(repo_name="workspace", layer="", role="", priority="", status="")
+    checker._check_no_prohibited_algorithms({"name": "workspace"}, root, result)
+    return [v.detail for v in result.violations]
+
+
+@case(
+    "scan_engine",
+    Param("--root", str(ROOT)),
+    Param("--repeat", 3, int),
+)
+def scan_engine(args: argparse.Namespace) -> None:
+    """Wall time of the compliance content scans on the workspace: separate walks vs. the shared scan engine.
+
+    ``separate`` is the previous behaviour, kept here as the baseline: ``check_algo_scan``,
+    ``check_tls_version`` and ``check_audit_worm`` each walk ``--root`` and re-read every file,
+    testing every pattern against every line, and the compliance checker's REQ-G04
+    check recompiles its patterns and ``rglob``s ``*.py`` per run. ``engine`` is
+    ``run_content_checks`` (one walk, one read per file, buffer prefilter) and the
+    engine-backed REQ-G04 check. Both sides run ``--repeat`` times (best kept), without
+    the scan cache, and the results are checked identical.
+    """
+    root = Path(args.root).resolve()
+    fips = fips_checker.load()
+    checker = ComplianceChecker()
+    files = sum(1 for _ in fips._walk_source_files(root))
+    print(f"{root}: {files} files in the FIPS walk, {sum(1 for _ in root.rglob('*.py'))} *.py")
+    print(f"{'scan':>22} {'separate s':>11} {'engine s':>9} {'speedup':>8} {'same':>5}")
+    for label, old, new in (
+        ("fips content checks", lambda: _separate_fips(fips, root), lambda: _engine_fips(fips, root)),
+        ("REQ-G04", lambda: _separate_prohibited(checker, root), lambda: _engine_prohibited(checker, root)),
+    ):
+        old_s, old_out = best(old, args.repeat)
+        new_s, new_out = best(new, args.repeat)
+        print(f"{label:>22} {old_s:>11.2f} {new_s:>9.2f} {old_s / new_s:>7.1f}x {str(old_out == new_out):>5}")
+
+
+# --------------------------------------------------------------------------- #
+# scan_cache
+# --------------------------------------------------------------------------- #
+
+_CACHE_HITS = ["AKIA" + "Q" * 16, "h = hashlib.md5(data)", "ctx = ssl.PROTOCOL_TLSv1_2", "bucket_mode = 'WORM'"]
+
+
+def _cached_scanners(fips):
+    def exposure(repo, cache):
+        report = cse.build_report(repo, POLICY, cache_path=cache)
+        return report["findings"], report["counts"]
+
+    def fips_checks(repo, cache):
+        return [check(repo, cache) for check in (fips.check_algo_scan, fips.check_tls_version,
+                                                 fips.check_audit_worm)]
+
+    def prohibited(repo, cache):
+        result = RepoResult(repo_name="bench", layer="", role="", priority="", status="")
+        ComplianceChecker(cache_path=cache)._check_no_prohibited_algorithms({"name": "bench"}, repo, result)
+        return result.violations
+
+    return {"source-exposure": exposure, "fips (3 checks)": fips_checks, "REQ-G04": prohibited}
+
+
+@case(
+    "scan_cache",
+    Param("--files", 20_000, int),
+    Param("--lines", 40, int),
+    Param("--hit-every", 200, int),
+)
+def scan_cache(args: argparse.Namespace) -> None:
+    """Cold vs. warm wall time of the repository content scanners with the blob-SHA scan cache.
+
+    Commits ``--files`` source-like files (``--lines`` lines each, a planted hit in one of
+    every ``--hit-every``) to a fresh git repository, then times each scanner:
+
+    - ``uncached``: no ``cache_path``;
+    - ``cold``: an empty cache file (every file scanned, results stored);
+    - ``warm``: the same tree again (every file answered from the cache);
+    - ``3-file diff``: after a commit that rewrites three files;
+
+    for ``check_source_exposure.build_report``, the FIPS checker's three content checks
+    (``check_algo_scan``, ``check_tls_version``, ``check_audit_worm``) and the compliance
+    checker's REQ-G04 prohibited-algorithm check, and checks every cached run reports
+    exactly what the uncached run on the same tree reports.
+    """
+    with scratch() as tmp:
+        repo = tmp / "repo"
+        _write_tree(repo, args.files, args.lines, args.hit_every, _CACHE_HITS, seed=24)
+        git(repo, "init", "-q")
+        git(repo, "add", ".")
+        git(repo, "commit", "-qm", "bench tree")
+        print(f"{args.files} committed files x {args.lines} lines, {os.cpu_count()} CPUs")
+        print(f"{'scanner':>16} {'uncached s':>11} {'cold s':>8} {'warm s':>8} {'3-file s':>9} {'same':>5}")
+        runs = _cached_scanners(fips_checker.load())
+        cache = tmp / "scan.sqlite"
+        rows = {}
+        for name, scan in runs.items():
+            plain_s, plain = timed(scan, repo, None)
+            cold_s, cold = timed(scan, repo, cache)
+            warm_s, warm = timed(scan, repo, cache)
+            rows[name] = [plain_s, cold_s, warm_s, plain == cold == warm]
+        for i in range(3):
+            path = repo / "pkg000" / f"mod{i:06d}.py"
+            path.write_text(path.read_text("utf-8") + f"extra_{i} = hashlib.sha1(b'')\n", "utf-8")
+        git(repo, "commit", "-qam", "three files")
+        for name, scan in runs.items():
+            diff_s, diff = timed(scan, repo, cache)
+            row = rows[name]
+            same = row[3] and diff == scan(repo, None)
+            print(f"{name:>16} {row[0]:>11.2f} {row[1]:>8.2f} {row[2]:>8.2f} {diff_s:>9.2f} {str(same):>5}")
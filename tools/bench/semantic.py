@@ -0,0 +1,291 @@
+"""Bench cases: the vendored ``procyber.semantic`` kernel (terms, term sets, intent routing)."""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from procyber.semantic import intent_address as ia
+from procyber.semantic import semantic_algebra as sa
+
+from .harness import Param, best, case, ints, latencies, p50, timed
+
+
+def _ms(fn, repeat: int) -> float:
+    return best(fn, repeat)[0] * 1e3
+
+
+# --------------------------------------------------------------------------- #
+# semantic_terms
+# --------------------------------------------------------------------------- #
+
+
+@dataclass(frozen=True)
+class _StructuralTerm:
+    primitive: Optional[str] = None
+    ground: Optional["_StructuralTerm"] = None
+    differentia: Optional["_StructuralTerm"] = None
+    mode: Optional["_StructuralTerm"] = None
+
+    def __post_init__(self) -> None:
+        if (self.primitive is not None) == (self.ground is not None):
+            raise ValueError("a Term is either a primitive or a product, not both/neither")
+        if self.primitive is not None and self.primitive not in sa.PRIMITIVES:
+            raise ValueError(f"unknown primitive {self.primitive!r}")
+
+    @property
+    def layer(self) -> int:
+        return 0 if self.primitive is not None else self.ground.layer + 1
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.primitive is not None
+
+    def roles(self) -> dict:
+        if self.is_leaf:
+            return {}
+        return {"ground": self.ground, "differentia": self.differentia, "mode": self.mode}
+
+    def code(self) -> str:
+        if self.is_leaf:
+            return str(self.primitive)
+        return f"({self.ground.code()} {self.differentia.code()} {self.mode.code()})"
+
+
+def _structural_distance(a, b) -> int:
+    if a.layer != b.layer:
+        raise sa.LayerError("cross-layer")
+    if a == b:
+        return 0
+    if a.is_leaf or b.is_leaf:
+        return 1
+    return sum(_structural_distance(a.roles()[r], b.roles()[r]) > 0 and 1 or 0 for r in sa.ROLES) or 1
+
+
+def _structural_pullback(cells, constraint):
+    return {c for c in cells if not c.is_leaf and all(c.roles()[r] == w for r, w in constraint.items())}
+
+
+_TERM_IMPLS = {
+    "structural": (_StructuralTerm, _structural_distance, _structural_pullback),
+    "interned": (sa.Term, sa.distance,
+                 lambda cells, constraint: set(sa.pullback(sa.TermSet(frozenset(cells)), constraint))),
+}
+
+
+def _random_shape(rng: random.Random, layer: int):
+    """A term as nested tuples of primitive symbols — built into either Term class later."""
+    if layer == 0:
+        return rng.choice(sa.PRIMITIVES)
+    return tuple(_random_shape(rng, layer - 1) for _ in sa.ROLES)
+
+
+def _build(cls, shape):
+    if isinstance(shape, str):
+        return cls(primitive=shape)
+    g, d, m = (_build(cls, s) for s in shape)
+    return cls(ground=g, differentia=d, mode=m)
+
+
+def _term_ops(name: str, deep_shapes, wide_shapes, pairs: int, repeat: int) -> dict:
+    cls, distance, pullback = _TERM_IMPLS[name]
+    out = {}
+    out["deep build"] = _ms(lambda: [_build(cls, s) for s in deep_shapes], repeat)
+    a = [_build(cls, s) for s in deep_shapes]
+    b = [_build(cls, s) for s in deep_shapes]
+    out["deep =="] = _ms(lambda: [x == y for x, y in zip(a, b)], repeat)
+    out["deep hash"] = _ms(lambda: [hash(x) for x in b], repeat)
+    out["deep layer"] = _ms(lambda: [x.layer for x in a], repeat)
+    out["deep code"] = _ms(lambda: [x.code() for x in a], repeat)
+    out["deep dist"] = _ms(lambda: [distance(x, y) for x, y in zip(a, a[1:])], repeat)
+    out["wide build"] = _ms(lambda: [_build(cls, s) for s in wide_shapes], repeat)
+    w = [_build(cls, s) for s in wide_shapes]
+    out["wide set"] = _ms(lambda: set(w), repeat)
+    out["wide sort"] = _ms(lambda: sorted(w, key=lambda t: t.code()), repeat)
+    head = w[:pairs]
+    out["wide dist"] = _ms(lambda: [distance(x, y) for x in head for y in head], repeat)
+    want = {"ground": w[0].ground}
+    out["pullback"] = _ms(lambda: pullback(w, want), repeat)
+    return out
+
+
+@case(
+    "semantic_terms",
+    Param("--deep", 200, int),
+    Param("--wide", 20000, int),
+    Param("--pairs", 300, int),
+    Param("--repeat", 5, int),
+)
+def semantic_terms(args: argparse.Namespace) -> None:
+    """Hash-consed ``procyber.semantic`` Terms vs. the previous structural dataclass, on deep and wide terms.
+
+    ``structural`` is the previous ``Term`` verbatim in behaviour — a frozen dataclass whose
+    equality, hash, ``layer``, ``code()`` and ``roles()`` walk the tree on every call, and the
+    recursive ``distance`` — kept here as the baseline. ``interned`` is the vendored kernel.
+
+    Workloads (best of ``--repeat`` runs each, milliseconds):
+
+    - ``deep``: the ``--deep`` most recently built layer-4 terms (81 leaves each), each built
+      twice from primitives: construction, ``==`` between the two copies, ``hash``, ``layer``,
+      ``code()``, and ``distance`` between neighbouring terms;
+    - ``wide``: ``--wide`` distinct layer-2 terms: construction, a ``set`` of them, sorting by
+      ``code()``, all-pairs ``distance`` over the first ``--pairs``, and a ``pullback`` on one role.
+    """
+    rng = random.Random(19)
+    deep_shapes = [_random_shape(rng, 4) for _ in range(args.deep)]
+    wide_shapes = list({_random_shape(rng, 2): None for _ in range(args.wide)})
+    results = {name: _term_ops(name, deep_shapes, wide_shapes, args.pairs, args.repeat) for name in _TERM_IMPLS}
+    print(f"{args.deep} layer-4 terms, {len(wide_shapes)} distinct layer-2 terms, "
+          f"{args.pairs}^2 distance pairs")
+    print(f"{'op':>11} {'structural ms':>14} {'interned ms':>12} {'speedup':>8}")
+    for op in results["structural"]:
+        s, i = results["structural"][op], results["interned"][op]
+        print(f"{op:>11} {s:>14.2f} {i:>12.2f} {s / i:>7.1f}x")
+
+
+# --------------------------------------------------------------------------- #
+# semantic_termset
+# --------------------------------------------------------------------------- #
+
+
+def _layer1() -> list:
+    return [sa.mul(sa.prim(a), sa.prim(b), sa.prim(c))
+            for a in sa.PRIMITIVES for b in sa.PRIMITIVES for c in sa.PRIMITIVES]
+
+
+@case(
+    "semantic_termset",
+    Param("--size", 50000, int),
+    Param("--fillers", 216, int),
+    Param("--queries", 200, int),
+)
+def semantic_termset(args: argparse.Namespace) -> None:
+    """Indexed ``TermSet`` queries vs. the brute-force scans, against a large layer-2 lexicon.
+
+    Builds ``--size`` distinct layer-2 terms (roles drawn from ``--fillers`` layer-1 terms, so
+    postings are ``size / fillers`` long on average) and times, per query, over ``--queries``
+    random targets and constraints:
+
+    - ``pullback``: one- and two-role constraints, ``pullback`` vs. ``_pullback_scan``;
+    - ``neighbours r``: ``TermSet.neighbours`` vs. the module ``neighbours`` scan at radius r;
+    - ``nearest k``: ``TermSet.nearest`` vs. sorting every member by (distance, code);
+
+    checking every indexed answer equals the brute-force one. ``index build`` is the one-off
+    cost of the first indexed query on a fresh set.
+    """
+    rng = random.Random(20)
+    layer1 = _layer1()[:args.fillers]
+    terms = set()
+    while len(terms) < args.size:
+        terms.add(sa.mul(*rng.sample(layer1, 3)))
+    cells = sa.TermSet(frozenset(terms))
+    members = list(cells.terms)
+    build_s, _ = timed(cells.headed, sa.NIL)
+    targets = [rng.choice(members) if i % 2 else sa.mul(*rng.sample(layer1, 3))
+               for i in range(args.queries)]
+    constraints = [{r: rng.choice(layer1) for r in rng.sample(sa.ROLES, 1 + i % 2)}
+                   for i in range(args.queries)]
+
+    def ranked(t):
+        return tuple(sorted(members, key=lambda c: (sa.distance(t, c), c.code())))
+
+    rows = [
+        ("pullback", constraints,
+         lambda c: sa.pullback(cells, c), lambda c: sa._pullback_scan(cells, c)),
+        *((f"neighbours {r}", targets,
+           lambda t, r=r: cells.neighbours(t, r), lambda t, r=r: sa.neighbours(t, members, r))
+          for r in (1, 2)),
+        ("nearest 10", targets[:max(1, args.queries // 10)],
+         lambda t: cells.nearest(t, 10), lambda t: ranked(t)[:10]),
+    ]
+    print(f"{len(cells)} layer-2 terms over {len(layer1)} fillers; index build {build_s * 1e3:.1f} ms")
+    print(f"{'query':>13} {'scan ms':>9} {'index ms':>9} {'speedup':>8} {'same':>5}")
+    for label, inputs, indexed, brute in rows:
+        same = all(indexed(a) == brute(a) for a in inputs[:20])
+        b, i = p50(latencies(brute, inputs)), p50(latencies(indexed, inputs))
+        print(f"{label:>13} {b:>9.3f} {i:>9.3f} {b / i:>7.0f}x {str(same):>5}")
+
+
+# --------------------------------------------------------------------------- #
+# intent_routing
+# --------------------------------------------------------------------------- #
+
+
+def _intent_lexicon(n: int) -> dict:
+    layer1 = _layer1()
+    anchors = [ia.column_anchor(c) for c in ia.COLUMNS if c != "sense"]
+    cells = itertools.product(layer1, layer1, anchors)
+    return {f"intent-{k}": sa.SemanticAddress(term=sa.mul(g, d, m))
+            for k, (d, m, g) in zip(range(n), cells)}
+
+
+def _brute_bind_tiered(query, upper, lower):
+    anchors = sa.neighbours(query, upper.terms, radius=1)
+    if not anchors:
+        return sa.BOTTOM
+    admitted = [c for c in lower.terms if not c.is_leaf and c.roles()["ground"] == anchors[0]]
+    return sorted(admitted, key=lambda t: t.code())[0] if admitted else sa.BOTTOM
+
+
+def _per_call_route(column: str, addresses: dict):
+    topic_terms = [a.term for n, a in addresses.items()
+                   if n != ia.META_ROW and a.term is not sa.BOTTOM and a.term.layer == 2]
+    if not topic_terms:
+        return sa.BOTTOM
+    upper = sa.add(*[ia.column_anchor(c) for c in ia.COLUMNS])
+    return _brute_bind_tiered(ia.column_anchor(column), upper, sa.add(*topic_terms))
+
+
+def _rate(fn, seconds: float) -> float:
+    """Calls per second of ``fn(column)``, cycling the columns for at least ``seconds``."""
+    columns = itertools.cycle(ia.COLUMNS)
+    calls, t0 = 0, time.perf_counter()
+    while True:
+        fn(next(columns))
+        calls += 1
+        elapsed = time.perf_counter() - t0
+        if elapsed >= seconds and calls >= len(ia.COLUMNS):
+            return calls / elapsed
+
+
+@case(
+    "intent_routing",
+    Param("--sizes", "1000,10000,100000", ints),
+    Param("--seconds", 2.0, float),
+)
+def intent_routing(args: argparse.Namespace) -> None:
+    """Routes per second of ``intent_address.route`` against large lexicons: per-call vs. compiled.
+
+    For each size in ``--sizes`` a lexicon of that many distinct layer-2 intent addresses is
+    spread over the five populated columns (``sense`` left empty, as in the estate), then
+    queries cycle through all six columns four ways:
+
+    - ``per-call``: the previous ``route`` — both tiers rebuilt and ``bind_tiered`` run with
+      brute-force scans on every query (replicated here; the kernel no longer has it);
+    - ``route``: today's ``route(column, addresses)`` over a plain dict — the lexicon's topic
+      terms are fingerprinted and the cached ``RoutingTable`` looked up per query;
+    - ``lexicon``: the same call over an ``ia.Lexicon`` — the table is found by the lexicon's
+      identity and edit count;
+    - ``table``: ``compile_routes(addresses).route(column)`` on a held table.
+
+    ``compile ms`` is the one-off cost of the first query against a lexicon. Every mode must
+    give the same answer for every column.
+    """
+    print(f"{'anchors':>8} {'compile ms':>11} {'per-call/s':>11} {'route/s':>10} {'lexicon/s':>11} "
+          f"{'table/s':>11} {'same':>5}")
+    for n in args.sizes:
+        addresses = _intent_lexicon(n)
+        versioned = ia.Lexicon(addresses)
+        compile_s, table = timed(ia.compile_routes, addresses)
+        same = all(_per_call_route(c, addresses) is ia.route(c, addresses) is ia.route(c, versioned)
+                   is table.route(c) for c in ia.COLUMNS)
+        slow = _rate(lambda c: _per_call_route(c, addresses), args.seconds)
+        cached = _rate(lambda c: ia.route(c, addresses), args.seconds)
+        keyed = _rate(lambda c: ia.route(c, versioned), args.seconds)
+        held = _rate(table.route, args.seconds)
+        print(f"{n:>8} {compile_s * 1e3:>11.1f} {slow:>11.1f} {cached:>10.1f} {keyed:>11.0f} "
+              f"{held:>11.0f} {str(same):>5}")
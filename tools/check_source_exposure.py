@@ -18,8 +18,15 @@ import sys
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from automation import scan_cache  # noqa: E402
+from automation.scan_engine import rule_literals  # noqa: E402
+from gbrg.governance import partition_pool  # noqa: E402
+
 
 SEVERITIES = ("block", "warn", "info")
+# Bump when ContentScanner's output for the same bytes and rules changes; keys the scan cache.
+CONTENT_SCAN_VERSION = 1
 
 
 def now_iso() -> str:
@@ -128,53 +135,118 @@ def path_findings(path: Path, root: Path, policy: dict[str, Any]) -> list[dict[s
     return findings
 
 
+class ContentScanner:
+    """A policy's content rules, compiled once and applied per file buffer.
+
+    Every rule with a derivable required literal feeds one combined literal
+    alternation. A file whose buffer holds none of those literals (and with no
+    rule lacking one) is done after a single search; otherwise only lines
+    carrying a literal run the full rule set, in policy order. Findings are
+    exactly those of testing every rule against every line.
+    """
+
+    def __init__(self, policy: dict[str, Any]) -> None:
+        self.max_bytes = int(policy.get("max_file_bytes", 1048576))
+        self.rules: list[tuple[re.Pattern[str], str, str, str]] = []
+        prefilter: list[str] = []
+        always: list[int] = []
+        for i, rule in enumerate(policy.get("content_rules", [])):
+            severity = rule.get("severity", "warn")
+            self.rules.append((
+                re.compile(rule["pattern"]),
+                rule.get("id", "unnamed-rule"),
+                severity if severity in SEVERITIES else "warn",
+                rule.get("description", "source exposure rule matched"),
+            ))
+            derived = rule_literals(rule["pattern"])
+            if derived is None:
+                always.append(i)
+                continue
+            literals, ignorecase = derived
+            prefilter.extend(f"(?i:{re.escape(a)})" if ignorecase else re.escape(a) for a in literals)
+        self.prefilter = re.compile("|".join(prefilter)) if prefilter else None
+        self.always = [self.rules[i] for i in always]
+
+    def scan(self, path: Path, root: Path) -> tuple[list[dict[str, Any]], bool]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return [], True
+
+        if stat.st_size > self.max_bytes:
+            return [], True
+
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return [], True
+
+        if b"\0" in raw:
+            return [], True
+
+        text = raw.decode("utf-8", errors="replace")
+        prefilter = self.prefilter
+        if not self.always and (prefilter is None or not prefilter.search(text)):
+            return [], False
+
+        findings: list[dict[str, Any]] = []
+        rel = None
+        for line_no, line in enumerate(text.splitlines(), start=1):
+            rules = self.rules if prefilter is not None and prefilter.search(line) else self.always
+            for compiled, rule_id, severity, message in rules:
+                if compiled.search(line):
+                    rel = rel or rel_path(path, root)
+                    findings.append(
+                        {
+                            "rule_id": rule_id,
+                            "severity": severity,
+                            "path": rel,
+                            "line": line_no,
+                            "message": message,
+                        }
+                    )
+        return findings, False
+
+
 def content_findings(path: Path, root: Path, policy: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
-    max_bytes = int(policy.get("max_file_bytes", 1048576))
-    try:
-        stat = path.stat()
-    except OSError:
-        return [], True
+    return ContentScanner(policy).scan(path, root)
 
-    if stat.st_size > max_bytes:
-        return [], True
 
-    try:
-        raw = path.read_bytes()
-    except OSError:
-        return [], True
-
-    if b"\0" in raw:
-        return [], True
-
-    text = raw.decode("utf-8", errors="replace")
-    rules = [
-        {
-            **rule,
-            "_compiled": re.compile(rule["pattern"]),
-        }
-        for rule in policy.get("content_rules", [])
-    ]
+def scan_content(path: Path, root: Path, scanner: ContentScanner) -> tuple[list[dict[str, Any]], bool] | None:
+    """Content findings for one candidate, or None when it is not a regular file."""
+    if not path.exists() or not path.is_file():
+        return None
+    return scanner.scan(path, root)
 
-    findings: list[dict[str, Any]] = []
-    for line_no, line in enumerate(text.splitlines(), start=1):
-        for rule in rules:
-            if rule["_compiled"].search(line):
-                severity = rule.get("severity", "warn")
-                if severity not in SEVERITIES:
-                    severity = "warn"
-                findings.append(
-                    {
-                        "rule_id": rule.get("id", "unnamed-rule"),
-                        "severity": severity,
-                        "path": rel_path(path, root),
-                        "line": line_no,
-                        "message": rule.get("description", "source exposure rule matched"),
-                    }
-                )
-    return findings, False
-
-
-def build_report(root: Path, policy_path: Path) -> dict[str, Any]:
+
+def _scanner_state(root: Path, policy: dict[str, Any]) -> tuple[Path, ContentScanner]:
+    return root, ContentScanner(policy)
+
+
+def _scan_chunk(
+    state: tuple[Path, ContentScanner], paths: list[Path]
+) -> list[tuple[list[dict[str, Any]], bool] | None]:
+    root, scanner = state
+    return [scan_content(p, root, scanner) for p in paths]
+
+
+def content_ruleset(policy: dict[str, Any]) -> str:
+    """Scan-cache key of everything besides the file bytes that content findings depend on."""
+    return scan_cache.ruleset_hash(
+        "source-exposure",
+        CONTENT_SCAN_VERSION,
+        policy.get("content_rules", []),
+        int(policy.get("max_file_bytes", 1048576)),
+    )
+
+
+def build_report(
+    root: Path,
+    policy_path: Path,
+    *,
+    workers: int = 1,
+    cache_path: Path | None = None,
+) -> dict[str, Any]:
     policy = load_policy(policy_path)
     ignored_dirs = set(policy.get("ignored_dirs", []))
     tracked = git_tracked_files(root)
@@ -184,21 +256,61 @@ def build_report(root: Path, policy_path: Path) -> dict[str, Any]:
     skipped = 0
     scanned = 0
 
+    wanted = []
     for path in candidates:
         if is_ignored(path, root, ignored_dirs):
             skipped += 1
-            continue
-        if not path.exists() or not path.is_file():
+        else:
+            wanted.append(path)
+
+    # Content results of unchanged blobs come from the cache; only the rest are read.
+    contents: list[tuple[list[dict[str, Any]], bool] | None] = [None] * len(wanted)
+    blobs: list[str | None] = [None] * len(wanted)
+    cache = None
+    if cache_path is not None:
+        shas = scan_cache.blob_shas(root) or {}
+        blobs = [shas.get(rel_path(p, root)) for p in wanted]
+        cache = scan_cache.ScanCache(cache_path, "source-exposure", content_ruleset(policy))
+        cached = cache.get_many(b for b in blobs if b is not None)
+        for i, blob in enumerate(blobs):
+            if blob in cached:
+                hit, was_skipped = cached[blob]
+                rel = rel_path(wanted[i], root)
+                contents[i] = ([{**f, "path": rel} for f in hit], was_skipped)
+    pending = [i for i, c in enumerate(contents) if c is None]
+
+    try:
+        todo = [wanted[i] for i in pending]
+        if workers > 1 and len(todo) > 1:
+            # Compiled rules do not pickle cheaply: each worker builds its own scanner.
+            with partition_pool.state_pool(workers, factory=_scanner_state, args=(root, policy)) as pool:
+                fresh = partition_pool.map_partitioned(_scan_chunk, todo, None, pool, workers)
+        else:
+            fresh = _scan_chunk(_scanner_state(root, policy), todo)
+        for i, result in zip(pending, fresh):
+            contents[i] = result
+
+        if cache is not None:
+            cache.put_many(
+                (blobs[i], ([{k: v for k, v in f.items() if k != "path"} for f in result[0]], result[1]))
+                for i, result in zip(pending, fresh)
+                if result is not None and blobs[i] is not None
+            )
+    finally:
+        if cache is not None:
+            cache.close()
+
+    for path, content in zip(wanted, contents):
+        if content is None:
             skipped += 1
             continue
-
+        content_matches, was_skipped = content
         findings.extend(path_findings(path, root, policy))
-        content_matches, was_skipped = content_findings(path, root, policy)
+        findings.extend(content_matches)
         if was_skipped:
             skipped += 1
         else:
             scanned += 1
-            findings.extend(content_matches)
 
     counts = {
         "files_scanned": scanned,
@@ -208,7 +320,7 @@ def build_report(root: Path, policy_path: Path) -> dict[str, Any]:
         "info": sum(1 for f in findings if f["severity"] == "info"),
     }
 
-    return {
+    report: dict[str, Any] = {
         "schema_version": "sociosphere.source-exposure-report/v1",
         "generated_at": now_iso(),
         "root": str(root),
@@ -220,6 +332,9 @@ def build_report(root: Path, policy_path: Path) -> dict[str, Any]:
         "counts": counts,
         "findings": findings,
     }
+    if cache is not None:
+        report["cache"] = {"path": str(cache_path), "hits": len(wanted) - len(pending), "rescanned": len(pending)}
+    return report
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -235,11 +350,30 @@ def main(argv: list[str] | None = None) -> int:
         default="artifacts/source-exposure/source-exposure-report.json",
         help="Report output path. Use '-' for stdout only.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Scan files on this many processes (0 = one per CPU).",
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help="SQLite scan cache; files whose git blob is unchanged are not rescanned.",
+    )
     args = parser.parse_args(argv)
 
     root = Path(args.root).resolve()
     policy_path = (root / args.policy).resolve() if not Path(args.policy).is_absolute() else Path(args.policy)
-    report = build_report(root, policy_path)
+    cache_path = None
+    if args.cache:
+        cache_path = (root / args.cache).resolve() if not Path(args.cache).is_absolute() else Path(args.cache)
+    report = build_report(
+        root,
+        policy_path,
+        workers=args.workers or os.cpu_count() or 1,
+        cache_path=cache_path,
+    )
 
     rendered = json.dumps(report, indent=2, sort_keys=True) + "\n"
     if args.json_out == "-":
@@ -254,6 +388,8 @@ def main(argv: list[str] | None = None) -> int:
             f"block={report['counts']['block']} warn={report['counts']['warn']} "
             f"files_scanned={report['counts']['files_scanned']}"
         )
+        if "cache" in report:
+            print(f"[source-exposure] cache hits={report['cache']['hits']} rescanned={report['cache']['rescanned']}")
 
     return 0 if report["result"] == "pass" else 2
 
@@ -0,0 +1,35 @@
+"""Import access to ``tools/validator/fips-compliance-checker.py``.
+
+The checker is run as a script and its file name is hyphenated, so it cannot be
+imported by name. :func:`load` executes it once, registers it in ``sys.modules``
+as ``fips_compliance_checker`` (its dataclasses resolve annotations through
+there), and returns that module on every later call. The scan tests and the
+scan benchmarks both go through it.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+NAME = "fips_compliance_checker"
+PATH = Path(__file__).resolve().parent / "validator" / "fips-compliance-checker.py"
+
+
+def load() -> ModuleType:
+    """The FIPS compliance checker module, loaded on first use."""
+    module = sys.modules.get(NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(NAME, PATH)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"could not load {PATH}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[NAME] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[NAME]
+            raise
+    return module
@@ -5,7 +5,7 @@ Canonical workspace runner for manifest+lock orchestration.
 
 Commands:
   - list:            show manifest repos + whether materialized
-  - fetch:           materialize missing repos (git clone) and checkout lock rev
+  - fetch:           materialize missing repos at the lock rev (parallel, shallow, optional shared cache)
   - lock-verify:     verify role validity plus manifest/lock/drift state
   - lock-update:     update lock revisions from currently-materialized repos
   - inventory:       print repo / revision / license supply-chain report
@@ -14,6 +14,7 @@ Commands:
   - validate-trust:  validate trust repo presence and trust metadata
   - trust-report:    emit a structured trust report for the workspace
   - run:             run a task (build/test/lint/etc.) across selected repos and emit structured artifacts
+                     (--jobs N for a bounded worker pool, --topo to honour dependency order)
   - check-manifest:  validate manifest role/path naming conventions
   - sbom:            emit a CycloneDX 1.4 JSON SBOM for the workspace
 
@@ -26,8 +27,13 @@ import argparse
 import datetime as dt
 import hashlib
 import json
+import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
@@ -489,6 +495,203 @@ def cmd_list(args: argparse.Namespace) -> int:
     return 0
 
 
+def _dir_bytes(path: Path) -> int:
+    total = 0
+    for p in path.rglob("*"):
+        try:
+            if p.is_file() and not p.is_symlink():
+                total += p.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _git(args: list[str], cwd: Path | None = None) -> str:
+    """git with captured output, so concurrent fetches do not interleave progress
+    meters; a failure raises with git's own stderr attached."""
+    cp = _run(["git", *args], cwd=cwd, check=False, capture=True)
+    if cp.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)}: {(cp.stderr or '').strip()[-400:]}")
+    return cp.stdout.strip()
+
+
+def git_cache_path(cache_dir: Path, url: str) -> Path:
+    return cache_dir / (hashlib.sha256(url.encode("utf-8")).hexdigest()[:24] + ".git")
+
+
+def _is_sha(want: str) -> bool:
+    return len(want) == 40 and all(c in "0123456789abcdef" for c in want.lower())
+
+
+def _has_commit(git_args: list[str], cwd: Path | None, want: str) -> str:
+    try:
+        return _git([*git_args, "rev-parse", "--verify", "-q", f"{want}^{{commit}}"], cwd=cwd)
+    except RuntimeError:
+        return ""
+
+
+def _fetch_locked(
+    git_args: list[str],
+    cwd: Path | None,
+    remote: str,
+    rev: str,
+    ref: str | None,
+    shallow: list[str],
+    partial: list[str],
+) -> None:
+    """Fetch the lock revision ``rev`` from ``remote``, deepening until it is present.
+
+    The first attempt asks for the SHA itself at the requested depth. Servers
+    that only serve advertised objects (no ``uploadpack.allowReachableSHA1InWant``)
+    refuse that, and a shallow fetch of the ref may stop short of an older lock
+    revision, so the fallbacks are the ref's full history and then every branch
+    and tag. Raises RuntimeError with the last git error if ``rev`` never appears.
+    """
+    attempts = [[*shallow, *partial, remote, rev]]
+    if ref and ref != "HEAD":
+        attempts.append([*partial, remote, f"+{ref}:refs/remotes/origin/{ref}"])
+    attempts.append([*partial, remote, "+refs/heads/*:refs/remotes/origin/*", "+refs/tags/*:refs/tags/*"])
+    error: RuntimeError | None = None
+    for attempt in attempts:
+        try:
+            _git([*git_args, "fetch", "--no-tags", "-q", *attempt], cwd=cwd)
+        except RuntimeError as exc:
+            error = exc
+            continue
+        if _has_commit(git_args, cwd, rev):
+            return
+    raise error or RuntimeError(f"{remote} does not contain {rev}")
+
+
+def fill_git_cache(cache_dir: Path, url: str, want: str, ref: str | None = None) -> tuple[Path, str]:
+    """Bring the shared reference repository for ``url`` up to ``want``.
+
+    The cache is a full (non-shallow) bare repo, one per URL, shared by every
+    workspace that points ``--cache-dir`` at it; workspaces borrow its objects via
+    ``objects/info/alternates`` instead of downloading them again. Fetches into it
+    are serialized with a file lock so two workspaces materializing at once cannot
+    race on the same pack. Returns the cache path and the commit ``want`` resolved to.
+    """
+    import fcntl
+
+    cache = git_cache_path(cache_dir, url)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache.with_suffix(".lock"), "w") as lock_fh:
+        fcntl.flock(lock_fh, fcntl.LOCK_EX)
+        if not (cache / "HEAD").exists():
+            _git(["init", "-q", "--bare", str(cache)])
+        git_dir = ["--git-dir", str(cache)]
+        sha = _has_commit(git_dir, None, want) if _is_sha(want) else ""
+        if not sha:
+            if _is_sha(want):
+                _fetch_locked(git_dir, None, url, want, ref, [], [])
+                sha = _has_commit(git_dir, None, want)
+            else:
+                _git([*git_dir, "fetch", "--no-tags", "-q", url, want])
+                sha = _git([*git_dir, "rev-parse", "FETCH_HEAD^{commit}"])
+            # Anchor the commit under a ref so a later gc in the cache cannot prune
+            # objects that workspaces borrow through alternates.
+            _git([*git_dir, "update-ref", f"refs/sociosphere/{sha}", sha])
+    return cache, sha
+
+
+def fetch_repo(
+    r: Repo,
+    rev: str | None,
+    depth: int = 1,
+    filter_spec: str | None = None,
+    cache_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Materialize one repo at its locked revision.
+
+    Only the wanted commit is fetched: with a lock SHA that is a direct
+    ``git fetch --depth N origin <sha>``, deepened to the ref's history and then to
+    every branch when the server refuses unadvertised objects (see _fetch_locked);
+    the work tree is detached at the lock SHA, as ``git checkout <sha>`` after a
+    clone would leave it. Without a lock the ref is fetched into
+    ``origin/<ref>`` and checked out as a local branch tracking it. The clone is
+    assembled in a sibling temp dir and renamed into place, so an interrupted fetch
+    never leaves a half-populated path that the next run would skip.
+    """
+    assert r.local_path is not None and r.url is not None
+    t0 = time.monotonic()
+    dest = r.local_path
+    tmp = dest.with_name(f".{dest.name}.fetch-tmp")
+    want = rev or r.ref or "HEAD"
+    branch = r.ref if not rev and r.ref and r.ref != "HEAD" and not _is_sha(r.ref) else None
+    row: dict[str, Any] = {
+        "name": r.name,
+        "url": r.url,
+        "want": want,
+        "rev": None,
+        "source": "cache" if cache_dir else "remote",
+        "status": "failed",
+        "bytes": 0,
+        "seconds": 0.0,
+    }
+    try:
+        if tmp.exists():
+            shutil.rmtree(tmp)
+        _git(["init", "-q", str(tmp)])
+        _git(["remote", "add", "origin", r.url], cwd=tmp)
+        if cache_dir is not None:
+            cache, sha = fill_git_cache(cache_dir, r.url, want, r.ref)
+            alternates = tmp / ".git" / "objects" / "info" / "alternates"
+            alternates.write_text(str((cache / "objects").resolve()) + "\n", encoding="utf-8")
+            # Every object is already reachable through alternates: this moves refs, not bytes.
+            # The anchor ref is advertised, so no SHA-in-want support is needed.
+            _git(["fetch", "--no-tags", "-q", str(cache), f"refs/sociosphere/{sha}"], cwd=tmp)
+            if branch:
+                _git(["update-ref", f"refs/remotes/origin/{branch}", sha], cwd=tmp)
+        else:
+            shallow = ["--depth", str(depth)] if depth > 0 else []
+            partial = [f"--filter={filter_spec}"] if filter_spec else []
+            if rev:
+                _fetch_locked([], tmp, "origin", rev, r.ref, shallow, partial)
+            elif branch:
+                _git(["fetch", "--no-tags", "-q", *shallow, *partial, "origin",
+                      f"+{branch}:refs/remotes/origin/{branch}"], cwd=tmp)
+            else:
+                _git(["fetch", "--no-tags", "-q", *shallow, *partial, "origin", want], cwd=tmp)
+        if rev:
+            _git(["checkout", "-q", "--detach", rev], cwd=tmp)
+        elif branch:
+            _git(["checkout", "-q", "-B", branch, "--track", f"origin/{branch}"], cwd=tmp)
+        else:
+            _git(["checkout", "-q", "--detach", "FETCH_HEAD"], cwd=tmp)
+        row["rev"] = _git(["rev-parse", "HEAD"], cwd=tmp)
+        tmp.replace(dest)
+        row["status"] = "cloned"
+        row["bytes"] = _dir_bytes(dest / ".git" / "objects")
+    except (RuntimeError, OSError) as exc:
+        row["error"] = str(exc)
+        shutil.rmtree(tmp, ignore_errors=True)
+    row["seconds"] = round(time.monotonic() - t0, 6)
+    return row
+
+
+def fetch_repos(
+    work: list[tuple[Repo, str | None]],
+    jobs: int = 4,
+    depth: int = 1,
+    filter_spec: str | None = None,
+    cache_dir: Path | None = None,
+) -> list[dict[str, Any]]:
+    """Run fetch_repo over ``work`` with at most ``jobs`` clones in flight; rows come
+    back in ``work`` order regardless of completion order."""
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(fetch_repo, r, rev, depth, filter_spec, cache_dir) for r, rev in work]
+        rows = []
+        for (r, _), fut in zip(work, futures):
+            row = fut.result()
+            if row["status"] == "cloned":
+                print(f"CLONE {r.name} -> {r.local_path} @ {row['rev']} ({row['bytes']} bytes, {row['seconds']:.2f}s)")
+            else:
+                print(f"FAIL {r.name}: {row.get('error')}", file=sys.stderr)
+            rows.append(row)
+    return rows
+
+
 def cmd_fetch(args: argparse.Namespace) -> int:
     _, repos = load_workspace_and_repos()
     lock = load_lock()
@@ -498,6 +701,7 @@ def cmd_fetch(args: argparse.Namespace) -> int:
             print(f"ERROR: {e}", file=sys.stderr)
         return 2
 
+    work: list[tuple[Repo, str | None]] = []
     for r in repos:
         if r.local_path is None:
             if r.url:
@@ -515,15 +719,36 @@ def cmd_fetch(args: argparse.Namespace) -> int:
             print(f"SKIP {r.name}: no url and path missing ({r.local_path})", file=sys.stderr)
             continue
 
-        print(f"CLONE {r.name} -> {r.local_path}")
-        _run(["git", "clone", r.url, str(r.local_path)])
+        work.append((r, locked_rev(lock, r.name) or r.rev))
 
-        lrev = locked_rev(lock, r.name) or r.rev
-        if lrev:
-            print(f"CHECKOUT {r.name} @ {lrev}")
-            _run(["git", "checkout", lrev], cwd=r.local_path)
+    cache_dir = Path(args.cache_dir) if getattr(args, "cache_dir", None) else None
+    t0 = time.monotonic()
+    rows = fetch_repos(
+        work,
+        jobs=getattr(args, "jobs", 4),
+        depth=getattr(args, "depth", 1),
+        filter_spec=getattr(args, "filter", None),
+        cache_dir=cache_dir,
+    )
+    failed = [row for row in rows if row["status"] != "cloned"]
 
-    return 0
+    if getattr(args, "json_out", None):
+        payload = {
+            "kind": "FetchReportArtifact",
+            "generatedAt": now_iso(),
+            "result": "pass" if not failed else "fail",
+            "jobs": getattr(args, "jobs", 4),
+            "depth": getattr(args, "depth", 1),
+            "filter": getattr(args, "filter", None),
+            "cacheDir": str(cache_dir) if cache_dir else None,
+            "wallSeconds": round(time.monotonic() - t0, 6),
+            "totalBytes": sum(row["bytes"] for row in rows),
+            "repos": rows,
+        }
+        write_json(Path(args.json_out), payload)
+        print(f"[fetch] wrote {args.json_out}")
+
+    return 0 if not failed else 1
 
 
 def detect_task_command(repo_path: Path, task: str) -> tuple[str, list[str]]:
@@ -748,6 +973,248 @@ def cmd_sbom(args: argparse.Namespace) -> int:
     return 0
 
 
+def _task_run_payload(
+    r: Repo,
+    task: str,
+    contract_type: str,
+    cmd: list[str],
+    started: str,
+    exit_code: int,
+    stdout_ref: str | None = None,
+    stderr_ref: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "kind": "TaskRunArtifact",
+        "generatedAt": now_iso(),
+        "repo": {"name": r.name, "role": r.role},
+        "task": task,
+        "contractType": contract_type,
+        "command": cmd,
+        "startedAt": started,
+        "finishedAt": now_iso(),
+        "exitCode": exit_code,
+        "stdoutRef": stdout_ref,
+        "stderrRef": stderr_ref,
+    }
+
+
+_print_lock = threading.Lock()
+
+
+def _echo_log(path: Path, stream: Any) -> None:
+    """Copy a finished task log to the console without loading it into memory."""
+    with path.open("r", encoding="utf-8", errors="replace") as fh:
+        shutil.copyfileobj(fh, stream)
+
+
+def run_task(r: Repo, task: str, run_dir: Path) -> dict[str, Any]:
+    """Run ``task`` in one repo and write its TaskRunArtifact.
+
+    The child's stdout/stderr go straight to the ``*.stdout.log``/``*.stderr.log``
+    files rather than through a pipe, so a chatty test suite costs disk, not memory,
+    and concurrent repos never contend on one buffer. Returns the artifact payload
+    plus the wall time in ``durationSeconds``.
+    """
+    started = now_iso()
+    t0 = time.monotonic()
+
+    if r.local_path is None:
+        print(f"REMOTE-ONLY {r.name}: no local_path to run '{task}'", file=sys.stderr)
+        payload = _task_run_payload(r, task, "none", [], started, 2)
+    elif not r.local_path.exists():
+        print(f"MISSING {r.name}: {r.local_path} (run fetch first)", file=sys.stderr)
+        payload = _task_run_payload(r, task, "none", [], started, 2)
+    else:
+        contract_type, cmd = detect_task_command(r.local_path, task)
+        if not cmd:
+            print(f"NO TASK CONTRACT for {r.name}: can't run '{task}'", file=sys.stderr)
+            payload = _task_run_payload(r, task, contract_type, cmd, started, 2)
+        else:
+            stdout_path = run_dir / f"{r.name}-{task}.stdout.log"
+            stderr_path = run_dir / f"{r.name}-{task}.stderr.log"
+            with stdout_path.open("wb") as out, stderr_path.open("wb") as err:
+                proc = subprocess.Popen(cmd, cwd=str(r.local_path), stdout=out, stderr=err)
+                returncode = proc.wait()
+            # Echo each task's logs whole once it exits, one task at a time, so
+            # output from concurrent repos never interleaves.
+            with _print_lock:
+                print(f"\n== {r.name}: {task} ==", flush=True)
+                _echo_log(stdout_path, sys.stdout)
+                _echo_log(stderr_path, sys.stderr)
+                sys.stdout.flush()
+                if returncode != 0:
+                    print(f"FAIL {r.name}: exit {returncode}", file=sys.stderr)
+            payload = _task_run_payload(
+                r, task, contract_type, cmd, started, returncode, str(stdout_path), str(stderr_path)
+            )
+
+    write_json(run_dir / f"task-run-{r.name}.json", payload)
+    return {**payload, "durationSeconds": round(time.monotonic() - t0, 6)}
+
+
+def _propagation_engine_module() -> Any:
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from engines import propagation_engine
+
+    return propagation_engine
+
+
+def target_dependencies(targets: list[Repo], engine: Any) -> dict[str, list[str]]:
+    """Map each target to the other targets it depends on, per the propagation registry.
+
+    Edges to repos outside the selection are dropped: a dependency that is not part of
+    this run has nothing to wait for. Names are matched through the engine's registry
+    normalization so ``TriTRPC`` in the manifest finds ``tritrpc`` in the graph.
+    """
+    normalize = _propagation_engine_module()._normalize_repo_id
+    by_id = {normalize(r.name): r.name for r in targets}
+    deps: dict[str, list[str]] = {}
+    for r in targets:
+        wanted: list[str] = []
+        for dep in engine.dependencies_of(r.name):
+            name = by_id.get(normalize(dep))
+            if name and name != r.name and name not in wanted:
+                wanted.append(name)
+        deps[r.name] = wanted
+    return deps
+
+
+def topo_priority(targets: list[Repo], engine: Any) -> dict[str, int]:
+    """Rank targets by ``PropagationEngine.merge_order()`` so lower dependency levels
+    are started first when several repos are ready at once."""
+    normalize = _propagation_engine_module()._normalize_repo_id
+    order = {repo: i for i, repo in enumerate(engine.merge_order())}
+    fallback = len(order)
+    return {r.name: order.get(normalize(r.name), fallback) for r in targets}
+
+
+def critical_path(results: dict[str, dict[str, Any]], deps: dict[str, list[str]]) -> dict[str, Any]:
+    """Longest chain of dependent repos by summed duration: the floor on wall time
+    no amount of --jobs can go below."""
+    best: dict[str, tuple[float, list[str]]] = {}
+    on_stack: set[str] = set()
+
+    for root in sorted(results):
+        # Iterative post-order so a long dependency chain cannot hit the recursion
+        # limit; ``on_stack`` cuts the back edge of a cycle inside the selection.
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in best:
+                continue
+            if not expanded:
+                on_stack.add(node)
+                stack.append((node, True))
+                stack.extend(
+                    (d, False) for d in deps.get(node, []) if d in results and d not in best and d not in on_stack
+                )
+                continue
+            on_stack.discard(node)
+            prior = max(
+                (best[d] for d in deps.get(node, []) if d in best),
+                key=lambda item: item[0],
+                default=(0.0, []),
+            )
+            best[node] = (prior[0] + float(results[node].get("durationSeconds", 0.0)), prior[1] + [node])
+
+    longest = max(best.values(), key=lambda item: item[0], default=(0.0, []))
+    return {"repos": longest[1], "seconds": round(longest[0], 6)}
+
+
+def run_targets(
+    targets: list[Repo],
+    task: str,
+    run_dir: Path,
+    jobs: int = 1,
+    deps: dict[str, list[str]] | None = None,
+    priority: dict[str, int] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Run ``task`` over ``targets`` with at most ``jobs`` children at once.
+
+    With ``deps``, a repo is started only after every repo it depends on has
+    finished successfully; if one of them failed (or was itself blocked) the repo is
+    not run and its artifact records ``blockedBy``. Without ``deps`` the targets are
+    independent and simply share the worker pool.
+    """
+    deps = deps or {r.name: [] for r in targets}
+    priority = priority or {r.name: i for i, r in enumerate(targets)}
+    by_name = {r.name: r for r in targets}
+    results: dict[str, dict[str, Any]] = {}
+    waiting = {r.name: set(deps.get(r.name, [])) for r in targets}
+    running: dict[Future, str] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while waiting or running:
+            ready = sorted((n for n, pend in waiting.items() if not pend), key=lambda n: (priority[n], n))
+            for name in ready:
+                if len(running) >= jobs:
+                    break
+                del waiting[name]
+                running[pool.submit(run_task, by_name[name], task, run_dir)] = name
+
+            if not running:
+                # Everything left is waiting on something that will never finish
+                # successfully: a failed dependency or a cycle inside the selection.
+                for name in sorted(waiting):
+                    failed = sorted(d for d in deps.get(name, []) if results.get(d, {}).get("exitCode") != 0)
+                    blocked_by = failed or sorted(waiting[name])
+                    print(f"BLOCKED {name}: waiting on {', '.join(blocked_by)}", file=sys.stderr)
+                    payload = _task_run_payload(by_name[name], task, "none", [], now_iso(), 2)
+                    payload["blockedBy"] = blocked_by
+                    write_json(run_dir / f"task-run-{name}.json", payload)
+                    results[name] = {**payload, "durationSeconds": 0.0}
+                waiting.clear()
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = running.pop(fut)
+                results[name] = fut.result()
+                if results[name]["exitCode"] != 0:
+                    continue
+                for pend in waiting.values():
+                    pend.discard(name)
+
+    return results
+
+
+def run_summary_payload(
+    task: str,
+    results: dict[str, dict[str, Any]],
+    deps: dict[str, list[str]],
+    jobs: int,
+    mode: str,
+    started: str,
+    wall_seconds: float,
+) -> dict[str, Any]:
+    repos = [
+        {
+            "name": name,
+            "exitCode": res["exitCode"],
+            "startedAt": res["startedAt"],
+            "finishedAt": res["finishedAt"],
+            "durationSeconds": res.get("durationSeconds", 0.0),
+            "dependsOn": deps.get(name, []),
+            **({"blockedBy": res["blockedBy"]} if "blockedBy" in res else {}),
+        }
+        for name, res in sorted(results.items())
+    ]
+    return {
+        "kind": "TaskRunSummaryArtifact",
+        "generatedAt": now_iso(),
+        "task": task,
+        "mode": mode,
+        "jobs": jobs,
+        "startedAt": started,
+        "finishedAt": now_iso(),
+        "wallSeconds": round(wall_seconds, 6),
+        "result": "pass" if all(r["exitCode"] == 0 for r in repos) else "fail",
+        "repos": repos,
+        "criticalPath": critical_path(results, deps),
+    }
+
+
 def cmd_run(args: argparse.Namespace) -> int:
     workspace, repos = load_workspace_and_repos()
 
@@ -769,104 +1236,37 @@ def cmd_run(args: argparse.Namespace) -> int:
         print("No targets selected. Use --all or --only <name> or --role <role>.", file=sys.stderr)
         return 2
 
+    jobs = getattr(args, "jobs", 1) or 1
+    if jobs < 1:
+        print("ERROR: --jobs must be >= 1", file=sys.stderr)
+        return 2
+
     run_dir = artifact_run_dir() if args.artifact_dir == "auto" else Path(args.artifact_dir)
     run_dir.mkdir(parents=True, exist_ok=True)
 
+    mode = "topo" if getattr(args, "topo", False) else "flat"
+    deps: dict[str, list[str]] = {r.name: [] for r in targets}
+    priority: dict[str, int] | None = None
+    if mode == "topo":
+        engine = _propagation_engine_module().PropagationEngine()
+        engine.load()
+        deps = target_dependencies(targets, engine)
+        priority = topo_priority(targets, engine)
+
+    started = now_iso()
+    t0 = time.monotonic()
+    results = run_targets(targets, args.task, run_dir, jobs=jobs, deps=deps, priority=priority)
+    summary = run_summary_payload(args.task, results, deps, jobs, mode, started, time.monotonic() - t0)
+    write_json(run_dir / "task-run-summary.json", summary)
+    print(f"[run] {len(results)} repo(s), jobs={jobs}, mode={mode}, wall={summary['wallSeconds']:.2f}s; "
+          f"critical path {' -> '.join(summary['criticalPath']['repos']) or '-'} "
+          f"({summary['criticalPath']['seconds']:.2f}s)")
+
     rc = 0
     for r in targets:
-        started = now_iso()
-        stdout_ref = None
-        stderr_ref = None
-        if r.local_path is None:
-            print(f"REMOTE-ONLY {r.name}: no local_path to run '{args.task}'", file=sys.stderr)
-            rc = 2
-            payload = {
-                "kind": "TaskRunArtifact",
-                "generatedAt": now_iso(),
-                "repo": {"name": r.name, "role": r.role},
-                "task": args.task,
-                "contractType": "none",
-                "command": [],
-                "startedAt": started,
-                "finishedAt": now_iso(),
-                "exitCode": 2,
-                "stdoutRef": stdout_ref,
-                "stderrRef": stderr_ref,
-            }
-            write_json(run_dir / f"task-run-{r.name}.json", payload)
-            continue
-
-        if not r.local_path.exists():
-            print(f"MISSING {r.name}: {r.local_path} (run fetch first)", file=sys.stderr)
-            rc = 2
-            payload = {
-                "kind": "TaskRunArtifact",
-                "generatedAt": now_iso(),
-                "repo": {"name": r.name, "role": r.role},
-                "task": args.task,
-                "contractType": "none",
-                "command": [],
-                "startedAt": started,
-                "finishedAt": now_iso(),
-                "exitCode": 2,
-                "stdoutRef": stdout_ref,
-                "stderrRef": stderr_ref,
-            }
-            write_json(run_dir / f"task-run-{r.name}.json", payload)
-            continue
-
-        contract_type, cmd = detect_task_command(r.local_path, args.task)
-        if not cmd:
-            print(f"NO TASK CONTRACT for {r.name}: can't run '{args.task}'", file=sys.stderr)
-            rc = 2
-            payload = {
-                "kind": "TaskRunArtifact",
-                "generatedAt": now_iso(),
-                "repo": {"name": r.name, "role": r.role},
-                "task": args.task,
-                "contractType": contract_type,
-                "command": cmd,
-                "startedAt": started,
-                "finishedAt": now_iso(),
-                "exitCode": 2,
-                "stdoutRef": stdout_ref,
-                "stderrRef": stderr_ref,
-            }
-            write_json(run_dir / f"task-run-{r.name}.json", payload)
-            continue
-
-        print(f"\n== {r.name}: {args.task} ==")
-        cp = _run(cmd, cwd=r.local_path, check=False, capture=True)
-        if cp.stdout:
-            print(cp.stdout, end="")
-        if cp.stderr:
-            print(cp.stderr, end="", file=sys.stderr)
-
-        stdout_path = run_dir / f"{r.name}-{args.task}.stdout.log"
-        stderr_path = run_dir / f"{r.name}-{args.task}.stderr.log"
-        stdout_path.write_text(cp.stdout or "", encoding="utf-8")
-        stderr_path.write_text(cp.stderr or "", encoding="utf-8")
-        stdout_ref = str(stdout_path)
-        stderr_ref = str(stderr_path)
-
-        payload = {
-            "kind": "TaskRunArtifact",
-            "generatedAt": now_iso(),
-            "repo": {"name": r.name, "role": r.role},
-            "task": args.task,
-            "contractType": contract_type,
-            "command": cmd,
-            "startedAt": started,
-            "finishedAt": now_iso(),
-            "exitCode": cp.returncode,
-            "stdoutRef": stdout_ref,
-            "stderrRef": stderr_ref,
-        }
-        write_json(run_dir / f"task-run-{r.name}.json", payload)
-        if cp.returncode != 0:
-            rc = cp.returncode or 1
-            print(f"FAIL {r.name}: exit {cp.returncode}", file=sys.stderr)
-
+        code = results[r.name]["exitCode"]
+        if code != 0:
+            rc = code or 1
     return rc
 
 
@@ -908,6 +1308,15 @@ def main() -> int:
     sp.set_defaults(fn=cmd_list)
 
     sp = sub.add_parser("fetch", help="Materialize missing repos (git clone) + checkout lock")
+    sp.add_argument("--jobs", "-j", type=int, default=4, help="Clone up to N repos concurrently (default: 4)")
+    sp.add_argument("--depth", type=int, default=1, help="History depth to fetch; 0 for full history (default: 1)")
+    sp.add_argument("--filter", default=None, help="Partial-clone filter spec, e.g. blob:none")
+    sp.add_argument(
+        "--cache-dir",
+        default=os.environ.get("SOCIOSPHERE_GIT_CACHE"),
+        help="Shared reference-repository cache reused across workspaces (env: SOCIOSPHERE_GIT_CACHE)",
+    )
+    sp.add_argument("--json-out", help="Optional path to write a FetchReportArtifact")
     sp.set_defaults(fn=cmd_fetch)
 
     sp = sub.add_parser("lock-verify", help="Verify manifest/lock consistency and role validity")
@@ -944,6 +1353,12 @@ def main() -> int:
     sp.add_argument("--only", action="append", help="Run only on named repo (repeatable)")
     sp.add_argument("--role", choices=sorted(VALID_ROLES), help="Run on repos with this role")
     sp.add_argument("--artifact-dir", default="auto", help="Artifact output directory (default: auto under artifacts/workspace)")
+    sp.add_argument("--jobs", "-j", type=int, default=1, help="Run up to N repos concurrently (default: 1)")
+    sp.add_argument(
+        "--topo",
+        action="store_true",
+        help="Start a repo only after the repos it depends on (per registry/dependency-graph.yaml) succeed",
+    )
     sp.set_defaults(fn=cmd_run)
 
     sp = sub.add_parser("check-manifest", help="Validate manifest role/path naming conventions")
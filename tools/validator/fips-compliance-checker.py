@@ -20,6 +20,7 @@ Options:
   --audit-log PATH    Path to audit log JSON Lines file to verify hash chain
   --evidence-dir PATH Directory containing NIST 800-53 evidence files
   --report PATH       Write JSON compliance report to this file (default: stdout)
+  --cache PATH        SQLite scan cache; unchanged git blobs are not rescanned
   --fail-fast         Exit immediately on first failure
   --no-color          Disable ANSI color output
 
@@ -47,6 +48,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:  # run as `python3 tools/validator/fips-compliance-checker.py`
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from automation.scan_engine import Hit, Rule, ScanEngine  # noqa: E402
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -166,47 +173,70 @@ def bold(t: str) -> str:
 
 
 # ---------------------------------------------------------------------------
-# Check 1: Algorithm scan
+# Content checks 1-3: one walk of the source tree
 # ---------------------------------------------------------------------------
+#
+# algo-scan, tls-version and audit-worm register their patterns as rules on one
+# ScanEngine (automation/scan_engine.py): the tree is walked once, each file read
+# once, and the hits are handed back to each check's result builder.
+
+CONTENT_CHECKS = ("algo-scan", "tls-version", "audit-worm")
+
+# algo-scan and tls-version do not look at documentation (see ALGO_SCAN_SKIP_EXTENSIONS).
+_DOC_GLOBS = tuple(f"*{ext}" for ext in sorted(ALGO_SCAN_SKIP_EXTENSIONS - SKIP_EXTENSIONS))
+
+# Explicit TLS 1.3 configuration, recorded as tls-version evidence.
+TLS13_PATTERN = r"tls[-_\s]?1[\._]?3|TLSv1_3|TLS1_3"
+
+# WORM / immutable storage references, recorded as audit-worm evidence.
+WORM_PATTERNS: list[str] = [
+    r"\bworm\b",
+    r"object.?lock",
+    r"immutable.?blob",
+    r"append.?only",
+    r"write.?once",
+    r"immutableStorage",
+    r"wormCompliant",
+]
 
-def check_algo_scan(source_dir: Path) -> CheckResult:
-    """Scan source files for disallowed cryptographic algorithms."""
-    result = CheckResult(
-        check_id="algo-scan",
-        description="Scan source code for disallowed cryptographic algorithms (MD5, SHA-1, DES, 3DES, RC4, ECB mode)",
-        status="pass",
-    )
-
-    compiled = [
-        (re.compile(pattern, re.IGNORECASE), desc, ref)
-        for pattern, desc, ref in DISALLOWED_ALGO_PATTERNS
-    ]
-
-    for file_path in _walk_source_files(source_dir, skip_extensions=ALGO_SCAN_SKIP_EXTENSIONS):
-        try:
-            text = file_path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
 
-        for lineno, line in enumerate(text.splitlines(), start=1):
-            for regex, algo_name, std_ref in compiled:
-                if regex.search(line):
-                    finding = Finding(
-                        check_id="algo-scan",
-                        status="fail",
-                        message=f"Disallowed algorithm detected: {algo_name}",
-                        file=str(file_path),
-                        line=lineno,
-                        detail=line.strip(),
-                        standard_ref=std_ref,
-                    )
-                    result.findings.append(finding)
-                    result.status = "fail"
+def content_rules(checks: tuple[str, ...] = CONTENT_CHECKS) -> list[Rule]:
+    """The scan-engine rules of the requested content checks, in report order."""
+    rules: list[Rule] = []
+    if "algo-scan" in checks:
+        rules.extend(
+            Rule("algo-scan", f"algo-{i}", re.compile(pattern, re.IGNORECASE), "fail", exclude=_DOC_GLOBS)
+            for i, (pattern, _desc, _ref) in enumerate(DISALLOWED_ALGO_PATTERNS)
+        )
+    if "tls-version" in checks:
+        rules.extend(
+            Rule("tls-version", f"tls-{i}", re.compile(pattern, re.IGNORECASE), "fail", exclude=_DOC_GLOBS)
+            for i, (pattern, _desc) in enumerate(DISALLOWED_TLS_PATTERNS)
+        )
+        rules.append(Rule("tls-version", "tls13", re.compile(TLS13_PATTERN, re.IGNORECASE), "pass",
+                          exclude=_DOC_GLOBS, per_line=False))
+    if "audit-worm" in checks:
+        rules.extend(
+            Rule("audit-worm", f"worm-{i}", re.compile(pattern, re.IGNORECASE), "pass", per_line=False)
+            for i, pattern in enumerate(WORM_PATTERNS)
+        )
+    return rules
 
-    if result.status == "pass":
-        result.evidence.append("No disallowed algorithm references found in source tree.")
 
-    return result
+def run_content_checks(
+    source_dir: Path,
+    checks: tuple[str, ...] = CONTENT_CHECKS,
+    cache_path: Optional[Path] = None,
+) -> dict[str, CheckResult]:
+    """Run the requested content checks over a single walk of ``source_dir``."""
+    engine = ScanEngine(content_rules(checks))
+    hits = engine.scan(source_dir, _walk_source_files(source_dir), scope="fips-content", cache_path=cache_path)
+    builders = {
+        "algo-scan": _algo_scan_result,
+        "tls-version": _tls_version_result,
+        "audit-worm": _audit_worm_result,
+    }
+    return {check_id: builders[check_id](hits[check_id]) for check_id in checks}
 
 
 def _walk_source_files(root: Path, skip_extensions: Optional[set] = None):
@@ -240,51 +270,80 @@ def _walk_source_files(root: Path, skip_extensions: Optional[set] = None):
             yield fpath
 
 
+# ---------------------------------------------------------------------------
+# Check 1: Algorithm scan
+# ---------------------------------------------------------------------------
+
+def check_algo_scan(source_dir: Path, cache_path: Optional[Path] = None) -> CheckResult:
+    """Scan source files for disallowed cryptographic algorithms."""
+    return run_content_checks(source_dir, ("algo-scan",), cache_path)["algo-scan"]
+
+
+def _algo_scan_result(hits: list[Hit]) -> CheckResult:
+    result = CheckResult(
+        check_id="algo-scan",
+        description="Scan source code for disallowed cryptographic algorithms (MD5, SHA-1, DES, 3DES, RC4, ECB mode)",
+        status="pass",
+    )
+
+    algos = {f"algo-{i}": (desc, ref) for i, (_pattern, desc, ref) in enumerate(DISALLOWED_ALGO_PATTERNS)}
+    for hit in hits:
+        algo_name, std_ref = algos[hit.rule.id]
+        finding = Finding(
+            check_id="algo-scan",
+            status=hit.rule.severity,
+            message=f"Disallowed algorithm detected: {algo_name}",
+            file=str(hit.path),
+            line=hit.line,
+            detail=hit.text,
+            standard_ref=std_ref,
+        )
+        result.findings.append(finding)
+        result.status = "fail"
+
+    if result.status == "pass":
+        result.evidence.append("No disallowed algorithm references found in source tree.")
+
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Check 2: TLS version validation
 # ---------------------------------------------------------------------------
 
-def check_tls_version(source_dir: Path) -> CheckResult:
+def check_tls_version(source_dir: Path, cache_path: Optional[Path] = None) -> CheckResult:
     """Validate that no TLS version below 1.3 is configured."""
+    return run_content_checks(source_dir, ("tls-version",), cache_path)["tls-version"]
+
+
+def _tls_version_result(hits: list[Hit]) -> CheckResult:
     result = CheckResult(
         check_id="tls-version",
         description="Validate TLS configuration (minimum TLS 1.3 per RFC 8446 and NIST SP 800-52 Rev. 2)",
         status="pass",
     )
 
-    compiled = [
-        (re.compile(pattern, re.IGNORECASE), desc)
-        for pattern, desc in DISALLOWED_TLS_PATTERNS
-    ]
-
-    # Also look for explicit TLS 1.3 configurations as evidence.
-    tls13_pattern = re.compile(r"tls[-_\s]?1[\._]?3|TLSv1_3|TLS1_3", re.IGNORECASE)
+    messages = {f"tls-{i}": desc for i, (_pattern, desc) in enumerate(DISALLOWED_TLS_PATTERNS)}
     tls13_found = False
 
-    for file_path in _walk_source_files(source_dir, skip_extensions=ALGO_SCAN_SKIP_EXTENSIONS):
-        try:
-            text = file_path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
-
-        if tls13_pattern.search(text):
+    for hit in hits:
+        # Also look for explicit TLS 1.3 configurations as evidence.
+        if hit.rule.id == "tls13":
             tls13_found = True
-            result.evidence.append(f"TLS 1.3 configuration found in: {file_path}")
+            result.evidence.append(f"TLS 1.3 configuration found in: {hit.path}")
+            continue
 
-        for lineno, line in enumerate(text.splitlines(), start=1):
-            for regex, desc in compiled:
-                if regex.search(line):
-                    finding = Finding(
-                        check_id="tls-version",
-                        status="fail",
-                        message=desc,
-                        file=str(file_path),
-                        line=lineno,
-                        detail=line.strip(),
-                        standard_ref="RFC 8446, NIST SP 800-52 Rev. 2",
-                    )
-                    result.findings.append(finding)
-                    result.status = "fail"
+        finding = Finding(
+            check_id="tls-version",
+            status=hit.rule.severity,
+            message=messages[hit.rule.id],
+            file=str(hit.path),
+            line=hit.line,
+            detail=hit.text,
+            standard_ref="RFC 8446, NIST SP 800-52 Rev. 2",
+        )
+        result.findings.append(finding)
+        result.status = "fail"
 
     if not tls13_found and result.status == "pass":
         result.status = "warn"
@@ -302,38 +361,23 @@ def check_tls_version(source_dir: Path) -> CheckResult:
 # Check 3: Audit WORM storage
 # ---------------------------------------------------------------------------
 
-def check_audit_worm(source_dir: Path) -> CheckResult:
+def check_audit_worm(source_dir: Path, cache_path: Optional[Path] = None) -> CheckResult:
     """Check for WORM-compliant audit storage configuration."""
+    return run_content_checks(source_dir, ("audit-worm",), cache_path)["audit-worm"]
+
+
+def _audit_worm_result(hits: list[Hit]) -> CheckResult:
     result = CheckResult(
         check_id="audit-worm",
         description="Check audit trail for WORM storage configuration (NIST SP 800-88)",
         status="pass",
     )
 
-    worm_patterns = [
-        re.compile(r"\bworm\b", re.IGNORECASE),
-        re.compile(r"object.?lock", re.IGNORECASE),
-        re.compile(r"immutable.?blob", re.IGNORECASE),
-        re.compile(r"append.?only", re.IGNORECASE),
-        re.compile(r"write.?once", re.IGNORECASE),
-        re.compile(r"immutableStorage", re.IGNORECASE),
-        re.compile(r"wormCompliant", re.IGNORECASE),
-    ]
-
-    found_worm = False
-    for file_path in _walk_source_files(source_dir):
-        try:
-            text = file_path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
+    # Per-file rules: at most one hit per file, the first WORM pattern it matches.
+    for hit in hits:
+        result.evidence.append(f"WORM/immutable storage reference found in: {hit.path}")
 
-        for pattern in worm_patterns:
-            if pattern.search(text):
-                found_worm = True
-                result.evidence.append(f"WORM/immutable storage reference found in: {file_path}")
-                break
-
-    if not found_worm:
+    if not hits:
         result.status = "fail"
         result.findings.append(Finding(
             check_id="audit-worm",
@@ -658,6 +702,13 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         metavar="PATH",
         help="Write JSON compliance report to this file (default: stdout)",
     )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="SQLite scan cache; files whose git blob is unchanged are not rescanned",
+    )
     parser.add_argument(
         "--fail-fast",
         action="store_true",
@@ -688,11 +739,19 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     results: list[CheckResult] = []
 
+    # The content checks share one walk: the first of them runs all three.
+    content: dict[str, CheckResult] = {}
+
+    def content_check(check_id: str) -> CheckResult:
+        if not content:
+            content.update(run_content_checks(source_dir, cache_path=args.cache))
+        return content[check_id]
+
     # Run checks.
     checks = [
-        ("algo-scan", lambda: check_algo_scan(source_dir)),
-        ("tls-version", lambda: check_tls_version(source_dir)),
-        ("audit-worm", lambda: check_audit_worm(source_dir)),
+        ("algo-scan", lambda: content_check("algo-scan")),
+        ("tls-version", lambda: content_check("tls-version")),
+        ("audit-worm", lambda: content_check("audit-worm")),
         ("hash-chain", lambda: check_hash_chain(args.audit_log)),
         ("nist-controls", lambda: check_nist_controls(evidence_dir)),
     ]
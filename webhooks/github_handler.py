@@ -120,6 +120,9 @@ class _WebhookHandler(http.server.BaseHTTPRequestHandler):
 def serve(port: int = DEFAULT_PORT, secret: str = "") -> None:
     """Start the webhook HTTP server."""
     _WebhookHandler.secret = secret
+    # Load the registry graph once up front; push events then hit the resident
+    # snapshot, which reloads only when the registry files change.
+    propagation_engine.resident_engine().current()
 
     with http.server.HTTPServer(("", port), _WebhookHandler) as httpd:
         print(f"Webhook server listening on port {port}")